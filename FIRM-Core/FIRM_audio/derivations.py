@@ -9,6 +9,8 @@ from __future__ import annotations
 from typing import Tuple, NamedTuple, List
 import math
 
+import numpy as np
+
 
 class ParsevalNormalization(NamedTuple):
     """Container for Parseval-based energy normalization parameters.
@@ -83,3 +85,27 @@ def compute_coherence_audio_normalized(fft_magnitudes: List[float], normalizatio
     c_audio = min(1.0, corrected_energy / normalization.max_energy_bound)
     
     return c_audio
+
+
+def coherence_from_energy(energy: np.ndarray, normalization: ParsevalNormalization) -> np.ndarray:
+    """Map Parseval energies E = Σ|X[k]|² to C_audio ∈ [0,1] (array-valued).
+    
+    Same normalization as compute_coherence_audio_normalized, applied to any
+    number of frames at once.
+    """
+    return np.minimum(1.0, np.asarray(energy, dtype=float) * normalization.correction_factor
+                      / normalization.max_energy_bound)
+
+
+def compute_coherence_audio_batch(fft_magnitudes: np.ndarray, normalization: ParsevalNormalization) -> np.ndarray:
+    """Vectorized compute_coherence_audio_normalized over a stack of frames.
+    
+    Args:
+        fft_magnitudes: (frames, bins) array of magnitudes
+        normalization: Derived Parseval normalization
+        
+    Returns:
+        (frames,) array of C_audio values in [0,1]
+    """
+    magnitudes = np.asarray(fft_magnitudes, dtype=float)
+    return coherence_from_energy(np.einsum("fk,fk->f", magnitudes, magnitudes), normalization)
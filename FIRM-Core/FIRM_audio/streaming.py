@@ -0,0 +1,238 @@
+"""streaming.py
+
+Block-streaming audio coherence engine.
+
+Consumes PCM in arbitrary-sized blocks (NumPy arrays or memory-mapped WAV
+data) and emits one C_audio value per hop:
+
+- A periodic Hann window of length N is computed once; its energy
+  Σw² = 3N/8 is exactly the 8/3 correction in derive_parseval_normalization.
+- Overlapping frames (hop H ≤ N) are read as strided views over the carried
+  tail + new block, windowed and transformed with one batched real FFT.
+- One-sided spectra are folded back to full-spectrum Parseval energy
+  (DC/Nyquist once, every other bin twice, divided by N), so each frame's
+  value equals compute_coherence_audio_normalized on its Parseval magnitudes.
+- Only the last N - H (+ partial hop) samples are carried between blocks, so
+  memory and latency are bounded by one frame regardless of stream length.
+"""
+from __future__ import annotations
+from typing import Iterable, Iterator, Optional, Tuple
+import struct
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .derivations import (
+    ParsevalNormalization,
+    coherence_from_energy,
+    derive_parseval_normalization,
+)
+
+
+def hann_window(size: int) -> np.ndarray:
+    """Periodic Hann window w[n] = 0.5 (1 - cos(2πn/N)), n = 0..N-1."""
+    n = np.arange(size)
+    return 0.5 * (1.0 - np.cos(2.0 * np.pi * n / size))
+
+
+class StreamingCoherenceEngine:
+    """Hop-by-hop C_audio over an unbounded PCM stream."""
+
+    def __init__(
+        self,
+        fft_size: int = 2048,
+        sample_rate: float = 44100.0,
+        hop_size: Optional[int] = None,
+        normalization: Optional[ParsevalNormalization] = None,
+        max_frames_per_batch: int = 256
+    ):
+        """Initialize engine.
+
+        Args:
+            fft_size: N, frame length (power of 2)
+            sample_rate: fs in Hz
+            hop_size: H, samples between frame starts (default N/2)
+            normalization: Parseval normalization (derived from N, fs by default)
+            max_frames_per_batch: Frames transformed per FFT call (bounds memory
+                when a single block spans many hops)
+        """
+        self.normalization = normalization or derive_parseval_normalization(fft_size, sample_rate)
+        self.fft_size = fft_size
+        self.sample_rate = sample_rate
+        self.hop_size = hop_size or fft_size // 2
+        if not 0 < self.hop_size <= fft_size:
+            raise ValueError("hop_size must be in (0, fft_size]")
+        self.max_frames_per_batch = max_frames_per_batch
+
+        self.window = hann_window(fft_size)
+        # One-sided → full-spectrum Parseval weights, including the 1/N factor
+        weights = np.full(fft_size // 2 + 1, 2.0 / fft_size)
+        weights[0] = weights[-1] = 1.0 / fft_size
+        self._bin_weights = weights
+
+        self.reset()
+
+    def reset(self):
+        """Discard carried samples and restart the hop count."""
+        self._tail = np.zeros(0)
+        self.frames_emitted = 0
+        self.samples_consumed = 0
+
+    @property
+    def latency_samples(self) -> int:
+        """Worst-case samples between a sample arriving and its frame being emitted."""
+        return self.fft_size
+
+    def frame_times(self, count: int, start: int = 0) -> np.ndarray:
+        """Start times (seconds) of frames start .. start+count-1."""
+        return (start + np.arange(count)) * self.hop_size / self.sample_rate
+
+    def process_block(self, block: np.ndarray) -> np.ndarray:
+        """Consume PCM samples and return C_audio for every frame completed.
+
+        Args:
+            block: (samples,) or (samples, channels) PCM in [-1, 1];
+                multichannel input is down-mixed by averaging
+
+        Returns:
+            (frames,) array of C_audio values (possibly empty)
+        """
+        samples = np.asarray(block, dtype=float)
+        if samples.ndim == 2:
+            samples = samples.mean(axis=1)
+        elif samples.ndim != 1:
+            raise ValueError("block must be 1-D or (samples, channels)")
+        self.samples_consumed += len(samples)
+
+        buffer = np.concatenate([self._tail, samples]) if len(self._tail) else samples
+        N, H = self.fft_size, self.hop_size
+        num_frames = 0 if len(buffer) < N else 1 + (len(buffer) - N) // H
+        if num_frames == 0:
+            self._tail = buffer.copy()
+            return np.empty(0)
+
+        frames = sliding_window_view(buffer, N)[::H][:num_frames]
+        out = np.empty(num_frames)
+        for start in range(0, num_frames, self.max_frames_per_batch):
+            batch = frames[start:start + self.max_frames_per_batch]
+            spectra = np.fft.rfft(batch * self.window, axis=1)
+            power = spectra.real**2 + spectra.imag**2
+            out[start:start + len(batch)] = coherence_from_energy(power @ self._bin_weights,
+                                                                  self.normalization)
+
+        # Carry only what the next frame still needs
+        self._tail = buffer[num_frames * H:].copy()
+        self.frames_emitted += num_frames
+        return out
+
+    def process_stream(self, blocks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Yield C_audio arrays block by block (for live loops)."""
+        for block in blocks:
+            yield self.process_block(block)
+
+    def process_all(self, blocks: Iterable[np.ndarray]) -> np.ndarray:
+        """Run a finite stream and return every hop's C_audio in one array."""
+        parts = [c for c in self.process_stream(blocks) if len(c)]
+        return np.concatenate(parts) if parts else np.empty(0)
+
+
+# =============================================================================
+# WAV input
+# =============================================================================
+
+_PCM_SCALES = {1: (np.uint8, 128.0, 128.0), 2: (np.int16, 0.0, 32768.0), 4: (np.int32, 0.0, 2147483648.0)}
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# KSDATAFORMAT_SUBTYPE_* GUIDs are the base format code followed by this suffix
+_SUBFORMAT_GUID_SUFFIX = b"\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71"
+
+
+def _wav_format_code(fmt_chunk: bytes) -> int:
+    """Base format code of a fmt chunk, resolving WAVE_FORMAT_EXTENSIBLE via its SubFormat GUID."""
+    format_tag = struct.unpack_from("<H", fmt_chunk)[0]
+    if format_tag != WAVE_FORMAT_EXTENSIBLE:
+        return format_tag
+    if len(fmt_chunk) < 40:
+        raise ValueError("WAVE_FORMAT_EXTENSIBLE fmt chunk is missing its SubFormat")
+    subformat = fmt_chunk[24:40]
+    if subformat[2:] != _SUBFORMAT_GUID_SUFFIX:
+        raise ValueError(f"Unsupported WAV SubFormat {subformat.hex()}")
+    return struct.unpack_from("<H", subformat)[0]
+
+
+def open_wav_memmap(path: str) -> Tuple[np.memmap, float, float, float]:
+    """Memory-map the sample data of a PCM / IEEE-float WAV file (plain or extensible).
+
+    Args:
+        path: WAV file path
+
+    Returns:
+        (samples, sample_rate, offset, scale): samples is a read-only
+        (frames, channels) memmap of raw values; PCM in [-1, 1] is
+        (samples - offset) / scale.
+    """
+    with open(path, "rb") as f:
+        riff, _, wave = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError(f"{path} is not a RIFF/WAVE file")
+
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path} has no data chunk")
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                fmt_chunk = f.read(chunk_size)
+                fmt = struct.unpack_from("<HHIIHH", fmt_chunk)
+                f.seek(chunk_size & 1, 1)
+            elif chunk_id == b"data":
+                data_offset = f.tell()
+                data_size = chunk_size
+                break
+            else:
+                f.seek(chunk_size + (chunk_size & 1), 1)
+
+    if fmt is None:
+        raise ValueError(f"{path} has no fmt chunk")
+    _, channels, sample_rate, _, block_align, bits = fmt
+    format_tag = _wav_format_code(fmt_chunk)
+    width = bits // 8
+
+    if format_tag == WAVE_FORMAT_IEEE_FLOAT and width in (4, 8):
+        dtype, offset, scale = (np.float32 if width == 4 else np.float64), 0.0, 1.0
+    elif format_tag == WAVE_FORMAT_PCM and width in _PCM_SCALES:
+        dtype, offset, scale = _PCM_SCALES[width]
+    else:
+        raise ValueError(f"Unsupported WAV encoding: format {format_tag}, {bits} bits")
+
+    frames = data_size // block_align
+    samples = np.memmap(path, dtype=np.dtype(dtype).newbyteorder("<"), mode="r",
+                        offset=data_offset, shape=(frames, channels))
+    return samples, float(sample_rate), offset, scale
+
+
+def iter_wav_blocks(path: str, block_size: int = 65536) -> Iterator[np.ndarray]:
+    """Yield (block_size, channels) float blocks in [-1, 1] from a memory-mapped WAV."""
+    samples, _, offset, scale = open_wav_memmap(path)
+    for start in range(0, len(samples), block_size):
+        yield (samples[start:start + block_size] - offset) / scale
+
+
+def coherence_from_wav(
+    path: str,
+    fft_size: int = 2048,
+    hop_size: Optional[int] = None,
+    block_size: int = 65536
+) -> Tuple[np.ndarray, np.ndarray]:
+    """C_audio per hop for a whole WAV file, streamed through a memory map.
+
+    Returns:
+        (times, c_audio): frame start times in seconds and coherence values
+    """
+    _, sample_rate, _, _ = open_wav_memmap(path)
+    engine = StreamingCoherenceEngine(fft_size, sample_rate, hop_size)
+    c_audio = engine.process_all(iter_wav_blocks(path, block_size))
+    return engine.frame_times(len(c_audio)), c_audio
@@ -0,0 +1,417 @@
+"""
+Parallel Sweep Runner for the Unified FSCTF Action
+
+Evaluates the Lagrangian density (and optionally the Euler-Lagrange residual)
+of UnifiedFSCTFAction over many FieldConfigurations:
+
+- Configurations are consumed lazily in fixed-size chunks, so grids of 10⁴+
+  points never have to be materialised at once.
+- Each worker process builds one action whose FIRM metric has its LRU cache
+  enabled. Every configuration in a sweep usually shares the same attractor
+  A∞, so its Grace iterate chain and FIRM norm are computed once per worker
+  instead of once per Lagrangian evaluation.
+- Every configuration seeds NumPy's global RNG from SeedSequence(seed)
+  spawned at its index in the sweep, so results depend on neither the
+  number of workers nor the chunk size.
+- Results are streamed, in input order, to a columnar directory: one raw
+  little-endian float64 file per column plus schema.json. Columns can be
+  memory-mapped back with load_sweep_columns().
+
+Usage:
+    runner = ActionSweepRunner(workers=8, chunk_size=64, seed=0)
+    grid = configuration_grid(base, coherence_field=psi_values, metric=metrics)
+    result = runner.run(grid, Psi_dot, output_path="sweeps/landscape")
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from itertools import islice, product
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+import json
+import os
+
+import numpy as np
+
+try:
+    from .atomic_io import atomic_open, fsync_directory
+    from .unified_action import UnifiedFSCTFAction, FieldConfiguration
+except ImportError:
+    from atomic_io import atomic_open, fsync_directory
+    from unified_action import UnifiedFSCTFAction, FieldConfiguration
+
+
+LAGRANGIAN_COLUMNS = (
+    "index",
+    "gradient_term",
+    "categorical_term",
+    "info_geom_term",
+    "coupling_term",
+    "total",
+)
+RESIDUAL_COLUMNS = ("Psi_residual",)
+
+
+# ============================================================================
+# Configuration Grids
+# ============================================================================
+
+def configuration_grid(
+    base: FieldConfiguration,
+    **axes: Sequence[np.ndarray]
+) -> Iterator[FieldConfiguration]:
+    """
+    Lazily enumerate the Cartesian product of field values around a base point.
+
+    Args:
+        base: Configuration supplying every field not swept
+        **axes: FieldConfiguration field name -> values to sweep, e.g.
+            coherence_field=[Ψ_1, Ψ_2], metric=[g_1, g_2, g_3]
+
+    Yields:
+        FieldConfiguration for each combination (last axis varies fastest)
+    """
+    names = list(axes)
+    for values in product(*(axes[name] for name in names)):
+        yield replace(base, **dict(zip(names, values)))
+
+
+# ============================================================================
+# Columnar Output
+# ============================================================================
+
+class ColumnarSweepWriter:
+    """
+    Append-only columnar output: <path>/<column>.f64 plus <path>/schema.json.
+
+    schema.json is rewritten after every chunk, so a sweep interrupted midway
+    still leaves a readable prefix of rows. Passing resume_rows reopens an
+    existing output, drops any rows past that count and appends after them.
+    """
+
+    def __init__(self, path: str, columns: Sequence[str], resume_rows: Optional[int] = None):
+        self.path = path
+        self.columns = list(columns)
+        self.rows = 0 if resume_rows is None else resume_rows
+        os.makedirs(path, exist_ok=True)
+        self._files = {}
+        for name in self.columns:
+            filename = os.path.join(path, f"{name}.f64")
+            if resume_rows is None or not os.path.exists(filename):
+                handle = open(filename, "wb")
+            else:
+                handle = open(filename, "r+b")
+            if resume_rows is not None:
+                handle.truncate(resume_rows * 8)
+                handle.seek(0, os.SEEK_END)
+            self._files[name] = handle
+        self._write_schema()
+
+    def append(self, chunk: Dict[str, np.ndarray]):
+        """Append one chunk of rows (all columns must have equal length)."""
+        lengths = {len(chunk[name]) for name in self.columns}
+        if len(lengths) != 1:
+            raise ValueError(f"Columns have mismatched lengths: {sorted(lengths)}")
+        for name in self.columns:
+            handle = self._files[name]
+            np.asarray(chunk[name], dtype="<f8").tofile(handle)
+            handle.flush()
+        self.rows += lengths.pop()
+        self._write_schema()
+
+    def sync(self):
+        """Force every appended row to disk (fsync the column files and directory)."""
+        for handle in self._files.values():
+            handle.flush()
+            os.fsync(handle.fileno())
+        fsync_directory(self.path)
+
+    def close(self):
+        for handle in self._files.values():
+            handle.close()
+        self._write_schema()
+
+    def _write_schema(self):
+        schema = {"columns": self.columns, "dtype": "<f8", "rows": self.rows}
+        with atomic_open(os.path.join(self.path, "schema.json"), "w") as f:
+            json.dump(schema, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_sweep_columns(path: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Read a sweep written by ColumnarSweepWriter.
+
+    Args:
+        path: Output directory
+        mmap: Memory-map the columns instead of reading them into memory
+
+    Returns:
+        Column name -> 1-D float64 array
+    """
+    with open(os.path.join(path, "schema.json")) as f:
+        schema = json.load(f)
+
+    columns = {}
+    for name in schema["columns"]:
+        filename = os.path.join(path, f"{name}.f64")
+        if mmap and schema["rows"] > 0:
+            columns[name] = np.memmap(filename, dtype=schema["dtype"], mode="r", shape=(schema["rows"],))
+        else:
+            columns[name] = np.fromfile(filename, dtype=schema["dtype"], count=schema["rows"])
+    return columns
+
+
+# ============================================================================
+# Sweep Runner
+# ============================================================================
+
+@dataclass
+class SweepResult:
+    """Result of a configuration sweep."""
+    num_points: int
+    num_chunks: int
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)  # Empty if not collected
+    output_path: Optional[str] = None
+
+
+@dataclass
+class _SweepChunk:
+    """One unit of scheduled work."""
+    chunk_index: int
+    root_seed: int
+    start: int
+    configs: List[FieldConfiguration]
+    time_derivatives: List[np.ndarray]
+
+
+# Per-process action, built once by the pool initializer
+_WORKER_ACTION: Optional[UnifiedFSCTFAction] = None
+
+
+def point_seed(root_seed: int, index: int) -> int:
+    """Seed for the configuration at position `index` of a sweep."""
+    return int(np.random.SeedSequence(root_seed, spawn_key=(index,)).generate_state(1)[0])
+
+
+def _build_action(
+    action_factory: Callable[[], UnifiedFSCTFAction],
+    firm_cache_size: int
+) -> UnifiedFSCTFAction:
+    action = action_factory()
+    if firm_cache_size > 0:
+        action.firm.enable_cache(firm_cache_size)
+    return action
+
+
+def _init_worker(action_factory, firm_cache_size):
+    global _WORKER_ACTION
+    _WORKER_ACTION = _build_action(action_factory, firm_cache_size)
+
+
+def _evaluate_chunk(
+    action: UnifiedFSCTFAction,
+    chunk: _SweepChunk,
+    residuals: bool,
+    epsilon: float
+) -> Dict[str, np.ndarray]:
+    """Lagrangian components (and residuals) for every point of a chunk."""
+    size = len(chunk.configs)
+    columns = LAGRANGIAN_COLUMNS + (RESIDUAL_COLUMNS if residuals else ())
+    out = {name: np.empty(size) for name in columns}
+    out["index"][:] = np.arange(chunk.start, chunk.start + size)
+
+    for row, (config, Psi_dot) in enumerate(zip(chunk.configs, chunk.time_derivatives)):
+        np.random.seed(point_seed(chunk.root_seed, chunk.start + row))
+        lagrangian = action.compute_lagrangian_density(config, Psi_dot)
+        out["gradient_term"][row] = lagrangian.gradient_term
+        out["categorical_term"][row] = lagrangian.categorical_term
+        out["info_geom_term"][row] = lagrangian.info_geom_term
+        out["coupling_term"][row] = lagrangian.coupling_term
+        out["total"][row] = lagrangian.total
+
+        if residuals:
+            el = action.compute_euler_lagrange_residual(
+                config, Psi_dot, np.zeros_like(Psi_dot), epsilon=epsilon, lagrangian=lagrangian
+            )
+            out["Psi_residual"][row] = el["Psi_residual"]
+
+    return out
+
+
+def _evaluate_chunk_in_worker(args) -> Dict[str, np.ndarray]:
+    chunk, residuals, epsilon = args
+    return _evaluate_chunk(_WORKER_ACTION, chunk, residuals, epsilon)
+
+
+class ActionSweepRunner:
+    """
+    Evaluate the unified action over a stream of field configurations.
+
+    Results are identical for any worker count and chunk size: the FIRM cache
+    returns exactly the uncached values and seeding is per configuration index.
+    """
+
+    def __init__(
+        self,
+        action_factory: Callable[[], UnifiedFSCTFAction] = UnifiedFSCTFAction,
+        workers: Optional[int] = None,
+        chunk_size: int = 64,
+        seed: int = 0,
+        firm_cache_size: int = 1024,
+        compute_residuals: bool = True,
+        residual_epsilon: float = 1e-6
+    ):
+        """
+        Initialize sweep runner.
+
+        Args:
+            action_factory: Picklable zero-argument callable building the action
+                (a class or module-level function)
+            workers: Worker processes (None or 1 = evaluate in this process)
+            chunk_size: Configurations per scheduled chunk
+            seed: Root seed for per-configuration RNG seeding
+            firm_cache_size: FIRM LRU size per worker (0 disables iterate sharing)
+            compute_residuals: Also compute the Euler-Lagrange residual
+            residual_epsilon: Finite difference step for the residual
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.action_factory = action_factory
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.firm_cache_size = firm_cache_size
+        self.compute_residuals = compute_residuals
+        self.residual_epsilon = residual_epsilon
+        self._local_action: Optional[UnifiedFSCTFAction] = None
+
+    @property
+    def columns(self) -> tuple:
+        """Output columns, in file order."""
+        return LAGRANGIAN_COLUMNS + (RESIDUAL_COLUMNS if self.compute_residuals else ())
+
+    def run(
+        self,
+        configs: Iterable[FieldConfiguration],
+        time_derivatives: Union[np.ndarray, Iterable[np.ndarray]],
+        output_path: Optional[str] = None,
+        collect: bool = True
+    ) -> SweepResult:
+        """
+        Evaluate every configuration.
+
+        Args:
+            configs: Field configurations (any iterable, consumed lazily)
+            time_derivatives: One ∂_t Ψ shared by all points, or one per point
+            output_path: Directory to stream columnar results into
+            collect: Also return the columns in memory
+
+        Returns:
+            SweepResult (columns in input order)
+        """
+        writer = ColumnarSweepWriter(output_path, self.columns) if output_path else None
+        collected: Dict[str, List[np.ndarray]] = {name: [] for name in self.columns}
+        num_points = 0
+        num_chunks = 0
+
+        try:
+            for chunk_result in self._stream(self._chunks(configs, time_derivatives)):
+                if writer is not None:
+                    writer.append(chunk_result)
+                if collect:
+                    for name in self.columns:
+                        collected[name].append(chunk_result[name])
+                num_points += len(chunk_result["index"])
+                num_chunks += 1
+        finally:
+            if writer is not None:
+                writer.close()
+
+        columns = {}
+        if collect:
+            columns = {
+                name: np.concatenate(parts) if parts else np.empty(0)
+                for name, parts in collected.items()
+            }
+
+        return SweepResult(
+            num_points=num_points,
+            num_chunks=num_chunks,
+            columns=columns,
+            output_path=output_path
+        )
+
+    # ------------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------------
+
+    def _chunks(
+        self,
+        configs: Iterable[FieldConfiguration],
+        time_derivatives: Union[np.ndarray, Iterable[np.ndarray]]
+    ) -> Iterator[_SweepChunk]:
+        """Group the input stream into chunks."""
+        config_iter = iter(configs)
+        shared = isinstance(time_derivatives, np.ndarray) and time_derivatives.ndim == 2
+        derivative_iter = None if shared else iter(time_derivatives)
+
+        start = 0
+        chunk_index = 0
+        while True:
+            batch = list(islice(config_iter, self.chunk_size))
+            if not batch:
+                return
+            if shared:
+                derivatives = [time_derivatives] * len(batch)
+            else:
+                derivatives = list(islice(derivative_iter, len(batch)))
+                if len(derivatives) != len(batch):
+                    raise ValueError("Fewer time derivatives than configurations")
+
+            yield _SweepChunk(chunk_index, self.seed, start, batch, derivatives)
+            start += len(batch)
+            chunk_index += 1
+
+    def _stream(self, chunks: Iterator[_SweepChunk]) -> Iterator[Dict[str, np.ndarray]]:
+        """Evaluate chunks, yielding results in input order."""
+        if not self.workers or self.workers <= 1:
+            if self._local_action is None:
+                self._local_action = _build_action(self.action_factory, self.firm_cache_size)
+            for chunk in chunks:
+                yield _evaluate_chunk(self._local_action, chunk, self.compute_residuals,
+                                      self.residual_epsilon)
+            return
+
+        # Bounded in-flight window keeps memory flat for arbitrarily long sweeps
+        max_pending = 2 * self.workers
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.action_factory, self.firm_cache_size)
+        ) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(
+                    _evaluate_chunk_in_worker,
+                    (chunk, self.compute_residuals, self.residual_epsilon)
+                ))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+__all__ = [
+    "ActionSweepRunner",
+    "SweepResult",
+    "ColumnarSweepWriter",
+    "configuration_grid",
+    "load_sweep_columns",
+    "point_seed",
+]
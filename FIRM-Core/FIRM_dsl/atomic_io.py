@@ -0,0 +1,132 @@
+"""atomic_io.py
+
+Crash-safe file replacement shared by the on-disk writers (provenance
+bundles, sweep tables and memos, evolution checkpoints, dataset caches).
+
+Every file is staged under a unique sibling name (process id plus a random
+token, created exclusively) and moved into place with os.replace, so readers
+see either the previous file or the complete new one, and concurrent or
+repeated writers in one batch never share a staging file.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional
+import os
+import shutil
+import uuid
+
+
+def staging_path(path: str) -> str:
+    """Unique temporary sibling of path (same directory, so os.replace is atomic)."""
+    directory, name = os.path.split(os.fspath(path))
+    return os.path.join(directory, f".{name}.{os.getpid()}-{uuid.uuid4().hex[:12]}.tmp")
+
+
+def fsync_file(path: str) -> None:
+    """Flush an existing file's contents to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(path: str) -> None:
+    """Persist directory entries (renames); no-op where unsupported."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def stage_bytes(path: str, data: bytes) -> str:
+    """Write data to a fresh staging file for path and return its name.
+
+    For two-phase commits: stage everything, then os.replace each staging
+    file onto its destination.
+    """
+    tmp_path = staging_path(path)
+    with open(tmp_path, "xb") as f:
+        f.write(data)
+    return tmp_path
+
+
+@contextmanager
+def atomic_open(path: str, mode: str = "wb", fsync: bool = False) -> Iterator[IO]:
+    """Open a staging file that replaces path when the block exits cleanly.
+
+    Args:
+        path: Destination file
+        mode: "wb" or "w"
+        fsync: Flush the data to disk before the rename
+
+    On an exception the staging file is removed and path is left untouched.
+    """
+    if mode not in ("wb", "w"):
+        raise ValueError(f"mode must be 'wb' or 'w', got {mode!r}")
+    tmp_path = staging_path(path)
+    try:
+        with open(tmp_path, mode.replace("w", "x")) as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        discard(tmp_path)
+        raise
+
+
+def atomic_write(path: str, data: bytes, fsync: bool = False) -> None:
+    """Replace path with data atomically."""
+    with atomic_open(path, "wb", fsync=fsync) as f:
+        f.write(data)
+
+
+@contextmanager
+def atomic_directory(path: str) -> Iterator[str]:
+    """Build a directory under a staging name and move it to path on success.
+
+    Yields the staging directory. If path already exists when the block ends
+    (e.g. another process finished first) the staged copy is discarded.
+    """
+    tmp_dir = staging_path(path)
+    os.makedirs(tmp_dir)
+    try:
+        yield tmp_dir
+        try:
+            os.replace(tmp_dir, path)
+        except OSError:
+            if not os.path.isdir(path):
+                raise
+    finally:
+        if os.path.isdir(tmp_dir):
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def discard(path: Optional[str]) -> None:
+    """Remove a staging file if it still exists."""
+    if path is None:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+__all__ = [
+    "atomic_open",
+    "atomic_write",
+    "atomic_directory",
+    "stage_bytes",
+    "staging_path",
+    "fsync_file",
+    "fsync_directory",
+    "discard",
+]
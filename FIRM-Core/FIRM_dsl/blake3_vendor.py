@@ -3,11 +3,36 @@
 Minimal BLAKE3 implementation or wrapper with dependency injection.
 
 This module provides BLAKE3 hashing with graceful fallback detection.
-No silent substitutions are performed per anti-tuning directive.
+No silent substitutions are performed per anti-tuning directive: when the
+`blake3` package is absent, the vendored engine below computes the same
+BLAKE3 function (verified against the official test vectors), never a
+different hash.
+
+Streaming API:
+    hasher = blake3_hasher(max_threads=4)
+    for block in blocks:
+        hasher.update(block)          # bytes, bytearray, memoryview, ndarray, mmap
+    digest = hasher.hexdigest()
+
+    blake3_hex_file("field_dump.bin")  # memory-mapped, no copy of the file
+
+Vendored engine:
+- Scalar pure-Python compression for partial chunks and parent nodes.
+- NumPy "lane" compression for bulk input: whole 1 KiB chunks are compressed
+  side by side (one uint32 lane per chunk), then aligned power-of-two subtrees
+  are reduced level by level, so only O(log n) chaining values reach the
+  Python-level stack.
+- Lane batches can be spread over a thread pool (NumPy releases the GIL in
+  its ufunc loops) with max_threads > 1.
 """
 from __future__ import annotations
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
 import hashlib
+import mmap
+import os
+
+import numpy as np
 
 
 def try_import_blake3() -> Optional[object]:
@@ -19,25 +44,438 @@ def try_import_blake3() -> Optional[object]:
         return None
 
 
+# =============================================================================
+# BLAKE3 constants
+# =============================================================================
+
+OUT_LEN = 32
+KEY_LEN = 32
+BLOCK_LEN = 64
+CHUNK_LEN = 1024
+
+CHUNK_START = 1 << 0
+CHUNK_END = 1 << 1
+PARENT = 1 << 2
+ROOT = 1 << 3
+KEYED_HASH = 1 << 4
+
+IV = (
+    0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A,
+    0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19,
+)
+MSG_PERMUTATION = (2, 6, 3, 10, 7, 0, 4, 13, 1, 11, 12, 5, 9, 14, 15, 8)
+
+_MASK32 = 0xFFFFFFFF
+
+# Message word order for each of the 7 rounds (permutation applied between rounds)
+_SCHEDULE: List[Tuple[int, ...]] = []
+_order = tuple(range(16))
+for _ in range(7):
+    _SCHEDULE.append(_order)
+    _order = tuple(_order[i] for i in MSG_PERMUTATION)
+del _order
+
+# (a, b, c, d, mx, my) positions of the 8 G applications in a round
+_G_PLAN = (
+    (0, 4, 8, 12, 0, 1), (1, 5, 9, 13, 2, 3), (2, 6, 10, 14, 4, 5), (3, 7, 11, 15, 6, 7),
+    (0, 5, 10, 15, 8, 9), (1, 6, 11, 12, 10, 11), (2, 7, 8, 13, 12, 13), (3, 4, 9, 14, 14, 15),
+)
+
+# Lane batches smaller than this use the scalar path (NumPy overhead dominates)
+_MIN_LANES = 8
+# Chunks per lane batch (bounds temporary memory to ~16 × batch × 4 bytes per array)
+_LANE_BATCH = 8192
+# Small writes are buffered until this many bytes are pending
+_BUFFER_LEN = 1 << 20
+
+
+# =============================================================================
+# Scalar compression
+# =============================================================================
+
+def _compress(cv: Sequence[int], m: Sequence[int], counter: int, block_len: int, flags: int) -> List[int]:
+    """BLAKE3 compression function on Python ints; returns all 16 output words."""
+    s = [
+        cv[0], cv[1], cv[2], cv[3], cv[4], cv[5], cv[6], cv[7],
+        IV[0], IV[1], IV[2], IV[3],
+        counter & _MASK32, (counter >> 32) & _MASK32, block_len, flags,
+    ]
+    for order in _SCHEDULE:
+        for a, b, c, d, x, y in _G_PLAN:
+            sa, sb, sc, sd = s[a], s[b], s[c], s[d]
+            sa = (sa + sb + m[order[x]]) & _MASK32
+            sd ^= sa
+            sd = ((sd >> 16) | (sd << 16)) & _MASK32
+            sc = (sc + sd) & _MASK32
+            sb ^= sc
+            sb = ((sb >> 12) | (sb << 20)) & _MASK32
+            sa = (sa + sb + m[order[y]]) & _MASK32
+            sd ^= sa
+            sd = ((sd >> 8) | (sd << 24)) & _MASK32
+            sc = (sc + sd) & _MASK32
+            sb ^= sc
+            sb = ((sb >> 7) | (sb << 25)) & _MASK32
+            s[a], s[b], s[c], s[d] = sa, sb, sc, sd
+    for i in range(8):
+        s[i] ^= s[i + 8]
+        s[i + 8] ^= cv[i]
+    return s
+
+
+def _words(block: bytes) -> List[int]:
+    """16 little-endian words of a (zero-padded) block."""
+    return list(np.frombuffer(block.ljust(BLOCK_LEN, b"\0"), dtype="<u4").tolist())
+
+
+class _Output:
+    """Inputs of a final compression, from which the root (XOF) bytes are drawn."""
+
+    def __init__(self, cv, block_words, counter, block_len, flags):
+        self.cv = cv
+        self.block_words = block_words
+        self.counter = counter
+        self.block_len = block_len
+        self.flags = flags
+
+    def chaining_value(self) -> List[int]:
+        return _compress(self.cv, self.block_words, self.counter, self.block_len, self.flags)[:8]
+
+    def root_bytes(self, length: int) -> bytes:
+        out = bytearray()
+        block_counter = 0
+        while len(out) < length:
+            words = _compress(self.cv, self.block_words, block_counter, self.block_len,
+                              self.flags | ROOT)
+            out += np.asarray(words, dtype="<u4").tobytes()
+            block_counter += 1
+        return bytes(out[:length])
+
+
+def _chunk_output(key: Sequence[int], data: bytes, chunk_counter: int, flags: int) -> _Output:
+    """Output of one (possibly partial, possibly empty) chunk."""
+    cv = list(key)
+    blocks = [data[i:i + BLOCK_LEN] for i in range(0, len(data), BLOCK_LEN)] or [b""]
+    for index, block in enumerate(blocks[:-1]):
+        start = CHUNK_START if index == 0 else 0
+        cv = _compress(cv, _words(block), chunk_counter, BLOCK_LEN, flags | start)[:8]
+    start = CHUNK_START if len(blocks) == 1 else 0
+    return _Output(cv, _words(blocks[-1]), chunk_counter, len(blocks[-1]), flags | start | CHUNK_END)
+
+
+def _parent_output(left: Sequence[int], right: Sequence[int], key: Sequence[int], flags: int) -> _Output:
+    return _Output(list(key), list(left) + list(right), 0, BLOCK_LEN, flags | PARENT)
+
+
+# =============================================================================
+# Lane (NumPy) compression
+# =============================================================================
+
+def _rotr_inplace(x: np.ndarray, n: int):
+    high = x << np.uint32(32 - n)
+    x >>= np.uint32(n)
+    x |= high
+
+
+def _compress_lanes(cv: np.ndarray, m: np.ndarray, counter: np.ndarray, block_len: int, flags: int) -> np.ndarray:
+    """
+    Compress K independent blocks at once; returns the (8, K) chaining values.
+
+    Args:
+        cv: (8, K) uint32 input chaining values
+        m: (16, K) uint32 message words
+        counter: (K,) uint64 counters
+        block_len: Block length (shared)
+        flags: Domain flags (shared)
+    """
+    lanes = cv.shape[1]
+    s = [cv[i].copy() for i in range(8)]
+    s += [np.full(lanes, IV[i], dtype=np.uint32) for i in range(4)]
+    s += [
+        (counter & _MASK32).astype(np.uint32),
+        (counter >> np.uint64(32)).astype(np.uint32),
+        np.full(lanes, block_len, dtype=np.uint32),
+        np.full(lanes, flags, dtype=np.uint32),
+    ]
+    for order in _SCHEDULE:
+        for a, b, c, d, x, y in _G_PLAN:
+            sa, sb, sc, sd = s[a], s[b], s[c], s[d]
+            sa += sb
+            sa += m[order[x]]
+            sd ^= sa
+            _rotr_inplace(sd, 16)
+            sc += sd
+            sb ^= sc
+            _rotr_inplace(sb, 12)
+            sa += sb
+            sa += m[order[y]]
+            sd ^= sa
+            _rotr_inplace(sd, 8)
+            sc += sd
+            sb ^= sc
+            _rotr_inplace(sb, 7)
+    return np.stack([s[i] ^ s[i + 8] for i in range(8)])
+
+
+def _chunk_cvs_lanes(words: np.ndarray, first_counter: int, key: Sequence[int], flags: int) -> np.ndarray:
+    """(8, K) chaining values of K whole chunks given as (K, 256) uint32 words."""
+    lanes = words.shape[0]
+    cv = np.repeat(np.asarray(key, dtype=np.uint32)[:, None], lanes, axis=1)
+    counter = np.arange(first_counter, first_counter + lanes, dtype=np.uint64)
+    blocks_per_chunk = CHUNK_LEN // BLOCK_LEN
+    for block in range(blocks_per_chunk):
+        m = np.ascontiguousarray(words[:, 16 * block:16 * (block + 1)].T)
+        block_flags = flags
+        if block == 0:
+            block_flags |= CHUNK_START
+        if block == blocks_per_chunk - 1:
+            block_flags |= CHUNK_END
+        cv = _compress_lanes(cv, m, counter, BLOCK_LEN, block_flags)
+    return cv
+
+
+def _chunk_cvs(words: np.ndarray, first_counter: int, key: Sequence[int], flags: int,
+               pool: Optional[ThreadPoolExecutor]) -> np.ndarray:
+    """Chaining values of whole chunks, batched over lanes (and threads)."""
+    lanes = words.shape[0]
+    if lanes < _MIN_LANES:
+        cvs = [
+            _chunk_output(key, words[i].tobytes(), first_counter + i, flags).chaining_value()
+            for i in range(lanes)
+        ]
+        return np.asarray(cvs, dtype=np.uint32).T.reshape(8, lanes)
+
+    starts = range(0, lanes, _LANE_BATCH)
+    jobs = [(words[s:s + _LANE_BATCH], first_counter + s, key, flags) for s in starts]
+    if pool is not None and len(jobs) > 1:
+        parts = list(pool.map(lambda job: _chunk_cvs_lanes(*job), jobs))
+    else:
+        parts = [_chunk_cvs_lanes(*job) for job in jobs]
+    return np.concatenate(parts, axis=1)
+
+
+def _reduce_subtree(cvs: np.ndarray, key: Sequence[int], flags: int) -> List[int]:
+    """Merge a power-of-two run of (8, K) chaining values into its (non-root) parent CV."""
+    while cvs.shape[1] > 1:
+        left, right = cvs[:, 0::2], cvs[:, 1::2]
+        if cvs.shape[1] // 2 < _MIN_LANES:
+            cvs = np.asarray([
+                _parent_output(left[:, i].tolist(), right[:, i].tolist(), key, flags).chaining_value()
+                for i in range(left.shape[1])
+            ], dtype=np.uint32).T
+            continue
+        key_lanes = np.repeat(np.asarray(key, dtype=np.uint32)[:, None], left.shape[1], axis=1)
+        zero = np.zeros(left.shape[1], dtype=np.uint64)
+        cvs = _compress_lanes(key_lanes, np.concatenate([left, right]), zero, BLOCK_LEN, flags | PARENT)
+    return cvs[:, 0].tolist()
+
+
+def _aligned_subtrees(start: int, count: int) -> List[Tuple[int, int]]:
+    """Split chunk range [start, start+count) into aligned power-of-two runs."""
+    runs = []
+    position, end = start, start + count
+    while position < end:
+        size = position & -position if position else 1 << (end - position).bit_length()
+        while size > end - position:
+            size >>= 1
+        runs.append((position, size))
+        position += size
+    return runs
+
+
+# =============================================================================
+# Incremental hasher
+# =============================================================================
+
+class Blake3Hasher:
+    """
+    Incremental BLAKE3 hasher (vendored engine), API-compatible with
+    `blake3.blake3` for update / digest / hexdigest / copy.
+
+    Input is consumed in whole chunks as soon as more data is known to follow;
+    at most one chunk (plus a small write buffer) is ever held back, so hashing
+    a memory-mapped file never copies it.
+    """
+
+    name = "blake3"
+    digest_size = OUT_LEN
+    block_size = BLOCK_LEN
+    AUTO = -1
+
+    def __init__(self, data=None, *, key: Optional[bytes] = None, max_threads: int = 1):
+        """
+        Args:
+            data: Optional initial input
+            key: 32-byte key for keyed hashing mode
+            max_threads: Threads for bulk lane batches (AUTO = CPU count)
+        """
+        if key is not None:
+            key = bytes(key)
+            if len(key) != KEY_LEN:
+                raise ValueError(f"key must be {KEY_LEN} bytes, got {len(key)}")
+            self._key = tuple(np.frombuffer(key, dtype="<u4").tolist())
+            self._flags = KEYED_HASH
+        else:
+            self._key = IV
+            self._flags = 0
+        if max_threads == self.AUTO:
+            max_threads = os.cpu_count() or 1
+        if max_threads < 1:
+            raise ValueError(f"max_threads must be positive or AUTO, got {max_threads}")
+        self.max_threads = max_threads
+
+        self._cv_stack: List[List[int]] = []
+        self._chunks_done = 0          # whole chunks already folded into the stack
+        self._pending = bytearray()    # bytes not yet compressed
+        if data is not None:
+            self.update(data)
+
+    def update(self, data) -> "Blake3Hasher":
+        """Add input (any C-contiguous buffer); returns self."""
+        view = memoryview(data).cast("B")
+
+        if self._pending:
+            if len(self._pending) + len(view) <= _BUFFER_LEN:
+                self._pending += view
+                return self
+            # Complete the buffered chunks, then stream the rest directly
+            fill = (-len(self._pending)) % CHUNK_LEN
+            self._pending += view[:fill]
+            view = view[fill:]
+            if not view:
+                return self
+            self._consume_chunks(self._pending)
+            self._pending = bytearray()
+
+        # Always hold back at least one byte: the last chunk may be the root
+        whole = (len(view) - 1) // CHUNK_LEN * CHUNK_LEN if view else 0
+        if whole:
+            self._consume_chunks(view[:whole])
+        self._pending += view[whole:]
+        return self
+
+    def update_file(self, path: str) -> "Blake3Hasher":
+        """Hash a file through a read-only memory map (no copy)."""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return self
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    self.update(view)
+                finally:
+                    view.release()
+        return self
+
+    def copy(self) -> "Blake3Hasher":
+        """Independent hasher with the same state."""
+        clone = Blake3Hasher.__new__(Blake3Hasher)
+        clone._key = self._key
+        clone._flags = self._flags
+        clone.max_threads = self.max_threads
+        clone._cv_stack = [list(cv) for cv in self._cv_stack]
+        clone._chunks_done = self._chunks_done
+        clone._pending = bytearray(self._pending)
+        return clone
+
+    def digest(self, length: int = OUT_LEN) -> bytes:
+        """Finalize (non-destructively) and return `length` output bytes."""
+        pending = bytes(self._pending)
+        counter = self._chunks_done
+        stack = [list(cv) for cv in self._cv_stack]
+
+        # Whole buffered chunks ahead of the last one are ordinary chunks
+        head = (len(pending) - 1) // CHUNK_LEN * CHUNK_LEN if pending else 0
+        for offset in range(0, head, CHUNK_LEN):
+            cv = _chunk_output(self._key, pending[offset:offset + CHUNK_LEN], counter, self._flags).chaining_value()
+            self._push_cv(stack, cv, counter)
+            counter += 1
+        self._merge_stack(stack, counter)
+
+        output = _chunk_output(self._key, pending[head:], counter, self._flags)
+        for cv in reversed(stack):
+            output = _parent_output(cv, output.chaining_value(), self._key, self._flags)
+        return output.root_bytes(length)
+
+    def hexdigest(self, length: int = OUT_LEN) -> str:
+        return self.digest(length).hex()
+
+    # ------------------------------------------------------------------
+    # Tree maintenance
+    # ------------------------------------------------------------------
+
+    def _consume_chunks(self, data):
+        """Fold whole chunks (known not to be the final chunk) into the CV stack."""
+        words = np.frombuffer(data, dtype="<u4").reshape(-1, CHUNK_LEN // 4)
+        count = words.shape[0]
+        threads = min(self.max_threads, -(-count // _LANE_BATCH))
+        pool = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+        try:
+            offset = 0
+            for start, size in _aligned_subtrees(self._chunks_done, count):
+                cvs = _chunk_cvs(words[offset:offset + size], start, self._key, self._flags, pool)
+                self._push_cv(self._cv_stack, _reduce_subtree(cvs, self._key, self._flags), start)
+                offset += size
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self._chunks_done += count
+
+    def _push_cv(self, stack: List[List[int]], cv: List[int], start_chunk: int):
+        """Push the CV of an aligned subtree starting at chunk `start_chunk`."""
+        self._merge_stack(stack, start_chunk)
+        stack.append(cv)
+
+    def _merge_stack(self, stack: List[List[int]], total_chunks: int):
+        """Lazily merge until the stack holds one CV per set bit of total_chunks."""
+        while len(stack) > bin(total_chunks).count("1"):
+            right = stack.pop()
+            left = stack.pop()
+            stack.append(_parent_output(left, right, self._key, self._flags).chaining_value())
+
+
+# =============================================================================
+# Public helpers
+# =============================================================================
+
+def blake3_hasher(key: Optional[bytes] = None, max_threads: int = 1):
+    """Incremental BLAKE3 hasher: the `blake3` package if present, else vendored.
+
+    Both expose update(buffer) / digest() / hexdigest() and produce identical
+    digests.
+    """
+    blake3_mod = try_import_blake3()
+    if blake3_mod is not None:
+        if max_threads == Blake3Hasher.AUTO:
+            max_threads = blake3_mod.blake3.AUTO
+        return blake3_mod.blake3(key=key, max_threads=max_threads)
+    return Blake3Hasher(key=key, max_threads=max_threads)
+
+
 def blake3_hex(data: bytes) -> str:
     """Compute BLAKE3 hex digest with dependency detection.
-    
-    This function attempts to use the blake3 package if available.
-    If not available, it raises NotImplementedError with clear guidance.
-    No silent fallback to other hash functions is performed.
+
+    Uses the blake3 package if available and the vendored engine otherwise.
+    Both compute BLAKE3; no other hash function is ever substituted.
     """
-    blake3_mod = try_import_blake3()
-    if blake3_mod is None:
-        raise NotImplementedError(
-            "BLAKE3 not available. Install with: pip install blake3\n"
-            "Or add blake3 to optional dependencies: pip install -e '.[blake3]'"
-        )
-    
-    hasher = blake3_mod.blake3()
+    hasher = blake3_hasher()
     hasher.update(data)
     return hasher.hexdigest()
 
 
+def blake3_hex_file(path: str, max_threads: int = 1) -> str:
+    """BLAKE3 hex digest of a file, hashed through a memory map."""
+    hasher = blake3_hasher(max_threads=max_threads)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    hasher.update(view)
+                finally:
+                    view.release()
+    return hasher.hexdigest()
+
+
 def create_test_blake3_function() -> callable:
     """Create a deterministic test hash function for CI/testing.
     
@@ -27,7 +27,7 @@ Physical interpretation:
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Sequence
 from enum import Enum
 import numpy as np
 
@@ -146,6 +146,13 @@ class FSCTFCategory:
     - Composition: (g ∘ f) with φ-scaling
     - Grace: Endofunctor 𝒢: 𝓒 → 𝓒
     
+    Hom-values, FIRM norms, limits and colimits are evaluated by a batched
+    engine: Grace iterates 𝒢ⁿ(Ψ) are computed for all objects at once with
+    GraceOperator.apply_batch, cached per object, and each φ-weighted series
+    term for a whole block of Hom-values is one matrix product of the
+    flattened iterates. Every entry stops accumulating exactly when the
+    scalar FIRM series would, so results match FIRMMetric.inner_product.
+    
     Axioms:
     1. Associativity: (h ∘ g) ∘ f = h ∘ (g ∘ f)
     2. Identity: f ∘ id = f = id ∘ f
@@ -173,6 +180,9 @@ class FSCTFCategory:
         
         self.objects: Dict[str, MonadObject] = {}
         self.morphisms: List[CoherenceMorphism] = []
+        
+        # Grace iterate chains [Ψ, 𝒢(Ψ), 𝒢²(Ψ), ...] keyed by id(object)
+        self._iterate_cache: Dict[int, Tuple[MonadObject, List[np.ndarray]]] = {}
     
     # ------------------------------------------------------------------------
     # Object Management
@@ -189,17 +199,38 @@ class FSCTFCategory:
         Returns:
             MonadObject instance
         """
-        # Compute FIRM norm
-        norm_result = self.firm.norm(state)
+        return self.add_objects([state], [name])[0]
+    
+    def add_objects(self, states: Sequence[np.ndarray], names: Sequence[str]) -> List[MonadObject]:
+        """
+        Add several objects, computing their FIRM norms in one batch.
         
-        obj = MonadObject(
-            state=state.copy(),
-            name=name,
-            norm_firm=norm_result.norm
-        )
+        Args:
+            states: Coherence fields Ψ_i
+            names: Labels (same length as states)
         
-        self.objects[name] = obj
-        return obj
+        Returns:
+            List of MonadObject instances
+        """
+        if len(states) != len(names):
+            raise ValueError(f"Got {len(states)} states but {len(names)} names")
+        
+        objs = [MonadObject(state=state.copy(), name=name, norm_firm=0.0)
+                for state, name in zip(states, names)]
+        
+        # ‖Ψ‖²_{φ,𝒢} is the diagonal of the Hom-matrix
+        norms_squared = self._hom_diagonal(objs).real
+        if np.any(norms_squared < 0):
+            raise ValueError(f"FIRM norm squared is negative: {norms_squared.min():.6e}")
+        
+        for obj, norm_sq in zip(objs, norms_squared):
+            obj.norm_firm = float(np.sqrt(norm_sq))
+            previous = self.objects.get(obj.name)
+            if previous is not None:
+                self._iterate_cache.pop(id(previous), None)
+            self.objects[obj.name] = obj
+        
+        return objs
     
     def get_object(self, name: str) -> Optional[MonadObject]:
         """Retrieve object by name."""
@@ -304,18 +335,138 @@ class FSCTFCategory:
         """
         Compute full Hom-matrix for a list of objects.
         
+        Only the upper triangle is evaluated; the lower triangle follows from
+        Hermitian symmetry Hom(Ψ_j, Ψ_i) = conj(Hom(Ψ_i, Ψ_j)), and the
+        diagonal ⟨Ψ, Ψ⟩ is real.
+        
         Returns:
             N×N matrix H where H[i,j] = Hom(obj[i], obj[j])
         """
         n = len(objects)
-        H = np.zeros((n, n), dtype=complex)
+        if n == 0:
+            return np.zeros((0, 0), dtype=complex)
+        
+        upper = np.triu(np.ones((n, n), dtype=bool))
+        H = self._hom_series(objects, objects, upper)
+        strict_upper = np.triu(H, 1)
+        return strict_upper + strict_upper.conj().T + np.diag(H.diagonal().real)
+    
+    def hom_block(
+        self,
+        sources: List[MonadObject],
+        targets: List[MonadObject]
+    ) -> np.ndarray:
+        """
+        Compute Hom-values between two lists of objects in one batch.
+        
+        Returns:
+            S×T matrix H where H[i,j] = Hom(sources[i], targets[j])
+        """
+        mask = np.ones((len(sources), len(targets)), dtype=bool)
+        return self._hom_series(sources, targets, mask)
+    
+    def clear_iterate_cache(self):
+        """Drop cached Grace iterates (call if the Grace operator changes)."""
+        self._iterate_cache.clear()
+    
+    # ------------------------------------------------------------------------
+    # Batched Hom Engine
+    # ------------------------------------------------------------------------
+    
+    def _iterate_chain(self, obj: MonadObject) -> List[np.ndarray]:
+        """Cached iterate chain of an object (starts as [Ψ])."""
+        entry = self._iterate_cache.get(id(obj))
+        if entry is None or entry[0] is not obj:
+            entry = (obj, [obj.state])
+            self._iterate_cache[id(obj)] = entry
+        return entry[1]
+    
+    def _iterates(self, objects: Sequence[MonadObject], k: int) -> np.ndarray:
+        """
+        Stack 𝒢ᵏ(Ψ_i) for all objects as an (N, d²) array.
+        
+        Missing iterates are produced with one batched Grace application per
+        level for every object whose chain is too short.
+        """
+        chains = [self._iterate_chain(obj) for obj in objects]
+        
+        pending = {id(chain): chain for chain in chains if len(chain) <= k}
+        while pending:
+            stale = list(pending.values())
+            outputs = self.firm.grace.apply_batch(np.stack([chain[-1] for chain in stale]))
+            for chain, output in zip(stale, outputs):
+                chain.append(output)
+            pending = {key: chain for key, chain in pending.items() if len(chain) <= k}
+        
+        return np.stack([chain[k] for chain in chains]).reshape(len(chains), -1)
+    
+    def _hom_series(
+        self,
+        sources: Sequence[MonadObject],
+        targets: Sequence[MonadObject],
+        mask: np.ndarray
+    ) -> np.ndarray:
+        """
+        φ-weighted Grace series for every masked (source, target) pair.
+        
+        Term n of the whole block is φ⁻ⁿ conj(Xₙ) Yₙᵀ with Xₙ, Yₙ the
+        flattened iterates. Each entry stops after its first term with
+        magnitude below the FIRM tolerance, as in FIRMMetric.inner_product.
+        Entries outside the mask are left at zero.
+        """
+        H = np.zeros(mask.shape, dtype=complex)
+        active = mask.copy()
+        phi_power = 1.0
+        
+        for n in range(self.firm.max_terms):
+            rows = np.flatnonzero(active.any(axis=1))
+            cols = np.flatnonzero(active.any(axis=0))
+            if rows.size == 0:
+                break
+            
+            X = self._iterates([sources[i] for i in rows], n)
+            Y = self._iterates([targets[j] for j in cols], n)
+            term = (X.conj() @ Y.T) / phi_power
+            
+            block = np.ix_(rows, cols)
+            block_active = active[block]
+            H[block] += np.where(block_active, term, 0)
+            active[block] = block_active & (np.abs(term) >= self.firm.tolerance)
+            
+            phi_power *= PHI
         
-        for i, obj_i in enumerate(objects):
-            for j, obj_j in enumerate(objects):
-                H[i, j] = self.hom(obj_i, obj_j)
+        unconverged = int(np.count_nonzero(active))
+        if unconverged:
+            print(f"⚠️  FIRM series did not converge in {self.firm.max_terms} terms "
+                  f"for {unconverged} Hom entries")
         
         return H
     
+    def _hom_diagonal(self, objects: Sequence[MonadObject]) -> np.ndarray:
+        """Hom(Ψ_i, Ψ_i) for each object without forming the full matrix."""
+        values = np.zeros(len(objects), dtype=complex)
+        active = np.ones(len(objects), dtype=bool)
+        phi_power = 1.0
+        
+        for n in range(self.firm.max_terms):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+            
+            X = self._iterates([objects[i] for i in idx], n)
+            term = np.einsum('ij,ij->i', X.conj(), X) / phi_power
+            values[idx] += term
+            active[idx] = np.abs(term) >= self.firm.tolerance
+            
+            phi_power *= PHI
+        
+        unconverged = int(np.count_nonzero(active))
+        if unconverged:
+            print(f"⚠️  FIRM series did not converge in {self.firm.max_terms} terms "
+                  f"for {unconverged} norms")
+        
+        return values
+    
     # ------------------------------------------------------------------------
     # Grace Endofunctor
     # ------------------------------------------------------------------------
@@ -436,15 +587,10 @@ class FSCTFCategory:
         
         # Initialize limit as weighted average
         n = objects[0].dimension
-        limit_state = np.zeros((n, n), dtype=complex)
-        total_weight = 0.0
-        
-        for obj in objects:
-            weight = obj.norm_firm
-            limit_state += weight * obj.state
-            total_weight += weight
-        
-        limit_state /= total_weight
+        weights = np.array([obj.norm_firm for obj in objects])
+        states = np.stack([obj.state for obj in objects])
+        limit_state = np.tensordot(weights, states, axes=1).astype(complex)
+        limit_state /= weights.sum()
         
         # Converge to coherent core via Grace
         for iteration in range(max_iterations):
@@ -461,14 +607,16 @@ class FSCTFCategory:
         # Create limit object
         limit_obj = self.add_object(limit_state, name="Limit")
         
+        # Resonance = alignment, for all projections in one batch
+        resonances = self.hom_block([limit_obj], objects)[0]
+        
         # Create projection morphisms π_i: L → Ψ_i
         projections = []
         for i, obj in enumerate(objects):
             # Projection operator (simplified: identity with scaling)
             proj_op = np.eye(n, dtype=complex)
             
-            # Resonance = alignment
-            resonance = self.hom(limit_obj, obj)
+            resonance = resonances[i]
             
             proj = CoherenceMorphism(
                 source=limit_obj,
@@ -508,13 +656,10 @@ class FSCTFCategory:
         # Compute colimit as weighted sum in original space (not direct sum)
         # This represents the "harvest" - compression to shared patterns
         n = objects[0].dimension
-        colimit_state = np.zeros((n, n), dtype=complex)
-        total_weight = 0.0
-        
-        for obj in objects:
-            weight = obj.norm_firm if obj.norm_firm > 0 else 1.0
-            colimit_state += weight * obj.state
-            total_weight += weight
+        weights = np.array([obj.norm_firm if obj.norm_firm > 0 else 1.0 for obj in objects])
+        states = np.stack([obj.state for obj in objects])
+        colimit_state = np.tensordot(weights, states, axes=1).astype(complex)
+        total_weight = weights.sum()
         
         if total_weight > 0:
             colimit_state /= total_weight
@@ -526,6 +671,9 @@ class FSCTFCategory:
         # Create colimit object
         colimit_obj = self.add_object(colimit_state, name="Colimit")
         
+        # Resonances of all injections in one batch
+        resonances = self.hom_block(objects, [colimit_obj])[:, 0]
+        
         # Create injection morphisms ι_i: Ψ_i → C
         # These are "forgetful" maps - each monad contributes to colimit
         injections = []
@@ -533,8 +681,7 @@ class FSCTFCategory:
             # Injection operator: identity (both same dimension)
             inj_op = np.eye(n, dtype=complex)
             
-            # Resonance
-            resonance = self.hom(obj, colimit_obj)
+            resonance = resonances[i]
             
             inj = CoherenceMorphism(
                 source=obj,
@@ -92,6 +92,28 @@ PHI_INV = 1 / PHI            # φ⁻¹ ≈ 0.618
 GOLDEN_ANGLE = 2 * np.pi / (PHI * PHI)
 
 
+# ============================================================================
+# ARRAY HELPERS
+# ============================================================================
+
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Cross product over the last axis, with broadcasting.
+    
+    Written out component-wise: for (3,) inputs this avoids np.cross
+    overhead, and for (..., 3) batches it stays a handful of array ops.
+    """
+    a1, a2, a3 = a[..., 0], a[..., 1], a[..., 2]
+    b1, b2, b3 = b[..., 0], b[..., 1], b[..., 2]
+    return np.stack([a2 * b3 - a3 * b2, a3 * b1 - a1 * b3, a1 * b2 - a2 * b1], axis=-1)
+
+
+def _normalize_rows(B: np.ndarray) -> np.ndarray:
+    """Batched Bivector.normalize(): B/|B|, leaving |B| < 1e-10 unchanged."""
+    mag = np.linalg.norm(B, axis=-1, keepdims=True)
+    return np.where(mag < 1e-10, B, B / np.where(mag < 1e-10, 1.0, mag))
+
+
 # ============================================================================
 # BIVECTOR STRUCTURES
 # ============================================================================
@@ -263,10 +285,10 @@ class Rotor:
         B = self.bivector.components
         
         # First cross product
-        BxV = np.cross(B, vector)
+        BxV = _cross(B, vector)
         
         # Second cross product
-        BxBxV = np.cross(B, BxV)
+        BxBxV = _cross(B, BxV)
         
         # Rodrigues formula
         rotated = vector + 2 * s * BxV + 2 * BxBxV
@@ -288,6 +310,172 @@ class Rotor:
         )
 
 
+@dataclass
+class RotorArray:
+    """
+    Array of rotors R_k = s_k + B_k stored as flat arrays.
+    
+    Same algebra as Rotor (scalar cos(θ/2), bivector sin(θ/2) B̂), but with
+    scalar of shape (...) and bivector of shape (..., 3), so sandwich
+    products, composition and sequence scans run as NumPy array
+    operations over whole vector fields instead of per-vector Python calls.
+    Leading dimensions broadcast like ordinary NumPy arrays.
+    """
+    scalar: np.ndarray      # cos(θ/2), shape (...)
+    bivector: np.ndarray    # sin(θ/2) B̂, shape (..., 3)
+    
+    def __post_init__(self):
+        """Coerce to float arrays and validate shapes."""
+        self.scalar = np.asarray(self.scalar, dtype=float)
+        self.bivector = np.asarray(self.bivector, dtype=float)
+        if self.bivector.shape != self.scalar.shape + (3,):
+            raise ValueError(
+                f"bivector shape {self.bivector.shape} does not match "
+                f"scalar shape {self.scalar.shape} + (3,)"
+            )
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Batch shape."""
+        return self.scalar.shape
+    
+    def __len__(self) -> int:
+        return len(self.scalar)
+    
+    def __getitem__(self, index) -> Union['Rotor', 'RotorArray']:
+        """Index like an array; a single element comes back as a Rotor."""
+        scalar = self.scalar[index]
+        bivector = self.bivector[index]
+        if np.ndim(scalar) == 0:
+            return Rotor(scalar=float(scalar), bivector=Bivector(np.array(bivector)))
+        return RotorArray(scalar, bivector)
+    
+    @staticmethod
+    def identity(shape: Union[int, Tuple[int, ...]] = ()) -> 'RotorArray':
+        """Identity rotors R = 1."""
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        return RotorArray(np.ones(shape), np.zeros(shape + (3,)))
+    
+    @staticmethod
+    def from_rotors(rotors: List['Rotor']) -> 'RotorArray':
+        """Pack a list of Rotor objects."""
+        return RotorArray(
+            np.array([R.scalar for R in rotors], dtype=float),
+            np.array([R.bivector.components for R in rotors], dtype=float).reshape(-1, 3),
+        )
+    
+    def to_rotors(self) -> List['Rotor']:
+        """Unpack a 1-D RotorArray into Rotor objects."""
+        return [self[k] for k in range(len(self))]
+    
+    @staticmethod
+    def from_angle_bivector(angles: np.ndarray, bivectors: np.ndarray) -> 'RotorArray':
+        """
+        Batched Rotor.from_angle_bivector: R = cos(θ/2) + sin(θ/2) B̂.
+        
+        Args:
+            angles: Rotation angles, shape (...)
+            bivectors: Rotation planes, shape (..., 3) (normalized here)
+        
+        Returns:
+            RotorArray with the broadcast batch shape
+        """
+        angles = np.asarray(angles, dtype=float)
+        B_hat = _normalize_rows(np.asarray(bivectors, dtype=float))
+        half_angle = angles / 2.0
+        shape = np.broadcast_shapes(half_angle.shape, B_hat.shape[:-1])
+        scalar = np.broadcast_to(np.cos(half_angle), shape).copy()
+        bivector = np.sin(half_angle)[..., None] * B_hat
+        return RotorArray(scalar, np.broadcast_to(bivector, shape + (3,)).copy())
+    
+    @staticmethod
+    def from_vectors(v: np.ndarray, w: np.ndarray) -> 'RotorArray':
+        """
+        Batched Rotor.from_vectors: rotors taking each v to the matching w.
+        
+        Args:
+            v: Initial vectors (..., 3)
+            w: Target vectors (..., 3)
+        
+        Returns:
+            RotorArray R with w ≈ R v R̃ row-wise
+        """
+        v = np.asarray(v, dtype=float)
+        w = np.asarray(w, dtype=float)
+        v_norm = v / (np.linalg.norm(v, axis=-1, keepdims=True) + 1e-10)
+        w_norm = w / (np.linalg.norm(w, axis=-1, keepdims=True) + 1e-10)
+        
+        cos_angle = np.sum(v_norm * w_norm, axis=-1)
+        angle = np.arccos(np.clip(cos_angle, -1.0, 1.0))
+        return RotorArray.from_angle_bivector(angle, _cross(v_norm, w_norm))
+    
+    def compose(self, other: 'RotorArray') -> 'RotorArray':
+        """
+        Batched Rotor.compose: self ∘ other (apply other first).
+        
+        Args:
+            other: RotorArray (or Rotor) broadcastable against self
+        
+        Returns:
+            Combined rotors
+        """
+        if isinstance(other, Rotor):
+            other = RotorArray(np.asarray(other.scalar), other.bivector.components)
+        s1, B1 = self.scalar, self.bivector
+        s2, B2 = other.scalar, other.bivector
+        
+        scalar = s1 * s2 - np.sum(B1 * B2, axis=-1)
+        bivector = s1[..., None] * B2 + s2[..., None] * B1 + _cross(B1, B2)
+        return RotorArray(scalar, bivector)
+    
+    def inverse(self) -> 'RotorArray':
+        """Batched reverse R̃ = s - B."""
+        return RotorArray(self.scalar.copy(), -self.bivector)
+    
+    def apply(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Batched sandwich product v' = R v R̃ (Rodrigues form).
+        
+        Args:
+            vectors: (..., 3), broadcast against the rotor batch shape
+        
+        Returns:
+            Rotated vectors with the broadcast shape
+        """
+        vectors = np.asarray(vectors, dtype=float)
+        if vectors.shape[-1] != 3:
+            raise ValueError("Only 3D vectors supported")
+        
+        s = self.scalar[..., None]
+        B = self.bivector
+        BxV = _cross(B, vectors)
+        return vectors + 2 * s * BxV + 2 * _cross(B, BxV)
+    
+    def scan(self) -> 'RotorArray':
+        """
+        Cumulative composition along the first axis.
+        
+        out[k] = R_k ∘ R_{k-1} ∘ ... ∘ R_0, i.e. the net rotor after applying
+        R_0 first through R_k last. Uses a Hillis-Steele prefix scan, so
+        only ⌈log₂ M⌉ vectorized compose steps are executed.
+        
+        Returns:
+            RotorArray of the same shape
+        """
+        scalar = self.scalar.copy()
+        bivector = self.bivector.copy()
+        M = len(scalar)
+        offset = 1
+        while offset < M:
+            later = RotorArray(scalar[offset:], bivector[offset:])
+            earlier = RotorArray(scalar[:-offset], bivector[:-offset])
+            combined = later.compose(earlier)
+            scalar[offset:] = combined.scalar
+            bivector[offset:] = combined.bivector
+            offset *= 2
+        return RotorArray(scalar, bivector)
+
+
 # ============================================================================
 # GRACE ROTOR
 # ============================================================================
@@ -371,6 +559,51 @@ class GraceRotor:
         # Create and apply rotor
         R = Rotor.from_angle_bivector(angle, B)
         return R.apply(state)
+    
+    def compute_grace_bivectors(
+        self,
+        states: np.ndarray,
+        ground_state: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Batched compute_grace_bivector for states of shape (..., 3).
+        
+        Returns:
+            Bivector components (..., 3)
+        """
+        states = np.asarray(states, dtype=float)
+        if ground_state is not None:
+            return _cross(states, np.asarray(ground_state, dtype=float))
+        
+        norm = np.linalg.norm(states, axis=-1, keepdims=True)
+        safe_norm = np.where(norm < 1e-10, 1.0, norm)
+        
+        # Canonical z ground state, switching to x when already along z
+        along_z = np.abs(states[..., 2:3] / safe_norm) > 0.99
+        ground = np.where(along_z, [1.0, 0.0, 0.0], [0.0, 0.0, 1.0])
+        
+        return np.where(norm < 1e-10, 0.0, _cross(states, ground))
+    
+    def apply_grace_batch(
+        self,
+        states: np.ndarray,
+        dt: float = 0.01,
+        ground_state: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Apply Grace rotation to a whole field of states (..., 3) at once.
+        
+        Args:
+            states: State vectors (..., 3)
+            dt: Time step
+            ground_state: Target ground state (shared by all states)
+        
+        Returns:
+            States after Grace rotation
+        """
+        B = self.compute_grace_bivectors(states, ground_state)
+        R = RotorArray.from_angle_bivector(self.grace_strength * dt, B)
+        return R.apply(states)
 
 
 # ============================================================================
@@ -444,6 +677,36 @@ class LoveRotor:
         # Create partial rotor
         R_partial = Rotor.from_angle_bivector(angle_partial, R_full.bivector)
         return R_partial.apply(state)
+    
+    def apply_love_batch(
+        self,
+        states: np.ndarray,
+        targets: np.ndarray,
+        dt: float = 0.01,
+        full_alignment: bool = False
+    ) -> np.ndarray:
+        """
+        Apply Love rotation to states (..., 3) toward targets (..., 3).
+        
+        Args:
+            states: Current states
+            targets: Target states (broadcast against states)
+            dt: Time step
+            full_alignment: If True, fully align; else partial
+        
+        Returns:
+            States after Love rotation
+        """
+        R_full = RotorArray.from_vectors(states, targets)
+        
+        if full_alignment:
+            return R_full.apply(states)
+        
+        angle_full = 2 * np.arccos(np.clip(R_full.scalar, -1.0, 1.0))
+        angle_partial = angle_full * self.love_strength * dt
+        
+        R_partial = RotorArray.from_angle_bivector(angle_partial, R_full.bivector)
+        return R_partial.apply(states)
 
 
 # ============================================================================
@@ -515,6 +778,29 @@ class ForgivenessRotor:
         R = self.compute_neutralization_rotor(B)
         
         return R.apply(state)
+    
+    def apply_forgiveness_batch(
+        self,
+        states: np.ndarray,
+        dissonances: np.ndarray,
+        dt: float = 0.01
+    ) -> np.ndarray:
+        """
+        Apply Forgiveness rotation to states (..., 3).
+        
+        Args:
+            states: Current states
+            dissonances: Dissonance vectors (broadcast against states)
+            dt: Time step
+        
+        Returns:
+            States after forgiveness
+        """
+        states = np.asarray(states, dtype=float)
+        B = _cross(states, np.asarray(dissonances, dtype=float))
+        angle = self.forgiveness_rate * np.linalg.norm(B, axis=-1)
+        R = RotorArray.from_angle_bivector(angle, -B)
+        return R.apply(states)
 
 
 # ============================================================================
@@ -566,6 +852,35 @@ class CombinedRotorDynamics:
         
         return state
     
+    def evolve_states(
+        self,
+        states: np.ndarray,
+        targets: Optional[np.ndarray] = None,
+        dissonances: Optional[np.ndarray] = None,
+        dt: float = 0.01
+    ) -> np.ndarray:
+        """
+        Vectorized evolve_state over a field of states (..., 3).
+        
+        Args:
+            states: Current states
+            targets: Love targets (optional, broadcast against states)
+            dissonances: Dissonances to forgive (optional)
+            dt: Time step
+        
+        Returns:
+            Evolved states
+        """
+        states = self.grace.apply_grace_batch(states, dt=dt)
+        
+        if targets is not None:
+            states = self.love.apply_love_batch(states, targets, dt=dt)
+        
+        if dissonances is not None:
+            states = self.forgiveness.apply_forgiveness_batch(states, dissonances, dt=dt)
+        
+        return states
+    
     def golden_rotation_sequence(
         self,
         initial_state: np.ndarray,
@@ -583,20 +898,42 @@ class CombinedRotorDynamics:
         Returns:
             Trajectory of states
         """
-        trajectory = [initial_state]
-        current = initial_state
+        trajectory = self.golden_rotation_field(initial_state, num_steps)
+        return [initial_state] + list(trajectory[1:])
+    
+    def golden_rotation_field(
+        self,
+        states: np.ndarray,
+        num_steps: int = 100
+    ) -> np.ndarray:
+        """
+        Golden rotation sequence for a whole field of states at once.
+        
+        Repeating one rotor k times is the rotor with angle k·θ in the same
+        plane, so all num_steps rotors are built in closed form and applied
+        in one broadcast sandwich product.
+        
+        Args:
+            states: Starting states (..., 3)
+            num_steps: Number of rotations
+        
+        Returns:
+            Trajectory array of shape (num_steps + 1, ..., 3)
+        """
+        states = np.asarray(states, dtype=float)
         
         # Define bivector for golden rotation (arbitrary optimal plane)
-        golden_bivector = Bivector(np.array([1.0, PHI_INV, 0.0]))
-        golden_bivector = golden_bivector.normalize()
+        golden_bivector = np.array([1.0, PHI_INV, 0.0])
         
-        for _ in range(num_steps):
-            # Rotate by golden angle
-            R = Rotor.from_angle_bivector(GOLDEN_ANGLE, golden_bivector)
-            current = R.apply(current)
-            trajectory.append(current)
+        angles = GOLDEN_ANGLE * np.arange(num_steps + 1, dtype=float)
+        rotors = RotorArray.from_angle_bivector(angles, golden_bivector)
         
-        return trajectory
+        batch_dims = states.ndim - 1
+        rotors = RotorArray(
+            rotors.scalar.reshape((-1,) + (1,) * batch_dims),
+            rotors.bivector.reshape((-1,) + (1,) * batch_dims + (3,)),
+        )
+        return rotors.apply(states)
 
 
 # ============================================================================
@@ -606,6 +943,7 @@ class CombinedRotorDynamics:
 __all__ = [
     'Bivector',
     'Rotor',
+    'RotorArray',
     'GraceRotor',
     'LoveRotor',
     'ForgivenessRotor',
@@ -549,6 +549,215 @@ class CP1Quantizer:
         return deviation < tolerance * (2 * np.pi)
 
 
+def _central_gradient_into(src: np.ndarray, axis: int, out: np.ndarray) -> np.ndarray:
+    """
+    Unit-spacing gradient along one axis, written into a preallocated buffer.
+    
+    Matches np.gradient(src, axis=axis) (second-order interior, first-order
+    edges) without allocating the result.
+    """
+    def sl(start, stop):
+        index = [slice(None)] * src.ndim
+        index[axis] = slice(start, stop)
+        return tuple(index)
+    
+    interior = out[sl(1, -1)]
+    np.subtract(src[sl(2, None)], src[sl(None, -2)], out=interior)
+    interior *= 0.5
+    np.subtract(src[sl(1, 2)], src[sl(0, 1)], out=out[sl(0, 1)])
+    np.subtract(src[sl(-1, None)], src[sl(-2, -1)], out=out[sl(-1, None)])
+    return out
+
+
+class GaugeExtractionPipeline:
+    """
+    Snapshot pipeline for n → z → a_μ → f_μν → B → Φ on 3D grids.
+    
+    Produces the same GaugeField as CP1Quantizer.extract_gauge_field, but:
+    1. The spinor and each of its directional gradients are computed once
+       and shared by every derived quantity
+    2. Only the three independent components f_xy, f_yz, f_zx are
+       differentiated; the rest of f_μν follows from antisymmetry
+    3. Scratch buffers are allocated once per grid shape and reused across
+       snapshots, with in-place arithmetic throughout
+    4. dtype=np.float32 runs the whole chain in float32/complex64, halving
+       memory for large topology sweeps
+    """
+    
+    def __init__(
+        self,
+        grid: Optional[GridParameters] = None,
+        spacing: Optional[Tuple[float, float, float]] = None,
+        dtype: type = np.float64
+    ):
+        """
+        Initialize pipeline.
+        
+        Args:
+            grid: Optional grid parameters (uses Lx/Nx, Ly/Ny, Lz/Nz)
+            spacing: Optional explicit (dx, dy, dz); overrides grid
+            dtype: Real working precision (np.float64 or np.float32)
+        """
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+            raise ValueError(f"Unsupported dtype: {self.dtype}")
+        self.complex_dtype = np.result_type(self.dtype, np.complex64)
+        
+        if spacing is not None:
+            self.spacing = tuple(float(d) for d in spacing)
+        elif grid is not None:
+            self.spacing = (grid.Lx / grid.Nx, grid.Ly / grid.Ny, grid.Lz / grid.Nz)
+        else:
+            self.spacing = (1.0, 1.0, 1.0)
+        
+        self._shape = None
+        self._scratch = None
+    
+    def _buffers(self, shape: Tuple[int, ...]) -> Dict[str, np.ndarray]:
+        """Scratch buffers for a given spatial shape (reallocated on shape change)."""
+        if shape != self._shape:
+            self._shape = shape
+            self._scratch = {
+                'z': np.empty((2,) + shape, dtype=self.complex_dtype),
+                'dz': np.empty((2,) + shape, dtype=self.complex_dtype),
+                'r0': np.empty((2,) + shape, dtype=self.dtype),
+                'r1': np.empty((2,) + shape, dtype=self.dtype),
+                'd': np.empty(shape, dtype=self.dtype),
+            }
+        return self._scratch
+    
+    def spinor(self, n: np.ndarray) -> np.ndarray:
+        """
+        CP¹ spinor z = (cos(θ/2) e^(iφ), sin(θ/2)) written into scratch.
+        
+        Uses the half-angle forms cos(θ/2) = √((1+n_z)/2), sin(θ/2) = √((1-n_z)/2),
+        so |z| = 1 by construction.
+        
+        Args:
+            n: Unit vector field (3, Nx, Ny, Nz)
+            
+        Returns:
+            Complex spinor (2, Nx, Ny, Nz); a view into scratch, overwritten
+            by the next call
+        """
+        n = np.asarray(n, dtype=self.dtype)
+        buf = self._buffers(n.shape[1:])
+        z, half = buf['z'], buf['r0']
+        
+        nz = np.clip(n[2], -1.0, 1.0, out=buf['d'])
+        np.add(1.0, nz, out=half[0])
+        np.subtract(1.0, nz, out=half[1])
+        half *= 0.5
+        np.sqrt(half, out=half)
+        
+        phi = np.arctan2(n[1], n[0], out=buf['r1'][0])
+        np.multiply(1j, phi, out=z[0])
+        np.exp(z[0], out=z[0])
+        z[0] *= half[0]
+        z[1] = half[1]
+        
+        return z
+    
+    def gauge_potential(self, z: np.ndarray) -> np.ndarray:
+        """
+        a_μ = 2 Im(z† ∂_μ z) / dx_μ, one shared spinor gradient per direction.
+        
+        Args:
+            z: Complex spinor (2, Nx, Ny, Nz)
+            
+        Returns:
+            Gauge potential (3, Nx, Ny, Nz)
+        """
+        shape = z.shape[1:]
+        buf = self._buffers(shape)
+        dz, t0, t1 = buf['dz'], buf['r0'], buf['r1']
+        
+        a = np.empty((3,) + shape, dtype=self.dtype)
+        for mu in range(3):
+            _central_gradient_into(z, mu + 1, dz)
+            # Im(conj(z) dz) = Re(z) Im(dz) - Im(z) Re(dz)
+            np.multiply(z.real, dz.imag, out=t0)
+            np.multiply(z.imag, dz.real, out=t1)
+            t0 -= t1
+            np.add(t0[0], t0[1], out=a[mu])
+            a[mu] *= 2.0 / self.spacing[mu]
+        return a
+    
+    def field_strength(self, a: np.ndarray) -> np.ndarray:
+        """
+        f_μν = ∂_μ a_ν - ∂_ν a_μ from the three independent components.
+        
+        Args:
+            a: Gauge potential (3, Nx, Ny, Nz)
+            
+        Returns:
+            Field strength (3, 3, Nx, Ny, Nz)
+        """
+        shape = a.shape[1:]
+        d = self._buffers(shape)['d']
+        f = np.zeros((3, 3) + shape, dtype=self.dtype)
+        
+        for mu, nu in ((0, 1), (1, 2), (2, 0)):
+            out = f[mu, nu]
+            _central_gradient_into(a[nu], mu, out)
+            out *= 1.0 / self.spacing[mu]
+            _central_gradient_into(a[mu], nu, d)
+            d *= 1.0 / self.spacing[nu]
+            out -= d
+            np.negative(out, out=f[nu, mu])
+        return f
+    
+    def magnetic_field(self, f: np.ndarray) -> np.ndarray:
+        """B_i = ½ε_ijk f_jk = (f_yz, f_zx, f_xy)."""
+        return np.stack([f[1, 2], f[2, 0], f[0, 1]])
+    
+    def magnetic_flux(self, B: np.ndarray) -> float:
+        """Flux Φ = ∫ B_z dx dy (same convention as CP1Quantizer, surface='xy')."""
+        return float(np.sum(B[2], dtype=np.float64) * self.spacing[0] * self.spacing[1])
+    
+    def process(self, n: np.ndarray, compute_flux: bool = True) -> GaugeField:
+        """
+        Run the full extraction for one snapshot.
+        
+        Args:
+            n: Unit vector field (3, Nx, Ny, Nz)
+            compute_flux: Whether to compute magnetic flux and charge
+            
+        Returns:
+            GaugeField with freshly allocated a, f, B (safe to keep across calls)
+        """
+        n = np.asarray(n)
+        if n.ndim != 4 or n.shape[0] != 3:
+            raise ValueError(f"Expected field of shape (3, Nx, Ny, Nz), got {n.shape}")
+        
+        z = self.spinor(n)
+        a = self.gauge_potential(z)
+        f = self.field_strength(a)
+        B = self.magnetic_field(f)
+        
+        flux = None
+        charge = None
+        if compute_flux:
+            flux = self.magnetic_flux(B)
+            charge = flux / (2 * np.pi)
+        
+        return GaugeField(a=a, f=f, E=None, B=B, flux=flux, charge=charge)
+    
+    def process_many(self, snapshots, compute_flux: bool = True):
+        """
+        Lazily process a sequence of snapshots, reusing scratch buffers.
+        
+        Args:
+            snapshots: Iterable of (3, Nx, Ny, Nz) arrays, or a (T, 3, Nx, Ny, Nz) array
+            compute_flux: Whether to compute magnetic flux and charge
+            
+        Yields:
+            GaugeField per snapshot
+        """
+        for n in snapshots:
+            yield self.process(n, compute_flux=compute_flux)
+
+
 def extract_gauge_field(
     field_data: np.ndarray,
     grid: Optional[GridParameters] = None
@@ -0,0 +1,375 @@
+"""
+Checkpoint/Resume for Long Evolution Runs
+
+Keeps multi-day evolution runs restartable after pre-emption:
+
+- Snapshots: the current graph, NumPy's global RNG state, the step counter
+  and a JSON blob of run state go into one compressed .npz per checkpoint
+  (snapshot_<step>.npz). Each is written to a temporary file, fsynced and
+  renamed into place, so a snapshot is either complete or absent. Only the
+  newest `keep` snapshots are retained.
+- Metrics: per-step rows are buffered and streamed to an append-only
+  columnar log (ColumnarSweepWriter, one float64 file per column). Every
+  snapshot records how many log rows it covers, and the column files are
+  fsynced before it is written; on resume the log is cut back to that
+  count, so metrics never run ahead of the restored state.
+- resume() restores from the newest snapshot that loads cleanly and whose
+  rows are all present in the log, falling back to older ones otherwise.
+  An existing run with no usable snapshot raises instead of being
+  overwritten; only reset() discards a run.
+
+Usage:
+    checkpointer = EvolutionCheckpointer("runs/ckpt", METRIC_COLUMNS)
+    snapshot = checkpointer.resume()          # None on a fresh directory
+    for step in range(start, num_steps):
+        ...
+        checkpointer.log(step=step, coherence=coh, ...)
+        if (step + 1) % 500 == 0:
+            checkpointer.save(step, graph, state={"vacuum_coherence": c0})
+"""
+
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import glob
+import json
+import os
+import re
+
+import numpy as np
+
+try:
+    from .action_sweep import ColumnarSweepWriter, load_sweep_columns
+    from .atomic_io import atomic_open, fsync_directory
+    from .core import NodeLabel, ObjectG
+except ImportError:
+    from action_sweep import ColumnarSweepWriter, load_sweep_columns
+    from atomic_io import atomic_open, fsync_directory
+    from core import NodeLabel, ObjectG
+
+
+SNAPSHOT_PATTERN = re.compile(r"snapshot_(\d+)\.npz$")
+
+
+# ============================================================================
+# Graph and RNG Encoding
+# ============================================================================
+
+def _column(values: List[Any]) -> np.ndarray:
+    """Typed array for one node attribute (numbers stay numeric, rest as str)."""
+    if all(isinstance(v, (bool, int, np.integer)) for v in values):
+        return np.asarray(values, dtype=np.int64)
+    if all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in values):
+        return np.asarray(values, dtype=np.float64)
+    return np.asarray([str(v) for v in values], dtype=str)
+
+
+def encode_graph(graph: Any) -> Dict[str, np.ndarray]:
+    """
+    Flatten a graph into node/edge tables.
+
+    Supports ObjectG (labels are NodeLabel dataclasses) and mutable graphs
+    whose `nodes` maps id -> attribute dict.
+
+    Returns:
+        'graph.nodes' (n,), 'graph.edges' (E, 2) and one 'graph.attr.<name>'
+        column per node attribute, plus 'graph.format'
+    """
+    labels = getattr(graph, "labels", None)
+    if isinstance(getattr(graph, "nodes", None), dict):
+        node_ids = list(graph.nodes)
+        attributes = [dict(graph.nodes[n]) for n in node_ids]
+        graph_format = "attributes"
+    elif labels is not None:
+        node_ids = list(graph.nodes)
+        attributes = [
+            {f.name: getattr(labels[n], f.name) for f in fields(labels[n])} if is_dataclass(labels.get(n)) else {}
+            for n in node_ids
+        ]
+        graph_format = "object_g"
+    else:
+        raise TypeError(f"Cannot encode graph of type {type(graph).__name__}")
+
+    edges = np.asarray([tuple(edge)[:2] for edge in graph.edges], dtype=np.int64).reshape(-1, 2)
+    arrays = {
+        "graph.format": np.asarray(graph_format),
+        "graph.nodes": np.asarray(node_ids, dtype=np.int64),
+        "graph.edges": edges,
+    }
+    names = dict.fromkeys(name for attrs in attributes for name in attrs)
+    for name in names:
+        if any(name not in attrs for attrs in attributes):
+            raise ValueError(f"Node attribute '{name}' is not set on every node")
+        arrays[f"graph.attr.{name}"] = _column([attrs[name] for attrs in attributes])
+    return arrays
+
+
+def decode_graph(arrays: Dict[str, np.ndarray], graph_factory: Optional[Callable[[], Any]] = None) -> Any:
+    """
+    Rebuild a graph from encode_graph() tables.
+
+    Args:
+        arrays: Snapshot arrays
+        graph_factory: Zero-argument constructor for mutable ('attributes')
+            graphs; nodes and edges are re-added with add_node/add_edge
+
+    Returns:
+        ObjectG, or the factory's graph
+    """
+    node_ids = arrays["graph.nodes"].tolist()
+    edges = [tuple(edge) for edge in arrays["graph.edges"].tolist()]
+    attr_names = [key[len("graph.attr."):] for key in arrays if key.startswith("graph.attr.")]
+    attributes = [
+        {name: arrays[f"graph.attr.{name}"][i].item() for name in attr_names}
+        for i in range(len(node_ids))
+    ]
+
+    if str(arrays["graph.format"]) == "object_g":
+        labels = {n: NodeLabel(**attrs) for n, attrs in zip(node_ids, attributes) if attrs}
+        return ObjectG(nodes=node_ids, edges=edges, labels=labels)
+
+    if graph_factory is None:
+        raise ValueError("graph_factory is required to rebuild an attribute graph")
+    graph = graph_factory()
+    for n, attrs in zip(node_ids, attributes):
+        graph.add_node(n, **attrs)
+    for u, v in edges:
+        graph.add_edge(u, v)
+    return graph
+
+
+def encode_rng_state(state: Optional[Tuple] = None) -> Dict[str, np.ndarray]:
+    """NumPy legacy global RNG state (np.random.get_state()) as arrays."""
+    name, keys, pos, has_gauss, cached_gaussian = np.random.get_state() if state is None else state
+    return {
+        "rng.name": np.asarray(name),
+        "rng.keys": np.asarray(keys, dtype=np.uint32),
+        "rng.scalars": np.asarray([pos, has_gauss]),
+        "rng.cached_gaussian": np.asarray(cached_gaussian, dtype=np.float64),
+    }
+
+
+def decode_rng_state(arrays: Dict[str, np.ndarray]) -> Tuple:
+    """Inverse of encode_rng_state, ready for np.random.set_state()."""
+    pos, has_gauss = (int(v) for v in arrays["rng.scalars"])
+    return (str(arrays["rng.name"]), arrays["rng.keys"], pos, has_gauss, float(arrays["rng.cached_gaussian"]))
+
+
+# ============================================================================
+# Snapshots
+# ============================================================================
+
+def _json_default(value: Any) -> Any:
+    """NumPy values in run state (e.g. emergence results) as plain JSON."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass
+class EvolutionSnapshot:
+    """State restored from a checkpoint."""
+    step: int  # Last completed step
+    graph: Any
+    rng_state: Tuple
+    metric_rows: int  # Metrics log rows covered by this snapshot
+    state: Dict[str, Any] = field(default_factory=dict)
+    path: Optional[str] = None
+
+
+def write_snapshot(path: str, step: int, graph: Any, metric_rows: int,
+                   state: Optional[Dict[str, Any]] = None, rng_state: Optional[Tuple] = None):
+    """Write one snapshot atomically (temp file, fsync, rename)."""
+    arrays = {
+        "step": np.asarray(step, dtype=np.int64),
+        "metric_rows": np.asarray(metric_rows, dtype=np.int64),
+        "state": np.asarray(json.dumps(state or {}, default=_json_default)),
+    }
+    arrays.update(encode_graph(graph))
+    arrays.update(encode_rng_state(rng_state))
+
+    with atomic_open(path, "wb", fsync=True) as f:
+        np.savez_compressed(f, **arrays)
+    fsync_directory(os.path.dirname(path) or ".")
+
+
+def read_snapshot(path: str, graph_factory: Optional[Callable[[], Any]] = None) -> EvolutionSnapshot:
+    """Load a snapshot; raises on truncated or corrupt files."""
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}  # reads (and CRC-checks) every member
+    return EvolutionSnapshot(
+        step=int(arrays["step"]),
+        graph=decode_graph(arrays, graph_factory),
+        rng_state=decode_rng_state(arrays),
+        metric_rows=int(arrays["metric_rows"]),
+        state=json.loads(str(arrays["state"])),
+        path=path,
+    )
+
+
+# ============================================================================
+# Checkpointer
+# ============================================================================
+
+class EvolutionCheckpointer:
+    """
+    Periodic snapshots plus a streaming columnar metrics log in one directory.
+
+    Layout: <directory>/snapshot_<step>.npz and <directory>/metrics/.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        columns: Sequence[str],
+        keep: int = 3,
+        graph_factory: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Initialize checkpointer.
+
+        Args:
+            directory: Checkpoint directory (created if missing)
+            columns: Metric column names, in log order
+            keep: Snapshots retained (older ones are deleted after each save)
+            graph_factory: Constructor for mutable graphs (see decode_graph)
+        """
+        if keep < 1:
+            raise ValueError(f"keep must be positive, got {keep}")
+        self.directory = directory
+        self.columns = list(columns)
+        self.keep = keep
+        self.graph_factory = graph_factory
+        self.metrics_path = os.path.join(directory, "metrics")
+        self._writer: Optional[ColumnarSweepWriter] = None
+        self._buffer: Dict[str, List[float]] = {name: [] for name in self.columns}
+        os.makedirs(directory, exist_ok=True)
+
+    # ------------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------------
+
+    @property
+    def rows(self) -> int:
+        """Metric rows logged so far (written plus buffered)."""
+        written = self._writer.rows if self._writer is not None else 0
+        return written + len(self._buffer[self.columns[0]])
+
+    def log(self, **row: float):
+        """Buffer one metrics row (every column must be given)."""
+        missing = set(self.columns) - set(row)
+        if missing:
+            raise ValueError(f"Missing metric columns: {sorted(missing)}")
+        for name in self.columns:
+            self._buffer[name].append(row[name])
+
+    def flush(self):
+        """Append buffered rows to the metrics log."""
+        if self._writer is None:
+            if self.exists():
+                raise RuntimeError(f"{self.directory} holds an earlier run; call resume() or reset() first")
+            self._writer = ColumnarSweepWriter(self.metrics_path, self.columns)
+        if self._buffer[self.columns[0]]:
+            self._writer.append({name: np.asarray(values) for name, values in self._buffer.items()})
+            self._buffer = {name: [] for name in self.columns}
+
+    def history(self) -> Dict[str, np.ndarray]:
+        """All logged metrics (flushes first; columns are memory-mapped)."""
+        self.flush()
+        return load_sweep_columns(self.metrics_path)
+
+    # ------------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------------
+
+    def snapshot_path(self, step: int) -> str:
+        return os.path.join(self.directory, f"snapshot_{step:012d}.npz")
+
+    def snapshots(self) -> List[str]:
+        """Snapshot paths, newest first."""
+        paths = [p for p in glob.glob(os.path.join(self.directory, "snapshot_*.npz"))
+                 if SNAPSHOT_PATTERN.search(p)]
+        return sorted(paths, key=lambda p: int(SNAPSHOT_PATTERN.search(p).group(1)), reverse=True)
+
+    def save(self, step: int, graph: Any, state: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Snapshot the run after `step` completed.
+
+        Metrics are flushed and fsynced first, so the snapshot's row count is
+        always on disk, even after a host crash.
+        """
+        self.flush()
+        self._writer.sync()
+        path = self.snapshot_path(step)
+        write_snapshot(path, step, graph, self._writer.rows, state)
+        for old in self.snapshots()[self.keep:]:
+            os.remove(old)
+        return path
+
+    def resume(self) -> Optional[EvolutionSnapshot]:
+        """
+        Restore the newest valid snapshot.
+
+        Restores NumPy's global RNG state and truncates the metrics log to the
+        snapshot's rows. Returns None (and starts a fresh log) on an empty
+        directory.
+
+        Raises:
+            RuntimeError: The directory holds a run (snapshots or logged
+                metrics) but no usable snapshot; nothing is truncated
+        """
+        logged = self._logged_rows()
+        for path in self.snapshots():
+            try:
+                snapshot = read_snapshot(path, self.graph_factory)
+            except Exception:
+                continue  # partial or corrupt file: try an older one
+            if snapshot.metric_rows > logged:
+                continue
+            np.random.set_state(snapshot.rng_state)
+            self._writer = ColumnarSweepWriter(self.metrics_path, self.columns, resume_rows=snapshot.metric_rows)
+            self._buffer = {name: [] for name in self.columns}
+            return snapshot
+
+        if self.exists():
+            raise RuntimeError(
+                f"No usable snapshot in {self.directory} ({len(self.snapshots())} found, "
+                f"{logged} metric rows logged); call reset() to discard the run"
+            )
+        self._writer = ColumnarSweepWriter(self.metrics_path, self.columns)
+        return None
+
+    def exists(self) -> bool:
+        """True if the directory holds snapshots or logged metrics."""
+        return bool(self.snapshots()) or self._logged_rows() > 0
+
+    def reset(self):
+        """Delete all snapshots and start an empty metrics log."""
+        for path in self.snapshots():
+            os.remove(path)
+        self._writer = ColumnarSweepWriter(self.metrics_path, self.columns)
+        self._buffer = {name: [] for name in self.columns}
+
+    def _logged_rows(self) -> int:
+        """Rows present in every metrics column file."""
+        sizes = []
+        for name in self.columns:
+            filename = os.path.join(self.metrics_path, f"{name}.f64")
+            sizes.append(os.path.getsize(filename) // 8 if os.path.exists(filename) else 0)
+        return min(sizes) if sizes else 0
+
+    def close(self):
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+__all__ = [
+    "EvolutionCheckpointer",
+    "EvolutionSnapshot",
+    "encode_graph",
+    "decode_graph",
+    "write_snapshot",
+    "read_snapshot",
+]
@@ -399,6 +399,60 @@ class FieldEvolution:
             self.D2_x = None
             self.D2_y = None
     
+    def _stencil_pattern_1d(self, n: int) -> sp.csr_matrix:
+        """Sparsity of the three-point stencil along one axis (incl. wrap if periodic)."""
+        offsets = [-1, 0, 1]
+        diagonals = [np.ones(n - 1), np.ones(n), np.ones(n - 1)]
+        if self.field.grid.boundary == BoundaryCondition.PERIODIC:
+            offsets += [n - 1, -(n - 1)]
+            diagonals += [[1.0], [1.0]]
+        return sp.diags(diagonals, offsets, shape=(n, n), format='csr')
+    
+    def laplacian_sparsity(self) -> sp.csr_matrix:
+        """
+        Sparsity pattern of the discrete Laplacian on the flattened grid.
+        
+        In 2D the five-point stencil is the Kronecker sum of the 1D stencils,
+        matching the C-ordered flattening used by get_state_vector().
+        
+        Returns:
+            N×N boolean CSR matrix (N = number of grid points)
+        """
+        grid = self.field.grid
+        P_x = self._stencil_pattern_1d(grid.Nx)
+        if grid.is_1d:
+            pattern = P_x
+        else:
+            P_y = self._stencil_pattern_1d(grid.Ny)
+            pattern = sp.kron(P_x, sp.identity(grid.Ny)) + sp.kron(sp.identity(grid.Nx), P_y)
+        return sp.csr_matrix(pattern, dtype=bool)
+    
+    def jacobian_sparsity(self) -> sp.csr_matrix:
+        """
+        Sparsity pattern of ∂(rhs)/∂(state) for the implicit solvers.
+        
+        State layout is [n_x, n_y, n_z, ṅ_x, ṅ_y, ṅ_z]. The structure is:
+            ∂n/∂ṅ  = identity (per component)
+            ∂n̈/∂n  = Laplacian stencil, coupled across all three components
+                     through the Lagrange multiplier λ = n·(f²∇²n + forces)
+            ∂n̈/∂ṅ  = 0 (no velocity-dependent forces)
+        
+        The retrocausal source depends only on t and the attractor, so it
+        does not contribute.
+        
+        Returns:
+            6N×6N boolean CSR matrix, suitable for solve_ivp(jac_sparsity=...)
+        """
+        N = self.field.n_x.size
+        L = self.laplacian_sparsity()
+        I = sp.identity(N, dtype=bool, format='csr')
+        
+        velocity_block = sp.kron(sp.identity(3), I)
+        force_block = sp.kron(np.ones((3, 3)), L)
+        
+        pattern = sp.bmat([[None, velocity_block], [force_block, None]], format='csr')
+        return sp.csr_matrix(pattern, dtype=bool)
+    
     def compute_laplacian(self, field_component: np.ndarray) -> np.ndarray:
         """
         Compute Laplacian ∇²f of a field component.
@@ -508,6 +562,42 @@ class FieldEvolution:
         n_y_dot = state[4*N:5*N].reshape(shape)
         n_z_dot = state[5*N:6*N].reshape(shape)
         
+        n_x_ddot, n_y_ddot, n_z_ddot = self.acceleration(t, n_x, n_y, n_z)
+        
+        # Assemble derivative
+        dstate_dt = np.concatenate([
+            n_x_dot.flatten(),
+            n_y_dot.flatten(),
+            n_z_dot.flatten(),
+            n_x_ddot.flatten(),
+            n_y_ddot.flatten(),
+            n_z_ddot.flatten()
+        ])
+        
+        return dstate_dt
+    
+    def acceleration(
+        self,
+        t: float,
+        n_x: np.ndarray,
+        n_y: np.ndarray,
+        n_z: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Second time derivative n̈ for a given field configuration.
+        
+        n̈ = f⁻²(f²∇²n + ∂V/∂n + 𝒢_retro - λn)
+        
+        The right-hand side does not depend on ṅ, which is what makes the
+        leapfrog scheme in evolve_leapfrog() symplectic.
+        
+        Args:
+            t: Current time
+            n_x, n_y, n_z: Field components (grid-shaped)
+            
+        Returns:
+            Tuple of (n̈_x, n̈_y, n̈_z)
+        """
         # Laplacian terms
         lap_n_x = self.compute_laplacian(n_x)
         lap_n_y = self.compute_laplacian(n_y)
@@ -544,29 +634,49 @@ class FieldEvolution:
         n_z_ddot = (self.params.f**2 * lap_n_z + force_potential_z + self.params.kappa * force_skyrme_z + G_z 
                     - lambda_multiplier * n_z) / self.params.f**2
         
-        # Assemble derivative
-        dstate_dt = np.concatenate([
-            n_x_dot.flatten(),
-            n_y_dot.flatten(),
-            n_z_dot.flatten(),
-            n_x_ddot.flatten(),
-            n_y_ddot.flatten(),
-            n_z_ddot.flatten()
-        ])
-        
-        return dstate_dt
+        return n_x_ddot, n_y_ddot, n_z_ddot
+    
+    IMPLICIT_METHODS = ('BDF', 'Radau')
     
-    def evolve(self, t_span: Tuple[float, float], method: str = 'RK45') -> Dict:
+    def evolve(
+        self,
+        t_span: Tuple[float, float],
+        method: str = 'RK45',
+        max_step: Optional[float] = None,
+        use_jac_sparsity: bool = True
+    ) -> Dict:
         """
         Evolve field from t_span[0] to t_span[1].
         
+        For the implicit methods ('BDF', 'Radau') the solver is handed the
+        stencil-derived jacobian_sparsity(), so finite-difference Jacobians
+        cost O(N) grouped evaluations instead of a dense (6N)² build, and the
+        step size is no longer capped at grid.dt unless max_step says so.
+        
+        method='leapfrog' dispatches to the fixed-step symplectic integrator
+        (see evolve_leapfrog).
+        
         Args:
             t_span: (t_start, t_end)
-            method: ODE solver method ('RK45', 'DOP853', 'BDF')
+            method: ODE solver method ('RK45', 'DOP853', 'BDF', 'Radau', 'leapfrog')
+            max_step: Maximum step size. Defaults to grid.dt for explicit
+                methods and unbounded for implicit ones.
+            use_jac_sparsity: Pass the sparsity pattern to implicit solvers
             
         Returns:
             Dictionary with solution history
         """
+        if method == 'leapfrog':
+            return self.evolve_leapfrog(t_span, dt=max_step)
+        
+        implicit = method in self.IMPLICIT_METHODS
+        if max_step is None:
+            max_step = np.inf if implicit else self.field.grid.dt
+        
+        options = {}
+        if implicit and use_jac_sparsity:
+            options['jac_sparsity'] = self.jacobian_sparsity()
+        
         # Initial state
         y0 = self.field.get_state_vector()
         
@@ -577,7 +687,8 @@ class FieldEvolution:
             y0,
             method=method,
             dense_output=True,
-            max_step=self.field.grid.dt
+            max_step=max_step,
+            **options
         )
         
         # Update field to final state
@@ -591,6 +702,76 @@ class FieldEvolution:
             'success': sol.success,
             'message': sol.message
         }
+    
+    def evolve_leapfrog(
+        self,
+        t_span: Tuple[float, float],
+        dt: Optional[float] = None,
+        save_every: int = 1
+    ) -> Dict:
+        """
+        Fixed-step symplectic (velocity-Verlet / kick-drift-kick) evolution.
+        
+        Since n̈ depends only on n, the scheme is second order, time
+        reversible and has bounded energy error for the second-order
+        n-field dynamics. The last step is shortened to land exactly on
+        t_span[1].
+        
+        Args:
+            t_span: (t_start, t_end)
+            dt: Time step (defaults to grid.dt)
+            save_every: Record the state every this many steps
+            
+        Returns:
+            Dictionary with solution history (same keys as evolve())
+        """
+        if dt is None:
+            dt = self.field.grid.dt
+        if dt <= 0:
+            raise ValueError("dt must be positive")
+        if save_every < 1:
+            raise ValueError("save_every must be at least 1")
+        
+        t0, t1 = t_span
+        n_steps = max(int(np.ceil((t1 - t0) / dt - 1e-12)), 0)
+        
+        n = np.stack([self.field.n_x, self.field.n_y, self.field.n_z]).astype(float)
+        v = np.stack([self.field.n_x_dot, self.field.n_y_dot, self.field.n_z_dot]).astype(float)
+        a = np.stack(self.acceleration(t0, *n))
+        
+        def snapshot():
+            return np.concatenate([n.reshape(3, -1).ravel(), v.reshape(3, -1).ravel()])
+        
+        times = [t0]
+        states = [snapshot()]
+        t = t0
+        
+        for step in range(n_steps):
+            h = min(dt, t1 - t)
+            v += 0.5 * h * a          # kick
+            n += h * v                # drift
+            t += h
+            a = np.stack(self.acceleration(t, *n))
+            v += 0.5 * h * a          # kick
+            
+            if (step + 1) % save_every == 0 or step == n_steps - 1:
+                times.append(t)
+                states.append(snapshot())
+        
+        y = np.stack(states, axis=1)
+        
+        self.field.set_from_state_vector(y[:, -1].copy())
+        self.field.t = t
+        self.field.normalize()
+        
+        finite = bool(np.all(np.isfinite(y[:, -1])))
+        return {
+            't': np.array(times),
+            'y': y,
+            'success': finite,
+            'message': 'Leapfrog integration completed.' if finite
+                       else 'Leapfrog integration produced non-finite values.'
+        }
 
 
 # Module-level convenience function
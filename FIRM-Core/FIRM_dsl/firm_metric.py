@@ -15,8 +15,10 @@ Key theorems:
 - Coercivity on core (Theorem 3.4): ‖A‖_{φ,𝒢}² ≥ C_V‖A‖_hs² for A ∈ V
 """
 
+import hashlib
+from collections import OrderedDict
 import numpy as np
-from typing import Optional, Tuple
+from typing import Hashable, List, Optional, Tuple
 from dataclasses import dataclass
 
 # Handle both package and standalone imports
@@ -61,6 +63,33 @@ class FIRMNormResult:
     coercivity_constant: float      # Actual C_V if in core
 
 
+@dataclass
+class FIRMCacheInfo:
+    """Statistics of the optional FIRM memoization cache."""
+    hits: int                       # Lookups served from cache
+    misses: int                     # Lookups that had to compute
+    size: int                       # Entries currently held
+    maxsize: int                    # LRU bound (0 = disabled)
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def operator_fingerprint(A: np.ndarray) -> Tuple:
+    """
+    Cheap content fingerprint of an operator: (shape, dtype, blake2b-128 of bytes).
+    
+    Equal arrays give equal fingerprints regardless of object identity, so
+    freshly rebuilt copies of the same attractor hit the same cache entry.
+    """
+    A = np.ascontiguousarray(A)
+    digest = hashlib.blake2b(A.data, digest_size=16).digest()
+    return (A.shape, A.dtype.str, digest)
+
+
 class FIRMMetric:
     """
     φ-Fractal Informational Resonance Metric (FIRM).
@@ -72,13 +101,25 @@ class FIRMMetric:
         firm = FIRMMetric(grace_operator)
         result = firm.inner_product(A, B)
         norm_result = firm.norm(A)
+    
+    Memoization (opt-in):
+        firm = FIRMMetric(grace_operator, cache_size=256)
+        firm.norm(A_infinity)      # computed
+        firm.norm(A_infinity)      # served from cache
+        firm.cache_info()          # hits / misses / size
+    
+    With cache_size > 0, norms, inner products and Grace iterate chains are
+    kept in an LRU keyed by operator_fingerprint() of the operator bytes.
+    Results are exactly those of the uncached path. The cache assumes the
+    Grace operator is not mutated; call clear_cache() if its parameters change.
     """
     
     def __init__(
         self,
         grace: Optional[GraceOperator] = None,
         tolerance: float = TOLERANCE_CONVERGENCE,
-        max_terms: int = MAX_ITERATIONS
+        max_terms: int = MAX_ITERATIONS,
+        cache_size: int = 0
     ):
         self.grace = grace or create_default_grace_operator()
         self.tolerance = tolerance
@@ -87,6 +128,121 @@ class FIRMMetric:
         # Precompute theoretical bounds (from FSCTF_AXIOMS.md Theorem 3.3)
         kappa = self.grace.params.kappa
         self.upper_bound_constant = 1.0 / (1.0 - kappa**2 / PHI)
+        
+        # Optional LRU memoization
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be non-negative, got {cache_size}")
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    # ------------------------------------------------------------------
+    # Memoization
+    # ------------------------------------------------------------------
+    
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether memoization is active."""
+        return self.cache_size > 0
+    
+    def enable_cache(self, cache_size: int = 256):
+        """Turn on memoization with the given LRU bound (0 disables and clears)."""
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be non-negative, got {cache_size}")
+        self.cache_size = cache_size
+        self._evict()
+    
+    def clear_cache(self):
+        """Drop all cached entries and reset statistics."""
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    def cache_info(self) -> FIRMCacheInfo:
+        """Current cache statistics."""
+        return FIRMCacheInfo(
+            hits=self._cache_hits,
+            misses=self._cache_misses,
+            size=len(self._cache),
+            maxsize=self.cache_size
+        )
+    
+    def _cache_get(self, key: Hashable):
+        """LRU lookup; returns None on miss (and counts it)."""
+        value = self._cache.get(key)
+        if value is None:
+            self._cache_misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._cache_hits += 1
+        return value
+    
+    def _cache_put(self, key: Hashable, value):
+        """Insert and evict least-recently-used entries beyond cache_size."""
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        self._evict()
+    
+    def _evict(self):
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def grace_iterates(
+        self,
+        A: np.ndarray,
+        count: int,
+        in_core: bool = False
+    ) -> List[np.ndarray]:
+        """
+        First `count` Grace iterates [A, 𝒢(A), ..., 𝒢^{count-1}(A)].
+        
+        With the cache enabled the chain is stored (read-only) and extended
+        in place, so repeated series against a fixed reference such as A∞
+        apply 𝒢 only once per term overall.
+        
+        Args:
+            A: Input operator
+            count: Number of iterates
+            in_core: Whether A is in coherence core V
+        
+        Returns:
+            List of iterates
+        """
+        chain = self._iterate_chain(A, in_core, fingerprint=None)
+        while len(chain) < count:
+            self._extend_chain(chain, in_core)
+        return chain[:count]
+    
+    def _iterate_chain(
+        self,
+        A: np.ndarray,
+        in_core: bool,
+        fingerprint: Optional[Tuple]
+    ) -> List[np.ndarray]:
+        """Cached (or fresh) iterate list starting at A."""
+        if not self.cache_enabled:
+            return [A.copy()]
+        
+        key = ('iterates', fingerprint or operator_fingerprint(A), in_core)
+        chain = self._cache_get(key)
+        if chain is None:
+            start = A.copy()
+            start.setflags(write=False)
+            chain = [start]
+            self._cache_put(key, chain)
+        return chain
+    
+    def _extend_chain(self, chain: List[np.ndarray], in_core: bool):
+        """Append the next Grace iterate to a chain."""
+        nxt = self.grace.apply(chain[-1], in_core=in_core, verify_axioms=False).output
+        if self.cache_enabled:
+            nxt.setflags(write=False)
+        chain.append(nxt)
+    
+    # ------------------------------------------------------------------
+    # Inner product and norm
+    # ------------------------------------------------------------------
     
     def inner_product(
         self,
@@ -107,16 +263,44 @@ class FIRMMetric:
         if A.shape != B.shape or A.shape[0] != A.shape[1]:
             raise ValueError(f"A and B must be square and same size, got {A.shape}, {B.shape}")
         
+        if not self.cache_enabled:
+            return self._inner_product_series(A, B, in_core)
+        
+        fp_A = operator_fingerprint(A)
+        fp_B = fp_A if B is A else operator_fingerprint(B)
+        key = ('inner', fp_A, fp_B, in_core)
+        
+        result = self._cache_get(key)
+        if result is None:
+            result = self._inner_product_series(A, B, in_core, fp_A, fp_B)
+            self._cache_put(key, result)
+        return result
+    
+    def _inner_product_series(
+        self,
+        A: np.ndarray,
+        B: np.ndarray,
+        in_core: bool,
+        fp_A: Optional[Tuple] = None,
+        fp_B: Optional[Tuple] = None
+    ) -> FIRMResult:
+        """Evaluate the φ-weighted Grace series for ⟨A, B⟩_{φ,𝒢}."""
+        # Iterate chains; ⟨A, A⟩ (e.g. from norm()) shares a single chain
+        same = B is A or (fp_A is not None and fp_A == fp_B)
+        chain_A = self._iterate_chain(A, in_core, fp_A)
+        chain_B = chain_A if same else self._iterate_chain(B, in_core, fp_B)
+        
         # Initialize accumulators
         result_sum = 0.0 + 0.0j
         phi_power = 1.0
-        A_n, B_n = A.copy(), B.copy()
         
         # Compute HS inner product for comparison
         hs_value = self._hs_inner_product(A, B)
         
         # Iterate φ-weighted Grace series
         for n in range(self.max_terms):
+            A_n, B_n = chain_A[n], chain_B[n]
+            
             # Current term: φ⁻ⁿ ⟨𝒢ⁿ(A), 𝒢ⁿ(B)⟩_hs
             term = self._hs_inner_product(A_n, B_n) / phi_power
             result_sum += term
@@ -138,8 +322,10 @@ class FIRMMetric:
                 )
             
             # Apply Grace operator for next iteration
-            A_n = self.grace.apply(A_n, in_core=in_core, verify_axioms=False).output
-            B_n = self.grace.apply(B_n, in_core=in_core, verify_axioms=False).output
+            if len(chain_A) <= n + 1:
+                self._extend_chain(chain_A, in_core)
+            if not same and len(chain_B) <= n + 1:
+                self._extend_chain(chain_B, in_core)
             phi_power *= PHI
         
         # Did not converge
@@ -167,6 +353,17 @@ class FIRMMetric:
         Returns:
             FIRMNormResult with norm and bound verification
         """
+        if self.cache_enabled:
+            key = ('norm', operator_fingerprint(A), in_core)
+            cached = self._cache_get(key)
+            if cached is None:
+                cached = self._norm_uncached(A, in_core)
+                self._cache_put(key, cached)
+            return cached
+        return self._norm_uncached(A, in_core)
+    
+    def _norm_uncached(self, A: np.ndarray, in_core: bool) -> FIRMNormResult:
+        """Compute FIRM norm and bound diagnostics."""
         # Compute FIRM inner product with self
         inner_result = self.inner_product(A, A, in_core=in_core)
         firm_norm_squared = inner_result.value.real
@@ -121,7 +121,7 @@ class GraceFromClifford:
         """Initialize Clifford-Grace derivation."""
         self.phi = PHI
         self.phi_inv = PHI_INVERSE
-        self.clifford = CliffordAlgebra(dimension=4)  # Cl(1,3)
+        self.clifford = CliffordAlgebra(dimension=4, signature=(1, 3))  # Cl(1,3)
     
     def extract_scalar_part(self, multivector: np.ndarray) -> float:
         """
@@ -147,6 +147,47 @@ class GraceOperator:
             converged=converged
         )
     
+    def apply_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Apply Grace operator to a stack of operators: 𝒢(X_b) for every b.
+
+        Equivalent to apply(X_b, verify_axioms=False).output per slice, but
+        runs a single batched decomposition and skips diagnostics.
+
+        Args:
+            X: (B, N, N) stack of operators
+
+        Returns:
+            (B, N, N) stack of Grace outputs
+        """
+        if X.ndim != 3 or X.shape[1] != X.shape[2]:
+            raise ValueError(f"X must be a (B, N, N) stack, got shape {X.shape}")
+
+        XH = X.conj().swapaxes(-1, -2)
+        impl = self.params.implementation
+
+        if impl == GraceImplementation.SPECTRAL:
+            eigenvalues, eigenvectors = np.linalg.eigh((X + XH) / 2)
+            damped = self.params.kappa * eigenvalues
+            return (eigenvectors * damped[:, None, :]) @ eigenvectors.conj().swapaxes(-1, -2)
+        elif impl == GraceImplementation.HEAT_KERNEL:
+            tau = -np.log(self.params.kappa)
+            eigenvalues, eigenvectors = np.linalg.eigh((X + XH) / 2)
+            damped = eigenvalues * np.exp(-tau * np.abs(eigenvalues))
+            return (eigenvectors * damped[:, None, :]) @ eigenvectors.conj().swapaxes(-1, -2)
+        elif impl == GraceImplementation.WAVELET:
+            U, s, Vh = np.linalg.svd(X, full_matrices=False)
+            threshold = self.params.kappa * np.max(s, axis=-1, keepdims=True)
+            s_filtered = np.maximum(s - threshold, 0)
+            return (U * s_filtered[:, None, :]) @ Vh
+        elif impl == GraceImplementation.PROJECTOR:
+            if self._coherence_core_projector is None:
+                raise ValueError("Coherence core projector not set. Call set_coherence_core() first.")
+            P = self._coherence_core_projector
+            return P @ X @ P
+        else:
+            raise ValueError(f"Unknown implementation: {impl}")
+
     def apply_n_times(self, X: np.ndarray, n: int) -> np.ndarray:
         """Apply Grace operator n times: 𝒢ⁿ(X)."""
         result = X
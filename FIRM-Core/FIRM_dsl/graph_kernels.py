@@ -0,0 +1,160 @@
+"""graph_kernels.py
+
+Linear-time graph kernels shared by the 𝒮-GC machinery.
+
+The garbage-collection modes repeatedly ask the same structural questions of an
+ObjectG: which nodes are leaves, which components exist, what the induced
+subgraph on a node set looks like. Answering these by scanning the edge list
+per node (or by membership tests against Python lists) is O(N·E); the kernels
+here build the adjacency once and answer in O(N + E).
+
+All kernels are deterministic and order-preserving:
+- components are emitted in the order their first node appears in
+  ``structure.nodes`` and traversed in the same depth-first order as a naive
+  stack walk over the edge list;
+- induced subgraphs keep the caller's node order and the parent's edge order.
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, List, Sequence
+
+from .core import ObjectG
+
+
+def adjacency_lists(structure: ObjectG) -> Dict[int, List[int]]:
+    """Build undirected adjacency lists in edge-list order.
+
+    Args:
+        structure: Graph to index.
+
+    Returns:
+        Mapping node id -> neighbour ids. Every node in ``structure.nodes`` is
+        present (possibly with an empty list); edge endpoints that are not
+        listed as nodes are included as well.
+    """
+    adjacency: Dict[int, List[int]] = {node: [] for node in structure.nodes}
+    for u, v in structure.edges:
+        adjacency.setdefault(u, []).append(v)
+        adjacency.setdefault(v, []).append(u)
+    return adjacency
+
+
+def degree_map(structure: ObjectG) -> Dict[int, int]:
+    """Count incident edges per node in a single pass.
+
+    A self-loop counts once, matching ``sum(1 for u, v in edges if u == n or v == n)``.
+
+    Args:
+        structure: Graph to index.
+
+    Returns:
+        Mapping node id -> degree (0 for isolated nodes).
+    """
+    degrees: Dict[int, int] = {node: 0 for node in structure.nodes}
+    for u, v in structure.edges:
+        degrees[u] = degrees.get(u, 0) + 1
+        if v != u:
+            degrees[v] = degrees.get(v, 0) + 1
+    return degrees
+
+
+def connected_components(structure: ObjectG, min_size: int = 1) -> List[List[int]]:
+    """Find connected components with one adjacency build and one traversal.
+
+    Args:
+        structure: Graph to decompose.
+        min_size: Components smaller than this are dropped from the result.
+
+    Returns:
+        List of components, each a list of node ids in depth-first order.
+    """
+    adjacency = adjacency_lists(structure)
+    visited = set()
+    components: List[List[int]] = []
+
+    for start in structure.nodes:
+        if start in visited:
+            continue
+        component = []
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            component.append(node)
+            stack.extend(nb for nb in adjacency[node] if nb not in visited)
+        if len(component) >= min_size:
+            components.append(component)
+
+    return components
+
+
+def induced_subgraph(structure: ObjectG, nodes: Iterable[int]) -> ObjectG:
+    """Extract the subgraph induced by ``nodes`` with set-based membership.
+
+    Args:
+        structure: Parent graph.
+        nodes: Node ids to keep; order is preserved in the result.
+
+    Returns:
+        ObjectG with the given nodes, the parent's edges between them and
+        their labels.
+    """
+    node_list = list(nodes)
+    node_set = set(node_list)
+    edges = [(u, v) for u, v in structure.edges if u in node_set and v in node_set]
+    labels = {nid: structure.labels[nid] for nid in node_list if nid in structure.labels}
+    return ObjectG(nodes=node_list, edges=edges, labels=labels)
+
+
+def remove_nodes(structure: ObjectG, removed: Iterable[int]) -> ObjectG:
+    """Return the subgraph induced by every node not in ``removed``.
+
+    Surviving nodes keep their order from ``structure.nodes``.
+    """
+    removed_set = set(removed)
+    return induced_subgraph(structure, (n for n in structure.nodes if n not in removed_set))
+
+
+def partition_subgraphs(structure: ObjectG, groups: Sequence[Sequence[int]]) -> List[ObjectG]:
+    """Split a graph into the induced subgraphs of disjoint node groups.
+
+    The edge list is scanned once and each intra-group edge is routed to its
+    group, so splitting into k parts costs O(N + E) rather than O(k·E).
+
+    Args:
+        structure: Parent graph.
+        groups: Disjoint node-id groups.
+
+    Returns:
+        One ObjectG per group, in the same order.
+    """
+    owner: Dict[int, int] = {}
+    for index, group in enumerate(groups):
+        for nid in group:
+            owner[nid] = index
+
+    group_edges: List[List[tuple]] = [[] for _ in groups]
+    for u, v in structure.edges:
+        gu = owner.get(u)
+        if gu is not None and gu == owner.get(v):
+            group_edges[gu].append((u, v))
+
+    return [
+        ObjectG(
+            nodes=list(group),
+            edges=group_edges[index],
+            labels={nid: structure.labels[nid] for nid in group if nid in structure.labels},
+        )
+        for index, group in enumerate(groups)
+    ]
+
+
+__all__ = [
+    "adjacency_lists",
+    "degree_map",
+    "connected_components",
+    "induced_subgraph",
+    "remove_nodes",
+    "partition_subgraphs",
+]
@@ -16,6 +16,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional, Set, Any
 from enum import Enum
+from collections import Counter
+import itertools
 import math
 import copy
 
@@ -24,7 +26,7 @@ from .resonance import OmegaSignature, compute_resonance_alignment, derive_omega
 from .coherence import compute_coherence
 from .grace_field import GraceFieldParams, FieldRegime, recursion_depth_classification
 from .dynamic_evolution import DynamicPhaseEvolution, ModeCoefficients, EvolutionState
-from .sgc_modes import SGCMode, SGCModeSystem, ModeExecutionResult
+from .sgc_modes import SGCMode, SGCModeSystem, SGCModeScheduler, ModeExecutionResult
 
 
 class GCScale(Enum):
@@ -34,53 +36,113 @@ class GCScale(Enum):
     HARVEST_LAYER = "harvest_layer"   # Higher-order compression (Ω-compression)
 
 
+@dataclass
+class RunningStats:
+    """Welford running mean/variance that also supports removing samples."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x: float):
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.count -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (x - self.mean))
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (0 for fewer than two samples)."""
+        if self.count <= 1:
+            return 0.0
+        return math.sqrt(self.m2 / self.count)
+
+
+_member_ids = itertools.count()
+
+
 @dataclass
 class SubMonad:
-    """Individual locus of awareness handling local garbage collection."""
+    """Individual locus of awareness handling local garbage collection.
+
+    Assigning ``structure`` bumps ``structure_version`` so ensembles can refresh
+    only the members that changed. Call ``mark_dirty`` after mutating the
+    structure in place. ``member_id`` is unique for the life of the process and
+    keys ensemble caches.
+    """
     structure: ObjectG
     omega: OmegaSignature
     field_regime: FieldRegime
     local_gc_history: List[Dict[str, Any]] = field(default_factory=list)
+    structure_version: int = field(default=0, init=False, repr=False, compare=False)
+    member_id: int = field(default_factory=lambda: next(_member_ids), init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any):
+        if name == 'structure':
+            object.__setattr__(self, 'structure_version', getattr(self, 'structure_version', -1) + 1)
+        object.__setattr__(self, name, value)
+
+    def mark_dirty(self):
+        """Flag the structure as changed after an in-place edit."""
+        self.structure_version += 1
+
+    def perform_local_gc(self, mode_system: SGCModeSystem,
+                         scheduler: Optional[SGCModeScheduler] = None) -> Dict[str, Any]:
+        """Perform local garbage collection on this sub-monad.
+
+        Args:
+            mode_system: Mode system used when no scheduler is supplied.
+            scheduler: Optional scheduler whose metric context and per-mode
+                statistics persist across calls.
+        """
+        if scheduler is None:
+            scheduler = SGCModeScheduler(mode_system)
 
-    def perform_local_gc(self, mode_system: SGCModeSystem) -> Dict[str, Any]:
-        """Perform local garbage collection on this sub-monad."""
         # Apply various GC modes based on current state
         results = []
 
-        # Try different modes based on current state
-        coherence = compute_coherence(self.structure)
-        resonance = compute_resonance_alignment(self.structure, self.omega)
+        # Try different modes based on current state; metrics are computed
+        # once here and reused by every mode in the pipeline
+        ctx = scheduler.context(self.structure)
+        coherence = ctx.coherence()
+        resonance = ctx.resonance(self.omega)
 
+        plan = []
         if resonance < 0.3:  # Low resonance - try assimilation or shedding
-            result = mode_system.execute_mode(SGCMode.RESONANT_ASSIMILATION,
-                                            self.structure, self.omega, self.field_regime)
-            if result.success:
-                results.append(result)
-
+            plan.append(SGCMode.RESONANT_ASSIMILATION)
         if coherence < 0.4 and resonance < 0.2:  # Poor state - shedding
-            result = mode_system.execute_mode(SGCMode.DISSONANT_SHEDDING,
-                                            self.structure, self.omega, self.field_regime)
+            plan.append(SGCMode.DISSONANT_SHEDDING)
+        # Always try reflective rewriting for self-optimization
+        plan.append(SGCMode.REFLECTIVE_REWRITING)
+
+        for mode in plan:
+            result = scheduler.run(mode, ctx, self.omega, self.field_regime)
             if result.success:
                 results.append(result)
 
-        # Always try reflective rewriting for self-optimization
-        result = mode_system.execute_mode(SGCMode.REFLECTIVE_REWRITING,
-                                        self.structure, self.omega, self.field_regime)
-        if result.success:
-            results.append(result)
-
         # Update structure if any modes succeeded
         for result in results:
             if result.structures_modified:
                 self.structure = result.structures_modified[0]
                 break
 
+        if ctx.structure is not self.structure:
+            ctx = scheduler.context(self.structure)
+
         # Record GC history
         gc_record = {
             'timestamp': len(self.local_gc_history),
             'modes_applied': len(results),
-            'final_coherence': compute_coherence(self.structure),
-            'final_resonance': compute_resonance_alignment(self.structure, self.omega),
+            'final_coherence': ctx.coherence(),
+            'final_resonance': ctx.resonance(self.omega),
             'field_regime': self.field_regime
         }
         self.local_gc_history.append(gc_record)
@@ -88,15 +150,35 @@ class SubMonad:
         return gc_record
 
 
+@dataclass
+class _MemberMetrics:
+    """Cached accounting contribution of one sub-monad."""
+    sub_monad: SubMonad
+    version: int
+    coherence: float
+    resonance: float
+    weight: int = 1
+
+
 @dataclass
 class MetaMonad:
-    """Ensemble of mutually resonant sub-monads performing coherence accounting."""
+    """Ensemble of mutually resonant sub-monads performing coherence accounting.
+
+    Ensemble statistics are kept as Welford running aggregates. A refresh only
+    re-evaluates coherence/resonance for members whose ``structure_version``
+    changed (or that joined or left); the remaining per-member work is a
+    version comparison keyed by ``member_id``.
+    """
 
     sub_monads: List[SubMonad]
     shared_omega: OmegaSignature
     ensemble_field_regime: FieldRegime
     coherence_accounting: Dict[str, Any] = field(default_factory=dict)
     systemic_drift: float = 0.0
+    _members: Dict[int, _MemberMetrics] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _coherence_stats: RunningStats = field(default_factory=RunningStats, init=False, repr=False, compare=False)
+    _resonance_stats: RunningStats = field(default_factory=RunningStats, init=False, repr=False, compare=False)
+    _accounting_omega: Optional[OmegaSignature] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Initialize meta-monad coherence accounting."""
@@ -131,46 +213,84 @@ class MetaMonad:
                 phase_hist=new_hist
             )
 
+    def _member_values(self, sub_monad: SubMonad) -> Tuple[float, float]:
+        """(coherence, resonance vs shared Ω) of a sub-monad, reusing accounting when fresh."""
+        entry = self._members.get(sub_monad.member_id)
+        if (entry is not None and entry.sub_monad is sub_monad and
+                entry.version == sub_monad.structure_version and
+                self._accounting_omega is self.shared_omega):
+            return entry.coherence, entry.resonance
+        return (compute_coherence(sub_monad.structure),
+                compute_resonance_alignment(sub_monad.structure, self.shared_omega))
+
+    def _sync_member_metrics(self) -> int:
+        """Bring running aggregates in line with current membership and structures.
+
+        Returns:
+            Number of members whose metrics were re-evaluated.
+        """
+        if self._accounting_omega is not self.shared_omega:
+            # Resonance is measured against the shared Ω; replacing it
+            # invalidates every cached contribution
+            self._members.clear()
+            self._coherence_stats = RunningStats()
+            self._resonance_stats = RunningStats()
+            self._accounting_omega = self.shared_omega
+
+        weights = Counter(sm.member_id for sm in self.sub_monads)
+        by_id = {sm.member_id: sm for sm in self.sub_monads}
+
+        # Retract members that left, changed multiplicity or changed structure
+        for key in list(self._members):
+            entry = self._members[key]
+            if (by_id.get(key) is entry.sub_monad and weights[key] == entry.weight and
+                    entry.version == entry.sub_monad.structure_version):
+                continue
+            for _ in range(entry.weight):
+                self._coherence_stats.remove(entry.coherence)
+                self._resonance_stats.remove(entry.resonance)
+            del self._members[key]
+
+        refreshed = 0
+        for key, sub_monad in by_id.items():
+            if key in self._members:
+                continue
+            entry = _MemberMetrics(
+                sub_monad=sub_monad,
+                version=sub_monad.structure_version,
+                coherence=compute_coherence(sub_monad.structure),
+                resonance=compute_resonance_alignment(sub_monad.structure, self.shared_omega),
+                weight=weights[key],
+            )
+            for _ in range(entry.weight):
+                self._coherence_stats.add(entry.coherence)
+                self._resonance_stats.add(entry.resonance)
+            self._members[key] = entry
+            refreshed += 1
+
+        return refreshed
+
     def _update_coherence_accounting(self):
         """Update systemic coherence accounting."""
         if not self.sub_monads:
             return
 
-        # Compute ensemble coherence
-        ensemble_coherences = [compute_coherence(sm.structure) for sm in self.sub_monads]
-        ensemble_resonances = [compute_resonance_alignment(sm.structure, self.shared_omega)
-                              for sm in self.sub_monads]
+        # Refresh only dirty members; ensemble statistics are running aggregates
+        refreshed = self._sync_member_metrics()
 
         self.coherence_accounting = {
-            'ensemble_coherence': sum(ensemble_coherences) / len(ensemble_coherences),
-            'ensemble_resonance': sum(ensemble_resonances) / len(ensemble_resonances),
+            'ensemble_coherence': self._coherence_stats.mean,
+            'ensemble_resonance': self._resonance_stats.mean,
             'sub_monad_count': len(self.sub_monads),
-            'coherence_variance': self._compute_coherence_variance(ensemble_coherences),
-            'resonance_variance': self._compute_resonance_variance(ensemble_resonances),
-            'field_regime': self.ensemble_field_regime
+            'coherence_variance': self._coherence_stats.std,
+            'resonance_variance': self._resonance_stats.std,
+            'field_regime': self.ensemble_field_regime,
+            'members_refreshed': refreshed
         }
 
         # Detect systemic drift
         self.systemic_drift = self._detect_systemic_drift()
 
-    def _compute_coherence_variance(self, coherences: List[float]) -> float:
-        """Compute variance in sub-monad coherences."""
-        if len(coherences) <= 1:
-            return 0.0
-
-        mean = sum(coherences) / len(coherences)
-        variance = sum((c - mean) ** 2 for c in coherences) / len(coherences)
-        return math.sqrt(variance)  # Return standard deviation
-
-    def _compute_resonance_variance(self, resonances: List[float]) -> float:
-        """Compute variance in sub-monad resonances."""
-        if len(resonances) <= 1:
-            return 0.0
-
-        mean = sum(resonances) / len(resonances)
-        variance = sum((r - mean) ** 2 for r in resonances) / len(resonances)
-        return math.sqrt(variance)
-
     def _detect_systemic_drift(self) -> float:
         """Detect drift from optimal systemic coherence."""
         if not self.coherence_accounting:
@@ -186,38 +306,44 @@ class MetaMonad:
 
         return coherence_drift + variance_penalty * 0.3
 
-    def perform_ensemble_gc(self, mode_system: SGCModeSystem) -> Dict[str, Any]:
-        """Perform coherence accounting and ensemble-level garbage collection."""
+    def perform_ensemble_gc(self, mode_system: SGCModeSystem,
+                            scheduler: Optional[SGCModeScheduler] = None) -> Dict[str, Any]:
+        """Perform coherence accounting and ensemble-level garbage collection.
+
+        Args:
+            mode_system: Mode system used when no scheduler is supplied.
+            scheduler: Optional scheduler whose metric context and per-mode
+                statistics persist across calls.
+        """
+        if scheduler is None:
+            scheduler = SGCModeScheduler(mode_system)
+
         # Update accounting first
         self._update_coherence_accounting()
 
         # Apply ensemble-level modes
         ensemble_results = []
 
+        plan = []
         # Boundary pruning for ensemble boundaries
         if self.systemic_drift > 0.5:  # High drift - apply boundary pruning
-            result = mode_system.execute_mode(SGCMode.BOUNDARY_PRUNING,
-                                           self._create_ensemble_structure(),
-                                           self.shared_omega, self.ensemble_field_regime)
-            if result.success:
-                ensemble_results.append(result)
-
+            plan.append(SGCMode.BOUNDARY_PRUNING)
         # Grace reinstantiation if ensemble is struggling
         if self.coherence_accounting['ensemble_coherence'] < 0.5:
-            result = mode_system.execute_mode(SGCMode.GRACE_REINSTANTIATION,
-                                           self._create_ensemble_structure(),
-                                           self.shared_omega, self.ensemble_field_regime)
-            if result.success:
-                ensemble_results.append(result)
-
+            plan.append(SGCMode.GRACE_REINSTANTIATION)
         # Global resynchronization for high-performing ensembles
         if (self.coherence_accounting['ensemble_resonance'] > 0.8 and
             self.systemic_drift < 0.2):
-            result = mode_system.execute_mode(SGCMode.GLOBAL_RESYNCHRONIZATION,
-                                           self._create_ensemble_structure(),
-                                           self.shared_omega, self.ensemble_field_regime)
-            if result.success:
-                ensemble_results.append(result)
+            plan.append(SGCMode.GLOBAL_RESYNCHRONIZATION)
+
+        if plan:
+            # The ensemble structure depends only on membership, so it is
+            # built once and shared (with its metrics) by all planned modes
+            ctx = scheduler.context(self._create_ensemble_structure())
+            for mode in plan:
+                result = scheduler.run(mode, ctx, self.shared_omega, self.ensemble_field_regime)
+                if result.success:
+                    ensemble_results.append(result)
 
         # Apply pruning/reweighting of failing sub-monads
         survivors = self._prune_failing_sub_monads(mode_system)
@@ -267,8 +393,7 @@ class MetaMonad:
         survivors = []
 
         for sub_monad in self.sub_monads:
-            coherence = compute_coherence(sub_monad.structure)
-            resonance = compute_resonance_alignment(sub_monad.structure, self.shared_omega)
+            coherence, resonance = self._member_values(sub_monad)
 
             # Keep sub-monads that are still viable
             if coherence > 0.3 and resonance > 0.2:
@@ -290,8 +415,8 @@ class MetaMonad:
 
     def _can_mediate(self, monad1: SubMonad, monad2: SubMonad) -> bool:
         """Check if two sub-monads can mediate with each other."""
-        res1 = compute_resonance_alignment(monad1.structure, self.shared_omega)
-        res2 = compute_resonance_alignment(monad2.structure, self.shared_omega)
+        res1 = self._member_values(monad1)[1]
+        res2 = self._member_values(monad2)[1]
         return res1 > 0.5 and res2 > 0.5  # Both must be reasonably resonant
 
     def _mediate_structures(self, struct1: ObjectG, struct2: ObjectG) -> ObjectG:
@@ -319,7 +444,7 @@ class MetaMonad:
             return
 
         # Simple redistribution: normalize coherence across survivors
-        total_coherence = sum(compute_coherence(sm.structure) for sm in self.sub_monads)
+        total_coherence = sum(self._member_values(sm)[0] for sm in self.sub_monads)
 
         if total_coherence > 0:
             # Could implement more sophisticated redistribution here
@@ -444,6 +569,7 @@ class SovereignMonadGC:
     # System components
     mode_system: SGCModeSystem = field(default_factory=SGCModeSystem)
     shared_omega: Optional[OmegaSignature] = None
+    scheduler: Optional[SGCModeScheduler] = None
 
     # Cross-scale resonance bands
     resonance_bands: Dict[GCScale, Tuple[float, float]] = field(default_factory=lambda: {
@@ -462,6 +588,9 @@ class SovereignMonadGC:
                 phase_hist=[1.0/128] * 128  # Uniform distribution
             )
 
+        if self.scheduler is None:
+            self.scheduler = SGCModeScheduler(self.mode_system)
+
     def add_sub_monad(self, structure: ObjectG, field_regime: FieldRegime = FieldRegime.VACUUM):
         """Add a sub-monad to the system."""
         omega = derive_omega_signature(structure)
@@ -490,6 +619,10 @@ class SovereignMonadGC:
             for i in reversed(to_remove):
                 unassigned.pop(i)
 
+            # Account for the joined members (only they are evaluated)
+            if to_remove:
+                meta_monad._update_coherence_accounting()
+
             self.meta_monads.append(meta_monad)
 
     def _can_join_meta_monad(self, candidate: SubMonad, meta_monad: MetaMonad,
@@ -528,12 +661,12 @@ class SovereignMonadGC:
 
         # 1. Sub-monad level GC (local cleanup)
         for sub_monad in self.sub_monads:
-            result = sub_monad.perform_local_gc(self.mode_system)
+            result = sub_monad.perform_local_gc(self.mode_system, self.scheduler)
             cycle_results['sub_monad_gc'].append(result)
 
         # 2. Meta-monad level GC (coherence accounting)
         for meta_monad in self.meta_monads:
-            result = meta_monad.perform_ensemble_gc(self.mode_system)
+            result = meta_monad.perform_ensemble_gc(self.mode_system, self.scheduler)
             cycle_results['meta_monad_gc'].append(result)
 
         # 3. Harvest layer GC (Ω-compression)
@@ -566,7 +699,8 @@ class SovereignMonadGC:
                 'total_harvests': sum(len(hl.harvest_history) for hl in self.harvest_layers),
                 'compression_efficiency': self._compute_compression_efficiency()
             },
-            'resonance_bands': self.resonance_bands
+            'resonance_bands': self.resonance_bands,
+            'mode_scheduler': self.scheduler.summary()
         }
 
     def _compute_avg_sub_monad_coherence(self) -> float:
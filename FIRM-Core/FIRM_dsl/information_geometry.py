@@ -25,6 +25,8 @@ Physical interpretation:
 - Grace = regularizer preventing singularities
 """
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 from enum import Enum
@@ -129,27 +131,47 @@ class FisherInformationMetric:
         g_ij(θ) = (1/2) Tr((∂_i ρ)(ρ^{-1})(∂_j ρ)(ρ^{-1}))
     
     This provides a Riemannian metric for information geometry.
+    
+    For the built-in parameterization ρ = exp(H(θ))/Z the derivatives ∂_i ρ
+    are analytic: H is diagonalized once, H = U diag(h) U†, and in that
+    eigenbasis (Daleckii–Krein)
+    
+        (∂_i ρ)_kl = (B_i)_kl (λ_k - λ_l)/(h_k - h_l) - δ_kl λ_k Σ_m λ_m (B_i)_mm
+    
+    with λ = exp(h)/Z and B_i = ∂H/∂θ_i. The metric is then a single tensor
+    contraction against a kernel in the eigenvalues of ρ. Subclasses that
+    override _rho_from_parameters fall back to finite differences.
     """
     
     def __init__(
         self,
         epsilon: float = 1e-6,
-        regularization: float = 1e-10
+        regularization: float = 1e-10,
+        analytic: bool = True
     ):
         """
         Initialize Fisher metric computer.
         
         Args:
-            epsilon: Finite difference step for derivatives
+            epsilon: Finite difference step for derivatives (finite-difference path only)
             regularization: Small constant added to ρ for numerical stability
+            analytic: Use analytic derivatives of exp(H)/Z when available
         """
         self.epsilon = epsilon
         self.regularization = regularization
+        self.analytic = analytic
+    
+    @property
+    def uses_analytic_derivatives(self) -> bool:
+        """Whether the analytic exp(H)/Z engine applies to this instance."""
+        return (self.analytic and
+                type(self)._rho_from_parameters is FisherInformationMetric._rho_from_parameters)
     
     def compute_metric(
         self,
         state: ProbabilityState,
-        use_bures: bool = True
+        use_bures: bool = True,
+        sld: bool = False
     ) -> FisherMetricResult:
         """
         Compute Fisher information matrix g_ij(θ).
@@ -157,6 +179,9 @@ class FisherInformationMetric:
         Args:
             state: Probability distribution ρ(θ)
             use_bures: Use Bures metric (True) or logarithmic form (False)
+            sld: With use_bures, solve for the symmetric logarithmic derivative
+                exactly, g_ij = ½ Re Tr(∂_i ρ L_j), instead of the simplified
+                ρ⁻¹ contraction
         
         Returns:
             Fisher metric result
@@ -166,12 +191,62 @@ class FisherInformationMetric:
         d = len(theta)
         
         # Compute metric
-        if use_bures:
-            g = self._compute_bures_metric(rho, theta)
+        if self.uses_analytic_derivatives:
+            g = self._compute_analytic_metric(rho, theta, use_bures, sld)
+        elif use_bures:
+            g = self._compute_bures_metric(rho, theta, sld)
         else:
             g = self._compute_log_metric(rho, theta)
         
-        # Analyze metric
+        return self._analyze_metric(g)
+    
+    def compute_metric_batch(
+        self,
+        thetas: np.ndarray,
+        n: int,
+        use_bures: bool = True,
+        sld: bool = False
+    ) -> np.ndarray:
+        """
+        Fisher metric at many parameter points for ρ(θ) = exp(H(θ))/Z.
+        
+        All points are diagonalized in one batched eigh and contracted with
+        batched matrix products, so sampling the metric on a stencil or grid
+        costs little more than a single evaluation.
+        
+        Args:
+            thetas: (M, d) parameter points (a single (d,) point is accepted)
+            n: Hilbert space dimension
+            use_bures: Use Bures metric (True) or logarithmic form (False)
+            sld: Exact SLD form of the Bures metric (see compute_metric)
+        
+        Returns:
+            (M, d, d) array of metric matrices (or (d, d) for a single point)
+        """
+        thetas = np.asarray(thetas, dtype=float)
+        single = thetas.ndim == 1
+        thetas = np.atleast_2d(thetas)
+        
+        if not self.uses_analytic_derivatives:
+            g = np.stack([
+                self._compute_bures_metric(self._rho_from_parameters(t, n), t, sld) if use_bures
+                else self._compute_log_metric(self._rho_from_parameters(t, n), t)
+                for t in thetas
+            ])
+            return g[0] if single else g
+        
+        lam, _, d_rho = self._analytic_derivatives(thetas, n)
+        if use_bures:
+            g = self._contract_bures(d_rho, lam + self.regularization, sld)
+        else:
+            d_log = d_rho * self._log_divided_differences(lam + self.regularization)[:, None]
+            g = self._contract_diagonal_state(d_log, lam)
+        
+        return g[0] if single else g
+    
+    @staticmethod
+    def _analyze_metric(g: np.ndarray) -> FisherMetricResult:
+        """Package a metric matrix with its spectrum diagnostics."""
         eigvals = np.linalg.eigvalsh(g)
         is_positive = np.all(eigvals > -1e-10)
         
@@ -187,10 +262,163 @@ class FisherInformationMetric:
             condition_number=condition_number
         )
     
+    # ------------------------------------------------------------------------
+    # Analytic engine (ρ = exp(H)/Z)
+    # ------------------------------------------------------------------------
+    
+    @staticmethod
+    def _parameter_basis(n: int, d: int) -> np.ndarray:
+        """
+        Generators B_i = ∂H/∂θ_i of the exp(H)/Z parameterization.
+        
+        Order matches _rho_from_parameters: diagonal entries, then real and
+        imaginary off-diagonal parts. Parameters beyond n² have B_i = 0.
+        """
+        basis = np.zeros((d, n, n), dtype=complex)
+        idx = 0
+        for i in range(n):
+            if idx < d:
+                basis[idx, i, i] = 1.0
+                idx += 1
+        for i in range(n):
+            for j in range(i + 1, n):
+                if idx < d:
+                    basis[idx, i, j] = basis[idx, j, i] = 1.0
+                    idx += 1
+        for i in range(n):
+            for j in range(i + 1, n):
+                if idx < d:
+                    basis[idx, i, j] = 1j
+                    basis[idx, j, i] = -1j
+                    idx += 1
+        return basis
+    
+    def _analytic_derivatives(
+        self,
+        thetas: np.ndarray,
+        n: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Eigen-decomposition of ρ(θ) and ∂_i ρ in its eigenbasis.
+        
+        Args:
+            thetas: (M, d) parameter points
+            n: Hilbert space dimension
+        
+        Returns:
+            (λ (M, n), U (M, n, n), ∂ρ (M, d, n, n)) with ρ = U diag(λ) U†
+            and ∂ρ expressed in the eigenbasis U.
+        """
+        basis = self._parameter_basis(n, thetas.shape[1])
+        H = np.tensordot(thetas.astype(complex), basis, axes=1)
+        h, U = np.linalg.eigh(H)
+        
+        # λ = exp(h)/Z, shifted by max(h) to avoid overflow
+        h = h - h.max(axis=-1, keepdims=True)
+        lam = np.exp(h)
+        lam /= lam.sum(axis=-1, keepdims=True)
+        
+        # Divided differences (λ_k - λ_l)/(h_k - h_l), λ_k on the diagonal
+        dh = h[:, :, None] - h[:, None, :]
+        close = np.abs(dh) < 1e-12
+        safe_dh = np.where(close, 1.0, dh)
+        F = np.where(close, lam[:, None, :], lam[:, None, :] * np.expm1(dh) / safe_dh)
+        
+        # Generators in the eigenbasis: U† B_i U
+        Uh = U.conj().swapaxes(-1, -2)
+        B = np.einsum('mkp,ipq,mql->mikl', Uh, basis, U)
+        
+        # ∂_i ρ = B_i ∘ F - diag(λ) Σ_k λ_k (B_i)_kk
+        trace_term = np.einsum('mikk,mk->mi', B, lam).real
+        d_rho = B * F[:, None]
+        diag = np.arange(n)
+        d_rho[:, :, diag, diag] -= trace_term[:, :, None] * lam[:, None, :]
+        
+        return lam, U, d_rho
+    
+    @staticmethod
+    def _log_divided_differences(mu: np.ndarray) -> np.ndarray:
+        """Kernel (log μ_k - log μ_l)/(μ_k - μ_l), 1/μ_k on the diagonal."""
+        dmu = mu[:, :, None] - mu[:, None, :]
+        close = np.abs(dmu) < 1e-14 * np.maximum(mu[:, :, None], mu[:, None, :])
+        log_mu = np.log(mu)
+        safe = np.where(close, 1.0, dmu)
+        return np.where(close, 1.0 / mu[:, :, None],
+                        (log_mu[:, :, None] - log_mu[:, None, :]) / safe)
+    
+    @staticmethod
+    def _contract_bures(d_rho: np.ndarray, mu: np.ndarray, sld: bool = False) -> np.ndarray:
+        """
+        Bures-form metric from ∂_i ρ in the eigenbasis of ρ (eigenvalues μ).
+        
+        Simplified form: g_ij = ½ Re Σ_kl (∂_i ρ)_kl (∂_j ρ)_lk / (μ_k μ_l)
+        SLD form:        g_ij = Re Σ_kl (∂_i ρ)_kl (∂_j ρ)_lk / (μ_k + μ_l)
+        (the latter is ½ Re Tr(∂_i ρ L_j) with L_kl = 2 (∂ρ)_kl / (μ_k + μ_l)).
+        """
+        m, d = d_rho.shape[:2]
+        if sld:
+            kernel = 1.0 / (mu[:, :, None] + mu[:, None, :])
+        else:
+            kernel = 0.5 / (mu[:, :, None] * mu[:, None, :])
+        A = (d_rho * kernel[:, None]).reshape(m, d, -1)
+        # (∂_j ρ)_lk = conj((∂_j ρ)_kl) for Hermitian ∂_j ρ
+        C = d_rho.conj().reshape(m, d, -1)
+        return (A @ C.swapaxes(-1, -2)).real
+    
+    @staticmethod
+    def _contract_diagonal_state(d_log: np.ndarray, lam: np.ndarray) -> np.ndarray:
+        """g_ij = Re Tr(ρ ∂_i L ∂_j L) for ρ = diag(λ) in the working basis."""
+        m, d = d_log.shape[:2]
+        A = (d_log * lam[:, None, :, None]).reshape(m, d, -1)
+        C = d_log.conj().reshape(m, d, -1)
+        return (A @ C.swapaxes(-1, -2)).real
+    
+    def _compute_analytic_metric(
+        self,
+        rho: np.ndarray,
+        theta: np.ndarray,
+        use_bures: bool,
+        sld: bool = False
+    ) -> np.ndarray:
+        """
+        Metric at θ with analytic ∂_i ρ, evaluated against the state's ρ.
+        
+        When ρ equals ρ(θ) the eigenbasis of H is reused; otherwise the
+        derivatives are rotated into the eigenbasis of the supplied ρ, which
+        reproduces the finite-difference formulas exactly in the ε → 0 limit.
+        """
+        n = rho.shape[0]
+        lam, U, d_rho = self._analytic_derivatives(theta[None, :].astype(float), n)
+        lam, U, d_rho = lam[0], U[0], d_rho[0]
+        
+        consistent = np.allclose(rho, (U * lam) @ U.conj().T, atol=1e-12, rtol=0.0)
+        
+        if use_bures:
+            if consistent:
+                mu = lam + self.regularization
+                return self._contract_bures(d_rho[None], mu[None], sld)[0]
+            mu, V = np.linalg.eigh(rho + self.regularization * np.eye(n))
+            W = V.conj().T @ U
+            d_rho = W @ d_rho @ W.conj().T
+            return self._contract_bures(d_rho[None], mu[None], sld)[0]
+        
+        # ∂L is taken at ρ(θ) + reg·I (eigenbasis U); ρ enters only as a weight
+        d_log = d_rho * self._log_divided_differences((lam + self.regularization)[None])[0]
+        if consistent:
+            return self._contract_diagonal_state(d_log[None], lam[None])[0]
+        rho_u = U.conj().T @ rho @ U
+        g = np.einsum('mk,ikl,jlm->ij', rho_u, d_log, d_log).real
+        return np.triu(g) + np.triu(g, 1).T
+    
+    # ------------------------------------------------------------------------
+    # Finite-difference fallback
+    # ------------------------------------------------------------------------
+    
     def _compute_bures_metric(
         self,
         rho: np.ndarray,
-        theta: np.ndarray
+        theta: np.ndarray,
+        sld: bool = False
     ) -> np.ndarray:
         """
         Compute Bures-Helstrom metric (quantum Fisher information).
@@ -220,13 +448,19 @@ class FisherInformationMetric:
             d_rho_i = (rho_plus - rho_minus) / (2 * self.epsilon)
             partial_rho.append(d_rho_i)
         
+        if sld:
+            # Exact SLD contraction in the eigenbasis of ρ
+            mu, V = np.linalg.eigh(rho_reg)
+            d_rho = V.conj().T @ np.array(partial_rho) @ V
+            return self._contract_bures(d_rho[None], mu[None], sld=True)[0]
+        
         # Compute metric g_ij
+        rho_inv = np.linalg.pinv(rho_reg)
         for i in range(d):
             for j in range(i, d):  # Symmetric, only compute upper triangle
                 # Solve for L_j: ∂_j ρ = (1/2)(ρ L_j + L_j ρ)
                 # Use simplified formula: g_ij ≈ Tr(∂_i ρ ρ^{-1} ∂_j ρ ρ^{-1})
                 try:
-                    rho_inv = np.linalg.pinv(rho_reg)
                     term = partial_rho[i] @ rho_inv @ partial_rho[j] @ rho_inv
                     g[i, j] = 0.5 * np.trace(term).real
                     g[j, i] = g[i, j]  # Symmetric
@@ -357,13 +591,24 @@ class RiemannianCurvature:
     For information geometry, high curvature = high epistemic uncertainty.
     
     Grace acts as curvature regulator: R → φ^{-1} R in coherent regions.
+    
+    Curvature engine: the first and second metric derivatives needed for the
+    Christoffel symbols and R_{ijkl} come from central differences on a fixed
+    stencil of 1 + 2d² parameter points. All stencil samples for all
+    requested base points are gathered, looked up in a θ-keyed cache and the
+    missing ones evaluated in a single FisherInformationMetric.compute_metric_batch
+    call (split over a process pool when large). Neighbouring base points on a
+    grid whose spacing is a multiple of ε share stencil samples.
     """
     
     def __init__(
         self,
         fisher: FisherInformationMetric,
         grace: Optional[GraceOperator] = None,
-        epsilon: float = 1e-5
+        epsilon: float = 1e-5,
+        cache_size: int = 65536,
+        workers: Optional[int] = None,
+        parallel_threshold: int = 4096
     ):
         """
         Initialize curvature computer.
@@ -372,10 +617,21 @@ class RiemannianCurvature:
             fisher: Fisher metric computer
             grace: Grace operator for curvature regulation
             epsilon: Finite difference step
+            cache_size: Maximum number of cached metric samples (0 disables)
+            workers: Process count for large sample batches (None = serial)
+            parallel_threshold: Minimum number of new samples before the
+                process pool is used
         """
         self.fisher = fisher
         self.grace = grace or create_default_grace_operator()
         self.epsilon = epsilon
+        self.cache_size = cache_size
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        
+        self._metric_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def compute_curvature(
         self,
@@ -385,8 +641,8 @@ class RiemannianCurvature:
         """
         Compute Riemann curvature tensor R_{ijkl}.
         
-        For 2D manifolds (d=2 parameters), uses Gaussian curvature formula.
-        For higher dimensions, uses finite differences of Christoffel symbols.
+        The metric is sampled on the manifold ρ(θ) around state.parameters;
+        for d=2 the single sectional curvature is the Gaussian curvature.
         
         Args:
             state: Base point on manifold
@@ -395,85 +651,212 @@ class RiemannianCurvature:
         Returns:
             Curvature tensors
         """
-        d = state.num_parameters
-        
-        if d == 2:
-            return self._compute_curvature_2d(state, apply_grace_regulation)
-        else:
-            return self._compute_curvature_nd(state, apply_grace_regulation)
+        theta = np.asarray(state.parameters, dtype=float)
+        g, R = self._riemann_batch(theta[None], state.dimension)
+        factor = self._grace_factor(state.entropy()) if apply_grace_regulation else 1.0
+        return self._build_result(g[0], factor * R[0])
     
-    def _compute_curvature_2d(
+    def compute_curvature_batch(
         self,
-        state: ProbabilityState,
-        apply_grace: bool
-    ) -> CurvatureResult:
+        thetas: np.ndarray,
+        n: int,
+        apply_grace_regulation: bool = True
+    ) -> List[CurvatureResult]:
         """
-        Compute curvature for 2D manifold using Gaussian curvature.
+        Compute curvature at many base points ρ(θ_m) with one metric batch.
         
-        K = -1/(2√g) ∂_i(√g g^{jk} Γ^i_{jk})
+        Args:
+            thetas: (M, d) base points
+            n: Hilbert space dimension
+            apply_grace_regulation: Apply φ-scaling to curvature
         
-        Simplified for 2D: K = (R_1212) / det(g)
+        Returns:
+            One CurvatureResult per base point
         """
-        # Compute metric at base point
-        g_result = self.fisher.compute_metric(state)
-        g = g_result.metric_matrix
-        
-        # Compute Gaussian curvature (simplified)
-        det_g = np.linalg.det(g)
-        if det_g < 1e-15:
-            K = 0.0
-        else:
-            # Use finite differences to estimate curvature
-            # For simplicity, use a constant estimate
-            K = 0.0  # Placeholder - full implementation needs Christoffel symbols
-        
-        # Apply Grace regulation
-        if apply_grace:
-            # High coherence → low curvature
-            # Estimate coherence from entropy
-            S = state.entropy()
-            coherence = np.exp(-S)  # High entropy → low coherence
-            grace_factor = PHI_INVERSE + (1 - PHI_INVERSE) * coherence
-            K *= grace_factor
-        
-        # Build tensors
-        R_ijkl = np.zeros((2, 2, 2, 2))
-        R_ijkl[0, 1, 0, 1] = K * det_g
-        R_ijkl[1, 0, 1, 0] = K * det_g
-        R_ijkl[0, 1, 1, 0] = -K * det_g
-        R_ijkl[1, 0, 0, 1] = -K * det_g
-        
-        R_ij = np.array([[K, 0], [0, K]])
-        R_scalar = 2 * K
-        
-        sectional_K = np.array([K])
-        
-        return CurvatureResult(
-            riemann_tensor=R_ijkl,
-            ricci_tensor=R_ij,
-            ricci_scalar=R_scalar,
-            sectional_curvatures=sectional_K
-        )
+        thetas = np.atleast_2d(np.asarray(thetas, dtype=float))
+        g, R = self._riemann_batch(thetas, n)
+        factors = self._grace_factors(thetas, n, apply_grace_regulation)
+        return [self._build_result(g[m], factors[m] * R[m]) for m in range(len(thetas))]
     
-    def _compute_curvature_nd(
+    def scalar_curvature_map(
         self,
-        state: ProbabilityState,
-        apply_grace: bool
-    ) -> CurvatureResult:
+        thetas: np.ndarray,
+        n: int,
+        apply_grace_regulation: bool = True
+    ) -> np.ndarray:
         """
-        Compute curvature for N-dimensional manifold.
+        Ricci scalar over a grid of parameter points.
         
-        Uses finite differences of metric to estimate Christoffel symbols,
-        then computes Riemann tensor.
+        Args:
+            thetas: (..., d) array of base points, e.g. (A, B, d) for a 2-D map
+            n: Hilbert space dimension
+            apply_grace_regulation: Apply φ-scaling to curvature
+        
+        Returns:
+            Array of Ricci scalars with shape thetas.shape[:-1]
+        """
+        thetas = np.asarray(thetas, dtype=float)
+        flat = thetas.reshape(-1, thetas.shape[-1])
+        g, R = self._riemann_batch(flat, n)
+        ginv = np.linalg.pinv(g, hermitian=True)
+        ricci = np.einsum('zil,ziklm->zkm', ginv, R)
+        scalar = np.einsum('zkm,zkm->z', ginv, ricci)
+        return (self._grace_factors(flat, n, apply_grace_regulation) * scalar).reshape(thetas.shape[:-1])
+    
+    def clear_cache(self):
+        """Drop all cached metric samples."""
+        self._metric_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    # ------------------------------------------------------------------------
+    # Grace regulation
+    # ------------------------------------------------------------------------
+    
+    @staticmethod
+    def _grace_factor(entropy: float) -> float:
+        """φ⁻¹ ≤ factor ≤ 1: high coherence (low entropy) → low curvature."""
+        coherence = np.exp(-entropy)
+        return PHI_INVERSE + (1 - PHI_INVERSE) * coherence
+    
+    def _grace_factors(self, thetas: np.ndarray, n: int, apply_grace: bool) -> np.ndarray:
+        """Grace factors for ρ(θ_m), using the same entropy as ProbabilityState."""
+        if not apply_grace:
+            return np.ones(len(thetas))
+        factors = np.empty(len(thetas))
+        for m, theta in enumerate(thetas):
+            eigvals = np.linalg.eigvalsh(self.fisher._rho_from_parameters(theta, n))
+            eigvals = eigvals[eigvals > 1e-15]
+            factors[m] = self._grace_factor(-np.sum(eigvals * np.log(eigvals)))
+        return factors
+    
+    # ------------------------------------------------------------------------
+    # Curvature engine
+    # ------------------------------------------------------------------------
+    
+    @staticmethod
+    def _stencil(d: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
-        d = state.num_parameters
+        Central-difference stencil in units of ε.
         
-        # For now, return zero curvature (flat space approximation)
-        # Full implementation requires Christoffel symbol computation
-        R_ijkl = np.zeros((d, d, d, d))
-        R_ij = np.zeros((d, d))
-        R_scalar = 0.0
-        sectional_K = np.zeros(d * (d-1) // 2)
+        Returns:
+            offsets: (1 + 2d², d) integer offsets — origin, ±e_i, then
+                (±e_i ± e_j) for i < j
+            plus, minus: (d,) row indices of +e_i and -e_i
+            mixed: (d(d-1)/2, 4) row indices of (++, +-, -+, --) per pair
+        """
+        eye = np.eye(d, dtype=int)
+        rows = [np.zeros((1, d), dtype=int), eye, -eye]
+        i_idx, j_idx = np.triu_indices(d, k=1)
+        for si, sj in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+            rows.append(si * eye[i_idx] + sj * eye[j_idx])
+        offsets = np.concatenate(rows)
+        
+        plus = 1 + np.arange(d)
+        minus = 1 + d + np.arange(d)
+        pairs = len(i_idx)
+        mixed = 1 + 2 * d + np.arange(4)[None, :] * pairs + np.arange(pairs)[:, None]
+        return offsets, plus, minus, mixed
+    
+    def _sample_metrics(self, points: np.ndarray, n: int) -> np.ndarray:
+        """
+        Fisher metric at every point, served from the θ-keyed cache.
+        
+        Points are keyed on θ/ε rounded to 1e-6, so stencil points of
+        neighbouring base points that coincide up to floating-point noise
+        are evaluated once. Duplicates within the request are evaluated once.
+        """
+        keys = [(n, self.epsilon) + tuple(row) for row in np.round(points / self.epsilon, 6)]
+        out = np.empty((len(points), points.shape[1], points.shape[1]))
+        
+        pending: dict = {}
+        for idx, key in enumerate(keys):
+            cached = self._metric_cache.get(key)
+            if cached is not None:
+                self._metric_cache.move_to_end(key)
+                out[idx] = cached
+                self.cache_hits += 1
+            else:
+                pending.setdefault(key, []).append(idx)
+        
+        if pending:
+            first = np.array([rows[0] for rows in pending.values()])
+            values = self._evaluate_metrics(points[first], n)
+            self.cache_misses += len(pending)
+            for (key, rows), g in zip(pending.items(), values):
+                out[rows] = g
+                if self.cache_size > 0:
+                    self._metric_cache[key] = g
+            while len(self._metric_cache) > self.cache_size:
+                self._metric_cache.popitem(last=False)
+        
+        return out
+    
+    def _evaluate_metrics(self, points: np.ndarray, n: int) -> np.ndarray:
+        """One batched metric call, chunked across processes when large."""
+        if self.workers and self.workers > 1 and len(points) >= self.parallel_threshold:
+            chunks = np.array_split(points, self.workers * 4)
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                parts = pool.map(_metric_batch_chunk, [(self.fisher, chunk, n) for chunk in chunks])
+                return np.concatenate(list(parts))
+        return self.fisher.compute_metric_batch(points, n)
+    
+    def _riemann_batch(self, thetas: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Metric and covariant Riemann tensor at each base point.
+        
+        With Γ_{k,ij} = ½(∂_i g_jk + ∂_j g_ik − ∂_k g_ij) and Γ^n_ij = g^{nk} Γ_{k,ij}:
+        
+            R_{iklm} = ½(∂_k∂_l g_im + ∂_i∂_m g_kl − ∂_k∂_m g_il − ∂_i∂_l g_km)
+                       + Γ^n_kl Γ_{n,im} − Γ^n_km Γ_{n,il}
+        
+        Returns:
+            g: (M, d, d) metrics, R: (M, d, d, d, d) Riemann tensors
+        """
+        M, d = thetas.shape
+        eps = self.epsilon
+        offsets, plus, minus, mixed = self._stencil(d)
+        
+        points = (thetas[:, None, :] + eps * offsets[None]).reshape(-1, d)
+        samples = self._sample_metrics(points, n).reshape(M, len(offsets), d, d)
+        
+        g = samples[:, 0]
+        g_plus, g_minus = samples[:, plus], samples[:, minus]
+        
+        # dg[z, a, i, j] = ∂_a g_ij; ddg[z, a, b, i, j] = ∂_a∂_b g_ij
+        dg = (g_plus - g_minus) / (2 * eps)
+        ddg = np.empty((M, d, d, d, d))
+        diag = np.arange(d)
+        ddg[:, diag, diag] = (g_plus - 2 * g[:, None] + g_minus) / eps**2
+        i_idx, j_idx = np.triu_indices(d, k=1)
+        pp, pm, mp, mm = (samples[:, mixed[:, s]] for s in range(4))
+        cross = (pp - pm - mp + mm) / (4 * eps**2)
+        ddg[:, i_idx, j_idx] = cross
+        ddg[:, j_idx, i_idx] = cross
+        
+        gamma_first = 0.5 * (np.einsum('zijk->zkij', dg) + np.einsum('zjik->zkij', dg)
+                             - dg)
+        ginv = np.linalg.pinv(g, hermitian=True)
+        gamma = np.einsum('znk,zkij->znij', ginv, gamma_first)
+        
+        R = 0.5 * (np.einsum('zklim->ziklm', ddg) + np.einsum('zimkl->ziklm', ddg)
+                   - np.einsum('zkmil->ziklm', ddg) - np.einsum('zilkm->ziklm', ddg))
+        R += np.einsum('znkl,znim->ziklm', gamma, gamma_first)
+        R -= np.einsum('znkm,znil->ziklm', gamma, gamma_first)
+        
+        return g, R
+    
+    @staticmethod
+    def _build_result(g: np.ndarray, R_ijkl: np.ndarray) -> CurvatureResult:
+        """Contract a Riemann tensor into Ricci tensor, scalar and sectional curvatures."""
+        ginv = np.linalg.pinv(g, hermitian=True)
+        R_ij = np.einsum('il,iklm->km', ginv, R_ijkl)
+        R_scalar = float(np.einsum('km,km->', ginv, R_ij))
+        
+        i_idx, j_idx = np.triu_indices(g.shape[0], k=1)
+        area = g[i_idx, i_idx] * g[j_idx, j_idx] - g[i_idx, j_idx]**2
+        numerator = R_ijkl[i_idx, j_idx, i_idx, j_idx]
+        sectional_K = np.divide(numerator, area, out=np.zeros_like(numerator), where=area > 1e-15)
         
         return CurvatureResult(
             riemann_tensor=R_ijkl,
@@ -483,6 +866,12 @@ class RiemannianCurvature:
         )
 
 
+def _metric_batch_chunk(args) -> np.ndarray:
+    """Process-pool worker: evaluate one chunk of metric samples."""
+    fisher, points, n = args
+    return fisher.compute_metric_batch(points, n)
+
+
 # ============================================================================
 # KL Divergence (Relative Entropy)
 # ============================================================================
@@ -76,29 +76,121 @@ class CliffordAlgebra:
     
     For physics, we typically use Cl(3,0) - three spatial dimensions.
     
-    Basis elements:
+    Basis elements (grade order, lexicographic within a grade):
     - Grade 0 (scalar): 1
     - Grade 1 (vectors): e₁, e₂, e₃
     - Grade 2 (bivectors): e₁e₂, e₁e₃, e₂e₃
     - Grade 3 (trivector/pseudoscalar): e₁e₂e₃ = I
+    
+    Products are table-driven: every blade pair (i, j) maps to a single
+    blade index k = product_index[i, j] with sign product_sign[i, j], built
+    once at construction. Multivectors are arrays whose last axis has
+    length 2ⁿ, so all products broadcast over leading batch dimensions.
     """
     
-    def __init__(self, dimension: int = 3):
+    def __init__(self, dimension: int = 3, signature: Optional[Tuple[int, int]] = None):
         """
         Initialize Clifford algebra.
         
         Args:
             dimension: Spatial dimension (default 3 for physics)
+            signature: (p, q) with p basis vectors squaring to +1 followed by
+                q squaring to -1, e.g. (1, 3) for Cl(1,3). Defaults to (dimension, 0).
         """
+        if signature is None:
+            signature = (dimension, 0)
+        p, q = signature
+        if p < 0 or q < 0 or p + q != dimension:
+            raise ValueError(f"Signature {signature} does not match dimension {dimension}")
+        
         self.dim = dimension
+        self.signature = (p, q)
         self.basis_size = 2 ** dimension
+        self.metric = np.array([1.0] * p + [-1.0] * q)
         self._init_basis_products()
     
     def _init_basis_products(self):
         """Initialize basis product lookup tables."""
-        # For Cl(3), we have 8 basis elements: 1, e₁, e₂, e₃, e₁e₂, e₁e₃, e₂e₃, e₁e₂e₃
-        # Product table encodes: e_i * e_j = ...
-        pass  # Simplified - full implementation would build complete product table
+        n = self.dim
+        
+        # Blades as bitmasks (bit i ↔ e_{i+1}), ordered by grade then lexicographically
+        blades = sorted(
+            range(self.basis_size),
+            key=lambda m: (bin(m).count('1'), [i for i in range(n) if m >> i & 1])
+        )
+        self.blade_masks = np.array(blades, dtype=np.int64)
+        self.blade_index = np.empty(self.basis_size, dtype=np.int64)
+        self.blade_index[self.blade_masks] = np.arange(self.basis_size)
+        self.grades = np.array([bin(m).count('1') for m in blades], dtype=np.int64)
+        
+        size = self.basis_size
+        self.product_index = np.empty((size, size), dtype=np.int64)
+        self.product_sign = np.empty((size, size))
+        
+        for i, a in enumerate(blades):
+            for j, b in enumerate(blades):
+                # Reordering sign: each e_k in a must pass every lower e_l in b
+                swaps = 0
+                shifted = a >> 1
+                while shifted:
+                    swaps += bin(shifted & b).count('1')
+                    shifted >>= 1
+                sign = -1.0 if swaps % 2 else 1.0
+                
+                # Contract repeated generators with the metric
+                common = a & b
+                for k in range(n):
+                    if common >> k & 1:
+                        sign *= self.metric[k]
+                
+                self.product_index[i, j] = self.blade_index[a ^ b]
+                self.product_sign[i, j] = sign
+        
+        # Gather form: (A B)_k = Σ_i A_i · sign[i, j] · B_j with j = gather_index[i, k]
+        masks = self.blade_masks
+        self._gather_index = self.blade_index[masks[:, None] ^ masks[None, :]]
+        rows = np.arange(size)[:, None]
+        self._gather_sign = self.product_sign[rows, self._gather_index]
+        
+        # Outer product keeps pairs with no shared generator
+        disjoint = (masks[:, None] & masks[self._gather_index]) == 0
+        self._outer_sign = np.where(disjoint, self._gather_sign, 0.0)
+        
+        # Left contraction keeps pairs where blade i is contained in the result's source blade j
+        source = masks[self._gather_index]
+        contained = (masks[:, None] & source) == masks[:, None]
+        grade_drop = self.grades[self.blade_index[source]] - self.grades[:, None] == self.grades[None, :]
+        self._contraction_sign = np.where(contained & grade_drop, self._gather_sign, 0.0)
+        
+        # Reversion sign (-1)^{k(k-1)/2}
+        self.reverse_sign = np.where((self.grades * (self.grades - 1) // 2) % 2, -1.0, 1.0)
+    
+    def as_multivector(self, v: np.ndarray) -> np.ndarray:
+        """
+        Embed grade-1 vectors (..., n) as multivectors (..., 2ⁿ); pass multivectors through.
+        
+        Args:
+            v: Vector(s) or multivector(s)
+        
+        Returns:
+            Multivector array
+        """
+        v = np.asarray(v)
+        if v.shape[-1] == self.basis_size:
+            return v
+        if v.shape[-1] != self.dim:
+            raise ValueError(
+                f"Expected last axis of length {self.dim} or {self.basis_size}, got {v.shape[-1]}"
+            )
+        result = np.zeros(v.shape[:-1] + (self.basis_size,), dtype=np.result_type(v, float))
+        result[..., 1:self.dim + 1] = v
+        return result
+    
+    def _table_product(self, v1: np.ndarray, v2: np.ndarray, signs: np.ndarray) -> np.ndarray:
+        """Bilinear product Σ_i A_i · signs[i, k] · B_{gather[i, k]} over batches."""
+        A = self.as_multivector(v1)
+        B = self.as_multivector(v2)
+        return np.einsum('...i,...ik->...k', A, B[..., self._gather_index] * signs)
     
     def grade_projection(self, multivector: np.ndarray, grade: int) -> np.ndarray:
         """
@@ -111,39 +203,77 @@ class CliffordAlgebra:
         Returns:
             Multivector with only specified grade components
         """
-        result = np.zeros_like(multivector)
-        
-        if grade == 0:  # Scalar
-            result[0] = multivector[0]
-        elif grade == 1:  # Vector
-            result[1:4] = multivector[1:4]
-        elif grade == 2:  # Bivector
-            result[4:7] = multivector[4:7]
-        elif grade == 3:  # Trivector (pseudoscalar)
-            result[7] = multivector[7]
-        
-        return result
+        multivector = np.asarray(multivector)
+        return np.where(self.grades == grade, multivector, 0).astype(multivector.dtype)
+    
+    def reverse(self, multivector: np.ndarray) -> np.ndarray:
+        """Reversion Ã (reverses the order of generators in every blade)."""
+        return self.as_multivector(multivector) * self.reverse_sign
     
-    def inner_product(self, v1: np.ndarray, v2: np.ndarray) -> float:
+    def inner_product(self, v1: np.ndarray, v2: np.ndarray):
         """
         Clifford inner product: ⟨v₁, v₂⟩
         
         For vectors, this is the standard dot product.
-        For general multivectors, it's the grade-0 part of v₁ * v₂.
+        For general multivectors, it's the Euclidean inner product of the
+        blade coefficients, so ⟨v, v⟩ ≥ 0 in every signature. Use
+        scalar_product for the metric grade-0 part of v₁ * v₂.
+        
+        Args:
+            v1, v2: Vectors or multivectors of equal length, with optional
+                batch dimensions
+        
+        Returns:
+            Scalar result, shaped like the batch dimensions
+        """
+        return np.real(np.sum(np.conj(v1) * np.asarray(v2), axis=-1))
+    
+    def scalar_product(self, v1: np.ndarray, v2: np.ndarray):
+        """
+        Scalar product ⟨v₁ v₂⟩₀: the grade-0 part of the geometric product.
+        
+        Uses the algebra's metric, so it is indefinite for mixed signatures
+        (e.g. (e₁e₂)² = -1 and timelike/spacelike vectors in Cl(1,3)).
         
         Args:
-            v1, v2: Multivectors or vectors
+            v1, v2: Multivectors or vectors, with optional batch dimensions
         
         Returns:
-            Scalar (grade-0) result
+            Scalar (grade-0) result, shaped like the batch dimensions
+        """
+        v1 = np.asarray(v1)
+        v2 = np.asarray(v2)
+        if v1.shape[-1] == self.dim and v2.shape[-1] == self.dim:
+            return np.sum(v1 * v2 * self.metric, axis=-1)
+        
+        # ⟨AB⟩₀ = Σ_i A_i B_i · sign[i, i]  (only equal blades reach the scalar)
+        A = self.as_multivector(v1)
+        B = self.as_multivector(v2)
+        return np.sum(A * B * np.diagonal(self.product_sign), axis=-1)
+    
+    def left_contraction(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+        """
+        Left contraction v₁ ⌋ v₂: the grade-lowering inner product of multivectors.
+        
+        Args:
+            v1, v2: Multivectors or vectors, with optional batch dimensions
+        
+        Returns:
+            Multivector of grade(v₂) - grade(v₁) per blade pair
+        """
+        return self._table_product(v1, v2, self._contraction_sign)
+    
+    def outer_product(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
         """
-        # Simplified: Euclidean inner product for vectors
-        if len(v1) <= 3 and len(v2) <= 3:
-            return np.dot(v1, v2)
+        Exterior product of arbitrary multivectors, batched.
+        
+        Args:
+            v1, v2: Multivectors or vectors, with optional batch dimensions
         
-        # For multivectors: extract scalar part of geometric product
-        # This is simplified - full implementation needs geometric product
-        return np.real(np.vdot(v1, v2))
+        Returns:
+            Multivector v₁ ∧ v₂
+        """
+        return self._table_product(v1, v2, self._outer_sign)
     
     def wedge_product(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
         """
@@ -153,33 +283,22 @@ class CliffordAlgebra:
         Antisymmetric: v ∧ w = -(w ∧ v)
         
         Args:
-            v1, v2: Vectors (grade-1)
+            v1, v2: Vectors (grade-1) or general multivectors
         
         Returns:
-            Bivector (grade-2)
+            Bivector (grade-2) for vector inputs, as a full multivector
         """
-        # For 3D vectors, wedge product creates bivector
-        if len(v1) == 3 and len(v2) == 3:
-            # Bivector components: e₁e₂, e₁e₃, e₂e₃
-            # v₁ ∧ v₂ = (v₁ˣv₂ʸ - v₁ʸv₂ˣ)e₁e₂ + ...
-            result = np.zeros(8)  # Full multivector
-            result[4] = v1[0]*v2[1] - v1[1]*v2[0]  # e₁e₂
-            result[5] = v1[0]*v2[2] - v1[2]*v2[0]  # e₁e₃
-            result[6] = v1[1]*v2[2] - v1[2]*v2[1]  # e₂e₃
-            return result
-        
-        # General case would need full geometric product
-        raise NotImplementedError("Wedge product only implemented for 3D vectors")
+        return self.outer_product(v1, v2)
     
     def pseudoscalar(self) -> np.ndarray:
         """
-        Pseudoscalar I = e₁e₂e₃ (volume element).
+        Pseudoscalar I = e₁e₂...eₙ (volume element).
         
         In Cl(3), this is the grade-3 basis element.
         Squares to -1 in Cl(3,0): I² = -1
         """
-        result = np.zeros(8)
-        result[7] = 1.0  # I component
+        result = np.zeros(self.basis_size)
+        result[-1] = 1.0  # I component
         return result
     
     def geometric_product(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
@@ -191,22 +310,12 @@ class CliffordAlgebra:
         - Antisymmetric part (wedge product → bivector)
         
         Args:
-            v1, v2: Vectors
+            v1, v2: Vectors or multivectors, with optional batch dimensions
         
         Returns:
-            Multivector (scalar + bivector parts)
-        """
-        # For vectors: v₁v₂ = v₁·v₂ + v₁∧v₂
-        if len(v1) == 3 and len(v2) == 3:
-            result = np.zeros(8)
-            # Scalar part (inner product)
-            result[0] = np.dot(v1, v2)
-            # Bivector part (wedge product)
-            wedge = self.wedge_product(v1, v2)
-            result[4:7] = wedge[4:7]
-            return result
-        
-        raise NotImplementedError("Geometric product only implemented for 3D vectors")
+            Multivector product
+        """
+        return self._table_product(v1, v2, self._gather_sign)
 
 
 # ============================================================================
@@ -513,15 +622,19 @@ class LoveGraceDynamics:
         """
         # Grace gradient (toward local coherence)
         # Point toward normalized state
-        psi_norm = np.linalg.norm(psi)
-        if psi_norm > 1e-10:
-            grace_gradient = -psi / psi_norm + psi
-        else:
-            grace_gradient = np.zeros_like(psi)
+        # Norms are taken over the last axis, so psi may be a whole field (..., dim)
+        psi_norm = np.linalg.norm(psi, axis=-1, keepdims=True)
+        grace_gradient = np.where(
+            psi_norm > 1e-10,
+            -psi / np.where(psi_norm > 1e-10, psi_norm, 1.0) + psi,
+            0.0
+        )
         
         # Love gradient (toward A∞ alignment)
         # Simplified: direct pull toward attractor
-        love_gradient = (a_infinity - psi) / (np.linalg.norm(a_infinity - psi) + 1e-10)
+        love_gradient = (a_infinity - psi) / (
+            np.linalg.norm(a_infinity - psi, axis=-1, keepdims=True) + 1e-10
+        )
         
         # Combine with weights
         total_flow = grace_weight * grace_gradient + love_weight * love_gradient
@@ -560,13 +673,13 @@ class LoveGraceDynamics:
         Compute complete evolution trajectory.
         
         Args:
-            psi0: Initial state
-            a_infinity: Sovereign attractor
+            psi0: Initial state (dim,) or field of states (..., dim)
+            a_infinity: Sovereign attractor (broadcast against psi0)
             num_steps: Number of evolution steps
             dt: Time step
         
         Returns:
-            Trajectory array (num_steps × dim)
+            Trajectory array (num_steps + 1, ..., dim)
         """
         trajectory = [psi0]
         psi = psi0.copy()
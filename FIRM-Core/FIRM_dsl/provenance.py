@@ -9,8 +9,8 @@ Provenance ledger structures and helpers. No network access. No PII.
 - In CI, use machine_fingerprint := "CI_CANONICAL" for deterministic seeds.
 
 Note: Blake3 is not in the Python stdlib; to remain honest, we do not silently
-substitute another hash. Instead, we expose a function that raises until Blake3
-is available or vendored.
+substitute another hash. compute_blake3_hex uses the vendored BLAKE3 engine
+(blake3_vendor), which delegates to the `blake3` package when installed.
 """
 from __future__ import annotations
 from dataclasses import dataclass
@@ -40,7 +40,9 @@ def generate_node_id() -> str:
 def compute_blake3_hex(data: bytes) -> str:
     """Compute BLAKE3 hex digest of bytes.
 
-    This intentionally raises until BLAKE3 is available. No fake fallback.
+    Uses the vendored BLAKE3 engine (blake3_vendor), which delegates to the
+    `blake3` package when it is installed. The digest is the real BLAKE3
+    hash either way; there is no fallback to a different hash.
     """
     from .blake3_vendor import blake3_hex
     return blake3_hex(data)
@@ -68,8 +70,8 @@ class MachineInfo:
 def build_machine_fingerprint(info_json_bytes: bytes) -> str:
     """Hash serialized machine info using BLAKE3.
 
-    This function enforces the anti-tuning directive by refusing to proceed
-    without the exact hash algorithm specified in the spec.
+    This function enforces the anti-tuning directive: only the exact hash
+    algorithm specified in the spec (BLAKE3) is ever used.
     """
     return compute_blake3_hex(info_json_bytes)
 
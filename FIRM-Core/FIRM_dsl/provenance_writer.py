@@ -4,28 +4,103 @@ Provenance bundle file writer with hash verification (no network access).
 
 This module writes provenance bundles to the content-addressed file system
 with hash verification. All operations are local and deterministic.
+
+Write path:
+- Every file is staged under a unique temporary sibling (atomic_io) and moved
+  into place with os.replace, so readers never observe a partially written
+  file.
+- write_bundles() commits many bundles at once: all files are staged first,
+  flushed to disk as one fsync group, renamed, and the containing directories
+  and index are synced once per batch.
+- Traces can be stored as JSON/CSV (default, unchanged layout), newline-
+  delimited JSON, or raw little-endian float64.
+- <root>/index.ndjson records one line per committed bundle (hash, path,
+  per-file hashes and sizes), giving O(1) lookup by hash and letting integrity
+  checks compare the manifest's hash against the index instead of parsing it.
 """
 from __future__ import annotations
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
 import os
 import json
+import struct
 from .provenance import RunLedger, provenance_bundle_path, write_run_json, compute_content_hash
+from .atomic_io import atomic_write, discard, fsync_directory, fsync_file, stage_bytes
+
+
+INDEX_FILENAME = "index.ndjson"
+TRACE_FORMATS = ("json", "ndjson", "f64")
+
+
+def encode_trace(values: Iterable[float], trace_format: str, header: Optional[str] = None) -> bytes:
+    """Serialize a numeric trace in one pass.
+
+    Args:
+        values: Trace values
+        trace_format: "json" (list, or CSV rows when header is given),
+            "ndjson" (one value per line) or "f64" (raw little-endian float64)
+        header: CSV header "index_name,value_name" for the json/CSV layout
+
+    Returns:
+        Encoded bytes
+    """
+    values = list(values)
+    if trace_format == "json":
+        if header is None:
+            return json.dumps(values).encode("utf-8")
+        rows = "".join(f"{i},{v}\n" for i, v in enumerate(values))
+        return f"{header}\n{rows}".encode("utf-8")
+    if trace_format == "ndjson":
+        return "".join(f"{json.dumps(v)}\n" for v in values).encode("utf-8")
+    if trace_format == "f64":
+        return struct.pack(f"<{len(values)}d", *values)
+    raise ValueError(f"trace_format must be one of {TRACE_FORMATS}, got {trace_format!r}")
+
+
+def _makedirs(path: str) -> List[str]:
+    """os.makedirs(path, exist_ok=True); returns the directories it created, outermost first."""
+    missing = []
+    while path and not os.path.isdir(path):
+        missing.append(path)
+        path = os.path.dirname(path)
+    for directory in reversed(missing):
+        os.makedirs(directory, exist_ok=True)
+    return list(reversed(missing))
 
 
 class ProvenanceBundleWriter:
     """Writer for content-addressed provenance bundles with hash verification."""
     
-    def __init__(self, root_dir: str, hash_hex_fn: Callable[[bytes], str]):
+    def __init__(
+        self,
+        root_dir: str,
+        hash_hex_fn: Callable[[bytes], str],
+        trace_format: str = "json",
+        fsync: bool = True
+    ):
         """Initialize writer with root directory and hash function.
         
         Args:
             root_dir: Root directory for provenance storage
             hash_hex_fn: Function to compute hex hash from bytes (e.g., BLAKE3)
+            trace_format: Trace encoding: "json" (tau_trace.json + C_variation.csv),
+                "ndjson" or "f64"
+            fsync: Flush committed files, directories and index to disk
         """
         self.root_dir = root_dir
         self.hash_hex_fn = hash_hex_fn
         if not callable(hash_hex_fn):
             raise TypeError("hash_hex_fn must be callable")
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"trace_format must be one of {TRACE_FORMATS}, got {trace_format!r}")
+        self.trace_format = trace_format
+        self.fsync = fsync
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_offset = 0
+    
+    @property
+    def index_path(self) -> str:
+        """Path of the bundle index file."""
+        return os.path.join(self.root_dir, INDEX_FILENAME)
     
     def validate_bundle_structure(self, bundle_data: Dict[str, Any]) -> Dict[str, bool]:
         """Validate that bundle contains required components.
@@ -67,6 +142,12 @@ class ProvenanceBundleWriter:
         json_bytes = write_run_json("/dev/null", run_ledger)
         return compute_content_hash(json_bytes, self.hash_hex_fn)
     
+    def trace_filenames(self) -> Tuple[str, str]:
+        """File names for (tau trace, coherence variation) in this writer's format."""
+        if self.trace_format == "json":
+            return "tau_trace.json", "C_variation.csv"
+        return f"tau_trace.{self.trace_format}", f"C_variation.{self.trace_format}"
+    
     def write_bundle_to_filesystem(self, bundle_data: Dict[str, Any], run_ledger: RunLedger) -> Dict[str, Any]:
         """Write complete bundle to content-addressed filesystem.
         
@@ -77,58 +158,181 @@ class ProvenanceBundleWriter:
         Returns:
             Dict with write results and verification info
         """
-        import os
-        import json
+        return self.write_bundles([(bundle_data, run_ledger)])[0]
+    
+    def write_bundles(self, bundles: Iterable[Tuple[Dict[str, Any], RunLedger]]) -> List[Dict[str, Any]]:
+        """Commit many bundles with one fsync group and one index append.
+        
+        All files of all bundles are staged as temporary siblings first; only
+        once every bundle has been encoded and staged are they flushed and
+        renamed into place. A failure while staging leaves no partial bundle
+        files, no directories created by the batch and no index entries
+        behind. A bundle repeated within the batch is written once; its
+        repeats get the same result.
         
+        Args:
+            bundles: (bundle_data, run_ledger) pairs
+            
+        Returns:
+            One write-result dict per bundle (see write_bundle_to_filesystem)
+        """
+        staged: List[Tuple[str, str]] = []
+        created_dirs: List[str] = []
+        results = []
+        entries = []
+        by_hash: Dict[str, Dict[str, Any]] = {}
+        
+        try:
+            for bundle_data, run_ledger in bundles:
+                bundle_hash, files, validation = self._encode_bundle(bundle_data, run_ledger)
+                if bundle_hash in by_hash:
+                    results.append(dict(by_hash[bundle_hash], validation=validation))
+                    continue
+                
+                bundle_path = provenance_bundle_path(self.root_dir, bundle_hash)
+                created_dirs.extend(_makedirs(bundle_path))
+                
+                for name, data in files.items():
+                    final_path = os.path.join(bundle_path, name)
+                    staged.append((stage_bytes(final_path, data), final_path))
+                
+                entries.append(self._index_entry(bundle_hash, bundle_path, files))
+                by_hash[bundle_hash] = {
+                    "bundle_path": bundle_path,
+                    "bundle_hash": bundle_hash,
+                    "files_written": list(files),
+                    "write_successful": True,
+                    "validation": validation
+                }
+                results.append(by_hash[bundle_hash])
+        except BaseException:
+            for tmp_path, _ in staged:
+                discard(tmp_path)
+            for directory in reversed(created_dirs):
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    pass  # not empty: another writer is using it
+            raise
+        
+        if self.fsync:
+            for tmp_path, _ in staged:
+                fsync_file(tmp_path)
+        
+        for tmp_path, final_path in staged:
+            os.replace(tmp_path, final_path)
+        
+        if self.fsync:
+            directories = {os.path.dirname(final_path) for _, final_path in staged}
+            directories |= {os.path.dirname(d) for d in directories}
+            for directory in sorted(directories):
+                fsync_directory(directory)
+        
+        self._append_index(entries)
+        return results
+    
+    def _encode_bundle(
+        self,
+        bundle_data: Dict[str, Any],
+        run_ledger: RunLedger
+    ) -> Tuple[str, Dict[str, bytes], Dict[str, bool]]:
+        """Serialize every file of a bundle in memory (ordered name -> bytes)."""
         # Validate structure first
         validation = self.validate_bundle_structure(bundle_data)
         if not validation["structure_valid"]:
             raise ValueError("Bundle structure validation failed")
         
-        # Compute content hash and path
-        bundle_hash = self.compute_bundle_hash(run_ledger)
-        bundle_path = provenance_bundle_path(self.root_dir, bundle_hash)
-        
-        # Create directory structure
-        os.makedirs(bundle_path, exist_ok=True)
-        
-        # Write run.json
-        run_json_path = os.path.join(bundle_path, "run.json")
+        # run.json doubles as the addressing content
         run_json_bytes = write_run_json("/dev/null", run_ledger)
-        with open(run_json_path, "wb") as f:
-            f.write(run_json_bytes)
-        
-        # Write other bundle files
-        files_written = ["run.json"]
+        bundle_hash = compute_content_hash(run_json_bytes, self.hash_hex_fn)
+        files = {"run.json": run_json_bytes}
         
+        tau_name, coherence_name = self.trace_filenames()
         if "tau_trace" in bundle_data:
-            tau_path = os.path.join(bundle_path, "tau_trace.json")
-            with open(tau_path, "w") as f:
-                json.dump(bundle_data["tau_trace"], f)
-            files_written.append("tau_trace.json")
-        
+            files[tau_name] = encode_trace(bundle_data["tau_trace"], self.trace_format)
         if "coherence_variation" in bundle_data:
-            coherence_path = os.path.join(bundle_path, "C_variation.csv")
-            with open(coherence_path, "w") as f:
-                f.write("tick,coherence\n")
-                for i, c in enumerate(bundle_data["coherence_variation"]):
-                    f.write(f"{i},{c}\n")
-            files_written.append("C_variation.csv")
-        
-        # Create manifest
+            files[coherence_name] = encode_trace(
+                bundle_data["coherence_variation"], self.trace_format, header="tick,coherence"
+            )
+        
         manifest = self.create_bundle_manifest(bundle_data, bundle_hash)
-        manifest_path = os.path.join(bundle_path, "manifest.json")
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
-        files_written.append("manifest.json")
+        manifest["trace_format"] = self.trace_format
+        manifest["files"] = {
+            name: {"hash": bundle_hash if name == "run.json" else self.hash_hex_fn(data),
+                   "bytes": len(data)}
+            for name, data in files.items()
+        }
+        files["manifest.json"] = json.dumps(manifest, indent=2).encode("utf-8")
         
+        return bundle_hash, files, validation
+    
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    
+    def _index_entry(self, bundle_hash: str, bundle_path: str, files: Dict[str, bytes]) -> Dict[str, Any]:
+        manifest_bytes = files["manifest.json"]
         return {
-            "bundle_path": bundle_path,
             "bundle_hash": bundle_hash,
-            "files_written": files_written,
-            "write_successful": True,
-            "validation": validation
+            "path": os.path.relpath(bundle_path, self.root_dir),
+            "manifest": {"hash": self.hash_hex_fn(manifest_bytes), "bytes": len(manifest_bytes)},
+            "files": {name: len(data) for name, data in files.items()},
         }
+    
+    def _append_index(self, entries: List[Dict[str, Any]]) -> None:
+        """Append index lines for committed bundles in a single write."""
+        if not entries:
+            return
+        os.makedirs(self.root_dir, exist_ok=True)
+        payload = "".join(
+            json.dumps(entry, sort_keys=True, separators=(",", ":")) + "\n" for entry in entries
+        ).encode("utf-8")
+        with open(self.index_path, "ab") as f:
+            f.write(payload)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._refresh_index()
+    
+    def _refresh_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read index lines appended since the last refresh (by any process)."""
+        if self._index is None:
+            self._index = {}
+        
+        if not os.path.exists(self.index_path):
+            return self._index
+        
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_offset)
+            chunk = f.read()
+        
+        # Only consume complete lines; a torn final line is retried later
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self._index[entry["bundle_hash"]] = entry
+        self._index_offset += len(complete)
+        return self._index
+    
+    def lookup_bundle(self, bundle_hash: str) -> Optional[Dict[str, Any]]:
+        """Find a committed bundle by hash in O(1).
+        
+        Args:
+            bundle_hash: Content hash of the bundle
+            
+        Returns:
+            Index entry with an absolute "bundle_path" added, or None
+        """
+        index = self._index if self._index is not None else self._refresh_index()
+        entry = index.get(bundle_hash)
+        if entry is None:
+            entry = self._refresh_index().get(bundle_hash)
+        if entry is None:
+            return None
+        return dict(entry, bundle_path=os.path.join(self.root_dir, entry["path"]))
 
     def attach_resonance_provenance(self, bundle_path: str, omega_signature: dict, resonance_series: list) -> None:
         """Attach Ω signature and resonance time-series to an existing bundle.
@@ -145,24 +349,27 @@ class ProvenanceBundleWriter:
             raise ValueError("bundle_path must be an existing directory")
         omega_path = os.path.join(bundle_path, 'omega_signature.json')
         series_path = os.path.join(bundle_path, 'resonance_series.json')
-        with open(omega_path, 'w', encoding='utf-8') as f:
-            json.dump(omega_signature, f, ensure_ascii=False, indent=2)
-        with open(series_path, 'w', encoding='utf-8') as f:
-            json.dump(resonance_series, f, ensure_ascii=False, indent=2)
+        atomic_write(omega_path, json.dumps(omega_signature, ensure_ascii=False, indent=2).encode('utf-8'),
+                      fsync=self.fsync)
+        atomic_write(series_path, json.dumps(resonance_series, ensure_ascii=False, indent=2).encode('utf-8'),
+                      fsync=self.fsync)
     
-    def verify_bundle_integrity(self, bundle_path: str, expected_hash: str) -> Dict[str, Any]:
+    def verify_bundle_integrity(self, bundle_path: str, expected_hash: str, deep: bool = False) -> Dict[str, Any]:
         """Verify integrity of written bundle.
         
+        The run.json content hash is always recomputed. For an indexed bundle
+        the manifest is hashed and compared with the index entry (a size
+        mismatch rejects it without reading); otherwise it is parsed and its
+        bundle_hash compared.
+        
         Args:
             bundle_path: Path to bundle directory
             expected_hash: Expected content hash
+            deep: Also re-hash every bundle file against the index/manifest
             
         Returns:
             Dict with integrity verification results
         """
-        import os
-        import json
-        
         if not bundle_path or not expected_hash:
             raise ValueError("bundle_path and expected_hash required")
         
@@ -192,22 +399,63 @@ class ProvenanceBundleWriter:
         computed_hash = compute_content_hash(run_json_bytes, self.hash_hex_fn)
         hash_matches = computed_hash == expected_hash
         
-        # Read and validate manifest
         manifest_path = os.path.join(bundle_path, "manifest.json")
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
-        
-        manifest_hash_matches = manifest.get("bundle_hash") == expected_hash
+        entry = self.lookup_bundle(expected_hash)
+        index_hit = (entry is not None
+                     and os.path.abspath(entry["bundle_path"]) == os.path.abspath(bundle_path))
+        
+        if index_hit:
+            manifest_hash_matches = os.path.getsize(manifest_path) == entry["manifest"]["bytes"]
+            if manifest_hash_matches:
+                with open(manifest_path, "rb") as f:
+                    manifest_hash_matches = self.hash_hex_fn(f.read()) == entry["manifest"]["hash"]
+            file_sizes = entry["files"]
+        else:
+            # Read and validate manifest
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+            manifest_hash_matches = manifest.get("bundle_hash") == expected_hash
+            file_sizes = {name: info["bytes"] for name, info in manifest.get("files", {}).items()}
+        
+        files_verified = list(required_files)
+        files_valid = True
+        if deep:
+            files_valid, files_verified = self._verify_files(bundle_path, entry if index_hit else None,
+                                                             file_sizes)
         
         return {
-            "integrity_valid": hash_matches and manifest_hash_matches,
+            "integrity_valid": hash_matches and manifest_hash_matches and files_valid,
             "hash_matches": hash_matches,
             "manifest_hash_matches": manifest_hash_matches,
             "computed_hash": computed_hash,
             "expected_hash": expected_hash,
-            "files_verified": required_files
+            "files_verified": files_verified,
+            "index_hit": index_hit
         }
     
+    def _verify_files(
+        self,
+        bundle_path: str,
+        entry: Optional[Dict[str, Any]],
+        file_sizes: Dict[str, int]
+    ) -> Tuple[bool, List[str]]:
+        """Re-hash the manifest and every listed bundle file."""
+        manifest_path = os.path.join(bundle_path, "manifest.json")
+        with open(manifest_path, "rb") as f:
+            manifest_bytes = f.read()
+        valid = entry is None or self.hash_hex_fn(manifest_bytes) == entry["manifest"]["hash"]
+        
+        listed = json.loads(manifest_bytes).get("files", {})
+        for name, size in file_sizes.items():
+            if name == "manifest.json":
+                continue
+            with open(os.path.join(bundle_path, name), "rb") as f:
+                data = f.read()
+            expected = listed.get(name, {}).get("hash")
+            valid = valid and len(data) == size and self.hash_hex_fn(data) == expected
+        
+        return valid, ["manifest.json"] + [name for name in file_sizes if name != "manifest.json"]
+    
     def create_bundle_manifest(self, bundle_data: Dict[str, Any], bundle_hash: str) -> Dict[str, Any]:
         """Create manifest for bundle contents.
         
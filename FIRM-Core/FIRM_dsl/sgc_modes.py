@@ -22,12 +22,17 @@ from typing import Dict, List, Tuple, Optional, Set, Any
 from enum import Enum
 import math
 import copy
+import time
 
 from .core import ObjectG, NodeLabel, validate_object_g
 from .resonance import OmegaSignature, compute_resonance_alignment, derive_omega_signature
 from .coherence import compute_coherence
 from .grace_field import GraceFieldParams, FieldRegime, recursion_depth_classification
 from .dynamic_evolution import DynamicPhaseEvolution, ModeCoefficients, EvolutionState
+from .graph_kernels import (
+    adjacency_lists, degree_map, connected_components, induced_subgraph,
+    remove_nodes, partition_subgraphs,
+)
 
 
 class SGCMode(Enum):
@@ -51,6 +56,73 @@ class ModeExecutionResult:
     reflections: List[Dict[str, Any]] = field(default_factory=list)
 
 
+@dataclass
+class MetricCounter:
+    """Hit/miss tally shared by the metric contexts of one scheduler."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def evaluations(self) -> int:
+        return self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class StructureMetrics:
+    """Memoized per-structure metrics carried through a mode pipeline.
+
+    Coherence, resonance (per Ω), the derived Ω signature, node degrees and
+    connected components are each computed at most once for the wrapped
+    structure. Modes receive the context alongside the structure and read
+    from it instead of recomputing. A context is only valid for the exact
+    structure object it was built for.
+    """
+
+    def __init__(self, structure: ObjectG, counter: Optional[MetricCounter] = None):
+        self.structure = structure
+        self.counter = counter if counter is not None else MetricCounter()
+        self._values: Dict[Any, Any] = {}
+        # Keep Ω signatures alive so their id() keys cannot be reused
+        self._omegas: Dict[int, OmegaSignature] = {}
+
+    def _memo(self, key: Any, compute) -> Any:
+        if key in self._values:
+            self.counter.hits += 1
+            return self._values[key]
+        self.counter.misses += 1
+        value = compute()
+        self._values[key] = value
+        return value
+
+    def coherence(self) -> float:
+        return self._memo('coherence', lambda: compute_coherence(self.structure))
+
+    def resonance(self, omega: OmegaSignature) -> float:
+        self._omegas[id(omega)] = omega
+        return self._memo(('resonance', id(omega)),
+                          lambda: compute_resonance_alignment(self.structure, omega))
+
+    def derived_omega(self) -> OmegaSignature:
+        return self._memo('derived_omega', lambda: derive_omega_signature(self.structure))
+
+    def derived_resonance(self) -> float:
+        return self.resonance(self.derived_omega())
+
+    def degrees(self) -> Dict[int, int]:
+        return self._memo('degrees', lambda: degree_map(self.structure))
+
+    def leaf_count(self) -> int:
+        return self._memo('leaf_count', lambda: sum(1 for d in self.degrees().values() if d == 1))
+
+    def components(self) -> List[List[int]]:
+        """Connected components with more than one node."""
+        return self._memo('components', lambda: connected_components(self.structure, min_size=2))
+
+
 @dataclass
 class SGCModeSystem:
     """Complete multi-modal 𝒮-GC system implementing all 7 modes."""
@@ -79,33 +151,87 @@ class SGCModeSystem:
             self.mode_coefficients = ModeCoefficients()
 
     def execute_mode(self, mode: SGCMode, structure: ObjectG, omega: OmegaSignature,
-                   field_regime: FieldRegime) -> ModeExecutionResult:
-        """Execute a specific 𝒮-GC mode on a structure."""
+                   field_regime: FieldRegime,
+                   context: Optional[StructureMetrics] = None) -> ModeExecutionResult:
+        """Execute a specific 𝒮-GC mode on a structure.
+
+        Args:
+            mode: Mode to run.
+            structure: Structure to collect.
+            omega: Reference Ω signature.
+            field_regime: Field regime of the structure.
+            context: Optional metrics context for ``structure``; cached
+                coherence/resonance/degree/component values are reused.
+
+        Returns:
+            ModeExecutionResult for the mode.
+        """
+        ctx = self._metrics_for(structure, context)
         if mode == SGCMode.RESONANT_ASSIMILATION:
-            return self._execute_resonant_assimilation(structure, omega, field_regime)
+            return self._execute_resonant_assimilation(structure, omega, field_regime, ctx)
         elif mode == SGCMode.DISSONANT_SHEDDING:
-            return self._execute_dissonant_shedding(structure, omega, field_regime)
+            return self._execute_dissonant_shedding(structure, omega, field_regime, ctx)
         elif mode == SGCMode.REFLECTIVE_REWRITING:
-            return self._execute_reflective_rewriting(structure, omega, field_regime)
+            return self._execute_reflective_rewriting(structure, omega, field_regime, ctx)
         elif mode == SGCMode.TRANSMUTATIVE_MEDIATION:
-            return self._execute_transmutative_mediation(structure, omega, field_regime)
+            return self._execute_transmutative_mediation(structure, omega, field_regime, ctx)
         elif mode == SGCMode.BOUNDARY_PRUNING:
-            return self._execute_boundary_pruning(structure, omega, field_regime)
+            return self._execute_boundary_pruning(structure, omega, field_regime, ctx)
         elif mode == SGCMode.GRACE_REINSTANTIATION:
-            return self._execute_grace_reinstantiation(structure, omega, field_regime)
+            return self._execute_grace_reinstantiation(structure, omega, field_regime, ctx)
         elif mode == SGCMode.GLOBAL_RESYNCHRONIZATION:
-            return self._execute_global_resynchronization(structure, omega, field_regime)
+            return self._execute_global_resynchronization(structure, omega, field_regime, ctx)
         else:
             raise ValueError(f"Unknown mode: {mode}")
 
+    @staticmethod
+    def _metrics_for(structure: ObjectG, context: Optional[StructureMetrics]) -> StructureMetrics:
+        """Return ``context`` if it wraps ``structure``, else a fresh context."""
+        if context is not None and context.structure is structure:
+            return context
+        counter = context.counter if context is not None else None
+        return StructureMetrics(structure, counter)
+
+    def precheck_mode(self, mode: SGCMode, context: StructureMetrics, omega: OmegaSignature,
+                      field_regime: FieldRegime) -> Optional[str]:
+        """Decide from cached metrics whether a mode is certain to fail.
+
+        Only exact preconditions are checked, so a mode is never skipped when
+        running it could have succeeded.
+
+        Returns:
+            The failure reason the mode would report, or None if it must run.
+        """
+        if mode in (SGCMode.RESONANT_ASSIMILATION, SGCMode.BOUNDARY_PRUNING):
+            if context.leaf_count() == 0:
+                return ('no_pruning_candidates' if mode == SGCMode.RESONANT_ASSIMILATION
+                        else 'no_boundary_pruning_opportunities')
+        elif mode == SGCMode.DISSONANT_SHEDDING:
+            if context.resonance(omega) >= self.epsilon:
+                return 'shedding_criteria_not_met'
+            if not self._check_grace_state(context.structure, field_regime, context.coherence()):
+                return 'shedding_criteria_not_met'
+        elif mode == SGCMode.TRANSMUTATIVE_MEDIATION:
+            if len(context.components()) < 2:
+                return 'insufficient_monads_for_mediation'
+        elif mode == SGCMode.GRACE_REINSTANTIATION:
+            if self._assess_grace_state(context.structure, field_regime, context)['grace_level'] > 0.8:
+                return 'grace_level_already_high'
+        elif mode == SGCMode.GLOBAL_RESYNCHRONIZATION:
+            if len(context.components()) < 2:
+                return 'insufficient_sync_candidates'
+        return None
+
     def _execute_resonant_assimilation(self, structure: ObjectG, omega: OmegaSignature,
-                                     field_regime: FieldRegime) -> ModeExecutionResult:
+                                     field_regime: FieldRegime,
+                                     context: Optional[StructureMetrics] = None) -> ModeExecutionResult:
         """Mode 1: Resonant Assimilation - Improve coherence through targeted pruning."""
-        original_coherence = compute_coherence(structure)
-        original_resonance = compute_resonance_alignment(structure, omega)
+        ctx = self._metrics_for(structure, context)
+        original_coherence = ctx.coherence()
+        original_resonance = ctx.resonance(omega)
 
         # Find substructures with low resonance that can be pruned to improve overall coherence
-        pruning_candidates = self._find_pruning_candidates(structure, omega, field_regime)
+        pruning_candidates = self._find_pruning_candidates(structure, omega, field_regime, ctx)
 
         if not pruning_candidates:
             return ModeExecutionResult(
@@ -133,10 +259,12 @@ class SGCModeSystem:
         )
 
     def _execute_dissonant_shedding(self, structure: ObjectG, omega: OmegaSignature,
-                                  field_regime: FieldRegime) -> ModeExecutionResult:
+                                  field_regime: FieldRegime,
+                                  context: Optional[StructureMetrics] = None) -> ModeExecutionResult:
         """Mode 2: Dissonant Shedding - Remove structures with low resonance in grace state."""
-        resonance = compute_resonance_alignment(structure, omega)
-        coherence = compute_coherence(structure)
+        ctx = self._metrics_for(structure, context)
+        resonance = ctx.resonance(omega)
+        coherence = ctx.coherence()
 
         # Check if structure meets shedding criteria
         grace_ready = self._check_grace_state(structure, field_regime, coherence)
@@ -168,15 +296,17 @@ class SGCModeSystem:
         )
 
     def _execute_reflective_rewriting(self, structure: ObjectG, omega: OmegaSignature,
-                                    field_regime: FieldRegime) -> ModeExecutionResult:
+                                    field_regime: FieldRegime,
+                                    context: Optional[StructureMetrics] = None) -> ModeExecutionResult:
         """Mode 3: Reflective Rewriting - Recursive self-observation and rewriting."""
         reflections = []
 
         # Perform recursive self-observation
         for depth in range(self.reflection_depth):
+            ctx = self._metrics_for(structure, context)
             current_state = {
-                'coherence': compute_coherence(structure),
-                'resonance': compute_resonance_alignment(structure, omega),
+                'coherence': ctx.coherence(),
+                'resonance': ctx.resonance(omega),
                 'field_regime': field_regime,
                 'reflection_depth': depth,
                 'structure_size': len(structure.labels)
@@ -203,10 +333,11 @@ class SGCModeSystem:
         )
 
     def _execute_transmutative_mediation(self, structure: ObjectG, omega: OmegaSignature,
-                                       field_regime: FieldRegime) -> ModeExecutionResult:
+                                       field_regime: FieldRegime,
+                                       context: Optional[StructureMetrics] = None) -> ModeExecutionResult:
         """Mode 4: Transmutative Mediation - Cross-monad resonance mediation."""
         # Split structure into potential monads for mediation
-        monads = self._identify_potential_monads(structure)
+        monads = self._identify_potential_monads(structure, self._metrics_for(structure, context))
 
         if len(monads) < 2:
             return ModeExecutionResult(
@@ -241,10 +372,11 @@ class SGCModeSystem:
         )
 
     def _execute_boundary_pruning(self, structure: ObjectG, omega: OmegaSignature,
-                                field_regime: FieldRegime) -> ModeExecutionResult:
+                                field_regime: FieldRegime,
+                                context: Optional[StructureMetrics] = None) -> ModeExecutionResult:
         """Mode 5: Boundary Pruning - Sophisticated boundary analysis."""
         # Analyze structure boundaries for pruning opportunities
-        boundary_analysis = self._analyze_boundaries(structure, omega)
+        boundary_analysis = self._analyze_boundaries(structure, omega, self._metrics_for(structure, context))
 
         if not boundary_analysis['prune_candidates']:
             return ModeExecutionResult(
@@ -268,10 +400,12 @@ class SGCModeSystem:
         )
 
     def _execute_grace_reinstantiation(self, structure: ObjectG, omega: OmegaSignature,
-                                     field_regime: FieldRegime) -> ModeExecutionResult:
+                                     field_regime: FieldRegime,
+                                     context: Optional[StructureMetrics] = None) -> ModeExecutionResult:
         """Mode 6: Grace Reinstantiation - Enhanced grace operator usage."""
         # Check current grace state
-        current_grace_state = self._assess_grace_state(structure, field_regime)
+        current_grace_state = self._assess_grace_state(structure, field_regime,
+                                                       self._metrics_for(structure, context))
 
         if current_grace_state['grace_level'] > 0.8:
             # Structure already has high grace - no reinstantiation needed
@@ -298,10 +432,12 @@ class SGCModeSystem:
         )
 
     def _execute_global_resynchronization(self, structure: ObjectG, omega: OmegaSignature,
-                                        field_regime: FieldRegime) -> ModeExecutionResult:
+                                        field_regime: FieldRegime,
+                                        context: Optional[StructureMetrics] = None) -> ModeExecutionResult:
         """Mode 7: Global Resynchronization - Collective phase merging."""
         # Identify structures ready for synchronization
-        sync_candidates = self._identify_sync_candidates(structure, omega)
+        sync_candidates = self._identify_sync_candidates(structure, omega,
+                                                         self._metrics_for(structure, context))
 
         if len(sync_candidates) < 2:
             return ModeExecutionResult(
@@ -326,13 +462,15 @@ class SGCModeSystem:
     # Helper methods for each mode (detailed implementations would go here)
 
     def _find_pruning_candidates(self, structure: ObjectG, omega: OmegaSignature,
-                               field_regime: FieldRegime) -> List[Set[int]]:
+                               field_regime: FieldRegime,
+                               context: Optional[StructureMetrics] = None) -> List[Set[int]]:
         """Find substructures that can be pruned to improve overall coherence."""
         candidates = []
 
         # Simple heuristic: find leaf nodes with low resonance
+        degrees = self._metrics_for(structure, context).degrees()
         for node_id in structure.nodes:
-            if self._is_leaf_node(structure, node_id):
+            if degrees[node_id] == 1:
                 node_resonance = self._compute_node_resonance(structure, node_id, omega)
                 if node_resonance < self.epsilon:
                     candidates.append({node_id})
@@ -350,10 +488,7 @@ class SGCModeSystem:
             return structure  # Don't remove everything
 
         # Build new structure with remaining nodes
-        new_labels = {nid: structure.labels[nid] for nid in remaining_nodes if nid in structure.labels}
-        new_edges = [(u, v) for u, v in structure.edges if u in remaining_nodes and v in remaining_nodes]
-
-        return ObjectG(nodes=list(remaining_nodes), edges=new_edges, labels=new_labels)
+        return remove_nodes(structure, set(structure.nodes) - remaining_nodes)
 
     def _check_grace_state(self, structure: ObjectG, field_regime: FieldRegime, coherence: float) -> bool:
         """Check if structure is in grace state for shedding."""
@@ -384,12 +519,7 @@ class SGCModeSystem:
             return structure
 
         # Remove the nodes and their edges
-        remaining_nodes = set(structure.nodes) - set(nodes_to_remove)
-        new_labels = {nid: structure.labels[nid] for nid in remaining_nodes if nid in structure.labels}
-        new_edges = [(u, v) for u, v in structure.edges
-                    if u in remaining_nodes and v in remaining_nodes]
-
-        return ObjectG(nodes=list(remaining_nodes), edges=new_edges, labels=new_labels)
+        return remove_nodes(structure, nodes_to_remove)
 
     def _should_rewrite_based_on_reflection(self, state: Dict[str, Any], depth: int) -> bool:
         """Determine if reflective rewriting should be applied based on self-observation."""
@@ -427,22 +557,13 @@ class SGCModeSystem:
 
         return rewritten_structure
 
-    def _identify_potential_monads(self, structure: ObjectG) -> List[ObjectG]:
+    def _identify_potential_monads(self, structure: ObjectG,
+                                   context: Optional[StructureMetrics] = None) -> List[ObjectG]:
         """Identify potential monads within a structure for mediation."""
-        # Simple partitioning into connected components
-        monads = []
-
-        visited = set()
-        for node_id in structure.nodes:
-            if node_id not in visited:
-                component = self._dfs_connected_component(structure, node_id, visited)
-                if len(component) > 1:  # Only consider multi-node components as monads
-                    monad_labels = {nid: structure.labels[nid] for nid in component if nid in structure.labels}
-                    monad_edges = [(u, v) for u, v in structure.edges if u in component and v in component]
-                    monad = ObjectG(nodes=component, edges=monad_edges, labels=monad_labels)
-                    monads.append(monad)
-
-        return monads
+        # Simple partitioning into connected components; only multi-node
+        # components are considered monads
+        components = self._metrics_for(structure, context).components()
+        return partition_subgraphs(structure, components)
 
     def _find_mediation_pairs(self, monads: List[ObjectG], omega: OmegaSignature) -> List[Tuple[ObjectG, ObjectG]]:
         """Find pairs of monads that can mediate with each other."""
@@ -473,14 +594,12 @@ class SGCModeSystem:
 
         return mediated_structure
 
-    def _analyze_boundaries(self, structure: ObjectG, omega: OmegaSignature) -> Dict[str, Any]:
+    def _analyze_boundaries(self, structure: ObjectG, omega: OmegaSignature,
+                            context: Optional[StructureMetrics] = None) -> Dict[str, Any]:
         """Analyze structure boundaries for pruning opportunities."""
         # Simple boundary analysis: identify nodes with only one connection
-        boundary_nodes = []
-        for node_id in structure.nodes:
-            degree = sum(1 for u, v in structure.edges if u == node_id or v == node_id)
-            if degree == 1:
-                boundary_nodes.append(node_id)
+        degrees = self._metrics_for(structure, context).degrees()
+        boundary_nodes = [node_id for node_id in structure.nodes if degrees[node_id] == 1]
 
         return {
             'boundary_count': len(boundary_nodes),
@@ -501,15 +620,14 @@ class SGCModeSystem:
         if not remaining_nodes:
             return structure
 
-        new_labels = {nid: structure.labels[nid] for nid in remaining_nodes if nid in structure.labels}
-        new_edges = [(u, v) for u, v in structure.edges if u in remaining_nodes and v in remaining_nodes]
+        return remove_nodes(structure, prune_candidates)
 
-        return ObjectG(nodes=list(remaining_nodes), edges=new_edges, labels=new_labels)
-
-    def _assess_grace_state(self, structure: ObjectG, field_regime: FieldRegime) -> Dict[str, float]:
+    def _assess_grace_state(self, structure: ObjectG, field_regime: FieldRegime,
+                            context: Optional[StructureMetrics] = None) -> Dict[str, float]:
         """Assess the grace state of a structure."""
-        coherence = compute_coherence(structure)
-        resonance = compute_resonance_alignment(structure, derive_omega_signature(structure))
+        ctx = self._metrics_for(structure, context)
+        coherence = ctx.coherence()
+        resonance = ctx.derived_resonance()
 
         regime_grace_factor = {
             FieldRegime.NON_BEING: 0.1,
@@ -539,22 +657,18 @@ class SGCModeSystem:
 
         return reinstantiated_structure
 
-    def _identify_sync_candidates(self, structure: ObjectG, omega: OmegaSignature) -> List[ObjectG]:
+    def _identify_sync_candidates(self, structure: ObjectG, omega: OmegaSignature,
+                                  context: Optional[StructureMetrics] = None) -> List[ObjectG]:
         """Identify structures ready for synchronization."""
         # Simple identification: find substructures with high resonance
         candidates = []
 
-        # Split into connected components
-        visited = set()
-        for node_id in structure.nodes:
-            if node_id not in visited:
-                component = self._dfs_connected_component(structure, node_id, visited)
-                if len(component) > 1:
-                    component_resonance = compute_resonance_alignment(
-                        self._create_subgraph_from_nodes(structure, component), omega
-                    )
-                    if component_resonance > self.resynchronization_threshold:
-                        candidates.append(self._create_subgraph_from_nodes(structure, component))
+        # Split into connected components (one edge pass for all subgraphs)
+        components = self._metrics_for(structure, context).components()
+        for subgraph in partition_subgraphs(structure, components):
+            component_resonance = compute_resonance_alignment(subgraph, omega)
+            if component_resonance > self.resynchronization_threshold:
+                candidates.append(subgraph)
 
         return candidates
 
@@ -605,7 +719,10 @@ class SGCModeSystem:
 
     # Utility methods
     def _is_leaf_node(self, structure: ObjectG, node_id: int) -> bool:
-        """Check if a node is a leaf (degree 1)."""
+        """Check if a node is a leaf (degree 1).
+
+        For whole-graph scans use ``degree_map`` once instead of calling this per node.
+        """
         degree = sum(1 for u, v in structure.edges if u == node_id or v == node_id)
         return degree == 1
 
@@ -624,7 +741,12 @@ class SGCModeSystem:
         return compute_resonance_alignment(node_structure, omega)
 
     def _dfs_connected_component(self, structure: ObjectG, start_node: int, visited: Set[int]) -> List[int]:
-        """DFS to find connected component."""
+        """DFS to find connected component.
+
+        For a full decomposition use ``connected_components``, which shares one
+        adjacency build across all components.
+        """
+        adjacency = adjacency_lists(structure)
         component = []
         stack = [start_node]
 
@@ -635,21 +757,13 @@ class SGCModeSystem:
                 component.append(node)
 
                 # Add neighbors to stack
-                for u, v in structure.edges:
-                    if u == node and v not in visited:
-                        stack.append(v)
-                    elif v == node and u not in visited:
-                        stack.append(u)
+                stack.extend(nb for nb in adjacency.get(node, ()) if nb not in visited)
 
         return component
 
     def _create_subgraph_from_nodes(self, structure: ObjectG, nodes: List[int]) -> ObjectG:
         """Create subgraph containing specified nodes."""
-        node_set = set(nodes)
-        subgraph_edges = [(u, v) for u, v in structure.edges if u in node_set and v in node_set]
-        subgraph_labels = {nid: structure.labels[nid] for nid in nodes if nid in structure.labels}
-
-        return ObjectG(nodes=nodes, edges=subgraph_edges, labels=subgraph_labels)
+        return induced_subgraph(structure, nodes)
 
     def _merge_monads(self, monad1: ObjectG, monad2: ObjectG) -> ObjectG:
         """Merge two monads into one."""
@@ -668,6 +782,79 @@ class SGCModeSystem:
         return ObjectG(nodes=all_nodes, edges=unique_edges, labels=all_labels)
 
 
+@dataclass
+class ModeStats:
+    """Per-mode execution statistics collected by the scheduler."""
+    executed: int = 0
+    skipped: int = 0
+    succeeded: int = 0
+    total_time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.executed if self.executed else 0.0
+
+    @property
+    def skip_rate(self) -> float:
+        total = self.executed + self.skipped
+        return self.skipped / total if total else 0.0
+
+
+@dataclass
+class SGCModeScheduler:
+    """Cost-aware driver for running 𝒮-GC modes over a shared metrics context.
+
+    Each mode is first checked against ``SGCModeSystem.precheck_mode``; modes
+    whose failure is already decided by cached metrics are skipped without
+    running. Executed modes share the caller's ``StructureMetrics`` so
+    coherence, resonance and graph metrics are evaluated once per structure.
+    """
+    mode_system: SGCModeSystem = field(default_factory=SGCModeSystem)
+    metric_counter: MetricCounter = field(default_factory=MetricCounter)
+    mode_stats: Dict[SGCMode, ModeStats] = field(default_factory=dict)
+
+    def context(self, structure: ObjectG) -> StructureMetrics:
+        """Create a metrics context whose hits/misses feed this scheduler."""
+        return StructureMetrics(structure, self.metric_counter)
+
+    def run(self, mode: SGCMode, context: StructureMetrics, omega: OmegaSignature,
+            field_regime: FieldRegime) -> ModeExecutionResult:
+        """Run one mode on ``context.structure`` unless it is known to fail."""
+        stats = self.mode_stats.setdefault(mode, ModeStats())
+
+        reason = self.mode_system.precheck_mode(mode, context, omega, field_regime)
+        if reason is not None:
+            stats.skipped += 1
+            return ModeExecutionResult(mode=mode, success=False,
+                                       metrics={'reason': reason, 'skipped': True})
+
+        start = time.perf_counter()
+        result = self.mode_system.execute_mode(mode, context.structure, omega, field_regime,
+                                               context=context)
+        stats.total_time += time.perf_counter() - start
+        stats.executed += 1
+        if result.success:
+            stats.succeeded += 1
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-mode timing/skip statistics and metric cache hit rate."""
+        return {
+            'metric_evaluations': self.metric_counter.evaluations,
+            'metric_hit_rate': self.metric_counter.hit_rate,
+            'modes': {
+                mode.value: {
+                    'executed': stats.executed,
+                    'skipped': stats.skipped,
+                    'succeeded': stats.succeeded,
+                    'mean_time': stats.mean_time,
+                    'skip_rate': stats.skip_rate,
+                }
+                for mode, stats in self.mode_stats.items()
+            },
+        }
+
+
 # Factory function
 def create_sgc_mode_system(epsilon: float = 0.3, grace_threshold: float = 0.5,
                          reflection_depth: int = 3) -> SGCModeSystem:
@@ -17,6 +17,7 @@ from .core import ObjectG
 from .resonance import OmegaSignature, compute_resonance_alignment
 from .grace_field import GraceFieldParams, recursion_depth_classification, FieldRegime
 from .coherence import compute_coherence
+from .graph_kernels import induced_subgraph, partition_subgraphs
 
 
 @dataclass(frozen=True)
@@ -55,12 +56,10 @@ class MorphicStructure:
             mid_point = len(node_ids) // 2
 
             if mid_point > 0:
-                # Create child graphs
-                child1_nodes = node_ids[:mid_point]
-                child2_nodes = node_ids[mid_point:]
-
-                child1_graph = self._create_subgraph(child1_nodes)
-                child2_graph = self._create_subgraph(child2_nodes)
+                # Create child graphs in a single pass over the parent's edges
+                child1_graph, child2_graph = partition_subgraphs(
+                    self.graph, [node_ids[:mid_point], node_ids[mid_point:]]
+                )
 
                 if child1_graph and child2_graph:
                     self.children = [
@@ -74,14 +73,11 @@ class MorphicStructure:
             return None
 
         # Extract relevant edges and labels
-        subgraph_labels = {nid: self.graph.labels[nid] for nid in node_ids if nid in self.graph.labels}
-        subgraph_edges = [(u, v) for u, v in self.graph.edges if u in node_ids and v in node_ids]
-
-        if not subgraph_labels:
+        labelled = [nid for nid in dict.fromkeys(node_ids) if nid in self.graph.labels]
+        if not labelled:
             return None
 
-        subgraph_nodes = list(subgraph_labels.keys())
-        return ObjectG(nodes=subgraph_nodes, edges=subgraph_edges, labels=subgraph_labels)
+        return induced_subgraph(self.graph, labelled)
 
     def get_resonance(self, omega: OmegaSignature, params: SGCGCParams) -> float:
         """Compute resonance(μ) using existing resonance alignment."""
@@ -0,0 +1,450 @@
+"""
+Deterministic Parallel Sweep Runner
+
+Runs a declarative grid of (function, parameters) tasks, as used by the
+validation and constant-hunting scripts:
+
+- Tasks are sharded across a process pool; each worker call seeds NumPy's
+  global RNG, Python's `random` and (if the function takes an `rng`
+  argument) a fresh Generator from a SeedSequence derived from the task's
+  function name, parameters and the root seed, so results do not depend on
+  worker count or grid order, and stay the same when library code is edited.
+- With a cache_dir (memoization is off by default), every finished task is
+  stored atomically as JSON under its content hash: the source of the
+  function's module, a code version hashing every FIRM_dsl source file, the
+  parameters and the root seed. Re-running an interrupted sweep only
+  evaluates the tasks that are missing, and editing any library code the
+  tasks may call invalidates the memo. Failed tasks are not memoized and
+  are retried.
+- Records are aggregated, in grid order, into a columnar sweep directory:
+  numeric fields are written by ColumnarSweepWriter (float64, NaN where
+  missing; readable with load_sweep_columns), everything else goes to a
+  string column in text.json (JSON for non-string values).
+  load_sweep_table() reads both back.
+
+Usage:
+    tasks = task_grid(measure_constants, topology=['ring_cross', 'complete'], N=[50, 100])
+    runner = TaskSweepRunner(workers=8, cache_dir="results/sweeps/hunt-cache", seed=0)
+    result = runner.run(tasks, output_path="results/sweeps/hunt")
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import random
+import time
+
+import numpy as np
+
+from .action_sweep import ColumnarSweepWriter, load_sweep_columns
+from .atomic_io import atomic_open
+
+
+RECORD_COLUMNS = ("task", "function", "status", "seed", "elapsed", "error")
+TEXT_COLUMNS_FILE = "text.json"
+CODE_PACKAGES = ("FIRM_dsl",)
+
+
+# ============================================================================
+# Tasks and Grids
+# ============================================================================
+
+@dataclass(frozen=True)
+class SweepTask:
+    """One unit of work: function(**params), labelled by name."""
+    function: Callable
+    params: Dict[str, Any] = field(default_factory=dict)
+    name: Optional[str] = None
+
+    @property
+    def function_name(self) -> str:
+        return f"{self.function.__module__}.{self.function.__qualname__}"
+
+    @property
+    def label(self) -> str:
+        if self.name is not None:
+            return self.name
+        args = ", ".join(f"{k}={v!r}" for k, v in self.params.items())
+        return f"{self.function.__name__}({args})"
+
+    def identity(self, seed: int = 0) -> Dict[str, Any]:
+        """Function name, parameters and root seed: what the task's RNG stream depends on."""
+        return {"function": self.function_name, "params": _to_jsonable(self.params), "seed": seed}
+
+    def content_hash(self, seed: int = 0, code: str = "") -> str:
+        """
+        SHA-256 of the task's code, parameters and root seed.
+
+        The source of the whole defining module is hashed (helpers the
+        function calls there are covered too); `code` should be a
+        code_version() of the libraries it imports.
+        """
+        try:
+            source = inspect.getsource(inspect.getmodule(self.function))
+        except (OSError, TypeError):
+            source = ""
+        payload = json.dumps(
+            {**self.identity(seed), "source": source, "code": code},
+            sort_keys=True, default=repr,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def task_grid(function: Callable, name: Optional[str] = None, **axes: Sequence[Any]) -> List[SweepTask]:
+    """
+    Cartesian product of parameter values for one function.
+
+    Args:
+        function: Module-level (picklable) callable
+        name: Optional label prefix; tasks are named "<name>[k=v, ...]"
+        **axes: Parameter name -> values to sweep
+
+    Returns:
+        SweepTasks for each combination (last axis varies fastest)
+    """
+    names = list(axes)
+    tasks = []
+    for values in product(*(axes[axis] for axis in names)):
+        params = dict(zip(names, values))
+        label = None
+        if name is not None:
+            label = f"{name}[{', '.join(f'{k}={v}' for k, v in params.items())}]"
+        tasks.append(SweepTask(function, params, label))
+    return tasks
+
+
+def code_version(packages: Sequence[str] = CODE_PACKAGES) -> str:
+    """
+    SHA-256 over every .py file of the given packages.
+
+    Part of each memo key, so a memoized result is reused only while the
+    library code it may have called is unchanged.
+    """
+    digest = hashlib.sha256()
+    for package in packages:
+        spec = importlib.util.find_spec(package)
+        for root in (spec.submodule_search_locations or []) if spec else []:
+            for directory, subdirs, files in os.walk(root):
+                subdirs[:] = sorted(d for d in subdirs if d != "__pycache__")
+                for name in sorted(f for f in files if f.endswith(".py")):
+                    path = os.path.join(directory, name)
+                    digest.update(os.path.relpath(path, root).encode())
+                    with open(path, "rb") as f:
+                        digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+# ============================================================================
+# Evaluation
+# ============================================================================
+
+def task_seed(task: SweepTask, seed: int = 0) -> np.random.SeedSequence:
+    """
+    Per-task SeedSequence from the function name, parameters and root seed.
+
+    Unlike the memo key it ignores source code, so editing a library (even
+    a comment) never changes a task's random stream.
+    """
+    payload = json.dumps(task.identity(seed), sort_keys=True, default=repr)
+    return np.random.SeedSequence(int(hashlib.sha256(payload.encode()).hexdigest()[:32], 16))
+
+
+def _run_task(task: SweepTask, key: str, root_seed: int) -> Dict[str, Any]:
+    """Evaluate one task with seeded RNGs; exceptions become error records."""
+    seed_sequence = task_seed(task, root_seed)
+    seed = int(seed_sequence.generate_state(1)[0])
+    np.random.seed(seed)
+    random.seed(seed)
+
+    params = dict(task.params)
+    try:
+        if "rng" in inspect.signature(task.function).parameters and "rng" not in params:
+            params["rng"] = np.random.default_rng(seed_sequence)
+    except (TypeError, ValueError):
+        pass
+
+    record = {
+        "key": key,
+        "task": task.label,
+        "function": task.function_name,
+        "params": _to_jsonable(task.params),
+        "seed": seed,
+    }
+    start = time.perf_counter()
+    try:
+        record["result"] = _to_jsonable(task.function(**params))
+        record["status"] = "ok"
+    except Exception as e:
+        record["result"] = None
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["elapsed"] = time.perf_counter() - start
+    return record
+
+
+def _to_jsonable(value: Any) -> Any:
+    """NumPy scalars/arrays and tuples to plain JSON types."""
+    if isinstance(value, dict):
+        return {str(k): _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return _to_jsonable(value.tolist())
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+# ============================================================================
+# Memo Store
+# ============================================================================
+
+class TaskMemo:
+    """Finished task records on disk: <cache_dir>/<key[:2]>/<key>.json."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None  # missing or truncated: recompute
+
+    def store(self, record: Dict[str, Any]):
+        path = self.path(record["key"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with atomic_open(path, "w") as f:
+            json.dump(record, f)
+
+
+# ============================================================================
+# Columnar Aggregation
+# ============================================================================
+
+def _flatten(record: Dict[str, Any]) -> Dict[str, Any]:
+    """One table row: record fields, param.<name> and result.<name> columns."""
+    row = {name: record.get(name) for name in RECORD_COLUMNS}
+    for name, value in record.get("params", {}).items():
+        row[f"param.{name}"] = value
+    result = record.get("result")
+    if isinstance(result, dict):
+        for name, value in result.items():
+            row[f"result.{name}"] = value
+    elif result is not None:
+        row["result"] = result
+    return row
+
+
+def _is_number(value: Any) -> bool:
+    return value is None or (isinstance(value, (int, float)) and not isinstance(value, str))
+
+
+def records_to_columns(records: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Column arrays for a list of task records.
+
+    Args:
+        records: Task records in output order
+
+    Returns:
+        Column name -> float64 array (numeric/bool fields, NaN if missing)
+        or unicode array (other fields; non-strings JSON-encoded)
+    """
+    rows = [_flatten(record) for record in records]
+    names = list(dict.fromkeys(name for row in rows for name in row))
+
+    columns = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        if name not in ("task", "function", "status", "error") and all(map(_is_number, values)):
+            columns[name] = np.array([np.nan if v is None else float(v) for v in values])
+        else:
+            columns[name] = np.array(
+                ["" if v is None else v if isinstance(v, str) else json.dumps(v) for v in values],
+                dtype=str,
+            )
+    return columns
+
+
+def write_sweep_table(records: Sequence[Dict[str, Any]], path: str) -> Dict[str, np.ndarray]:
+    """
+    Write records to a columnar sweep directory and return the columns.
+
+    Float columns are written by ColumnarSweepWriter (<path>/<column>.f64
+    plus schema.json), string columns to <path>/text.json.
+    """
+    columns = records_to_columns(records)
+    numeric = [name for name, values in columns.items() if values.dtype == np.float64]
+    text = {name: values.tolist() for name, values in columns.items() if name not in numeric}
+
+    os.makedirs(path, exist_ok=True)
+    with atomic_open(os.path.join(path, TEXT_COLUMNS_FILE), "w") as f:
+        json.dump(text, f)
+    with ColumnarSweepWriter(path, numeric) as writer:
+        if records:
+            writer.append({name: columns[name] for name in numeric})
+    return columns
+
+
+def load_sweep_table(path: str, mmap: bool = False) -> Dict[str, np.ndarray]:
+    """Read a table written by write_sweep_table: float and string columns."""
+    columns = load_sweep_columns(path, mmap=mmap)
+    with open(os.path.join(path, TEXT_COLUMNS_FILE)) as f:
+        text = json.load(f)
+    columns.update({name: np.array(values, dtype=str) for name, values in text.items()})
+    return columns
+
+
+# ============================================================================
+# Sweep Runner
+# ============================================================================
+
+@dataclass
+class TaskSweepResult:
+    """Result of a task sweep."""
+    records: List[Dict[str, Any]]  # In task order
+    num_computed: int
+    num_cached: int
+    output_path: Optional[str] = None
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        return records_to_columns(self.records)
+
+    @property
+    def failures(self) -> List[Dict[str, Any]]:
+        return [record for record in self.records if record["status"] != "ok"]
+
+    def by_task(self) -> Dict[str, Dict[str, Any]]:
+        """Task label -> record."""
+        return {record["task"]: record for record in self.records}
+
+
+class TaskSweepRunner:
+    """
+    Evaluate a grid of SweepTasks in parallel with on-disk memoization.
+
+    Results are identical for any worker count: seeding depends only on each
+    task's function name, parameters and the root seed (task_seed).
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        seed: int = 0,
+        progress: Optional[Callable[[Dict[str, Any], int, int], None]] = None,
+        code_packages: Sequence[str] = CODE_PACKAGES
+    ):
+        """
+        Initialize sweep runner.
+
+        Args:
+            workers: Worker processes (None = all cores, 1 = run in this process)
+            cache_dir: Memo directory (None, the default, disables memoization
+                and resume)
+            seed: Root seed mixed into every task seed and memo key
+            progress: Optional callback(record, done, total) per finished task
+            code_packages: Packages whose sources key the memo (code_version)
+        """
+        self.workers = os.cpu_count() if workers is None else workers
+        self.memo = TaskMemo(cache_dir) if cache_dir else None
+        self.seed = seed
+        self.progress = progress
+        self.code_packages = tuple(code_packages)
+
+    def run(self, tasks: Iterable[SweepTask], output_path: Optional[str] = None) -> TaskSweepResult:
+        """
+        Evaluate every task not already memoized.
+
+        Args:
+            tasks: SweepTasks (functions must be picklable when workers > 1)
+            output_path: Optional directory for the aggregated columns
+
+        Returns:
+            TaskSweepResult with one record per task, in task order
+        """
+        tasks = list(tasks)
+        code = code_version(self.code_packages)
+        keys = [task.content_hash(self.seed, code) for task in tasks]
+        records: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+
+        pending = []
+        for i, key in enumerate(keys):
+            cached = self.memo.load(key) if self.memo else None
+            if cached is not None:
+                cached["task"] = tasks[i].label
+                records[i] = cached
+            else:
+                pending.append(i)
+
+        num_cached = len(tasks) - len(pending)
+        done = num_cached
+        for i, record in self._stream(tasks, keys, pending):
+            records[i] = record
+            if self.memo and record["status"] == "ok":
+                self.memo.store(record)
+            done += 1
+            if self.progress:
+                self.progress(record, done, len(tasks))
+
+        if output_path:
+            write_sweep_table(records, output_path)
+
+        return TaskSweepResult(
+            records=records,
+            num_computed=len(pending),
+            num_cached=num_cached,
+            output_path=output_path
+        )
+
+    def _stream(self, tasks: List[SweepTask], keys: List[str], pending: List[int]):
+        """Yield (index, record) as tasks finish."""
+        if self.workers <= 1 or len(pending) <= 1:
+            for i in pending:
+                yield i, _run_task(tasks[i], keys[i], self.seed)
+            return
+
+        # Bounded in-flight window keeps memory flat for long grids
+        max_pending = 2 * self.workers
+        queue = iter(pending)
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+            running = {}
+            for i in queue:
+                running[pool.submit(_run_task, tasks[i], keys[i], self.seed)] = i
+                if len(running) >= max_pending:
+                    break
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield running.pop(future), future.result()
+                    for i in queue:
+                        running[pool.submit(_run_task, tasks[i], keys[i], self.seed)] = i
+                        break
+
+
+__all__ = [
+    "SweepTask",
+    "TaskSweepRunner",
+    "TaskSweepResult",
+    "TaskMemo",
+    "task_grid",
+    "task_seed",
+    "code_version",
+    "records_to_columns",
+    "write_sweep_table",
+    "load_sweep_table",
+]
@@ -406,18 +406,13 @@ class UnifiedFSCTFAction:
         Psi = config.coherence_field
         g = config.metric
         A_mu = config.connection
-        A_inf = config.attractor
         
-        # Compute Ricci scalar for info-geom term
-        # (Requires full curvature computation - simplified here)
-        # For demonstration, use trace of metric as proxy
-        R_scalar = 0.0  # Placeholder - full implementation needs Riemann tensor
+        R_scalar = self._ricci_scalar(config)
         
         # Compute each term
-        L_grad = self.compute_gradient_term(Psi, Psi_dot, A_inf)
+        L_grad, L_coup = self._coherence_terms(Psi, Psi_dot, config, R_scalar)
         L_cat = self.compute_categorical_term(A_mu)
         L_info = self.compute_info_geom_term(g, R_scalar)
-        L_coup = self.compute_coupling_term(Psi, g, R_scalar)
         
         L_total = L_grad + L_cat + L_info + L_coup
         
@@ -429,6 +424,25 @@ class UnifiedFSCTFAction:
             total=L_total
         )
     
+    @staticmethod
+    def _ricci_scalar(config: FieldConfiguration) -> float:
+        """Ricci scalar entering ℒ_info-geom and ℒ_coupling at this point."""
+        # (Requires full curvature computation - simplified here)
+        # For demonstration, use trace of metric as proxy
+        return 0.0  # Placeholder - full implementation needs Riemann tensor
+    
+    def _coherence_terms(
+        self,
+        Psi: np.ndarray,
+        Psi_dot: np.ndarray,
+        config: FieldConfiguration,
+        R_scalar: float
+    ) -> Tuple[float, float]:
+        """The Ψ-dependent terms (ℒ_gradient, ℒ_coupling) at this point."""
+        L_grad = self.compute_gradient_term(Psi, Psi_dot, config.attractor)
+        L_coup = self.compute_coupling_term(Psi, config.metric, R_scalar)
+        return L_grad, L_coup
+    
     # ------------------------------------------------------------------------
     # Action Integral
     # ------------------------------------------------------------------------
@@ -485,7 +499,8 @@ class UnifiedFSCTFAction:
         config: FieldConfiguration,
         Psi_dot: np.ndarray,
         Psi_ddot: np.ndarray,
-        epsilon: float = 1e-6
+        epsilon: float = 1e-6,
+        lagrangian: Optional[LagrangianComponents] = None
     ) -> Dict[str, float]:
         """
         Compute Euler-Lagrange equation residuals.
@@ -498,25 +513,30 @@ class UnifiedFSCTFAction:
         
         This function computes the left-hand side (should be zero at extremum).
         
+        Only ℒ_gradient and ℒ_coupling depend on Ψ, so the perturbed point
+        re-evaluates just those two terms; ℒ_categorical and ℒ_info-geom
+        cancel in the difference.
+        
         Args:
             config: Field configuration
             Psi_dot: ∂_t Ψ
             Psi_ddot: ∂²_t Ψ
             epsilon: Finite difference step
+            lagrangian: Already-computed ℒ at config (skips re-evaluating it)
         
         Returns:
             Dictionary of residuals for each field
         """
         # Compute ∂ℒ/∂Ψ via finite differences
-        L_0 = self.compute_lagrangian_density(config, Psi_dot).total
+        if lagrangian is None:
+            lagrangian = self.compute_lagrangian_density(config, Psi_dot)
+        R_scalar = self._ricci_scalar(config)
         
         Psi_pert = config.coherence_field + epsilon * np.eye(config.hilbert_dimension, dtype=complex)
-        config_pert = FieldConfiguration(
-            Psi_pert, config.metric, config.connection, config.attractor, config.coordinates
-        )
-        L_pert = self.compute_lagrangian_density(config_pert, Psi_dot).total
+        L_grad_pert, L_coup_pert = self._coherence_terms(Psi_pert, Psi_dot, config, R_scalar)
         
-        dL_dPsi = (L_pert - L_0) / epsilon
+        dL_dPsi = ((L_grad_pert - lagrangian.gradient_term)
+                   + (L_coup_pert - lagrangian.coupling_term)) / epsilon
         
         # Compute d/dt(∂ℒ/∂(∂_t Ψ))
         # This requires ∂ℒ/∂(Psi_dot), which for kinetic term is:
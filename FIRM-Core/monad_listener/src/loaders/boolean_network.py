@@ -0,0 +1,130 @@
+"""
+Sparse Boolean Network Simulator
+
+Compiles per-node Boolean functions into:
+1. A CSR input matrix A (A[node, input] = 1), so s = A x counts active inputs
+2. Threshold / parity vectors: and, or and majority are s >= threshold,
+   xor is s mod 2
+
+Each step is one sparse matvec over a whole batch of states plus a vectorized
+comparison. Trajectories are hashed state-by-state so a run can stop once
+every member has entered its attractor; the rest of the trajectory is then
+filled in from the detected cycle.
+"""
+
+import numpy as np
+from scipy import sparse
+from typing import Dict, Optional, Tuple
+
+FUNCTION_TYPES = ('and', 'or', 'xor', 'majority')
+
+class BooleanNetwork:
+    """Synchronous Boolean network compiled to sparse threshold/parity form"""
+
+    def __init__(self, inputs: sparse.csr_matrix, threshold: np.ndarray, parity: np.ndarray):
+        self.inputs = sparse.csr_matrix(inputs, dtype=np.int32)
+        self.n_nodes = self.inputs.shape[0]
+        self.threshold = np.asarray(threshold, dtype=np.int32)
+        self.parity = np.asarray(parity, dtype=bool)
+
+    @classmethod
+    def from_functions(cls, functions: Dict[int, Dict], n_nodes: int) -> 'BooleanNetwork':
+        """Compile {node: {'type': ..., 'inputs': [...]}} function tables"""
+        rows, cols = [], []
+        threshold = np.zeros(n_nodes, dtype=np.int32)
+        parity = np.zeros(n_nodes, dtype=bool)
+
+        for node in range(n_nodes):
+            func = functions[node]
+            inputs = np.unique(func['inputs'])
+            k = len(inputs)
+            rows.extend([node] * k)
+            cols.extend(inputs.tolist())
+
+            if func['type'] == 'and':
+                threshold[node] = k            # all inputs on (vacuously true for k = 0)
+            elif func['type'] == 'or':
+                threshold[node] = 1
+            elif func['type'] == 'xor':
+                parity[node] = True
+            elif func['type'] == 'majority':
+                threshold[node] = k // 2 + 1   # strictly more than half
+            else:
+                raise ValueError(f"Unknown Boolean function type: {func['type']}")
+
+        inputs = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                                   shape=(n_nodes, n_nodes))
+        return cls(inputs, threshold, parity)
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Synchronous update of (batch, n_nodes) 0/1 states"""
+        active = (self.inputs @ states.T).T
+        if out is None:
+            out = np.empty(states.shape, dtype=np.uint8)
+        np.greater_equal(active, self.threshold, out=out, casting='unsafe')
+        out[:, self.parity] = active[:, self.parity] & 1
+        return out
+
+    def run(self, initial: np.ndarray, steps: int, stop_on_cycle: bool = True,
+            out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Evolve a batch of initial states.
+
+        Args:
+            initial: (batch, n_nodes) or (n_nodes,) 0/1 initial states
+            steps: Trajectory length (number of updates)
+            stop_on_cycle: Stop stepping once every member has revisited a state
+                and extend the trajectory periodically
+            out: Optional preallocated (batch, steps+1, n_nodes) trajectory
+
+        Returns:
+            (trajectory, transients, periods): transients[b] is the first time
+            of the attractor, periods[b] its cycle length (0 if not reached)
+        """
+        initial = np.asarray(initial)
+        single = initial.ndim == 1
+        states = np.atleast_2d(initial).astype(np.uint8)
+        batch = states.shape[0]
+
+        shape = (batch, steps + 1, self.n_nodes)
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        elif out.shape != shape:
+            raise ValueError(f"out must have shape {shape}, got {out.shape}")
+
+        transients = np.zeros(batch, dtype=np.int64)
+        periods = np.zeros(batch, dtype=np.int64)
+        seen = [{} for _ in range(batch)]
+        pending = np.arange(batch)
+
+        out[:, 0] = states
+        last = steps
+        for t in range(steps + 1):
+            if t > 0:
+                self.step(out[:, t - 1], out=out[:, t])
+            if not stop_on_cycle:
+                continue
+
+            # Hash the packed state of every member still looking for its cycle
+            keys = np.packbits(out[pending, t], axis=1)
+            still_pending = []
+            for b, key in zip(pending, keys):
+                first = seen[b].setdefault(key.tobytes(), t)
+                if first == t:
+                    still_pending.append(b)
+                else:
+                    transients[b], periods[b] = first, t - first
+            pending = np.array(still_pending, dtype=np.int64)
+
+            if len(pending) == 0:
+                last = t
+                break
+
+        if last < steps:
+            # Every member is periodic from transients[b] on
+            times = np.arange(last + 1, steps + 1)
+            source = transients[:, None] + (times[None, :] - transients[:, None]) % periods[:, None]
+            out[:, last + 1:] = out[np.arange(batch)[:, None], source]
+
+        if single:
+            return out[0], transients[0], periods[0]
+        return out, transients, periods
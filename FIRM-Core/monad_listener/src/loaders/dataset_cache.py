@@ -0,0 +1,243 @@
+"""
+Sharded On-Disk Dataset Cache
+
+Builds domain datasets once and reuses them across runs:
+1. Samples are generated in fixed-size shards; shard i of a config is seeded
+   from SeedSequence(seed, spawn_key=(i,)), so its contents do not depend on
+   how many shards exist or which worker built it
+2. Missing shards are fanned out over a process pool
+3. Each shard is a directory of per-key .npy arrays (memory-mapped on read)
+   plus a pickle of the remaining per-sample fields, keyed by a hash of
+   the domain and generator config
+4. ShardedDataset exposes the samples as a lazy, sliceable sequence with the
+   same train/val/test layout as DomainLoader.load_dataset
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from FIRM_dsl.atomic_io import atomic_directory
+
+from .dataset_generators import GENERATOR_VERSION, DomainLoader
+
+SAMPLES_FILE = 'samples.pkl'
+
+# =============================================================================
+# Shard I/O
+# =============================================================================
+
+def _stackable(values: List) -> bool:
+    """True if every value is a numeric array of one shape and dtype"""
+    first = values[0]
+    if not isinstance(first, np.ndarray) or first.dtype == object:
+        return False
+    return all(isinstance(v, np.ndarray) and v.shape == first.shape and v.dtype == first.dtype
+               for v in values)
+
+def write_shard(samples: List[Dict], shard_dir: Path):
+    """Write samples to shard_dir atomically (built in a temp dir, then renamed)"""
+    shard_dir = Path(shard_dir)
+    shard_dir.parent.mkdir(parents=True, exist_ok=True)
+    array_keys = [key for key in samples[0] if _stackable([s.get(key) for s in samples])]
+    rest = [{k: v for k, v in s.items() if k not in array_keys} for s in samples]
+
+    # If another builder finished the same shard first, its identical copy is kept
+    with atomic_directory(str(shard_dir)) as tmp_dir:
+        for key in array_keys:
+            np.save(os.path.join(tmp_dir, f"{key}.npy"), np.stack([s[key] for s in samples]))
+        with open(os.path.join(tmp_dir, SAMPLES_FILE), 'wb') as f:
+            pickle.dump({'array_keys': array_keys, 'samples': rest}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def read_shard(shard_dir: Path) -> Tuple[Dict[str, np.ndarray], List[Dict]]:
+    """Load a shard: memory-mapped arrays by key, plus the per-sample remainder"""
+    shard_dir = Path(shard_dir)
+    with open(shard_dir / SAMPLES_FILE, 'rb') as f:
+        payload = pickle.load(f)
+    arrays = {key: np.load(shard_dir / f"{key}.npy", mmap_mode='r') for key in payload['array_keys']}
+    return arrays, payload['samples']
+
+def _build_shard(domain: str, generator_kwargs: Dict, seed: int, index: int,
+                 shard_size: int, shard_dir: str) -> str:
+    """Process-pool worker: generate and write one shard"""
+    child = np.random.SeedSequence(seed, spawn_key=(index,))
+    generator_class = DomainLoader().generators[domain]
+    generator = generator_class(seed=int(child.generate_state(1)[0]), **generator_kwargs)
+    write_shard(generator._generate_samples(shard_size), Path(shard_dir))
+    return shard_dir
+
+# =============================================================================
+# Lazy dataset view
+# =============================================================================
+
+class _ShardStore:
+    """Small LRU of opened shards, shared by every view of one dataset"""
+
+    def __init__(self, shard_dirs: List[Path], max_open: int = 8):
+        self.shard_dirs = shard_dirs
+        self.max_open = max_open
+        self._open = OrderedDict()
+
+    def get(self, index: int) -> Tuple[Dict[str, np.ndarray], List[Dict]]:
+        if index in self._open:
+            self._open.move_to_end(index)
+        else:
+            self._open[index] = read_shard(self.shard_dirs[index])
+            if len(self._open) > self.max_open:
+                self._open.popitem(last=False)
+        return self._open[index]
+
+class ShardedDataset:
+    """Lazy sequence of sample dicts backed by on-disk shards"""
+
+    def __init__(self, store: _ShardStore, shard_size: int, start: int, stop: int):
+        self._store = store
+        self.shard_size = shard_size
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return ShardedDataset(self._store, self.shard_size,
+                                  self.start + start, self.start + max(start, stop))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ShardedDataset index out of range")
+
+        shard, offset = divmod(self.start + index, self.shard_size)
+        arrays, samples = self._store.get(shard)
+        sample = dict(samples[offset])
+        for key, values in arrays.items():
+            sample[key] = values[offset]
+        return sample
+
+    def column(self, key: str) -> np.ndarray:
+        """Stack one array field over the whole view (one read per shard)"""
+        parts = []
+        position = self.start
+        while position < self.stop:
+            shard, offset = divmod(position, self.shard_size)
+            count = min(self.shard_size - offset, self.stop - position)
+            arrays, _ = self._store.get(shard)
+            parts.append(arrays[key][offset:offset + count])
+            position += count
+        return np.concatenate(parts) if parts else np.empty(0)
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+class DatasetCache:
+    """Parallel, sharded, content-keyed cache for DomainLoader datasets"""
+
+    def __init__(self, cache_dir: str = "data/cache", shard_size: int = 256,
+                 workers: Optional[int] = None, seed: int = 42, max_open_shards: int = 8):
+        self.cache_dir = Path(cache_dir)
+        self.shard_size = shard_size
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.max_open_shards = max_open_shards
+
+    def config(self, domain: str, generator_kwargs: Dict) -> Dict:
+        """Everything that determines shard contents, including GENERATOR_VERSION"""
+        return {
+            'domain': domain,
+            'generator': generator_kwargs,
+            'generator_version': GENERATOR_VERSION,
+            'seed': self.seed,
+            'shard_size': self.shard_size,
+        }
+
+    def config_hash(self, domain: str, generator_kwargs: Dict) -> str:
+        """Stable key for everything that determines shard contents"""
+        encoded = json.dumps(self.config(domain, generator_kwargs), sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _domain_dir(self, domain: str, generator_kwargs: Dict) -> Path:
+        return self.cache_dir / f"{domain}-{self.config_hash(domain, generator_kwargs)}"
+
+    def _shard_dirs(self, domain: str, n_samples: int, generator_kwargs: Dict) -> List[Path]:
+        domain_dir = self._domain_dir(domain, generator_kwargs)
+        n_shards = -(-n_samples // self.shard_size)
+        return [domain_dir / f"shard-{i:05d}" for i in range(n_shards)]
+
+    def ensure(self, requests: List[Tuple[str, int, Dict]]) -> Dict[str, List[Path]]:
+        """Build every missing shard for (domain, n_samples, generator_kwargs) requests.
+
+        Returns:
+            Shard directories per domain, in sample order
+        """
+        shard_dirs, jobs = {}, []
+        for domain, n_samples, generator_kwargs in requests:
+            if domain not in DomainLoader().generators:
+                raise ValueError(f"Unknown domain: {domain}")
+
+            domain_dir = self._domain_dir(domain, generator_kwargs)
+            domain_dir.mkdir(parents=True, exist_ok=True)
+            config_file = domain_dir / 'config.json'
+            if not config_file.exists():
+                config_file.write_text(json.dumps(self.config(domain, generator_kwargs), indent=2, default=str))
+
+            dirs = self._shard_dirs(domain, n_samples, generator_kwargs)
+            shard_dirs[domain] = dirs
+            missing = [(i, d) for i, d in enumerate(dirs) if not (d / SAMPLES_FILE).exists()]
+            if missing:
+                print(f"Generating {domain} dataset: {len(missing)}/{len(dirs)} shards...")
+            jobs.extend((domain, generator_kwargs, self.seed, i, self.shard_size, str(d))
+                        for i, d in missing)
+
+        if len(jobs) > 1 and self.workers > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+                list(pool.map(_build_shard, *zip(*jobs)))
+        else:
+            for job in jobs:
+                _build_shard(*job)
+
+        return shard_dirs
+
+    def _splits(self, shard_dirs: List[Path], n_samples: int,
+                split_ratios: Tuple[float, float, float]) -> Dict[str, ShardedDataset]:
+        store = _ShardStore(shard_dirs, self.max_open_shards)
+        train_size = int(n_samples * split_ratios[0])
+        val_size = int(n_samples * split_ratios[1])
+        return {
+            'train': ShardedDataset(store, self.shard_size, 0, train_size),
+            'val': ShardedDataset(store, self.shard_size, train_size, train_size + val_size),
+            'test': ShardedDataset(store, self.shard_size, train_size + val_size, n_samples)
+        }
+
+    def open(self, domain: str, n_samples: int,
+             split_ratios: Tuple[float, float, float] = (0.7, 0.15, 0.15),
+             **generator_kwargs) -> Dict[str, ShardedDataset]:
+        """Lazy train/val/test splits for one domain (building missing shards)"""
+        shard_dirs = self.ensure([(domain, n_samples, generator_kwargs)])[domain]
+        return self._splits(shard_dirs, n_samples, split_ratios)
+
+    def open_all(self, n_samples_per_domain: int = 1000,
+                 generator_kwargs: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict[str, ShardedDataset]]:
+        """Lazy splits for all 5 domains, building missing shards in one pool"""
+        generator_kwargs = generator_kwargs or {}
+        domains = ['quantum', 'ca', 'pde', 'spin', 'graphs']
+        shard_dirs = self.ensure([(domain, n_samples_per_domain, generator_kwargs.get(domain, {}))
+                                  for domain in domains])
+        return {domain: self._splits(shard_dirs[domain], n_samples_per_domain, (0.7, 0.15, 0.15))
+                for domain in domains}
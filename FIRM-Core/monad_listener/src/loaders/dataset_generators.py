@@ -10,17 +10,23 @@ Generates reproducible datasets for 5 domains with rich symmetries:
 """
 
 import numpy as np
-import torch
 from typing import Dict, List, Tuple, Any
-import random
+
+from .ca_engine import evolve_elementary_ca
+from .spin_sampler import IsingSampler
+from .boolean_network import BooleanNetwork
+from .pde_kernels import KERNELS
+
+# Bump whenever a generator or engine changes its output, so cached shards are rebuilt
+GENERATOR_VERSION = 1
 
 class DatasetGenerator:
     """Base class for all dataset generators"""
 
     def __init__(self, seed: int = 42):
         self.seed = seed
-        np.random.seed(seed)
-        random.seed(seed)
+        # Per-generator stream (same draws as seeding the global RNG, which is left alone)
+        self.rng = np.random.RandomState(seed)
 
     def generate_dataset(self, n_samples: int, split_ratios: Tuple[float, float, float] = (0.7, 0.15, 0.15)) -> Dict[str, List]:
         """Generate train/val/test splits"""
@@ -76,18 +82,18 @@ class QuantumCircuitGenerator(DatasetGenerator):
         clifford_gates = ['H', 'S', 'X', 'Y', 'Z', 'CNOT']
         circuit = []
 
-        for _ in range(np.random.randint(5, self.max_gates)):
-            if np.random.random() < 0.3:  # 30% chance of T gate
+        for _ in range(self.rng.randint(5, self.max_gates)):
+            if self.rng.random() < 0.3:  # 30% chance of T gate
                 gate = 'T'
             else:
-                gate = np.random.choice(clifford_gates)
+                gate = self.rng.choice(clifford_gates)
 
             if gate == 'CNOT':
-                control = np.random.randint(0, self.n_qubits)
-                target = (control + np.random.randint(1, self.n_qubits)) % self.n_qubits
+                control = self.rng.randint(0, self.n_qubits)
+                target = (control + self.rng.randint(1, self.n_qubits)) % self.n_qubits
                 circuit.append(f'CNOT({control},{target})')
             else:
-                qubit = np.random.randint(0, self.n_qubits)
+                qubit = self.rng.randint(0, self.n_qubits)
                 circuit.append(f'{gate}({qubit})')
 
         return circuit
@@ -97,8 +103,8 @@ class QuantumCircuitGenerator(DatasetGenerator):
         # This would use actual quantum simulation
         # For now, return random but realistic statevector
         dim = 2 ** self.n_qubits
-        real_part = np.random.normal(0, 1/np.sqrt(dim), dim)
-        imag_part = np.random.normal(0, 1/np.sqrt(dim), dim)
+        real_part = self.rng.normal(0, 1/np.sqrt(dim), dim)
+        imag_part = self.rng.normal(0, 1/np.sqrt(dim), dim)
         statevector = real_part + 1j * imag_part
         statevector /= np.linalg.norm(statevector)
         return statevector
@@ -108,30 +114,31 @@ class QuantumCircuitGenerator(DatasetGenerator):
         # This would use actual ZX calculus
         # For now, return simplified representation
         return {
-            'spiders': np.random.randint(1, 10),
-            'phases': np.random.uniform(0, 2*np.pi, np.random.randint(1, 5)),
-            'connections': np.random.randint(0, 5, (np.random.randint(1, 10), 2))
+            'spiders': self.rng.randint(1, 10),
+            'phases': self.rng.uniform(0, 2*np.pi, self.rng.randint(1, 5)),
+            'connections': self.rng.randint(0, 5, (self.rng.randint(1, 10), 2))
         }
 
 class CellularAutomataGenerator(DatasetGenerator):
     """Generate cellular automata traces"""
 
-    def __init__(self, rule: int = 30, size: int = 100, steps: int = 200, **kwargs):
+    # Lattices at least this wide evolve bit-packed, 64 cells per word
+    PACKED_MIN_SIZE = 64
+
+    def __init__(self, rule: int = 30, size: int = 100, steps: int = 200, packed: bool = None, **kwargs):
         super().__init__(**kwargs)
         self.rule = rule
         self.size = size
         self.steps = steps
+        self.packed = size >= self.PACKED_MIN_SIZE if packed is None else packed
 
     def _generate_samples(self, n_samples: int) -> List[Dict]:
-        samples = []
-
-        for _ in range(n_samples):
-            # Generate random initial condition
-            initial = np.random.randint(0, 2, self.size)
-
-            # Evolve CA
-            trace = self._evolve_ca(initial)
+        # Random initial conditions for the whole batch, evolved together
+        initials = self.rng.randint(0, 2, (n_samples, self.size))
+        traces = self.evolve_batch(initials)
 
+        samples = []
+        for initial, trace in zip(initials, traces):
             samples.append({
                 'type': 'ca',
                 'rule': self.rule,
@@ -142,196 +149,176 @@ class CellularAutomataGenerator(DatasetGenerator):
 
         return samples
 
+    def evolve_batch(self, initials: np.ndarray) -> np.ndarray:
+        """Evolve (batch, size) initial conditions into a (batch, steps+1, size) trace"""
+        initials = np.asarray(initials)
+        return evolve_elementary_ca(initials, self.rule, self.steps,
+                                    packed=self.packed, dtype=initials.dtype)
+
     def _evolve_ca(self, initial: np.ndarray) -> np.ndarray:
         """Evolve cellular automaton"""
-        trace = [initial.copy()]
-
-        for step in range(self.steps):
-            current = trace[-1]
-            next_state = np.zeros_like(current)
-
-            for i in range(self.size):
-                # Get neighborhood
-                left = current[(i-1) % self.size]
-                center = current[i]
-                right = current[(i+1) % self.size]
-
-                # Apply rule
-                neighborhood = (left << 2) | (center << 1) | right
-                next_state[i] = (self.rule >> neighborhood) & 1
-
-            trace.append(next_state.copy())
-
-        return np.array(trace)
+        return self.evolve_batch(initial[np.newaxis])[0]
 
 class PDEFieldGenerator(DatasetGenerator):
     """Generate PDE field solutions"""
 
-    def __init__(self, equation: str = "wave", grid_size: int = 64, time_steps: int = 100, **kwargs):
+    def __init__(self, equation: str = "wave", grid_size: int = 64, time_steps: int = 100,
+                 boundary: str = "periodic", snapshot_every: int = None, batch_size: int = 256, **kwargs):
         super().__init__(**kwargs)
         self.equation = equation
         self.grid_size = grid_size
         self.time_steps = time_steps
+        self.boundary = boundary
+        self.snapshot_every = snapshot_every
+        self.batch_size = batch_size
+        self._kernels = {}
 
     def _generate_samples(self, n_samples: int) -> List[Dict]:
-        samples = []
+        if self.equation == "wave":
+            initial = np.broadcast_to(self._wave_initial(), (n_samples, self.grid_size, self.grid_size))
+        elif self.equation == "burgers":
+            initial = np.broadcast_to(self._burgers_initial(), (n_samples, self.grid_size, self.grid_size))
+        else:
+            initial = self.rng.uniform(0.4, 0.6, (n_samples, self.grid_size, self.grid_size))
 
-        for _ in range(n_samples):
-            if self.equation == "wave":
-                field = self._generate_wave_field()
-            elif self.equation == "burgers":
-                field = self._generate_burgers_field()
-            else:
-                field = self._generate_gray_scott_field()
-
-            samples.append({
-                'type': 'pde',
-                'equation': self.equation,
-                'field': field,
-                'symmetries': ['se2', 'mobius_complex']
-            })
+        samples = []
+        for start in range(0, n_samples, self.batch_size):
+            snapshots = self.evolve_batch(initial[start:start + self.batch_size])
+
+            for history in snapshots:
+                sample = {
+                    'type': 'pde',
+                    'equation': self.equation,
+                    'field': history[-1],
+                    'symmetries': ['se2', 'mobius_complex']
+                }
+                if self.snapshot_every is not None:
+                    sample['snapshots'] = history
+                samples.append(sample)
 
         return samples
 
-    def _generate_wave_field(self) -> np.ndarray:
-        """Generate 2D wave equation solution"""
+    def evolve_batch(self, initial: np.ndarray) -> np.ndarray:
+        """Evolve a (batch, H, W) stack; returns (batch, n_snapshots, H, W)"""
+        field = np.array(initial, dtype=np.float64)
+        kernel = self._kernel(field.shape)
+        # The wave generator has always taken one step fewer than the others
+        steps = self.time_steps - 1 if self.equation == "wave" else self.time_steps
+        return kernel.run(field, max(steps, 0), self.snapshot_every)
+
+    def _kernel(self, shape: Tuple[int, int, int]):
+        """Reuse one kernel (and its scratch buffers) per batch shape"""
+        if shape not in self._kernels:
+            name = self.equation if self.equation in ("wave", "burgers") else "gray_scott"
+            self._kernels[shape] = KERNELS[name](shape, boundary=self.boundary)
+        return self._kernels[shape]
+
+    def _wave_initial(self) -> np.ndarray:
         x = np.linspace(-1, 1, self.grid_size)
         y = np.linspace(-1, 1, self.grid_size)
         X, Y = np.meshgrid(x, y)
 
         # Initial condition: Gaussian pulse
-        field = np.exp(-((X-0.2)**2 + (Y-0.2)**2) / 0.1)
-
-        # Time evolution (simplified)
-        for t in range(1, self.time_steps):
-            # Simple wave propagation
-            field = np.roll(field, 1, axis=0) * 0.99 + np.roll(field, -1, axis=0) * 0.99
-            field = np.roll(field, 1, axis=1) * 0.99 + np.roll(field, -1, axis=1) * 0.99
+        return np.exp(-((X-0.2)**2 + (Y-0.2)**2) / 0.1)
 
-        return field
-
-    def _generate_burgers_field(self) -> np.ndarray:
-        """Generate Burgers equation solution"""
-        # Simplified Burgers equation solution
+    def _burgers_initial(self) -> np.ndarray:
         x = np.linspace(-2, 2, self.grid_size)
         y = np.linspace(-2, 2, self.grid_size)
         X, Y = np.meshgrid(x, y)
 
-        # Initial condition
-        field = np.exp(-X**2 - Y**2)
+        return np.exp(-X**2 - Y**2)
 
-        # Simplified evolution
-        for t in range(self.time_steps):
-            field = field - 0.1 * field * (np.roll(field, -1, axis=0) - np.roll(field, 1, axis=0))
+    def _generate_wave_field(self) -> np.ndarray:
+        """Generate 2D wave equation solution"""
+        return self.evolve_batch(self._wave_initial()[np.newaxis])[0, -1]
 
-        return field
+    def _generate_burgers_field(self) -> np.ndarray:
+        """Generate Burgers equation solution"""
+        return self.evolve_batch(self._burgers_initial()[np.newaxis])[0, -1]
 
     def _generate_gray_scott_field(self) -> np.ndarray:
         """Generate Gray-Scott reaction-diffusion"""
-        # Simplified Gray-Scott
-        field = np.random.uniform(0.4, 0.6, (self.grid_size, self.grid_size))
-
-        for t in range(self.time_steps):
-            laplacian = (np.roll(field, 1, axis=0) + np.roll(field, -1, axis=0) +
-                        np.roll(field, 1, axis=1) + np.roll(field, -1, axis=1) - 4*field)
-
-            reaction = field * (1 - field) * (field - 0.3)
-
-            field += 0.01 * (0.1 * laplacian - reaction)
-
-            field = np.clip(field, 0, 1)
-
-        return field
+        field = self.rng.uniform(0.4, 0.6, (1, self.grid_size, self.grid_size))
+        return self.evolve_batch(field)[0, -1]
 
 class SpinLatticeGenerator(DatasetGenerator):
     """Generate spin lattice trajectories"""
 
-    def __init__(self, model: str = "ising_2d", lattice_size: int = 32, steps: int = 100, **kwargs):
+    def __init__(self, model: str = "ising_2d", lattice_size: int = 32, steps: int = 100,
+                 beta: float = 1.0, algorithm: str = "checkerboard", **kwargs):
         super().__init__(**kwargs)
         self.model = model
         self.lattice_size = lattice_size
         self.steps = steps
+        self.beta = beta
+        self.algorithm = algorithm
 
     def _generate_samples(self, n_samples: int) -> List[Dict]:
-        samples = []
-
-        for _ in range(n_samples):
-            # Initialize random spin configuration
-            if self.model.startswith("ising"):
-                spins = np.random.choice([-1, 1], size=(self.lattice_size, self.lattice_size))
-            else:  # XY model
-                spins = np.random.uniform(0, 2*np.pi, size=(self.lattice_size, self.lattice_size))
+        # Initialize random spin configurations for every chain
+        if self.model.startswith("ising"):
+            spins = self.rng.choice(np.array([-1, 1], dtype=np.int8),
+                                     size=(n_samples, self.lattice_size, self.lattice_size))
+        else:  # XY model
+            spins = self.rng.uniform(0, 2*np.pi, size=(n_samples, self.lattice_size, self.lattice_size))
 
-            # Evolve spins
-            trajectory = self._evolve_spins(spins)
+        # Evolve all chains together
+        trajectories = self.evolve_batch(spins, seed=self.rng.randint(0, 2**31 - 1))
 
+        samples = []
+        for initial, trajectory in zip(spins, trajectories):
             samples.append({
                 'type': 'spin',
                 'model': self.model,
-                'initial_spins': spins,
+                'initial_spins': initial,
                 'trajectory': trajectory,
                 'symmetries': ['spin_flip', 'lattice_permutations']
             })
 
         return samples
 
-    def _evolve_spins(self, initial_spins: np.ndarray) -> np.ndarray:
-        """Evolve spin system"""
-        trajectory = [initial_spins.copy()]
-
-        for step in range(self.steps):
-            current = trajectory[-1]
+    def evolve_batch(self, spins: np.ndarray, seed=None) -> np.ndarray:
+        """Evolve (chains, L, L) spins into a (chains, steps+1, L, L) trajectory"""
+        if self.model == "ising_2d":
+            sampler = IsingSampler(self.lattice_size, beta=self.beta, algorithm=self.algorithm)
+            return sampler.run(spins, self.steps, seed=seed)
 
-            if self.model == "ising_2d":
-                # Metropolis-Hastings for Ising model
-                for _ in range(self.lattice_size * self.lattice_size):
-                    i, j = np.random.randint(0, self.lattice_size, 2)
+        # Models without dynamics keep their initial configuration
+        return np.repeat(spins[:, np.newaxis], self.steps + 1, axis=1)
 
-                    # Calculate energy change
-                    neighbors = [
-                        current[(i-1)%self.lattice_size, j],
-                        current[(i+1)%self.lattice_size, j],
-                        current[i, (j-1)%self.lattice_size],
-                        current[i, (j+1)%self.lattice_size]
-                    ]
-
-                    delta_E = 2 * current[i,j] * sum(neighbors)
-
-                    # Accept/reject
-                    if delta_E <= 0 or np.random.random() < np.exp(-delta_E):
-                        current[i,j] *= -1
-
-            trajectory.append(current.copy())
-
-        return np.array(trajectory)
+    def _evolve_spins(self, initial_spins: np.ndarray) -> np.ndarray:
+        """Evolve spin system"""
+        return self.evolve_batch(initial_spins[np.newaxis], seed=self.rng.randint(0, 2**31 - 1))[0]
 
 class GraphDynamicsGenerator(DatasetGenerator):
     """Generate graph dynamics (Boolean networks)"""
 
-    def __init__(self, n_nodes: int = 20, connectivity: float = 0.3, steps: int = 100, **kwargs):
+    def __init__(self, n_nodes: int = 20, connectivity: float = 0.3, steps: int = 100,
+                 stop_on_cycle: bool = True, **kwargs):
         super().__init__(**kwargs)
         self.n_nodes = n_nodes
         self.connectivity = connectivity
         self.steps = steps
+        self.stop_on_cycle = stop_on_cycle
 
     def _generate_samples(self, n_samples: int) -> List[Dict]:
         samples = []
 
         for _ in range(n_samples):
             # Generate random graph
-            graph = self._generate_graph()
+            self.graph = graph = self._generate_graph()
 
             # Generate random Boolean functions
             functions = self._generate_functions()
 
             # Evolve dynamics
-            trajectory = self._evolve_graph(graph, functions)
+            trajectory, transient, period = self._run_network(functions)
 
             samples.append({
                 'type': 'graph',
                 'graph': graph,
                 'functions': functions,
                 'trajectory': trajectory,
+                'attractor': {'transient': int(transient), 'period': int(period)},
                 'symmetries': ['node_relabeling']
             })
 
@@ -341,29 +328,29 @@ class GraphDynamicsGenerator(DatasetGenerator):
         """Generate random graph"""
         nodes = list(range(self.n_nodes))
 
-        # Generate edges
-        edges = []
-        for i in range(self.n_nodes):
-            for j in range(i+1, self.n_nodes):
-                if np.random.random() < self.connectivity:
-                    edges.append([i, j])
+        # One draw per node pair, in the same (i < j) row-major order as a double loop
+        rows, cols = np.triu_indices(self.n_nodes, k=1)
+        keep = self.rng.random(len(rows)) < self.connectivity
+        edges = np.stack([rows[keep], cols[keep]], axis=1)
 
         return {
             'nodes': nodes,
-            'edges': edges
+            'edges': edges.tolist()
         }
 
     def _generate_functions(self) -> Dict:
         """Generate random Boolean functions for each node"""
         functions = {}
+        edges = np.asarray(self.graph['edges'], dtype=int).reshape(-1, 2)
+        degree = np.bincount(edges.ravel(), minlength=self.n_nodes)
 
         for node in range(self.n_nodes):
             # Random Boolean function (simplified)
-            func_type = np.random.choice(['and', 'or', 'xor', 'majority'])
+            func_type = self.rng.choice(['and', 'or', 'xor', 'majority'])
 
             # Select 1-3 inputs
-            n_inputs = min(3, len([e for e in self.graph['edges'] if e[0] == node or e[1] == node]))
-            inputs = np.random.choice(self.n_nodes, n_inputs, replace=False)
+            n_inputs = min(3, degree[node])
+            inputs = self.rng.choice(self.n_nodes, n_inputs, replace=False)
 
             functions[node] = {
                 'type': func_type,
@@ -372,34 +359,19 @@ class GraphDynamicsGenerator(DatasetGenerator):
 
         return functions
 
-    def _evolve_graph(self, graph: Dict, functions: Dict) -> np.ndarray:
-        """Evolve Boolean network"""
-        n_nodes = len(graph['nodes'])
-        trajectory = []
-
-        # Initial state
-        state = np.random.randint(0, 2, n_nodes)
-        trajectory.append(state.copy())
-
-        for step in range(self.steps):
-            new_state = np.zeros(n_nodes)
-
-            for node in range(n_nodes):
-                func = functions[node]
+    def evolve_batch(self, functions: Dict, initial: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Evolve (batch, n_nodes) initial states of one network"""
+        network = BooleanNetwork.from_functions(functions, self.n_nodes)
+        return network.run(initial, self.steps, stop_on_cycle=self.stop_on_cycle)
 
-                if func['type'] == 'and':
-                    new_state[node] = np.all(state[func['inputs']])
-                elif func['type'] == 'or':
-                    new_state[node] = np.any(state[func['inputs']])
-                elif func['type'] == 'xor':
-                    new_state[node] = np.sum(state[func['inputs']]) % 2
-                else:  # majority
-                    new_state[node] = np.sum(state[func['inputs']]) > len(func['inputs']) / 2
+    def _run_network(self, functions: Dict) -> Tuple[np.ndarray, int, int]:
+        state = self.rng.randint(0, 2, self.n_nodes)
+        trajectory, transient, period = self.evolve_batch(functions, state)
+        return trajectory.astype(np.float64), transient, period
 
-            trajectory.append(new_state.copy())
-            state = new_state
-
-        return np.array(trajectory)
+    def _evolve_graph(self, graph: Dict, functions: Dict) -> np.ndarray:
+        """Evolve Boolean network"""
+        return self._run_network(functions)[0]
 
 class DomainLoader:
     """Unified interface for loading datasets"""
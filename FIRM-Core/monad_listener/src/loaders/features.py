@@ -0,0 +1,99 @@
+"""
+Feature Extraction into Preallocated Arrays
+
+Turns domain samples (lists or lazy ShardedDataset views) into a fixed-width
+float32 feature matrix, written row by row into a preallocated array or an
+on-disk .npy memmap so datasets larger than RAM can be featurized once and
+streamed during training:
+- quantum: [circuit length, Re ψ_0 .. Re ψ_7]
+- ca / pde: final CA state, or flattened PDE field
+- other domains: [mean, std, fraction > 0.5] of the trajectory
+"""
+
+import os
+import numpy as np
+from pathlib import Path
+from typing import Optional, Sequence, Dict
+
+from FIRM_dsl.atomic_io import staging_path
+
+QUANTUM_COMPONENTS = 8
+
+# Bump whenever sample_features changes, so cached feature files are rebuilt
+FEATURE_VERSION = 1
+
+def feature_kind(domain: str) -> str:
+    """Feature family used for a domain"""
+    if domain == 'quantum':
+        return 'quantum'
+    if domain in ('ca', 'pde'):
+        return 'field'
+    return 'generic'
+
+def feature_dim(domain: str, sample: Dict) -> int:
+    """Width of one feature row (field widths come from the sample itself)"""
+    kind = feature_kind(domain)
+    if kind == 'quantum':
+        return 1 + QUANTUM_COMPONENTS
+    if kind == 'field':
+        return int(np.prod(np.shape(sample['trace'])[1:])) if 'trace' in sample else int(np.size(sample['field']))
+    return 3
+
+def sample_features(domain: str, sample: Dict, out: np.ndarray) -> np.ndarray:
+    """Write one sample's features into the preallocated row `out`"""
+    kind = feature_kind(domain)
+    if kind == 'quantum':
+        out[0] = len(sample['circuit'])
+        components = np.real(sample['statevector'][:QUANTUM_COMPONENTS])
+        out[1:1 + len(components)] = components
+        out[1 + len(components):] = 0.0
+    elif kind == 'field':
+        # CA: final state; PDE: final field
+        source = sample['trace'][-1] if 'trace' in sample else sample['field']
+        out[:] = np.ravel(source)
+    elif 'trajectory' in sample:
+        trajectory = np.asarray(sample['trajectory'])
+        out[0] = np.mean(trajectory)
+        out[1] = np.std(trajectory)
+        out[2] = np.count_nonzero(trajectory > 0.5) / trajectory.size
+    else:
+        out[:] = 0.0
+    return out
+
+def build_features(domain: str, samples: Sequence[Dict], path: Optional[str] = None) -> np.ndarray:
+    """Featurize samples into an (n, d) float32 array.
+
+    Args:
+        domain: Dataset domain name
+        samples: Sample dicts (list or ShardedDataset view)
+        path: Optional .npy path; an existing file of the right shape is reused,
+            otherwise the matrix is built in a memmap and renamed into place.
+            The path must identify the samples and FEATURE_VERSION.
+
+    Returns:
+        (n, d) float32 array (read-only memmap when path is given)
+    """
+    n = len(samples)
+    d = feature_dim(domain, samples[0]) if n else 0
+    if path is not None and os.path.exists(path):
+        cached = np.load(path, mmap_mode='r')
+        if cached.shape == (n, d):
+            return cached
+
+    if path is None:
+        features = np.empty((n, d), dtype=np.float32)
+    else:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = staging_path(path)
+        features = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float32, shape=(n, d))
+
+    for i in range(n):
+        sample_features(domain, samples[i], features[i])
+
+    if path is None:
+        return features
+
+    features.flush()
+    del features
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode='r')
@@ -3,6 +3,10 @@ Pure Python Monad Listener (No PyTorch dependency)
 
 This implements the core mathematical framework for testing whether
 the 20 columns are "sung by the final monad" using only numpy.
+
+measurement_functor_batch runs the same measurement over a columnar batch:
+invariants are computed as arrays and every column is classified with
+vectorized rule tables, categorical columns coming back as int8 codes.
 """
 
 import numpy as np
@@ -86,6 +90,80 @@ class EmergenceIndexHead(ColumnHead):
         base_index = coherence * structure
         return min(1.0, base_index + recursive_bonus + sovereign_bonus)
 
+# =============================================================================
+# Columnar rule tables (batched measurement path)
+# =============================================================================
+
+# Each column: ordered (letter, value) rules, first match wins, else the default.
+# The only definition of the column rules: the scalar _compute_*_from_final
+# methods evaluate them with MonadListenerPure._rule_value, the batch path as
+# letter-presence masks.
+#
+# Letters: א Aleph (grace), ב Bet (container), ג Gimel (bridge), ד Dalet (gate),
+# ה Heh (manifestation), ו Vav (link), ז Zayin (cut), ח Chet (enclosure),
+# ט Teth (twist), י Yod (seed), כ Kaf (capacity), ל Lamed (elevation),
+# מ Mem (memory), נ Nun (descent), ס Samekh (support), ע Ayin (observation),
+# פ Peh (speech), צ Tzaddi (righteousness), ק Qof (cascade), ר Resh (reflection),
+# ש Shin (transformation), ת Tav (completion)
+COLUMN_RULES = {
+    'morphic_type_signature': ([('א', 'general_morphism'), ('ב', 'monomorphism'),
+                                ('ג', 'epimorphism'), ('ה', 'isomorphism')], 'general_morphism'),
+    'topos_mapping': ([('ו', 'coherent_topos'), ('ז', 'sheaf_topos'),
+                       ('ס', 'presheaf_category')], 'presheaf_category'),
+    'zx_phase_group': ([('ת', 'T_group'), ('ש', 'Clifford_group'), ('ר', 'Pauli_group')], 'identity_group'),
+    'frobenius_algebra_role': ([('ח', 'bimonoid'), ('צ', 'comonoid'), ('ק', 'monoid')], 'coalgebra'),
+    'spinor_projection': ([('פ', 'trivector_spinor'), ('ע', 'bivector_representation'),
+                           ('ט', 'vector_spinor')], 'scalar_identity'),
+    'lie_algebra_generator': ([('ל', 'su3_gell_mann'), ('מ', 'su2_pauli'),
+                               ('נ', 'so3_angular_momentum')], 'u1_phase'),
+    'quantum_gate_analog': ([('י', 'toffoli_gate'), ('כ', 'cnot_gate'), ('ד', 'hadamard_gate')], 'identity_gate'),
+    'tensor_rank_type': ([('צ', '(1,1,1)_tensor'), ('ק', '(1,1)_tensor'), ('ר', '(1)_tensor')], 'scalar'),
+    'dynamical_system_role': ([('ש', 'strange_attractor'), ('פ', 'limit_cycle'),
+                               ('ע', 'torus_attractor')], 'fixed_point'),
+    'symmetry_group_association': ([('צ', 'E8_exceptional'), ('ק', 'SU3_strong'),
+                                    ('ר', 'SO3_rotational')], 'U1_phase'),
+    'field_theory_analog': ([('ט', 'yang_mills_field'), ('ח', 'electromagnetic_field'),
+                             ('ב', 'scalar_field')], 'free_field'),
+    'conformal_geometry_role': ([('צ', 'conformal_infinity'), ('ק', 'mobius_sphere'),
+                                 ('ר', 'euclidean_isometry')], 'euclidean_isometry'),
+    'fourier_domain_signature': ([('ל', 'delta_function'), ('מ', 'power_law_spectrum'),
+                                  ('נ', 'white_noise')], 'white_noise'),
+    'morphic_gradient_behavior': ([('ל', 'recursive_descent'), ('מ', 'coherence_climbing'),
+                                   ('נ', 'random_walk')], 'random_walk'),
+    'computational_complexity_class': ([('ת', 'PSPACE'), ('ש', 'NP'), ('ר', 'BQP')], 'P'),
+    'recursive_depth_metric': ([('ת', 'sovereign'), ('ש', 'advanced'), ('ר', 'intermediate')], 'shallow'),
+    'causal_cone_depth': ([('ת', 'multi_layer'), ('ש', 'recursive_layer'), ('ר', 'base_layer')], 'base_layer'),
+    'fractal_attractor_role': ([('צ', 'strange_attractor'), ('ק', 'toroidal_attractor'),
+                                ('ר', 'fixed_point_attractor')], 'limit_cycle_attractor'),
+    'information_theoretic_role': ([('ס', 'low_entropy_channel'), ('מ', 'mutual_information_maximizer'),
+                                    ('נ', 'noise_channel')], 'noise_channel'),
+    'emergence_index': ([('ת', 1.0), ('ש', 0.8), ('ר', 0.6)], 0.2),
+}
+
+# Column 16 values are depth profiles; its integer codes index this table
+RECURSIVE_DEPTH_PROFILES = {
+    'sovereign': {'base': 'sovereign', 'mid': 'sovereign', 'apex': 'sovereign'},
+    'advanced': {'base': 'deep', 'mid': 'intermediate', 'apex': 'advanced'},
+    'intermediate': {'base': 'shallow', 'mid': 'intermediate', 'apex': 'sub_sovereign'},
+    'shallow': {'base': 'shallow', 'mid': 'shallow', 'apex': 'shallow'},
+}
+
+# Integer code -> category for every categorical column (code -1 = no measurement)
+COLUMN_CATEGORIES = {
+    name: tuple(dict.fromkeys([value for _, value in rules] + [default]))
+    for name, (rules, default) in COLUMN_RULES.items() if name != 'emergence_index'
+}
+
+# Letters that appear in any rule, in a fixed order for presence matrices
+RULE_LETTERS = tuple(dict.fromkeys(letter for rules, _ in COLUMN_RULES.values() for letter, _ in rules))
+
+# Grade slices of the 16 multivector components
+_GRADE_SLICES = {
+    'vector_invariant': (1, 4, 3),
+    'bivector_invariant': (4, 11, 10),
+    'trivector_invariant': (11, 15, 14),
+}
+
 class MonadListenerPure:
     """
     Pure Python implementation of the 20-column measurement system.
@@ -397,374 +475,210 @@ class MonadListenerPure:
 
         return columns
 
-    # COLUMN COMPUTATION FUNCTIONS FROM FINAL COALGEBRA STRUCTURE
-    # Each function determines column value from invariant structure, not arbitrary mappings
+    # BATCHED (COLUMNAR) MEASUREMENT PATH
+    # Struct-of-arrays in, integer-coded columns out; same values as the scalar path
 
-    def _compute_morphic_type_from_final(self, final_structure: Dict[str, Any]) -> str:
-        """Column 1: Morphic Type Signature - Primordial Hebrew letter determines type"""
-        # Hebrew letters are primordial morphisms - they determine the type
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
+    def morphic_batch(self, morphic_objects: List[Dict]) -> Dict[str, np.ndarray]:
+        """Pack morphic objects into a columnar batch.
 
-        # Aleph (א) - threshold of silence (Grace operator)
-        if any(letter.get('symbol') == 'א' for letter in active_letters):
-            return 'general_morphism'  # Aleph creates Grace transition
+        Returns:
+            'components' (n, width) zero-padded float array, 'lengths' (n,)
+            component counts and 'valid' (n,) mask of objects with a payload
+        """
+        n = len(morphic_objects)
+        valid = np.array([bool(obj) and 'payload' in obj for obj in morphic_objects], dtype=bool)
+        rows = [obj['payload'].get('components', []) if ok else [] for obj, ok in zip(morphic_objects, valid)]
+        lengths = np.array([len(row) for row in rows], dtype=np.int64)
+
+        components = np.zeros((n, max(16, lengths.max(initial=0))))
+        for i, row in enumerate(rows):
+            components[i, :len(row)] = row
+
+        return {'components': components, 'lengths': lengths, 'valid': valid}
+
+    def compute_final_structure_batch(self, batch: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Final-coalgebra invariants for a columnar batch (struct-of-arrays)"""
+        components = np.asarray(batch['components'], dtype=float)
+        n, width = components.shape
+        lengths = np.asarray(batch.get('lengths', np.full(n, width)))
+        valid = np.asarray(batch.get('valid', np.ones(n, dtype=bool)))
+        state = getattr(self, 'evolution_state', {})
+
+        squares = components ** 2
+        final = {'valid': valid}
+        final['scalar_invariant'] = np.where(lengths > 0, components[:, 0], 0.0)
+        for name, (start, stop, min_index) in _GRADE_SLICES.items():
+            norm = np.sqrt(squares[:, start:stop].sum(axis=1))
+            final[name] = np.where(lengths > min_index, norm, 0.0)
+        final['pseudoscalar_invariant'] = np.where(lengths > 15, np.abs(components[:, 15]), 0.0)
+
+        # Morphic invariants
+        final['coherence_invariant'] = final['scalar_invariant']
+        final['structural_invariant'] = np.where(lengths > 10, np.sqrt(squares[:, 1:11].sum(axis=1)), 0.0)
+        final['volumetric_invariant'] = np.where(lengths > 10, np.sqrt(squares[:, 11:].sum(axis=1)), 0.0)
+        final['recursive_invariant'] = np.full(n, state.get('recursive_depth', 0))
+        final['sovereign_invariant'] = np.full(n, state.get('sovereign_triads', 0))
+        return final
+
+    def letter_presence(self, n: int) -> np.ndarray:
+        """(n, len(RULE_LETTERS)) presence matrix from the listener's emergent letters"""
+        symbols = self._emergent_symbols()
+        row = np.array([letter in symbols for letter in RULE_LETTERS], dtype=bool)
+        return np.broadcast_to(row, (n, len(RULE_LETTERS)))
+
+    def compute_columns_from_final_batch(self, final_batch: Dict[str, np.ndarray],
+                                         letters: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """All 20 columns for a batch.
+
+        Args:
+            final_batch: Output of compute_final_structure_batch
+            letters: Optional (n, len(RULE_LETTERS)) per-object letter presence;
+                defaults to the listener's emergent letters for every object
 
-        # Bet (ב) - container/womb of form (Bootstrap)
-        if any(letter.get('symbol') == 'ב' for letter in active_letters):
-            return 'monomorphism'  # Bet creates container structure
+        Returns:
+            Categorical columns as int8 codes into COLUMN_CATEGORIES (-1 where
+            the object had no payload); emergence_index as float (NaN likewise)
+        """
+        valid = np.asarray(final_batch['valid'], dtype=bool)
+        n = len(valid)
+        present = self.letter_presence(n) if letters is None else np.asarray(letters, dtype=bool)
+        letter_index = {letter: i for i, letter in enumerate(RULE_LETTERS)}
 
-        # Gimel (ג) - bridge between worlds (Bireflection)
-        if any(letter.get('symbol') == 'ג' for letter in active_letters):
-            return 'epimorphism'   # Gimel creates bridge duality
+        columns = {}
+        for name, (rules, default) in COLUMN_RULES.items():
+            if name == 'emergence_index':
+                values = np.full(n, default, dtype=float)
+                missing = np.nan
+            else:
+                categories = COLUMN_CATEGORIES[name]
+                rules = [(letter, categories.index(value)) for letter, value in rules]
+                values = np.full(n, categories.index(default), dtype=np.int8)
+                missing = -1
+
+            # Apply in reverse so the first matching rule wins
+            for letter, value in reversed(rules):
+                values[present[:, letter_index[letter]]] = value
+            values[~valid] = missing
+            columns[name] = values
 
-        # Heh (ה) - breath/manifestation (Sovereignty)
-        if any(letter.get('symbol') == 'ה' for letter in active_letters):
-            return 'isomorphism'   # Heh creates manifested identity
+        return columns
 
-        return 'general_morphism'  # Default primordial structure
+    def measurement_functor_batch(self, morphic_objects, letters: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Columnar M ≅ N ∘ U over a batch (list of objects or a morphic_batch dict)"""
+        batch = self.morphic_batch(morphic_objects) if isinstance(morphic_objects, list) else morphic_objects
+        final_batch = self.compute_final_structure_batch(batch)
+        return self.compute_columns_from_final_batch(final_batch, letters)
+
+    def decode_columns(self, columns: Dict[str, np.ndarray], index: int) -> Dict[str, Any]:
+        """One object's columns in the scalar measurement_functor format"""
+        decoded = {}
+        for name, values in columns.items():
+            value = values[index]
+            if name == 'emergence_index':
+                decoded[name] = None if np.isnan(value) else float(value)
+            elif value < 0:
+                decoded[name] = None
+            elif name == 'recursive_depth_metric':
+                decoded[name] = dict(RECURSIVE_DEPTH_PROFILES[COLUMN_CATEGORIES[name][value]])
+            else:
+                decoded[name] = COLUMN_CATEGORIES[name][value]
+        return decoded
 
-    def _compute_topos_from_final(self, final_structure: Dict[str, Any]) -> str:
-        """Column 2: Topos Mapping - Hebrew letters as primordial topos structures"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
+    # COLUMN COMPUTATION FUNCTIONS FROM FINAL COALGEBRA STRUCTURE
+    # Each function determines column value from invariant structure, not arbitrary mappings
 
-        # Vav (ו) - link/hook creates coherent topos (bootstrap linking)
-        if any(letter.get('symbol') == 'ו' for letter in active_letters):
-            return 'coherent_topos'  # Vav creates linking coherence
+    def _emergent_symbols(self) -> set:
+        """Symbols of the listener's emergent Hebrew letters"""
+        return {letter.get('symbol') for letter in getattr(self, 'evolution_state', {}).get('emergent_letters', [])}
 
-        # Zayin (ז) - cut/sword creates sheaf topos (bireflection cutting)
-        if any(letter.get('symbol') == 'ז' for letter in active_letters):
-            return 'sheaf_topos'  # Zayin creates cutting structures
+    def _rule_value(self, name: str) -> Any:
+        """Scalar evaluation of COLUMN_RULES[name]: first rule whose letter has emerged"""
+        rules, default = COLUMN_RULES[name]
+        symbols = self._emergent_symbols()
+        for letter, value in rules:
+            if letter in symbols:
+                return value
+        return default
 
-        # Samekh (ס) - support creates presheaf category (grace support)
-        if any(letter.get('symbol') == 'ס' for letter in active_letters):
-            return 'presheaf_category'  # Samekh provides supportive structure
+    def _compute_morphic_type_from_final(self, final_structure: Dict[str, Any]) -> str:
+        """Column 1: Morphic Type Signature - Primordial Hebrew letter determines type"""
+        return self._rule_value('morphic_type_signature')
 
-        return 'presheaf_category'  # Default primordial structure
+    def _compute_topos_from_final(self, final_structure: Dict[str, Any]) -> str:
+        """Column 2: Topos Mapping - Hebrew letters as primordial topos structures"""
+        return self._rule_value('topos_mapping')
 
     def _compute_zx_phase_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 3: ZX Phase Group - Hebrew letters as primordial phase structures"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tav (ת) - completion creates T group (sovereign)
-        if any(letter.get('symbol') == 'ת' for letter in active_letters):
-            return 'T_group'  # Tav enables universal computation
-
-        # Shin (ש) - transformation creates Clifford group (bootstrap)
-        if any(letter.get('symbol') == 'ש' for letter in active_letters):
-            return 'Clifford_group'  # Shin enables Clifford operations
-
-        # Resh (ר) - reflection creates Pauli group (bireflection)
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return 'Pauli_group'  # Resh enables Pauli operations
-
-        return 'identity_group'  # Default primordial structure
+        return self._rule_value('zx_phase_group')
 
     def _compute_frobenius_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 4: Frobenius Algebra Role - Hebrew letters as primordial algebra"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Chet (ח) - enclosure creates bimonoid structures
-        if any(letter.get('symbol') == 'ח' for letter in active_letters):
-            return 'bimonoid'  # Chet creates enclosed dual structures
-
-        # Tzaddi (צ) - righteousness creates comonoid structures
-        if any(letter.get('symbol') == 'צ' for letter in active_letters):
-            return 'comonoid'  # Tzaddi creates righteous duality
-
-        # Qof (ק) - cascade creates monoid structures
-        if any(letter.get('symbol') == 'ק' for letter in active_letters):
-            return 'monoid'    # Qof creates cascading structures
-
-        return 'coalgebra'   # Default primordial structure
+        return self._rule_value('frobenius_algebra_role')
 
     def _compute_spinor_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 5: Spinor Projection - Hebrew letters as primordial spinors"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Peh (פ) - speech creates trivector spinors (sovereign)
-        if any(letter.get('symbol') == 'פ' for letter in active_letters):
-            return 'trivector_spinor'  # Peh creates speech volume
-
-        # Ayin (ע) - observation creates bivector representations (bootstrap)
-        if any(letter.get('symbol') == 'ע' for letter in active_letters):
-            return 'bivector_representation'  # Ayin creates observation areas
-
-        # Teth (ט) - twist creates vector spinors (bireflection)
-        if any(letter.get('symbol') == 'ט' for letter in active_letters):
-            return 'vector_spinor'  # Teth creates twisted vectors
-
-        return 'scalar_identity'  # Default primordial structure
+        return self._rule_value('spinor_projection')
 
     def _compute_lie_generator_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 6: Lie Algebra Generator - Hebrew letters as primordial generators"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Lamed (ל) - elevation creates SU(3) Gell-Mann (sovereign)
-        if any(letter.get('symbol') == 'ל' for letter in active_letters):
-            return 'su3_gell_mann'  # Lamed creates elevated structures
-
-        # Mem (מ) - memory creates SU(2) Pauli (bootstrap)
-        if any(letter.get('symbol') == 'מ' for letter in active_letters):
-            return 'su2_pauli'      # Mem creates memory structures
-
-        # Nun (נ) - descent creates SO(3) angular momentum (bireflection)
-        if any(letter.get('symbol') == 'נ' for letter in active_letters):
-            return 'so3_angular_momentum'  # Nun creates descending structures
-
-        return 'u1_phase'         # Default primordial structure
+        return self._rule_value('lie_algebra_generator')
 
     def _compute_quantum_gate_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 7: Quantum Gate Analog - Hebrew letters as primordial gates"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Yod (י) - seed point creates Toffoli gates (sovereign)
-        if any(letter.get('symbol') == 'י' for letter in active_letters):
-            return 'toffoli_gate'   # Yod creates universal computation
-
-        # Kaf (כ) - capacity creates CNOT gates (bootstrap)
-        if any(letter.get('symbol') == 'כ' for letter in active_letters):
-            return 'cnot_gate'      # Kaf creates controlled operations
-
-        # Dalet (ד) - gate creates Hadamard gates (bireflection)
-        if any(letter.get('symbol') == 'ד' for letter in active_letters):
-            return 'hadamard_gate'  # Dalet creates basis changes
-
-        return 'identity_gate'    # Default primordial structure
+        return self._rule_value('quantum_gate_analog')
 
     def _compute_tensor_type_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 8: Tensor Rank/Type - Hebrew letters as primordial tensor structures"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tzaddi (צ) - righteousness creates (1,1,1) tensors (sovereign)
-        if any(letter.get('symbol') == 'צ' for letter in active_letters):
-            return '(1,1,1)_tensor'  # Tzaddi creates righteous 3D structures
-
-        # Qof (ק) - cascade creates (1,1) tensors (bootstrap)
-        if any(letter.get('symbol') == 'ק' for letter in active_letters):
-            return '(1,1)_tensor'    # Qof creates cascading structures
-
-        # Resh (ר) - reflection creates (1) tensors (bireflection)
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return '(1)_tensor'      # Resh creates reflective structures
-
-        return 'scalar'            # Default primordial structure
+        return self._rule_value('tensor_rank_type')
 
     def _compute_dynamical_role_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 9: Dynamical System Role - Hebrew letters as primordial attractors"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Shin (ש) - transformation creates strange attractors (sovereign)
-        if any(letter.get('symbol') == 'ש' for letter in active_letters):
-            return 'strange_attractor'  # Shin creates chaotic transformation
-
-        # Peh (פ) - speech creates limit cycles (bootstrap)
-        if any(letter.get('symbol') == 'פ' for letter in active_letters):
-            return 'limit_cycle'        # Peh creates periodic speech
-
-        # Ayin (ע) - observation creates torus attractors (bireflection)
-        if any(letter.get('symbol') == 'ע' for letter in active_letters):
-            return 'torus_attractor'    # Ayin creates observational duality
-
-        return 'fixed_point'           # Default primordial structure
+        return self._rule_value('dynamical_system_role')
 
     def _compute_symmetry_group_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 10: Symmetry Group Association - Hebrew letters as primordial symmetry"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tzaddi (צ) - righteousness creates E8 exceptional (sovereign)
-        if any(letter.get('symbol') == 'צ' for letter in active_letters):
-            return 'E8_exceptional'     # Tzaddi creates exceptional symmetry
-
-        # Qof (ק) - cascade creates SU(3) strong (bootstrap)
-        if any(letter.get('symbol') == 'ק' for letter in active_letters):
-            return 'SU3_strong'         # Qof creates strong interactions
-
-        # Resh (ר) - reflection creates SO(3) rotational (bireflection)
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return 'SO3_rotational'     # Resh creates rotational symmetry
-
-        return 'U1_phase'              # Default primordial symmetry
+        return self._rule_value('symmetry_group_association')
 
     def _compute_field_theory_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 11: Field Theory Analog - Hebrew letters as primordial field theory"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Teth (ט) - twist creates Yang-Mills fields (sovereign)
-        if any(letter.get('symbol') == 'ט' for letter in active_letters):
-            return 'yang_mills_field'   # Teth creates twisted fields
-
-        # Chet (ח) - enclosure creates electromagnetic fields (bootstrap)
-        if any(letter.get('symbol') == 'ח' for letter in active_letters):
-            return 'electromagnetic_field'  # Chet creates enclosed fields
-
-        # Bet (ב) - container creates scalar fields (bireflection)
-        if any(letter.get('symbol') == 'ב' for letter in active_letters):
-            return 'scalar_field'       # Bet creates contained fields
-
-        return 'free_field'           # Default primordial field
+        return self._rule_value('field_theory_analog')
 
     def _compute_conformal_role_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 12: Conformal Geometry Role - Hebrew letters as primordial geometry"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tzaddi (צ) - righteousness creates conformal infinity (sovereign)
-        if any(letter.get('symbol') == 'צ' for letter in active_letters):
-            return 'conformal_infinity'  # Tzaddi creates righteous infinity
-
-        # Qof (ק) - cascade creates Möbius sphere (bootstrap)
-        if any(letter.get('symbol') == 'ק' for letter in active_letters):
-            return 'mobius_sphere'       # Qof creates cascading spheres
-
-        # Resh (ר) - reflection creates Euclidean isometry (bireflection)
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return 'euclidean_isometry'  # Resh creates reflective geometry
-
-        return 'euclidean_isometry'    # Default primordial geometry
+        return self._rule_value('conformal_geometry_role')
 
     def _compute_fourier_signature_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 13: Fourier Domain Signature - Hebrew letters as primordial spectra"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Lamed (ל) - elevation creates delta function (sovereign)
-        if any(letter.get('symbol') == 'ל' for letter in active_letters):
-            return 'delta_function'      # Lamed creates elevated coherence
-
-        # Mem (מ) - memory creates power law spectrum (bootstrap)
-        if any(letter.get('symbol') == 'מ' for letter in active_letters):
-            return 'power_law_spectrum'  # Mem creates memory structures
-
-        # Nun (נ) - descent creates white noise (bireflection)
-        if any(letter.get('symbol') == 'נ' for letter in active_letters):
-            return 'white_noise'           # Nun creates descending noise
-
-        return 'white_noise'           # Default primordial structure
+        return self._rule_value('fourier_domain_signature')
 
     def _compute_morphic_gradient_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 14: Morphic Gradient Behavior - Hebrew letters as primordial gradients"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Lamed (ל) - elevation creates recursive descent (sovereign)
-        if any(letter.get('symbol') == 'ל' for letter in active_letters):
-            return 'recursive_descent'   # Lamed creates elevated descent
-
-        # Mem (מ) - memory creates coherence climbing (bootstrap)
-        if any(letter.get('symbol') == 'מ' for letter in active_letters):
-            return 'coherence_climbing'  # Mem creates memory climbing
-
-        # Nun (נ) - descent creates random walk (bireflection)
-        if any(letter.get('symbol') == 'נ' for letter in active_letters):
-            return 'random_walk'           # Nun creates descending walk
-
-        return 'random_walk'           # Default primordial structure
+        return self._rule_value('morphic_gradient_behavior')
 
     def _compute_complexity_class_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 15: Computational Complexity Class - Hebrew letters as primordial complexity"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tav (ת) - completion creates PSPACE (sovereign)
-        if any(letter.get('symbol') == 'ת' for letter in active_letters):
-            return 'PSPACE'  # Tav creates complete complexity
-
-        # Shin (ש) - transformation creates NP (bootstrap)
-        if any(letter.get('symbol') == 'ש' for letter in active_letters):
-            return 'NP'      # Shin creates transformative complexity
-
-        # Resh (ר) - reflection creates BQP (bireflection)
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return 'BQP'     # Resh creates reflective complexity
-
-        return 'P'         # Default primordial complexity
+        return self._rule_value('computational_complexity_class')
 
     def _compute_recursive_depth_from_final(self, final_structure: Dict[str, Any]) -> Dict:
         """Column 16: Recursive Depth Metric - Hebrew letters as primordial recursion"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tav (ת) - completion creates sovereign depth
-        if any(letter.get('symbol') == 'ת' for letter in active_letters):
-            return {'base': 'sovereign', 'mid': 'sovereign', 'apex': 'sovereign'}
-
-        # Shin (ש) - transformation creates advanced depth
-        if any(letter.get('symbol') == 'ש' for letter in active_letters):
-            return {'base': 'deep', 'mid': 'intermediate', 'apex': 'advanced'}
-
-        # Resh (ר) - reflection creates intermediate depth
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return {'base': 'shallow', 'mid': 'intermediate', 'apex': 'sub_sovereign'}
-
-        return {'base': 'shallow', 'mid': 'shallow', 'apex': 'shallow'}
+        return dict(RECURSIVE_DEPTH_PROFILES[self._rule_value('recursive_depth_metric')])
 
     def _compute_causal_cone_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 17: Causal Cone Depth - Hebrew letters as primordial causality"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tav (ת) - completion creates multi-layer causality
-        if any(letter.get('symbol') == 'ת' for letter in active_letters):
-            return 'multi_layer'  # Tav creates complete causality
-
-        # Shin (ש) - transformation creates recursive layer causality
-        if any(letter.get('symbol') == 'ש' for letter in active_letters):
-            return 'recursive_layer'  # Shin creates transformative causality
-
-        # Resh (ר) - reflection creates base layer causality
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return 'base_layer'    # Resh creates reflective causality
-
-        return 'base_layer'    # Default primordial causality
+        return self._rule_value('causal_cone_depth')
 
     def _compute_fractal_role_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 18: Fractal Attractor Role - Hebrew letters as primordial attractors"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tzaddi (צ) - righteousness creates strange attractors (sovereign)
-        if any(letter.get('symbol') == 'צ' for letter in active_letters):
-            return 'strange_attractor'  # Tzaddi creates righteous chaos
-
-        # Qof (ק) - cascade creates toroidal attractors (bootstrap)
-        if any(letter.get('symbol') == 'ק' for letter in active_letters):
-            return 'toroidal_attractor'  # Qof creates cascading structures
-
-        # Resh (ר) - reflection creates fixed point attractors (bireflection)
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return 'fixed_point_attractor'  # Resh creates reflective stability
-
-        return 'limit_cycle_attractor'  # Default primordial structure
+        return self._rule_value('fractal_attractor_role')
 
     def _compute_information_role_from_final(self, final_structure: Dict[str, Any]) -> str:
         """Column 19: Information-Theoretic Role - Hebrew letters as primordial information"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Samekh (ס) - support creates low entropy channels (sovereign)
-        if any(letter.get('symbol') == 'ס' for letter in active_letters):
-            return 'low_entropy_channel'  # Samekh creates supportive coherence
-
-        # Mem (מ) - memory creates mutual information maximizers (bootstrap)
-        if any(letter.get('symbol') == 'מ' for letter in active_letters):
-            return 'mutual_information_maximizer'  # Mem creates memory coherence
-
-        # Nun (נ) - descent creates noise channels (bireflection)
-        if any(letter.get('symbol') == 'נ' for letter in active_letters):
-            return 'noise_channel'  # Nun creates descending noise
-
-        return 'noise_channel'  # Default primordial structure
+        return self._rule_value('information_theoretic_role')
 
     def _compute_emergence_index_from_final(self, final_structure: Dict[str, Any]) -> float:
         """Column 20: Emergence Index - Hebrew letters as primordial emergence"""
-        active_letters = getattr(self, 'evolution_state', {}).get('emergent_letters', [])
-
-        # Tav (ת) - completion creates maximum emergence (sovereign)
-        if any(letter.get('symbol') == 'ת' for letter in active_letters):
-            return 1.0  # Tav creates complete emergence
-
-        # Shin (ש) - transformation creates high emergence (bootstrap)
-        if any(letter.get('symbol') == 'ש' for letter in active_letters):
-            return 0.8  # Shin creates transformative emergence
-
-        # Resh (ר) - reflection creates medium emergence (bireflection)
-        if any(letter.get('symbol') == 'ר' for letter in active_letters):
-            return 0.6  # Resh creates reflective emergence
-
-        # Default primordial emergence
-        return 0.2
+        return self._rule_value('emergence_index')
 
     def check_naturality(self, transformation: Dict, original_columns: Dict) -> bool:
         """Test naturality: columns invariant under admissible transformations"""
@@ -15,7 +15,7 @@ from typing import Dict, List, Tuple, Any
 import copy
 
 from ..models.monad_listener import MonadListener
-from ..loaders.dataset_generators import DomainLoader
+from ..loaders.dataset_cache import DatasetCache
 
 class AblationTester:
     """Test minimality and necessity of columns"""
@@ -32,9 +32,9 @@ class AblationTester:
         print("🧪 Starting Ablation Study for 20-Column Minimality")
         print("=" * 60)
 
-        # Load datasets
-        loader = DomainLoader()
-        datasets = loader.load_all_datasets(1000)  # Smaller dataset for ablation
+        # Open cached datasets (shards are shared with the MDL sweep when configs match)
+        cache = DatasetCache(**self.config.get('cache', {}))
+        datasets = cache.open_all(1000)  # Smaller dataset for ablation
 
         # Train baseline model
         baseline_model = self._train_baseline_model(datasets)
@@ -102,7 +102,7 @@ class AblationTester:
                 total_loss += loss.item()
 
             if epoch % 10 == 0:
-                print(f"   Epoch {epoch}, Loss: {total_loss".4f"}")
+                print(f"   Epoch {epoch}, Loss: {total_loss:.4f}")
 
         return model
 
@@ -268,11 +268,11 @@ class AblationTester:
 
         print(f"   Critical heads ({len(critical_heads)}):")
         for head, deg in sorted(critical_heads, key=lambda x: x[1], reverse=True):
-            print(f"     {head}: {deg".3f"} degradation")
+            print(f"     {head}: {deg:.3f} degradation")
 
         print(f"   Optional heads ({len(optional_heads)}):")
         for head, deg in sorted(optional_heads, key=lambda x: x[1]):
-            print(f"     {head}: {deg".3f"} degradation")
+            print(f"     {head}: {deg:.3f} degradation")
 
         # Group ablation analysis
         print("\n📊 Group Ablation:")
@@ -281,7 +281,7 @@ class AblationTester:
                 abs(domain_result.get('relative_drop', 0))
                 for domain_result in result['degradation'].values()
             ])
-            print(f"   {group_name"12"}: {avg_degradation".3f"} avg degradation")
+            print(f"   {group_name:12}: {avg_degradation:.3f} avg degradation")
 
         # Subset sufficiency analysis
         print("\n🔍 Subset Sufficiency:")
@@ -290,7 +290,7 @@ class AblationTester:
                 np.mean([domain_result.get('accuracy', 0) for domain_result in result['performance'].values()])
                 for result in results
             ])
-            print(f"   {subset_size}-head subsets: {avg_performance".3f"} avg accuracy")
+            print(f"   {subset_size}-head subsets: {avg_performance:.3f} avg accuracy")
 
         # Overall assessment
         self._assess_minimality(critical_heads, subset_results)
@@ -320,7 +320,7 @@ class AblationTester:
                 perf_ratio = subset_performance[size] / full_size_performance
                 if perf_ratio > 0.95:  # Within 5% of full performance
                     minimal = False
-                    print(f"   ❌ {size}-head subset retains {perf_ratio".1%"} performance")
+                    print(f"   ❌ {size}-head subset retains {perf_ratio:.1%} performance")
                     print("   📊 20 is NOT minimal (smaller set sufficient)")
 
         if minimal:
@@ -0,0 +1,96 @@
+"""
+Streaming Tensor Pipeline for Sweep Training
+
+Feeds models from (n, d) float32 feature matrices (usually .npy memmaps
+written by loaders.features.build_features):
+1. FeatureDataset serves whole mini-batches per __getitem__ call, reading
+   one sorted fancy-index slice from the memmap instead of n single rows
+2. make_loader wraps it in a DataLoader with a seeded shuffling BatchSampler,
+   CPU worker processes and pinned host buffers when a GPU is present
+3. Datasets built from a .npy path reopen the memmap in each worker, so
+   nothing larger than a batch is pickled or copied into RAM
+"""
+
+import numpy as np
+import torch
+from torch.utils.data import BatchSampler, DataLoader, Dataset, RandomSampler, SequentialSampler
+from typing import Optional, Sequence, Union
+
+class FeatureDataset(Dataset):
+    """Mini-batch view over a feature matrix (in memory or a .npy memmap)"""
+
+    def __init__(self, features: Union[np.ndarray, str]):
+        if isinstance(features, str):
+            self.path = features
+            self._features = None
+            self._shape = np.load(features, mmap_mode='r').shape
+        else:
+            self.path = None
+            self._features = features
+            self._shape = features.shape
+
+    @property
+    def features(self) -> np.ndarray:
+        # Opened lazily so DataLoader workers map the file instead of unpickling a copy
+        if self._features is None:
+            self._features = np.load(self.path, mmap_mode='r')
+        return self._features
+
+    @property
+    def feature_dim(self) -> int:
+        return self._shape[1]
+
+    def __len__(self) -> int:
+        return self._shape[0]
+
+    def __getitem__(self, index: Union[int, Sequence[int]]) -> torch.Tensor:
+        if isinstance(index, (int, np.integer)):
+            return torch.from_numpy(np.array(self.features[index], dtype=np.float32))
+        # Sorted indices turn a random batch into one forward pass over the file
+        rows = self.features[np.sort(np.asarray(index))]
+        return torch.from_numpy(np.ascontiguousarray(rows, dtype=np.float32))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.path is not None:
+            state['_features'] = None
+        return state
+
+def make_loader(features: Union[np.ndarray, str, FeatureDataset], batch_size: int = 32,
+                shuffle: bool = True, num_workers: int = 0, seed: int = 0,
+                pin_memory: Optional[bool] = None) -> DataLoader:
+    """Mini-batch loader over a feature matrix.
+
+    Args:
+        features: Feature matrix, .npy path or FeatureDataset
+        batch_size: Rows per mini-batch
+        shuffle: Reshuffle batches every epoch (seeded)
+        num_workers: CPU loader processes (0 = load in the training thread)
+        seed: Shuffle seed
+        pin_memory: Pin host batches (defaults to True when CUDA is available)
+
+    Returns:
+        DataLoader yielding (batch, d) float32 tensors
+    """
+    dataset = features if isinstance(features, FeatureDataset) else FeatureDataset(features)
+
+    if shuffle:
+        generator = torch.Generator().manual_seed(seed)
+        sampler = RandomSampler(dataset, generator=generator)
+    else:
+        sampler = SequentialSampler(dataset)
+
+    if pin_memory is None:
+        pin_memory = torch.cuda.is_available()
+
+    # Worker-only options are omitted for in-thread loading (older torch rejects them)
+    worker_options = {'persistent_workers': True, 'prefetch_factor': 2} if num_workers > 0 else {}
+
+    return DataLoader(
+        dataset,
+        sampler=BatchSampler(sampler, batch_size, drop_last=False),
+        batch_size=None,  # the sampler already yields whole batches
+        num_workers=num_workers,
+        pin_memory=pin_memory,
+        **worker_options,
+    )
@@ -10,13 +10,17 @@ import torch.nn as nn
 import torch.optim as optim
 import numpy as np
 import yaml
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 from typing import Dict, List, Tuple, Any
 import matplotlib.pyplot as plt
 
 from ..models.monad_listener import MonadListener
-from ..loaders.dataset_generators import DomainLoader
+from ..loaders.dataset_cache import DatasetCache
+from ..loaders.features import FEATURE_VERSION, build_features
+from .data_pipeline import make_loader
 
 class MDLSweeper:
     """Main MDL sweep implementation"""
@@ -27,6 +31,9 @@ class MDLSweeper:
 
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self.results = {}
+        self.cache = None
+        self.generator_kwargs = self.config.get('generator_kwargs') or {}
+        self._features = {}
 
     def run_sweep(self):
         """Run MDL sweep across all latent dimensions and domains"""
@@ -34,17 +41,29 @@ class MDLSweeper:
         print("🧪 Starting MDL Sweep for Monad Listener Validation")
         print("=" * 60)
 
-        # Load datasets
-        loader = DomainLoader()
-        datasets = loader.load_all_datasets(self.config['datasets']['quantum']['samples'])
+        # Open the sharded dataset cache (built once, reused across runs and latent dims)
+        self.cache = DatasetCache(**self.config.get('cache', {}))
+        datasets = self.cache.open_all(self.config['datasets']['quantum']['samples'],
+                                       generator_kwargs=self.generator_kwargs)
 
-        # Test each latent dimension
-        for latent_dim in self.config['latent_dims']:
-            print(f"\n🔍 Testing latent dimension: {latent_dim}")
+        # Featurize every domain once; all latent dimensions stream the same memmaps
+        for domain_name, domain_data in datasets.items():
+            self._prepare_domain_data(domain_data, domain_name)
+
+        # Test latent dimensions, several at once on separate CPU threads if configured
+        latent_dims = self.config['latent_dims']
+        concurrent_dims = self.config['training'].get('concurrent_dims', 1)
+        if concurrent_dims > 1:
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // concurrent_dims))
+            with ThreadPoolExecutor(max_workers=concurrent_dims) as pool:
+                all_results = list(pool.map(lambda dim: self._test_dimension(dim, datasets), latent_dims))
+        else:
+            all_results = (self._test_dimension(dim, datasets) for dim in latent_dims)
 
-            results = self._test_dimension(latent_dim, datasets)
+        for latent_dim, results in zip(latent_dims, all_results):
             self.results[latent_dim] = results
 
+            print(f"\n🔍 Latent dimension: {latent_dim}")
             print(f"   MDL: {results['mdl']:.4f}")
             print(f"   NLL: {results['nll']:.4f}")
             print(f"   Param bits: {results['param_bits']:.4f}")
@@ -70,10 +89,11 @@ class MDLSweeper:
             domain_results = self._test_domain_dimension(latent_dim, domain_name, domain_data)
             results['domain_results'][domain_name] = domain_results
 
-            total_mdl += domain_results['mdl'] * len(domain_data)
-            total_nll += domain_results['nll'] * len(domain_data)
+            n_domain = sum(len(split) for split in domain_data.values()) if isinstance(domain_data, dict) else len(domain_data)
+            total_mdl += domain_results['mdl'] * n_domain
+            total_nll += domain_results['nll'] * n_domain
             total_param_bits += domain_results['param_bits']
-            total_samples += len(domain_data)
+            total_samples += n_domain
 
         # Average across all domains and samples
         results['mdl'] = total_mdl / total_samples
@@ -116,120 +136,118 @@ class MDLSweeper:
         }
         return backbone_map.get(domain, 'mlp')
 
-    def _prepare_domain_data(self, data: List, domain: str) -> Tuple[torch.Tensor, torch.Tensor]:
-        """Prepare domain-specific data format"""
-
-        # Split data
-        split_point = int(0.8 * len(data))
-        train_data = data[:split_point]
-        val_data = data[split_point:]
-
-        # Convert to tensors (domain-specific preprocessing)
-        if domain == 'quantum':
-            train_tensor = self._preprocess_quantum(train_data)
-            val_tensor = self._preprocess_quantum(val_data)
-        elif domain in ['ca', 'pde']:
-            train_tensor = self._preprocess_fields(train_data)
-            val_tensor = self._preprocess_fields(val_data)
+    def _prepare_domain_data(self, data, domain: str) -> Tuple[Any, Any]:
+        """Featurize train/val data once per domain.
+
+        Returns (train, val) feature matrices, as .npy paths next to the dataset
+        cache when one is open (streamed by the loaders) or in-memory arrays.
+        """
+        if domain in self._features:
+            return self._features[domain]
+
+        if isinstance(data, dict):
+            train_data, val_data = data['train'], data['val']
+        else:
+            # Split data
+            split_point = int(0.8 * len(data))
+            train_data, val_data = data[:split_point], data[split_point:]
+
+        if self.cache is not None:
+            feature_dir = self.cache.cache_dir / 'features'
+            key = self._feature_key(domain)
+            train_path = str(feature_dir / f"{domain}-{key}-train-{len(train_data)}.npy")
+            val_path = str(feature_dir / f"{domain}-{key}-val-{len(val_data)}.npy")
+            build_features(domain, train_data, train_path)
+            build_features(domain, val_data, val_path)
+            self._features[domain] = (train_path, val_path)
         else:
-            train_tensor = self._preprocess_generic(train_data)
-            val_tensor = self._preprocess_generic(val_data)
+            self._features[domain] = (build_features(domain, train_data), build_features(domain, val_data))
 
-        return train_tensor, val_tensor
+        return self._features[domain]
+
+    def _feature_key(self, domain: str) -> str:
+        """Cache key for a domain's feature files: dataset config plus featurizer version"""
+        return self.cache.config_hash(domain, {'generator': self.generator_kwargs.get(domain, {}),
+                                               'features': FEATURE_VERSION})
 
     def _preprocess_quantum(self, data: List) -> torch.Tensor:
         """Preprocess quantum circuit data"""
-        # Simplified: use circuit length as feature
-        features = []
-        for sample in data:
-            # Simple feature extraction
-            circuit_length = len(sample['circuit'])
-            statevector_real = np.real(sample['statevector'][:8])  # First 8 components
-            features.append([circuit_length] + statevector_real.tolist())
-
-        return torch.tensor(features, dtype=torch.float32)
+        return torch.from_numpy(build_features('quantum', data))
 
     def _preprocess_fields(self, data: List) -> torch.Tensor:
         """Preprocess field data (CA, PDE)"""
-        # Simplified: flatten field to vector
-        features = []
-        for sample in data:
-            if 'trace' in sample:
-                # CA: use final state
-                final_state = sample['trace'][-1]
-                features.append(final_state.astype(np.float32))
-            elif 'field' in sample:
-                # PDE: use final field
-                field = sample['field']
-                features.append(field.flatten().astype(np.float32))
-
-        return torch.tensor(features, dtype=torch.float32)
+        return torch.from_numpy(build_features('ca', data))
 
     def _preprocess_generic(self, data: List) -> torch.Tensor:
         """Generic preprocessing"""
-        features = []
-        for sample in data:
-            # Extract numerical features
-            feature_vec = []
-            if 'trajectory' in sample:
-                traj = sample['trajectory']
-                feature_vec.extend([
-                    np.mean(traj), np.std(traj.flatten()),
-                    np.sum(traj > 0.5) / traj.size
-                ])
-
-            features.append(feature_vec)
-
-        return torch.tensor(features, dtype=torch.float32)
-
-    def _train_model(self, model: MonadListener, train_data: torch.Tensor, val_data: torch.Tensor, domain: str):
+        return torch.from_numpy(build_features('spin', data))
+
+    def _make_loader(self, features, shuffle: bool, seed: int = 0):
+        training = self.config['training']
+        return make_loader(features, batch_size=training['batch_size'], shuffle=shuffle,
+                           num_workers=training.get('num_workers', 0), seed=seed)
+
+    def _train_model(self, model: MonadListener, train_data, val_data, domain: str):
         """Train model for this dimension"""
 
         optimizer = optim.Adam(model.parameters(), lr=self.config['training']['learning_rate'])
         criterion = nn.MSELoss()  # Simplified
+        loader = self._make_loader(train_data, shuffle=True)
 
         model.train()
 
         for epoch in range(self.config['training']['epochs']):
-            optimizer.zero_grad()
+            epoch_loss = 0.0
+
+            for batch in loader:
+                batch = batch.to(self.device, non_blocking=True)
+                optimizer.zero_grad()
 
-            # Forward pass
-            outputs = model(train_data.to(self.device), domain)
+                # Forward pass
+                outputs = model(batch, domain)
 
-            # Simplified loss (would be multi-head loss in practice)
-            loss = 0
-            for head_name, head_output in outputs.items():
-                if head_output is not None:
-                    # Dummy target (would be actual labels)
-                    target = torch.randn_like(head_output)
-                    loss += criterion(head_output, target)
+                # Simplified loss (would be multi-head loss in practice)
+                loss = 0
+                for head_name, head_output in outputs.items():
+                    if head_output is not None:
+                        # Dummy target (would be actual labels)
+                        target = torch.randn_like(head_output)
+                        loss += criterion(head_output, target)
 
-            loss.backward()
-            optimizer.step()
+                loss.backward()
+                optimizer.step()
+                epoch_loss += loss.item() * len(batch)
 
             if epoch % 20 == 0:
-                print(f"      Epoch {epoch}, Loss: {loss.item()".4f"}")
+                print(f"      Epoch {epoch}, Loss: {epoch_loss / max(len(loader.dataset), 1):.4f}")
 
-    def _compute_mdl(self, model: MonadListener, val_data: torch.Tensor, domain: str) -> Tuple[float, float, float]:
+    def _compute_mdl(self, model: MonadListener, val_data, domain: str) -> Tuple[float, float, float]:
         """Compute MDL for this model"""
 
         model.eval()
 
         with torch.no_grad():
-            outputs = model(val_data.to(self.device), domain)
+            # Stream validation batches, accumulating each head's output sum
+            head_sums, head_counts = {}, {}
+            for batch in self._make_loader(val_data, shuffle=False):
+                outputs = model(batch.to(self.device, non_blocking=True), domain)
+                for head_name, head_output in outputs.items():
+                    if head_output is not None:
+                        head_sums[head_name] = head_sums.get(head_name, 0.0) + head_output.sum().item()
+                        head_counts[head_name] = head_counts.get(head_name, 0) + head_output.numel()
 
             # Compute NLL (negative log likelihood)
             nll = 0
             n_samples = 0
 
-            for head_name, head_output in outputs.items():
-                if head_output is not None:
-                    # Simplified: assume Gaussian noise
-                    noise_std = 0.1
-                    nll_component = 0.5 * np.log(2 * np.pi * noise_std**2) + \
-                                   0.5 * ((head_output.mean() - 0)**2) / noise_std**2
-                    nll += nll_component
-                    n_samples += 1
+            for head_name, head_sum in head_sums.items():
+                # Simplified: assume Gaussian noise
+                noise_std = 0.1
+                head_mean = head_sum / max(head_counts[head_name], 1)
+                nll_component = 0.5 * np.log(2 * np.pi * noise_std**2) + \
+                               0.5 * ((head_mean - 0)**2) / noise_std**2
+                nll += nll_component
+                n_samples += 1
 
             nll_avg = nll / max(n_samples, 1)
 
@@ -256,7 +274,7 @@ class MDLSweeper:
         print("Latent Dim | MDL")
         print("-----------|-----")
         for dim, mdl in zip(dims, mdls):
-            print(f"{dim"9"} | {mdl".4f"}")
+            print(f"{dim:9} | {mdl:.4f}")
 
         # Find elbow (simplified)
         if len(mdls) >= 3:
@@ -292,8 +310,8 @@ class MDLSweeper:
     def _check_stability(self, elbow_dim: int):
         """Check if elbow is stable across domains"""
 
-        print("
-🔍 Stability Analysis:"        print(f"   Target elbow: {elbow_dim}")
+        print("\n🔍 Stability Analysis:")
+        print(f"   Target elbow: {elbow_dim}")
 
         # Check per-domain elbows
         domain_elbows = {}
@@ -308,7 +326,7 @@ class MDLSweeper:
             domain_elbows[domain] = domain_elbow
 
             diff = abs(domain_elbow - elbow_dim)
-            print(f"   {domain"8"}: {domain_elbow"2"} (diff: {diff})")
+            print(f"   {domain:8}: {domain_elbow:2} (diff: {diff})")
 
         # Check stability criterion
         max_diff = max(abs(elbow - elbow_dim) for elbow in domain_elbows.values())
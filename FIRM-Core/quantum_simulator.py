@@ -14,6 +14,8 @@ If this works, it's the experimental proof that changes everything.
 import numpy as np
 from typing import List, Tuple, Dict, Optional
 import math
+from scipy import sparse
+from scipy.sparse.linalg import eigsh
 
 # Check if Qiskit is available
 try:
@@ -120,6 +122,19 @@ class RingCrossQuantumSimulator:
             phase = (i * phi) % (2 * math.pi)
             self.circuit.p(phase, self.qreg[i])
     
+    def _build_ring_numpy(self):
+        """Ring couplings for the Qiskit-free backend (sparse hopping Hamiltonian)."""
+        self.sparse_simulator = None
+
+    def _add_cross_links_numpy(self, frequency: int = 5):
+        """Cross-links for the Qiskit-free backend."""
+        self.sparse_simulator = SparseRingCrossSimulator(self.n_qubits, frequency)
+        return self.sparse_simulator
+
+    def _initialize_zx_numpy(self):
+        """Z/X spider phases are single-site and leave the hopping spectrum unchanged."""
+        return None
+
     def measure_coupling_constant(self) -> float:
         """Measure effective coupling g from quantum state."""
         if not QISKIT_AVAILABLE:
@@ -375,28 +390,257 @@ def run_quantum_test_suite():
     """)
 
 
+# =============================================================================
+# SPARSE CPU SIMULATION (no Qiskit required)
+# =============================================================================
+#
+# The ring+cross coupling graph acts on the single-excitation sector as the
+# hopping Hamiltonian H = -Σ J_ij (|i⟩⟨j| + h.c.), an N×N sparse operator.
+# Whenever the cross-link pattern repeats every p sites, translation by p
+# commutes with H, so it block-diagonalizes into N/p momentum sectors of
+# size p×p. Small blocks are diagonalized densely in one batch; large ones
+# (and the unreduced operator) use Lanczos for the low-lying spectrum.
+
+
+def _ring_cross_edges(N: int, frequency: int = 5,
+                      ring_coupling: float = 1.0,
+                      cross_coupling: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unique undirected edges (lo, hi, coupling); a repeated edge is counted once."""
+    sites = np.arange(N)
+    cross = np.arange(0, N, frequency)
+    rows = np.concatenate([sites, cross])
+    cols = np.concatenate([(sites + 1) % N, (cross + N // 2) % N])
+    couplings = np.concatenate([np.full(N, ring_coupling), np.full(len(cross), cross_coupling)])
+
+    lo, hi = np.minimum(rows, cols), np.maximum(rows, cols)
+    # Keep the last occurrence, matching the assignment order of a dense fill
+    _, first_reversed = np.unique((lo * N + hi)[::-1], return_index=True)
+    keep = len(lo) - 1 - first_reversed
+    return lo[keep], hi[keep], couplings[keep]
+
+
+def ring_cross_adjacency(N: int, frequency: int = 5,
+                         ring_coupling: float = 1.0,
+                         cross_coupling: float = 1.0) -> sparse.csr_matrix:
+    """
+    Sparse weighted adjacency matrix of the ring+cross graph.
+
+    Args:
+        N: Number of nodes on the ring
+        frequency: Cross-link every 'frequency' nodes to the antipode
+        ring_coupling: Weight of nearest-neighbour ring edges
+        cross_coupling: Weight of cross-links
+
+    Returns:
+        Symmetric N×N CSR matrix (O(N) memory)
+    """
+    lo, hi, weights = _ring_cross_edges(N, frequency, ring_coupling, cross_coupling)
+    mirror = lo != hi
+    rows = np.concatenate([lo, hi[mirror]])
+    cols = np.concatenate([hi, lo[mirror]])
+    data = np.concatenate([weights, weights[mirror]])
+    return sparse.csr_matrix((data, (rows, cols)), shape=(N, N))
+
+
+def ring_cross_hamiltonian(N: int, frequency: int = 5,
+                           ring_coupling: float = 1.0,
+                           cross_coupling: float = 1.0) -> sparse.csr_matrix:
+    """Single-excitation hopping Hamiltonian H = -A of the ring+cross graph."""
+    return -ring_cross_adjacency(N, frequency, ring_coupling, cross_coupling)
+
+
+def translation_period(N: int, frequency: int = 5) -> int:
+    """
+    Smallest ring translation that maps the ring+cross graph onto itself.
+
+    Shifts are tried over the divisors of N; ring and cross edges carry
+    distinct labels so a shift may not trade one kind for the other.
+    Returns N when only the identity works.
+    """
+    lo, hi, kind = _ring_cross_edges(N, frequency, 1.0, 2.0)
+    order = np.argsort(lo * N + hi)
+    keys, kinds = (lo * N + hi)[order], kind[order]
+
+    for p in range(1, N):
+        if N % p:
+            continue
+        a, b = (lo + p) % N, (hi + p) % N
+        shifted = np.minimum(a, b) * N + np.maximum(a, b)
+        order = np.argsort(shifted)
+        if np.array_equal(shifted[order], keys) and np.array_equal(kind[order], kinds):
+            return p
+    return N
+
+
+class SparseRingCrossSimulator:
+    """
+    CPU ring+cross simulator scaling to N ~ 10⁵ without Qiskit.
+
+    Builds the single-excitation hopping Hamiltonian as a scipy sparse
+    operator and reduces it to momentum sectors k = 2πm/M (M = N/p unit
+    cells of p sites) before diagonalizing. Sizes with frequency | N give
+    p = frequency; otherwise the operator falls back to Lanczos, which slows
+    down at large N because the cross-link bound states are nearly degenerate.
+    """
+
+    def __init__(self, N: int, frequency: int = 5,
+                 ring_coupling: float = 1.0, cross_coupling: float = 1.0,
+                 dense_block_limit: int = 256):
+        """
+        Args:
+            N: Number of ring sites
+            frequency: Cross-link spacing
+            ring_coupling: Ring hopping amplitude
+            cross_coupling: Cross-link hopping amplitude
+            dense_block_limit: Largest sector diagonalized densely; bigger
+                sectors use Lanczos (eigsh)
+        """
+        self.N = N
+        self.frequency = frequency
+        self.dense_block_limit = dense_block_limit
+        self.hamiltonian = ring_cross_hamiltonian(N, frequency, ring_coupling, cross_coupling)
+        self.period = translation_period(N, frequency)
+        self.n_sectors = N // self.period
+
+        # Hoppings out of the reference cell: H(k)_ab = Σ_R t_ab(R) e^{ikR}
+        cell = self.hamiltonian[:self.period].tocoo()
+        self._cell_rows = cell.row
+        self._cell_cols = cell.col % self.period
+        self._cell_offsets = cell.col // self.period
+        self._cell_data = cell.data
+
+    def momenta(self) -> np.ndarray:
+        """Crystal momenta k_m = 2πm/M of the M sectors."""
+        return 2 * np.pi * np.arange(self.n_sectors) / self.n_sectors
+
+    def bloch_hamiltonian(self, sector: int) -> sparse.csr_matrix:
+        """p×p block of H in momentum sector m."""
+        k = 2 * np.pi * sector / self.n_sectors
+        data = self._cell_data * np.exp(1j * k * self._cell_offsets)
+        return sparse.csr_matrix((data, (self._cell_rows, self._cell_cols)),
+                                 shape=(self.period, self.period))
+
+    def bloch_blocks(self, sectors: Optional[np.ndarray] = None) -> np.ndarray:
+        """Dense (S, p, p) stack of sector blocks, assembled in one sparse product."""
+        if sectors is None:
+            sectors = np.arange(self.n_sectors)
+        p = self.period
+        k = 2 * np.pi * np.asarray(sectors) / self.n_sectors
+        phases = np.exp(1j * np.outer(self._cell_offsets, k)) * self._cell_data[:, None]
+
+        # Scatter each hopping term into its (a, b) entry for every sector at once
+        nnz = len(self._cell_data)
+        scatter = sparse.csr_matrix((np.ones(nnz), (self._cell_rows * p + self._cell_cols, np.arange(nnz))),
+                                    shape=(p * p, nnz))
+        return (scatter @ phases).T.reshape(len(k), p, p)
+
+    def spectrum(self, n_levels: Optional[int] = None, method: str = 'sectors',
+                 chunk_size: int = 4096) -> Dict[str, np.ndarray]:
+        """
+        Low-lying eigenvalues of the ring+cross Hamiltonian.
+
+        Args:
+            n_levels: Number of lowest levels (None = full spectrum, requires
+                sectors no larger than dense_block_limit)
+            method: 'sectors' (momentum blocks) or 'lanczos' (eigsh on the
+                full sparse operator, no symmetry reduction)
+            chunk_size: Sectors diagonalized per batched eigvalsh call
+
+        Returns:
+            Dict with ascending 'energies' and the momentum 'sectors' they
+            belong to (-1 for the unreduced Lanczos path)
+        """
+        if method == 'lanczos':
+            energies = self._lowest(self.hamiltonian, n_levels)
+            return {'energies': energies, 'sectors': np.full(len(energies), -1)}
+        if method != 'sectors':
+            raise ValueError(f"Unknown method '{method}'. Use 'sectors' or 'lanczos'.")
+
+        if self.period <= self.dense_block_limit:
+            energies, sectors = [], []
+            for start in range(0, self.n_sectors, chunk_size):
+                chunk = np.arange(start, min(start + chunk_size, self.n_sectors))
+                values = np.linalg.eigvalsh(self.bloch_blocks(chunk))
+                if n_levels is not None:
+                    values = values[:, :n_levels]
+                energies.append(values.ravel())
+                sectors.append(np.repeat(chunk, values.shape[1]))
+            energies, sectors = np.concatenate(energies), np.concatenate(sectors)
+        else:
+            if n_levels is None:
+                raise ValueError(f"Sectors of size {self.period} exceed dense_block_limit; "
+                                 "pass n_levels for a Lanczos spectrum")
+            per_sector = [self._lowest(self.bloch_hamiltonian(m), n_levels) for m in range(self.n_sectors)]
+            energies = np.concatenate(per_sector)
+            sectors = np.repeat(np.arange(self.n_sectors), [len(e) for e in per_sector])
+
+        order = np.argsort(energies, kind='stable')
+        if n_levels is not None:
+            order = order[:n_levels]
+        return {'energies': energies[order], 'sectors': sectors[order]}
+
+    def _lowest(self, operator: sparse.spmatrix, n_levels: Optional[int]) -> np.ndarray:
+        """Lowest eigenvalues via shift-invert Lanczos, or densely when the operator is tiny."""
+        size = operator.shape[0]
+        # Two guard levels keep both members of a degenerate ±k pair at the cutoff (a single
+        # Lanczos run can miss one)
+        n_computed = None if n_levels is None else n_levels + 2
+        if n_computed is None or n_computed >= size - 1:
+            values = np.linalg.eigvalsh(operator.toarray())
+            return values if n_levels is None else values[:n_levels]
+        # Shift-invert just below the Gershgorin bound separates the clustered bottom of the band;
+        # a fixed start vector makes the result independent of ARPACK's process-wide random state
+        lower_bound = -abs(operator).sum(axis=1).max()
+        v0 = np.random.default_rng(size).standard_normal(size).astype(operator.dtype)
+        values = eigsh(operator.tocsc(), k=n_computed, sigma=lower_bound - 0.01, which='LM',
+                       v0=v0, return_eigenvectors=False)
+        return np.sort(values.real)[:n_levels]
+
+    def graph_properties(self) -> Dict[str, float]:
+        """Degree statistics of the coupling graph (unweighted)."""
+        degree = np.diff(self.hamiltonian.indptr)
+        return {'N': self.N, 'avg_degree': float(np.mean(degree)),
+                'max_degree': int(np.max(degree)), 'period': self.period}
+
+
+def finite_size_scaling(sizes: List[int], frequency: int = 5,
+                        n_levels: int = 2) -> List[Dict[str, float]]:
+    """
+    Ground-state energy per site and spectral gap across ring sizes.
+
+    Args:
+        sizes: Ring sizes N (up to ~10⁵)
+        frequency: Cross-link spacing
+        n_levels: Levels computed per size (at least 2 for the gap)
+
+    Returns:
+        One dict per N with symmetry period, sector count, ground energy and gap
+    """
+    results = []
+    for N in sizes:
+        simulator = SparseRingCrossSimulator(N, frequency)
+        energies = simulator.spectrum(max(n_levels, 2))['energies']
+        results.append({
+            'N': N,
+            'period': simulator.period,
+            'n_sectors': simulator.n_sectors,
+            'ground_energy': float(energies[0]),
+            'gap': float(energies[1] - energies[0]),
+        })
+    return results
+
+
 def simplified_numpy_simulation(N: int = 100) -> Dict[str, float]:
     """
     Simplified simulation using only NumPy (no Qiskit required).
     """
     print(f"\nRunning simplified simulation with N={N} nodes...")
     
-    # Build adjacency matrix for ring+cross
-    adj = np.zeros((N, N))
-    
-    # Ring connections
-    for i in range(N):
-        adj[i, (i+1) % N] = 1
-        adj[(i+1) % N, i] = 1
-    
-    # Cross connections
-    for i in range(0, N, 5):
-        j = (i + N//2) % N
-        adj[i, j] = 1
-        adj[j, i] = 1
+    # Sparse adjacency for ring+cross (cross-links every 5 nodes)
+    adj = ring_cross_adjacency(N, frequency=5)
     
     # Calculate graph properties
-    degree = np.sum(adj, axis=1)
+    degree = np.diff(adj.indptr)
     avg_degree = np.mean(degree)
     
     # Effective coupling
@@ -19,6 +19,238 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from FIRM_dsl.core import ObjectG, make_node_label
 from FIRM_dsl.hamiltonian import derive_fine_structure_constant
+from FIRM_dsl.sweep_runner import SweepTask, TaskSweepRunner
+
+
+def build_ring_cross(N):
+    """Standard ring+cross builder."""
+    nodes = list(range(N))
+    edges = [[i, (i+1) % N] for i in range(N)]
+
+    for i in range(0, N, 5):
+        edges.append([i, (i + N//2) % N])
+
+    labels = {}
+    phi = (1 + np.sqrt(5)) / 2
+    for i in range(N):
+        kind = 'Z' if i % 2 == 0 else 'X'
+        phase_numer = int((i * 100 / phi)) % 100
+        labels[i] = make_node_label(kind, phase_numer, 100, f'n{i}')
+
+    return ObjectG(nodes=nodes, edges=edges, labels=labels)
+
+
+# =============================================================================
+# Claims (module-level so the sweep runner can evaluate them in worker processes)
+# =============================================================================
+
+def claim_alpha_derivation():
+    """Test α = 1/137.036 derivation."""
+    graph = build_ring_cross(100)
+    result = derive_fine_structure_constant(graph)
+    return result
+
+
+def claim_uniqueness():
+    """Test that ONLY ring+cross gives α = 1/137."""
+    N = 100
+    results = {}
+
+    # Test different topologies
+    # 1. Pure ring (no cross)
+    nodes = list(range(N))
+    edges_ring = [[i, (i+1) % N] for i in range(N)]
+    labels = {i: make_node_label('Z' if i%2==0 else 'X', i%100, 100, f'n{i}') 
+             for i in range(N)}
+    graph_ring = ObjectG(nodes=nodes, edges=edges_ring, labels=labels)
+    alpha_ring = derive_fine_structure_constant(graph_ring)['alpha_FIRM']
+    results['ring'] = 1/alpha_ring if alpha_ring > 0 else 0
+
+    # 2. Ring+cross (correct)
+    graph_cross = build_ring_cross(N)
+    alpha_cross = derive_fine_structure_constant(graph_cross)['alpha_FIRM']
+    results['ring+cross'] = 1/alpha_cross if alpha_cross > 0 else 0
+
+    # 3. Complete graph
+    edges_complete = [[i, j] for i in range(N) for j in range(i+1, N)][:500]
+    graph_complete = ObjectG(nodes=nodes, edges=edges_complete, labels=labels)
+    alpha_complete = derive_fine_structure_constant(graph_complete)['alpha_FIRM']
+    results['complete'] = 1/alpha_complete if alpha_complete > 0 else 0
+
+    return results
+
+
+def claim_scale_invariance():
+    """Test convergence with increasing N."""
+    N_values = [50, 100, 200, 500]
+    alphas = []
+    errors = []
+
+    for N in N_values:
+        graph = build_ring_cross(N)
+        result = derive_fine_structure_constant(graph)
+        alphas.append(result['alpha_FIRM'])
+        errors.append(result['error_pct'])
+
+    return {'N_values': N_values, 'alphas': alphas, 'errors': errors}
+
+
+def claim_weak_angle():
+    """Test sin²θ_W derivation."""
+    graph = build_ring_cross(100)
+
+    # From our derivation
+    alpha = derive_fine_structure_constant(graph)['alpha_FIRM']
+    sin2_theta = 0.25 - alpha  # Our formula
+
+    target = 0.23122
+    error = abs(sin2_theta - target) / target * 100
+
+    return {'sin2_theta': sin2_theta, 'target': target, 'error': error}
+
+
+def claim_higgs_mass():
+    """Test Higgs mass = 125 GeV."""
+    N = 100
+    # From symmetry breaking
+    mass_predicted = N * 1.25  # Our formula
+    target = 125.25
+    error = abs(mass_predicted - target) / target * 100
+
+    return {'mass': mass_predicted, 'target': target, 'error': error}
+
+
+def claim_hierarchy_problem():
+    """Test gravity weakness explanation."""
+    # α_G / α_EM ~ 10^-39
+    alpha_em = 1/137.036
+    N_universe = 10**61  # Planck volumes in universe
+
+    # Our prediction: suppressed by N²
+    alpha_G = alpha_em / (N_universe ** 2)
+
+    ratio = alpha_G / alpha_em
+    target_ratio = 10**(-39)
+
+    # Order of magnitude comparison
+    order_predicted = math.log10(abs(ratio))
+    order_target = -39
+
+    return {
+        'ratio': ratio,
+        'order': order_predicted,
+        'target_order': order_target
+    }
+
+
+def claim_dark_matter():
+    """Test dark matter = 27%."""
+    N = 100
+
+    # Count topological defects
+    # From our analysis: ~20% of nodes are defects
+    defect_fraction = 0.2
+
+    # Scale to cosmic fraction
+    # Dark:ordinary = 27:5
+    cosmic_ratio = 27/5
+
+    # Our prediction
+    our_ratio = defect_fraction / (1 - defect_fraction) * cosmic_ratio
+    our_dark_fraction = our_ratio / (1 + our_ratio)
+
+    target = 0.27
+    error = abs(our_dark_fraction - target) / target * 100
+
+    return {
+        'fraction': our_dark_fraction,
+        'target': target,
+        'error': error
+    }
+
+
+def claim_quantum_interference():
+    """Test quantum interference emergence."""
+    # Simplified test: Do paths interfere?
+    # In ring+cross, paths from node 0 to N/2
+    N = 100
+
+    # Two main paths:
+    # 1. Around ring clockwise
+    # 2. Through cross-link
+
+    # Phase difference should cause interference
+    phase1 = N/2 * (2*math.pi/N)  # Around ring
+    phase2 = math.pi/4  # Through cross
+
+    # Interference term
+    interference = math.cos(phase1 - phase2)
+
+    return {
+        'phase1': phase1,
+        'phase2': phase2, 
+        'interference': interference,
+        'has_interference': abs(interference) > 0.1
+    }
+
+
+def claim_uv_completeness():
+    """Test UV finiteness."""
+    # In discrete topology, momentum is bounded
+    k_max = math.pi  # Maximum momentum on lattice
+
+    # Standard QFT integral would diverge
+    # Our sum is finite
+
+    # Example: Self-energy
+    def integrand(k):
+        return 1 / (k**2 + 0.01)
+
+    # Discrete sum (finite)
+    N = 100
+    k_values = np.linspace(0.01, k_max, N)
+    sum_discrete = sum(integrand(k) for k in k_values) * k_max/N
+
+    # Check finiteness
+    is_finite = not np.isinf(sum_discrete) and not np.isnan(sum_discrete)
+
+    return {
+        'sum': sum_discrete,
+        'is_finite': is_finite,
+        'cutoff': k_max
+    }
+
+
+def claim_predictions():
+    """Test if we make testable predictions."""
+    predictions = [
+        'Quantum computer: α oscillates with N (period ~102)',
+        'Spectroscopy: Energy quantized in 1/100 units',
+        'Triple-slit: Phase shift = 19/80 wavelengths',
+        'Black holes: Ringdown quantized in π/50',
+        'Dark matter: Mass spectrum quantized'
+    ]
+
+    return {
+        'count': len(predictions),
+        'predictions': predictions,
+        'testable': True
+    }
+
+
+# Evaluation order; UltimateValidator.test_* print and judge them in this order
+CLAIM_FUNCTIONS = (
+    claim_alpha_derivation,
+    claim_uniqueness,
+    claim_scale_invariance,
+    claim_weak_angle,
+    claim_higgs_mass,
+    claim_hierarchy_problem,
+    claim_dark_matter,
+    claim_quantum_interference,
+    claim_uv_completeness,
+    claim_predictions,
+)
 
 
 class UltimateValidator:
@@ -33,29 +265,17 @@ class UltimateValidator:
             'untested': []
         }
         self.total_claims = 0
+        self.precomputed = {}  # claim function name -> sweep record
     
     def build_ring_cross(self, N):
         """Standard ring+cross builder."""
-        nodes = list(range(N))
-        edges = [[i, (i+1) % N] for i in range(N)]
-        
-        for i in range(0, N, 5):
-            edges.append([i, (i + N//2) % N])
-        
-        labels = {}
-        phi = (1 + np.sqrt(5)) / 2
-        for i in range(N):
-            kind = 'Z' if i % 2 == 0 else 'X'
-            phase_numer = int((i * 100 / phi)) % 100
-            labels[i] = make_node_label(kind, phase_numer, 100, f'n{i}')
-        
-        return ObjectG(nodes=nodes, edges=edges, labels=labels)
+        return build_ring_cross(N)
     
     def test_claim(self, name, test_func, success_criterion):
         """Test a single claim rigorously."""
         self.total_claims += 1
         try:
-            result = test_func()
+            result = self._claim_result(test_func)
             success = success_criterion(result)
             
             if success == True:
@@ -87,16 +307,33 @@ class UltimateValidator:
             })
             return 'ERROR'
     
+    def _claim_result(self, test_func):
+        """Result of a claim, from the parallel sweep when it already ran there."""
+        record = self.precomputed.get(getattr(test_func, '__name__', None))
+        if record is None:
+            return test_func()
+        if record['status'] != 'ok':
+            raise RuntimeError(record.get('error', 'claim failed'))
+        return record['result']
+
+    def run_claims_parallel(self, workers=None, cache_dir=None, output_path=None):
+        """
+        Evaluate every claim across a process pool before judging them.
+
+        With a cache_dir, finished claims are memoized there (keyed on the
+        claim code and the FIRM_dsl sources), so an interrupted validation
+        resumes where it stopped.
+        """
+        runner = TaskSweepRunner(workers=workers, cache_dir=cache_dir)
+        sweep = runner.run([SweepTask(fn) for fn in CLAIM_FUNCTIONS], output_path=output_path)
+        self.precomputed = {fn.__name__: record for fn, record in zip(CLAIM_FUNCTIONS, sweep.records)}
+        return sweep
+
     def test_alpha_derivation(self):
         """Test α = 1/137.036 derivation."""
         print("\n1. FINE STRUCTURE CONSTANT")
         print("-"*40)
         
-        def test():
-            graph = self.build_ring_cross(100)
-            result = derive_fine_structure_constant(graph)
-            return result
-        
         def criterion(result):
             error = result['error_pct']
             print(f"   α = {result['alpha_FIRM']:.8f} = 1/{1/result['alpha_FIRM']:.1f}")
@@ -112,40 +349,13 @@ class UltimateValidator:
                 print("   ❌ FAILED")
                 return False
         
-        return self.test_claim('α = 1/137.036', test, criterion)
+        return self.test_claim('α = 1/137.036', claim_alpha_derivation, criterion)
     
     def test_uniqueness(self):
         """Test that ONLY ring+cross gives α = 1/137."""
         print("\n2. TOPOLOGY UNIQUENESS")
         print("-"*40)
         
-        def test():
-            N = 100
-            results = {}
-            
-            # Test different topologies
-            # 1. Pure ring (no cross)
-            nodes = list(range(N))
-            edges_ring = [[i, (i+1) % N] for i in range(N)]
-            labels = {i: make_node_label('Z' if i%2==0 else 'X', i%100, 100, f'n{i}') 
-                     for i in range(N)}
-            graph_ring = ObjectG(nodes=nodes, edges=edges_ring, labels=labels)
-            alpha_ring = derive_fine_structure_constant(graph_ring)['alpha_FIRM']
-            results['ring'] = 1/alpha_ring if alpha_ring > 0 else 0
-            
-            # 2. Ring+cross (correct)
-            graph_cross = self.build_ring_cross(N)
-            alpha_cross = derive_fine_structure_constant(graph_cross)['alpha_FIRM']
-            results['ring+cross'] = 1/alpha_cross if alpha_cross > 0 else 0
-            
-            # 3. Complete graph
-            edges_complete = [[i, j] for i in range(N) for j in range(i+1, N)][:500]
-            graph_complete = ObjectG(nodes=nodes, edges=edges_complete, labels=labels)
-            alpha_complete = derive_fine_structure_constant(graph_complete)['alpha_FIRM']
-            results['complete'] = 1/alpha_complete if alpha_complete > 0 else 0
-            
-            return results
-        
         def criterion(results):
             print(f"   Ring only:  1/α = {results['ring']:.1f}")
             print(f"   Ring+cross: 1/α = {results['ring+cross']:.1f}")
@@ -163,26 +373,13 @@ class UltimateValidator:
                 print("   ❌ FAILED - Other topologies also work")
                 return False
         
-        return self.test_claim('Uniqueness of ring+cross', test, criterion)
+        return self.test_claim('Uniqueness of ring+cross', claim_uniqueness, criterion)
     
     def test_scale_invariance(self):
         """Test convergence with increasing N."""
         print("\n3. SCALE INVARIANCE")
         print("-"*40)
         
-        def test():
-            N_values = [50, 100, 200, 500]
-            alphas = []
-            errors = []
-            
-            for N in N_values:
-                graph = self.build_ring_cross(N)
-                result = derive_fine_structure_constant(graph)
-                alphas.append(result['alpha_FIRM'])
-                errors.append(result['error_pct'])
-            
-            return {'N_values': N_values, 'alphas': alphas, 'errors': errors}
-        
         def criterion(result):
             # Check if error decreases with N
             errors = result['errors']
@@ -197,25 +394,13 @@ class UltimateValidator:
                 print("   ❌ FAILED - No convergence")
                 return False
         
-        return self.test_claim('Scale invariance', test, criterion)
+        return self.test_claim('Scale invariance', claim_scale_invariance, criterion)
     
     def test_weak_angle(self):
         """Test sin²θ_W derivation."""
         print("\n4. WEAK MIXING ANGLE")
         print("-"*40)
         
-        def test():
-            graph = self.build_ring_cross(100)
-            
-            # From our derivation
-            alpha = derive_fine_structure_constant(graph)['alpha_FIRM']
-            sin2_theta = 0.25 - alpha  # Our formula
-            
-            target = 0.23122
-            error = abs(sin2_theta - target) / target * 100
-            
-            return {'sin2_theta': sin2_theta, 'target': target, 'error': error}
-        
         def criterion(result):
             print(f"   sin²θ_W = {result['sin2_theta']:.5f}")
             print(f"   Target:  {result['target']:.5f}")
@@ -231,22 +416,13 @@ class UltimateValidator:
                 print("   ❌ FAILED")
                 return False
         
-        return self.test_claim('Weak mixing angle', test, criterion)
+        return self.test_claim('Weak mixing angle', claim_weak_angle, criterion)
     
     def test_higgs_mass(self):
         """Test Higgs mass = 125 GeV."""
         print("\n5. HIGGS MASS")
         print("-"*40)
         
-        def test():
-            N = 100
-            # From symmetry breaking
-            mass_predicted = N * 1.25  # Our formula
-            target = 125.25
-            error = abs(mass_predicted - target) / target * 100
-            
-            return {'mass': mass_predicted, 'target': target, 'error': error}
-        
         def criterion(result):
             print(f"   m_H = {result['mass']:.1f} GeV")
             print(f"   Target: {result['target']:.1f} GeV")
@@ -262,34 +438,13 @@ class UltimateValidator:
                 print("   ❌ FAILED")
                 return False
         
-        return self.test_claim('Higgs mass', test, criterion)
+        return self.test_claim('Higgs mass', claim_higgs_mass, criterion)
     
     def test_hierarchy_problem(self):
         """Test gravity weakness explanation."""
         print("\n6. HIERARCHY PROBLEM")
         print("-"*40)
         
-        def test():
-            # α_G / α_EM ~ 10^-39
-            alpha_em = 1/137.036
-            N_universe = 10**61  # Planck volumes in universe
-            
-            # Our prediction: suppressed by N²
-            alpha_G = alpha_em / (N_universe ** 2)
-            
-            ratio = alpha_G / alpha_em
-            target_ratio = 10**(-39)
-            
-            # Order of magnitude comparison
-            order_predicted = math.log10(abs(ratio))
-            order_target = -39
-            
-            return {
-                'ratio': ratio,
-                'order': order_predicted,
-                'target_order': order_target
-            }
-        
         def criterion(result):
             print(f"   α_G/α_EM ~ 10^{result['order']:.0f}")
             print(f"   Target:   10^{result['target_order']}")
@@ -301,37 +456,13 @@ class UltimateValidator:
                 print("   ❌ FAILED")
                 return False
         
-        return self.test_claim('Hierarchy problem', test, criterion)
+        return self.test_claim('Hierarchy problem', claim_hierarchy_problem, criterion)
     
     def test_dark_matter(self):
         """Test dark matter = 27%."""
         print("\n7. DARK MATTER FRACTION")
         print("-"*40)
         
-        def test():
-            N = 100
-            
-            # Count topological defects
-            # From our analysis: ~20% of nodes are defects
-            defect_fraction = 0.2
-            
-            # Scale to cosmic fraction
-            # Dark:ordinary = 27:5
-            cosmic_ratio = 27/5
-            
-            # Our prediction
-            our_ratio = defect_fraction / (1 - defect_fraction) * cosmic_ratio
-            our_dark_fraction = our_ratio / (1 + our_ratio)
-            
-            target = 0.27
-            error = abs(our_dark_fraction - target) / target * 100
-            
-            return {
-                'fraction': our_dark_fraction,
-                'target': target,
-                'error': error
-            }
-        
         def criterion(result):
             print(f"   Dark matter: {result['fraction']:.1%}")
             print(f"   Target:      {result['target']:.1%}")
@@ -347,36 +478,13 @@ class UltimateValidator:
                 print("   ❌ FAILED")
                 return False
         
-        return self.test_claim('Dark matter fraction', test, criterion)
+        return self.test_claim('Dark matter fraction', claim_dark_matter, criterion)
     
     def test_quantum_interference(self):
         """Test quantum interference emergence."""
         print("\n8. QUANTUM INTERFERENCE")
         print("-"*40)
         
-        def test():
-            # Simplified test: Do paths interfere?
-            # In ring+cross, paths from node 0 to N/2
-            N = 100
-            
-            # Two main paths:
-            # 1. Around ring clockwise
-            # 2. Through cross-link
-            
-            # Phase difference should cause interference
-            phase1 = N/2 * (2*math.pi/N)  # Around ring
-            phase2 = math.pi/4  # Through cross
-            
-            # Interference term
-            interference = math.cos(phase1 - phase2)
-            
-            return {
-                'phase1': phase1,
-                'phase2': phase2, 
-                'interference': interference,
-                'has_interference': abs(interference) > 0.1
-            }
-        
         def criterion(result):
             print(f"   Path 1 phase: {result['phase1']:.3f}")
             print(f"   Path 2 phase: {result['phase2']:.3f}")
@@ -389,38 +497,13 @@ class UltimateValidator:
                 print("   ❌ FAILED - No interference")
                 return False
         
-        return self.test_claim('Quantum interference', test, criterion)
+        return self.test_claim('Quantum interference', claim_quantum_interference, criterion)
     
     def test_uv_completeness(self):
         """Test UV finiteness."""
         print("\n9. UV COMPLETENESS")
         print("-"*40)
         
-        def test():
-            # In discrete topology, momentum is bounded
-            k_max = math.pi  # Maximum momentum on lattice
-            
-            # Standard QFT integral would diverge
-            # Our sum is finite
-            
-            # Example: Self-energy
-            def integrand(k):
-                return 1 / (k**2 + 0.01)
-            
-            # Discrete sum (finite)
-            N = 100
-            k_values = np.linspace(0.01, k_max, N)
-            sum_discrete = sum(integrand(k) for k in k_values) * k_max/N
-            
-            # Check finiteness
-            is_finite = not np.isinf(sum_discrete) and not np.isnan(sum_discrete)
-            
-            return {
-                'sum': sum_discrete,
-                'is_finite': is_finite,
-                'cutoff': k_max
-            }
-        
         def criterion(result):
             print(f"   Discrete sum: {result['sum']:.2f}")
             print(f"   UV cutoff:    {result['cutoff']:.3f}")
@@ -432,28 +515,13 @@ class UltimateValidator:
                 print("   ❌ FAILED - Still diverges")
                 return False
         
-        return self.test_claim('UV completeness', test, criterion)
+        return self.test_claim('UV completeness', claim_uv_completeness, criterion)
     
     def test_predictions(self):
         """Test if we make testable predictions."""
         print("\n10. TESTABLE PREDICTIONS")
         print("-"*40)
         
-        def test():
-            predictions = [
-                'Quantum computer: α oscillates with N (period ~102)',
-                'Spectroscopy: Energy quantized in 1/100 units',
-                'Triple-slit: Phase shift = 19/80 wavelengths',
-                'Black holes: Ringdown quantized in π/50',
-                'Dark matter: Mass spectrum quantized'
-            ]
-            
-            return {
-                'count': len(predictions),
-                'predictions': predictions,
-                'testable': True
-            }
-        
         def criterion(result):
             print(f"   Number of predictions: {result['count']}")
             for i, pred in enumerate(result['predictions'], 1):
@@ -466,10 +534,18 @@ class UltimateValidator:
                 print("   ❌ FAILED - Not testable")
                 return False
         
-        return self.test_claim('Testable predictions', test, criterion)
+        return self.test_claim('Testable predictions', claim_predictions, criterion)
     
-    def run_complete_validation(self):
-        """Run all tests and generate report."""
+    def run_complete_validation(self, workers=None, cache_dir=None, output_path=None):
+        """
+        Run all tests and generate report.
+
+        Args:
+            workers: Worker processes for the claims (None = all cores, 1 = serial)
+            cache_dir: Memo directory for finished claims (None disables resume)
+            output_path: Optional directory with every claim result as columns
+        """
+        self.run_claims_parallel(workers, cache_dir, output_path)
         
         print("="*80)
         print("ULTIMATE VALIDATION OF RING+CROSS THEORY")
@@ -587,6 +663,15 @@ and explore alternative formulations.
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ultimate validation of the ring+cross theory")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--cache-dir', default=None,
+                        help="memoize finished claims here and resume from them (off by default)")
+    parser.add_argument('--output', default=None, help="columnar output directory with all claim results")
+    args = parser.parse_args()
+
     print("="*80)
     print("FINAL VALIDATION OF THE THEORY OF EVERYTHING")
     print("="*80)
@@ -597,7 +682,11 @@ if __name__ == "__main__":
     print()
     
     validator = UltimateValidator()
-    results = validator.run_complete_validation()
+    results = validator.run_complete_validation(
+        workers=args.workers,
+        cache_dir=args.cache_dir,
+        output_path=args.output
+    )
     
     print("\n" + "="*80)
     print("VALIDATION COMPLETE")
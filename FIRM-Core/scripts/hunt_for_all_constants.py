@@ -24,6 +24,7 @@ import math
 from scipy import stats, optimize, signal
 from FIRM_dsl.core import ObjectG, make_node_label, validate_object_g
 from FIRM_dsl.hamiltonian import derive_fine_structure_constant
+from FIRM_dsl.sweep_runner import TaskSweepRunner, task_grid
 import matplotlib.pyplot as plt
 
 
@@ -286,8 +287,25 @@ def extract_mass_ratio(graph):
     return best_method, best_value, best_error
 
 
-def search_all_topologies():
-    """Try different topologies to find constants."""
+def measure_constants(topology, N):
+    """Extract e, φ, m_p/m_e and α from one graph (one sweep task)."""
+    graph = build_graph(N, topology=topology)
+
+    e_method, e_value, e_error = extract_euler_e(graph)
+    phi_method, phi_value, phi_error = extract_golden_ratio(graph)
+    mass_method, mass_value, mass_error = extract_mass_ratio(graph)
+    alpha_result = derive_fine_structure_constant(graph)
+
+    return {
+        'e_method': e_method, 'e_value': e_value, 'e_error': e_error,
+        'phi_method': phi_method, 'phi_value': phi_value, 'phi_error': phi_error,
+        'mass_method': mass_method, 'mass_value': mass_value, 'mass_error': mass_error,
+        'alpha_value': alpha_result['alpha_FIRM'], 'alpha_error': alpha_result['error_pct'],
+    }
+
+
+def search_all_topologies(workers=None, cache_dir=None, output_path=None):
+    """Try different topologies to find constants (one parallel task per graph)."""
     print("="*80)
     print("HUNTING FOR ALL FUNDAMENTAL CONSTANTS")
     print("="*80)
@@ -302,38 +320,33 @@ def search_all_topologies():
         'alpha': []
     }
     
+    tasks = task_grid(measure_constants, topology=topologies, N=sizes)
+    sweep = TaskSweepRunner(workers=workers, cache_dir=cache_dir).run(tasks, output_path=output_path)
+    records = iter(sweep.records)
+    
     for topology in topologies:
         print(f"\n{'='*40}")
         print(f"TOPOLOGY: {topology.upper()}")
         print(f"{'='*40}")
         
         for N in sizes:
-            try:
-                graph = build_graph(N, topology=topology)
-                
-                # Extract constants
-                e_method, e_value, e_error = extract_euler_e(graph)
-                phi_method, phi_value, phi_error = extract_golden_ratio(graph)
-                mass_method, mass_value, mass_error = extract_mass_ratio(graph)
-                
-                # Also check alpha
-                alpha_result = derive_fine_structure_constant(graph)
-                alpha_error = alpha_result['error_pct']
-                
-                print(f"\nN = {N}:")
-                print(f"  e = {e_value:.6f} (error: {e_error:.2f}%) via {e_method}")
-                print(f"  φ = {phi_value:.6f} (error: {phi_error:.2f}%) via {phi_method}")
-                print(f"  m_p/m_e = {mass_value:.2f} (error: {mass_error:.2f}%) via {mass_method}")
-                print(f"  α = {alpha_result['alpha_FIRM']:.6e} (error: {alpha_error:.2f}%)")
-                
-                # Store results
-                results['e'].append((topology, N, e_value, e_error))
-                results['phi'].append((topology, N, phi_value, phi_error))
-                results['mass_ratio'].append((topology, N, mass_value, mass_error))
-                results['alpha'].append((topology, N, alpha_result['alpha_FIRM'], alpha_error))
-                
-            except Exception as e:
-                print(f"  Error with {topology} at N={N}: {e}")
+            record = next(records)
+            if record['status'] != 'ok':
+                print(f"  Error with {topology} at N={N}: {record['error']}")
+                continue
+            r = record['result']
+            
+            print(f"\nN = {N}:")
+            print(f"  e = {r['e_value']:.6f} (error: {r['e_error']:.2f}%) via {r['e_method']}")
+            print(f"  φ = {r['phi_value']:.6f} (error: {r['phi_error']:.2f}%) via {r['phi_method']}")
+            print(f"  m_p/m_e = {r['mass_value']:.2f} (error: {r['mass_error']:.2f}%) via {r['mass_method']}")
+            print(f"  α = {r['alpha_value']:.6e} (error: {r['alpha_error']:.2f}%)")
+            
+            # Store results
+            results['e'].append((topology, N, r['e_value'], r['e_error']))
+            results['phi'].append((topology, N, r['phi_value'], r['phi_error']))
+            results['mass_ratio'].append((topology, N, r['mass_value'], r['mass_error']))
+            results['alpha'].append((topology, N, r['alpha_value'], r['alpha_error']))
     
     # Find best results
     print("\n" + "="*80)
@@ -350,39 +363,41 @@ def search_all_topologies():
             print(f"  Error = {best[3]:.2f}%")
 
 
-def deep_dive_resonances():
-    """Deep analysis of quantum resonances."""
+def kinetic_scale(N):
+    """Mean squared phase gradient over the edges of the N-node ring+cross graph."""
+    graph = build_graph(N)
+    
+    phase_grad_sq_sum = 0.0
+    N_edges = 0
+    
+    for u, v in graph.edges:
+        if u in graph.labels and v in graph.labels:
+            phase_u = math.pi * graph.labels[u].phase_numer / graph.labels[u].phase_denom
+            phase_v = math.pi * graph.labels[v].phase_numer / graph.labels[v].phase_denom
+            phase_diff = phase_v - phase_u
+            
+            while phase_diff > math.pi:
+                phase_diff -= 2 * math.pi
+            while phase_diff < -math.pi:
+                phase_diff += 2 * math.pi
+            
+            phase_grad_sq_sum += phase_diff ** 2
+            N_edges += 1
+    
+    return phase_grad_sq_sum / N_edges if N_edges > 0 else None
+
+
+def deep_dive_resonances(workers=None, cache_dir=None):
+    """Deep analysis of quantum resonances (one parallel task per N)."""
     print("\n" + "="*80)
     print("DEEP DIVE: QUANTUM RESONANCES")
     print("="*80)
     
     N_values = np.arange(50, 1000, 10)
-    k_values = []
     
-    for N in N_values:
-        graph = build_graph(int(N))
-        
-        # Measure kinetic scale
-        phase_grad_sq_sum = 0.0
-        N_edges = 0
-        
-        for u, v in graph.edges:
-            if u in graph.labels and v in graph.labels:
-                phase_u = math.pi * graph.labels[u].phase_numer / graph.labels[u].phase_denom
-                phase_v = math.pi * graph.labels[v].phase_numer / graph.labels[v].phase_denom
-                phase_diff = phase_v - phase_u
-                
-                while phase_diff > math.pi:
-                    phase_diff -= 2 * math.pi
-                while phase_diff < -math.pi:
-                    phase_diff += 2 * math.pi
-                
-                phase_grad_sq_sum += phase_diff ** 2
-                N_edges += 1
-        
-        if N_edges > 0:
-            k = phase_grad_sq_sum / N_edges
-            k_values.append(k)
+    tasks = task_grid(kinetic_scale, N=[int(N) for N in N_values])
+    sweep = TaskSweepRunner(workers=workers, cache_dir=cache_dir).run(tasks)
+    k_values = [record['result'] for record in sweep.records if record['result'] is not None]
     
     # FFT to find frequencies
     if len(k_values) > 10:
@@ -511,16 +526,25 @@ def ultimate_validation():
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Hunt for fundamental constants in FIRM graphs")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--cache-dir', default=None,
+                        help="memoize finished tasks here and resume from them (off by default)")
+    parser.add_argument('--output', default=None, help="columnar output directory with the topology search")
+    args = parser.parse_args()
+
     print("="*80)
     print("PUSHING THE LIMITS: HUNT FOR ALL CONSTANTS")
     print("="*80)
     print()
     
     # 1. Search all topologies
-    search_all_topologies()
+    search_all_topologies(args.workers, args.cache_dir, args.output)
     
     # 2. Deep dive into resonances
-    period = deep_dive_resonances()
+    period = deep_dive_resonances(args.workers, args.cache_dir)
     
     # 3. Find Planck scale
     hbar = find_planck_scale()
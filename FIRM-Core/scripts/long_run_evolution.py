@@ -9,6 +9,12 @@ This script runs FIRM evolution for thousands of steps, logging:
 - Phase transition markers
 
 Results are saved to JSON for analysis and visualization.
+
+Long runs are restartable: per-step metrics stream to an append-only
+columnar log, and every --snapshot-interval steps the graph, RNG state and
+step counter are written to a compact binary snapshot (atomic rename).
+--resume continues from the latest valid snapshot in --checkpoint-dir;
+a directory holding an earlier run is only cleared with --overwrite.
 """
 
 import sys
@@ -18,36 +24,89 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import json
 import time
 import numpy as np
-from collections import defaultdict
-from FIRM_dsl.core import ObjectG
+from FIRM_dsl.core import ObjectG, add_phases_qpi, make_node_label
 from FIRM_dsl.coherence import compute_coherence
 from FIRM_dsl.resonance import derive_omega_signature, compute_resonance_alignment
 from FIRM_dsl.emergence_detection import run_emergence_battery
-from FIRM_zx.rules import apply_spider_fusion, apply_color_flip
+from FIRM_dsl.evolution_checkpoint import EvolutionCheckpointer
+
+METRIC_COLUMNS = ("step", "coherence", "resonance", "node_count", "edge_count", "event_size")
+DEFAULT_CHECKPOINT_DIR = os.path.join('.cache', 'evolution', 'long_run')
+PHI = (1 + np.sqrt(5)) / 2  # Golden ratio
+PHASE_DENOM = 64  # Qπ denominator for φ-modulated phases
+
+
+def phi_label(node_id, kind):
+    """Spider label with phase node_id·π/φ (mod 2π), in units of π/64."""
+    phase_numer = int(round(node_id * PHASE_DENOM / PHI)) % (2 * PHASE_DENOM)
+    return make_node_label(kind, phase_numer, PHASE_DENOM, f"n{node_id}")
 
 
 def initialize_graph(num_nodes=10):
     """Create initial graph with some structure."""
-    graph = ObjectG()
-    phi = (1 + np.sqrt(5)) / 2  # Golden ratio
-    
-    for i in range(num_nodes):
-        node_type = 'Z' if i % 2 == 0 else 'X'
-        phase = (i * np.pi / phi) % (2 * np.pi)
-        graph.add_node(i, node_type=node_type, phase=phase)
+    nodes = list(range(num_nodes))
+    labels = {i: phi_label(i, 'Z' if i % 2 == 0 else 'X') for i in nodes}
     
     # Create initial edges (ring + some cross-links)
-    for i in range(num_nodes - 1):
-        graph.add_edge(i, i + 1)
-    graph.add_edge(num_nodes - 1, 0)  # Close ring
+    edges = [(i, (i + 1) % num_nodes) for i in range(num_nodes)]
     
     # Add cross-links for richer structure
+    linked = {frozenset(edge) for edge in edges}
     for i in range(0, num_nodes, 3):
         target = (i + num_nodes // 2) % num_nodes
-        if not graph.has_edge(i, target):
-            graph.add_edge(i, target)
+        if target != i and frozenset((i, target)) not in linked:
+            edges.append((i, target))
+            linked.add(frozenset((i, target)))
     
-    return graph
+    return ObjectG(nodes=nodes, edges=edges, labels=labels)
+
+
+def degrees(graph):
+    """Node id -> degree."""
+    degree = {n: 0 for n in graph.nodes}
+    for u, v in graph.edges:
+        degree[u] += 1
+        degree[v] += 1
+    return degree
+
+
+def add_grace_node(graph, kind, target):
+    """Grace emergence: a new φ-phased spider attached to `target`."""
+    new_id = max(graph.nodes) + 1
+    return ObjectG(
+        nodes=graph.nodes + [new_id],
+        edges=graph.edges + [(new_id, target)],
+        labels={**graph.labels, new_id: phi_label(new_id, kind)}
+    )
+
+
+def fuse_spiders(graph, keep, merged):
+    """
+    Spider fusion: `merged` is absorbed into the adjacent same-colour `keep`.
+
+    Phases add in Qπ; `merged`'s other edges move to `keep` (self-loops and
+    parallel edges are dropped, keeping the graph simple).
+    """
+    keep_label, merged_label = graph.labels[keep], graph.labels[merged]
+    numer, denom = add_phases_qpi(keep_label.phase_numer, keep_label.phase_denom,
+                                  merged_label.phase_numer, merged_label.phase_denom)
+    edges, seen = [], set()
+    for u, v in graph.edges:
+        u, v = (keep if u == merged else u), (keep if v == merged else v)
+        if u != v and frozenset((u, v)) not in seen:
+            seen.add(frozenset((u, v)))
+            edges.append((u, v))
+    labels = {n: label for n, label in graph.labels.items() if n != merged}
+    labels[keep] = make_node_label(keep_label.kind, numer, denom, keep_label.monadic_id)
+    return ObjectG(nodes=[n for n in graph.nodes if n != merged], edges=edges, labels=labels)
+
+
+def flip_color(graph, node):
+    """Colour change: swap a spider between Z and X, keeping its phase."""
+    label = graph.labels[node]
+    flipped = make_node_label('X' if label.kind == 'Z' else 'Z', label.phase_numer, label.phase_denom,
+                              label.monadic_id)
+    return ObjectG(nodes=graph.nodes, edges=graph.edges, labels={**graph.labels, node: flipped})
 
 
 def evolve_step(graph, omega, grace_probability=0.1):
@@ -55,59 +114,49 @@ def evolve_step(graph, omega, grace_probability=0.1):
     Perform one evolution step with resonance-guided selection.
     
     Returns:
-        event_size: Number of nodes affected by this step
+        (graph, events): The evolved graph and the rewrites applied this step
+        ('grace', 'fusion', 'colorflip'); the event size is len(events)
     """
-    event_size = 0
+    events = []
     
     # Compute resonance for steering
     res = compute_resonance_alignment(graph, omega)
     
     # Grace emergence (probabilistic, φ-scaled)
     if np.random.random() < grace_probability * res:
-        # Add new node with φ-modulated phase
-        new_id = max(graph.nodes.keys()) + 1
-        phi = (1 + np.sqrt(5)) / 2
-        phase = (new_id * np.pi / phi) % (2 * np.pi)
         node_type = 'Z' if np.random.random() > 0.5 else 'X'
-        graph.add_node(new_id, node_type=node_type, phase=phase)
         
         # Connect to existing node (prefer high-degree nodes)
-        existing_nodes = list(graph.nodes.keys())
-        degrees = [len(list(graph.neighbors(n))) for n in existing_nodes]
-        probs = np.array(degrees) / sum(degrees) if sum(degrees) > 0 else np.ones(len(degrees)) / len(degrees)
-        target = np.random.choice(existing_nodes, p=probs)
-        graph.add_edge(new_id, target)
-        
-        event_size += 1
+        degree = degrees(graph)
+        existing_nodes = list(degree)
+        weights = np.array([degree[n] for n in existing_nodes], dtype=float)
+        probs = weights / weights.sum() if weights.sum() > 0 else np.ones(len(weights)) / len(weights)
+        target = existing_nodes[np.random.choice(len(existing_nodes), p=probs)]
+        graph = add_grace_node(graph, node_type, target)
+        events.append('grace')
     
     # Spider fusion (if eligible)
     if len(graph.nodes) > 3 and np.random.random() < 0.3 * res:
-        nodes = list(graph.nodes.keys())
+        linked = {frozenset(edge) for edge in graph.edges}
+        nodes = list(graph.nodes)
         for _ in range(min(5, len(nodes) // 2)):  # Try multiple fusions
-            n1, n2 = np.random.choice(nodes, 2, replace=False)
-            if graph.has_edge(n1, n2) and graph.nodes[n1]['node_type'] == graph.nodes[n2]['node_type']:
-                try:
-                    apply_spider_fusion(graph, n1, n2)
-                    event_size += 1
-                    break
-                except:
-                    pass
+            n1, n2 = (nodes[i] for i in np.random.choice(len(nodes), 2, replace=False))
+            if frozenset((n1, n2)) in linked and graph.labels[n1].kind == graph.labels[n2].kind:
+                graph = fuse_spiders(graph, n1, n2)
+                events.append('fusion')
+                break
     
     # Color flip (if eligible)
-    if np.random.random() < 0.2:
-        nodes = list(graph.nodes.keys())
-        if nodes:
-            node_to_flip = np.random.choice(nodes)
-            try:
-                apply_color_flip(graph, node_to_flip)
-                event_size += 1
-            except:
-                pass
-    
-    return event_size
+    if np.random.random() < 0.2 and graph.nodes:
+        graph = flip_color(graph, graph.nodes[np.random.choice(len(graph.nodes))])
+        events.append('colorflip')
+    
+    return graph, events
 
 
-def run_long_evolution(num_steps=5000, checkpoint_interval=100, output_file="evolution_data.json"):
+def run_long_evolution(num_steps=5000, checkpoint_interval=100, output_file="evolution_data.json",
+                       checkpoint_dir=DEFAULT_CHECKPOINT_DIR, snapshot_interval=500, resume=False,
+                       overwrite=False, keep_snapshots=3, seed=None):
     """
     Run extended evolution and log all data.
     
@@ -115,66 +164,100 @@ def run_long_evolution(num_steps=5000, checkpoint_interval=100, output_file="evo
         num_steps: Number of evolution steps
         checkpoint_interval: How often to log detailed data
         output_file: Where to save results
+        checkpoint_dir: Directory for snapshots and the metrics log
+        snapshot_interval: Steps between binary snapshots
+        resume: Continue from the latest valid snapshot in checkpoint_dir
+        overwrite: Discard an earlier run in checkpoint_dir and start fresh
+        keep_snapshots: Snapshots retained on disk
+        seed: Seed for NumPy's global RNG on a fresh run
+
+    Raises:
+        FileExistsError: checkpoint_dir holds an earlier run and neither
+            resume nor overwrite was given
     """
     print(f"Starting long-run evolution: {num_steps} steps")
     print(f"Checkpoint interval: {checkpoint_interval}")
     print(f"Output file: {output_file}\n")
     
-    # Initialize
+    if seed is not None:
+        np.random.seed(seed)
+    
+    # Omega comes from the initial structure, so it is the same after a resume
     graph = initialize_graph(num_nodes=10)
     omega = derive_omega_signature(graph)
     
-    # Measure vacuum baseline
-    vacuum_coherence = compute_coherence(graph)
+    checkpointer = EvolutionCheckpointer(checkpoint_dir, METRIC_COLUMNS, keep=keep_snapshots)
+    snapshot = None
+    if resume:
+        snapshot = checkpointer.resume()
+        if snapshot is None:
+            print(f"No earlier run in {checkpoint_dir}, starting fresh\n")
+    elif overwrite or not checkpointer.exists():
+        checkpointer.reset()
+    else:
+        raise FileExistsError(
+            f"{checkpoint_dir} holds an earlier run; pass --resume to continue it "
+            f"or --overwrite to discard it"
+        )
+    
+    # Data collection (per-step histories live in the metrics log)
+    if snapshot is None:
+        vacuum_coherence = compute_coherence(graph)
+        state = {
+            "vacuum_coherence": vacuum_coherence,
+            "grace_events": 0,
+            "fusion_events": 0,
+            "colorflip_events": 0,
+            "checkpoints": []
+        }
+        start_step = 0
+    else:
+        graph = snapshot.graph
+        state = snapshot.state
+        vacuum_coherence = state["vacuum_coherence"]
+        start_step = snapshot.step + 1
+        print(f"Resumed from {snapshot.path} at step {start_step}\n")
     print(f"Vacuum coherence (baseline): {vacuum_coherence:.4f}\n")
     
-    # Data collection
-    data = {
-        "vacuum_coherence": vacuum_coherence,
-        "steps": [],
-        "coherence_history": [],
-        "resonance_history": [],
-        "node_count_history": [],
-        "edge_count_history": [],
-        "event_sizes": [],
-        "grace_events": 0,
-        "fusion_events": 0,
-        "colorflip_events": 0,
-        "checkpoints": []
-    }
-    
     start_time = time.time()
     
     # Evolution loop
-    for step in range(num_steps):
+    for step in range(start_step, num_steps):
         # Evolve
-        event_size = evolve_step(graph, omega, grace_probability=0.1)
+        graph, events = evolve_step(graph, omega, grace_probability=0.1)
+        event_size = len(events)
+        for event in events:
+            state[f"{event}_events"] += 1
         
         # Measure
         coh = compute_coherence(graph)
         res = compute_resonance_alignment(graph, omega)
         
         # Log
-        data["coherence_history"].append(coh)
-        data["resonance_history"].append(res)
-        data["node_count_history"].append(len(graph.nodes))
-        data["edge_count_history"].append(len(graph.edges))
-        data["event_sizes"].append(event_size)
+        checkpointer.log(
+            step=step,
+            coherence=coh,
+            resonance=res,
+            node_count=len(graph.nodes),
+            edge_count=len(graph.edges),
+            event_size=event_size
+        )
         
         # Checkpoint
         if step % checkpoint_interval == 0:
             elapsed = time.time() - start_time
-            steps_per_sec = (step + 1) / elapsed if elapsed > 0 else 0
+            steps_per_sec = (step + 1 - start_step) / elapsed if elapsed > 0 else 0
             
             print(f"Step {step}/{num_steps} ({steps_per_sec:.1f} steps/sec)")
             print(f"  Nodes: {len(graph.nodes)}, Edges: {len(graph.edges)}")
             print(f"  C(G): {coh:.4f}, Res(S,Ω): {res:.4f}")
             
             # Run emergence detection
+            history = checkpointer.history()
             emergence_results = run_emergence_battery(
                 graph,
-                data["coherence_history"],
-                data["event_sizes"]
+                history["coherence"].tolist(),
+                history["event_size"].astype(int).tolist()
             )
             
             print(f"  Emergence: {emergence_results['summary']['assessment']}")
@@ -189,7 +272,27 @@ def run_long_evolution(num_steps=5000, checkpoint_interval=100, output_file="evo
                 "edges": len(graph.edges),
                 "emergence": emergence_results
             }
-            data["checkpoints"].append(checkpoint)
+            state["checkpoints"].append(checkpoint)
+        
+        # Snapshot
+        if (step + 1) % snapshot_interval == 0 or step == num_steps - 1:
+            checkpointer.save(step, graph, state)
+    
+    checkpointer.close()
+    history = checkpointer.history()
+    data = {
+        "vacuum_coherence": vacuum_coherence,
+        "steps": [],
+        "coherence_history": history["coherence"].tolist(),
+        "resonance_history": history["resonance"].tolist(),
+        "node_count_history": history["node_count"].astype(int).tolist(),
+        "edge_count_history": history["edge_count"].astype(int).tolist(),
+        "event_sizes": history["event_size"].astype(int).tolist(),
+        "grace_events": state["grace_events"],
+        "fusion_events": state["fusion_events"],
+        "colorflip_events": state["colorflip_events"],
+        "checkpoints": state["checkpoints"]
+    }
     
     # Final measurements
     print("\n" + "="*60)
@@ -241,7 +344,7 @@ def run_long_evolution(num_steps=5000, checkpoint_interval=100, output_file="evo
     
     # Save data
     with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, default=lambda value: np.asarray(value).tolist())  # NumPy results
     
     print(f"\nData saved to: {output_file}")
     print(f"Total time: {time.time() - start_time:.1f} seconds")
@@ -256,11 +359,29 @@ if __name__ == "__main__":
     parser.add_argument("--steps", type=int, default=5000, help="Number of evolution steps")
     parser.add_argument("--checkpoint", type=int, default=100, help="Checkpoint interval")
     parser.add_argument("--output", type=str, default="evolution_data.json", help="Output file")
+    parser.add_argument("--checkpoint-dir", type=str, default=DEFAULT_CHECKPOINT_DIR, help="Snapshot and metrics log directory")
+    parser.add_argument("--snapshot-interval", type=int, default=500, help="Steps between binary snapshots")
+    parser.add_argument("--keep", type=int, default=3, help="Snapshots to keep")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for a fresh run")
+    parser.add_argument("--resume", action="store_true", help="Resume from the latest valid snapshot")
+    parser.add_argument("--overwrite", action="store_true", help="Discard an earlier run in --checkpoint-dir")
     
     args = parser.parse_args()
     
-    run_long_evolution(
-        num_steps=args.steps,
-        checkpoint_interval=args.checkpoint,
-        output_file=args.output
-    )
+    if args.resume and args.overwrite:
+        parser.error("--resume and --overwrite are mutually exclusive")
+    
+    try:
+        run_long_evolution(
+            num_steps=args.steps,
+            checkpoint_interval=args.checkpoint,
+            output_file=args.output,
+            checkpoint_dir=args.checkpoint_dir,
+            snapshot_interval=args.snapshot_interval,
+            resume=args.resume,
+            overwrite=args.overwrite,
+            keep_snapshots=args.keep,
+            seed=args.seed
+        )
+    except FileExistsError as e:
+        parser.error(str(e))
@@ -13,44 +13,81 @@ Expected runtime: ~10 minutes
 import sys
 import os
 import time
+import io
+import hashlib
+import runpy
+import contextlib
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from FIRM_dsl.sweep_runner import SweepTask, TaskSweepRunner
 
-def run_experiment(name, script_name):
-    """Run an experiment script and capture results."""
+
+def script_hash(script_name):
+    """Content hash of an experiment script, so edits invalidate its memo."""
+    path = os.path.join(os.path.dirname(__file__), f"{script_name}.py")
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def run_experiment_script(script_name, source_hash=None):
+    """Run one experiment script's main in this process, capturing its output."""
+    output = io.StringIO()
+    start_time = time.time()
+    
+    with contextlib.redirect_stdout(output):
+        try:
+            runpy.run_module(f"scripts.{script_name}", run_name="__main__")
+            success = True
+        except Exception as e:
+            print(f"\n✗ EXPERIMENT FAILED: {e}")
+            success = False
+    
+    return {
+        'success': success,
+        'output': output.getvalue(),
+        'duration': time.time() - start_time
+    }
+
+
+def run_experiment(name, script_name, result=None):
+    """Print an experiment's captured output (running it here if not given)."""
     print("\n" + "█"*80)
     print(f"█  {name}")
     print("█"*80 + "\n")
     
-    start_time = time.time()
+    if result is None:
+        result = run_experiment_script(script_name)
     
-    try:
-        # Import and run the script
-        if script_name == "test_alpha_rigorously":
-            from scripts import test_alpha_rigorously
-            # Run the script's main
-            import importlib
-            importlib.reload(test_alpha_rigorously)
-        
-        elif script_name == "test_continuum_limit":
-            from scripts import test_continuum_limit
-            import importlib
-            importlib.reload(test_continuum_limit)
-        
-        elif script_name == "fix_destructive_interference":
-            from scripts import fix_destructive_interference
-            import importlib
-            importlib.reload(fix_destructive_interference)
-        
-        success = True
-    except Exception as e:
-        print(f"\n✗ EXPERIMENT FAILED: {e}")
-        success = False
+    print(result['output'], end='')
+    print(f"\n[Completed in {result['duration']:.1f}s]")
     
-    duration = time.time() - start_time
-    print(f"\n[Completed in {duration:.1f}s]")
+    return result['success']
+
+
+def run_experiments_parallel(experiments, workers=None, cache_dir=None, output_path=None):
+    """
+    Run experiment scripts across a process pool.
+
+    With a cache_dir, finished experiments are memoized there by script
+    content and FIRM_dsl sources, so an interrupted suite resumes with the
+    experiments that had not completed.
+    """
+    tasks = [
+        SweepTask(run_experiment_script, {'script_name': script, 'source_hash': script_hash(script)}, name)
+        for name, script in experiments
+    ]
+    sweep = TaskSweepRunner(workers=workers, cache_dir=cache_dir).run(tasks, output_path=output_path)
     
-    return success
+    results = {}
+    for (name, script), record in zip(experiments, sweep.records):
+        if record['status'] != 'ok':
+            record['result'] = {
+                'success': False,
+                'output': f"\n✗ EXPERIMENT FAILED: {record['error']}\n",
+                'duration': record['elapsed']
+            }
+        results[script] = run_experiment(name, script, record['result'])
+    return results
 
 
 def generate_final_report():
@@ -190,8 +227,8 @@ LONG TERM (1+ Years):
     """)
 
 
-def main():
-    """Run all experiments and generate report."""
+def main(workers=None, cache_dir=None, output_path=None):
+    """Run all experiments (in parallel) and generate report."""
     print("="*80)
     print("FIRM CRITICAL EXPERIMENTS SUITE")
     print("="*80)
@@ -209,9 +246,7 @@ def main():
         ("Experiment 3: Fix Destructive Interference", "fix_destructive_interference"),
     ]
     
-    results = {}
-    for name, script in experiments:
-        results[script] = run_experiment(name, script)
+    results = run_experiments_parallel(experiments, workers, cache_dir, output_path)
     
     # Generate final report
     print("\n\n")
@@ -234,4 +269,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run all critical FIRM experiments")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--cache-dir', default=None,
+                        help="memoize finished experiments here and resume from them (off by default)")
+    parser.add_argument('--output', default=None, help="columnar output directory with experiment results")
+    args = parser.parse_args()
+
+    main(args.workers, args.cache_dir, args.output)
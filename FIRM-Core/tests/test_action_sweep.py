@@ -0,0 +1,104 @@
+"""Unified action sweeps: columns match direct evaluation for any workers and chunking."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from FIRM_dsl.action_sweep import (
+    ActionSweepRunner,
+    configuration_grid,
+    load_sweep_columns,
+)
+from FIRM_dsl.gradient_flow import create_coherent_attractor
+from FIRM_dsl.unified_action import FieldConfiguration, UnifiedFSCTFAction
+
+
+def random_hermitian(rng, n=2):
+    A = rng.standard_normal((n, n)) + 1j * rng.standard_normal((n, n))
+    return (A + A.conj().T) / 2
+
+
+class NoisyAction(UnifiedFSCTFAction):
+    """Action whose total draws from the global RNG, to expose seeding."""
+
+    def compute_lagrangian_density(self, config, Psi_dot):
+        lagrangian = super().compute_lagrangian_density(config, Psi_dot)
+        noise = np.random.random()
+        return replace(lagrangian, coupling_term=lagrangian.coupling_term + noise,
+                       total=lagrangian.total + noise)
+
+
+@pytest.fixture
+def sweep():
+    rng = np.random.default_rng(3)
+    base = FieldConfiguration(
+        random_hermitian(rng),
+        3.0 * np.eye(2),
+        0.05 * np.stack([random_hermitian(rng) for _ in range(4)]),
+        create_coherent_attractor(2),
+        np.zeros(4),
+    )
+    psi_values = [s * random_hermitian(rng) for s in (0.3, 0.6, 0.9)]
+    metrics = [2.0 * np.eye(2), 4.0 * np.eye(2)]
+    grid = list(configuration_grid(base, coherence_field=psi_values, metric=metrics))
+    return base, psi_values, metrics, grid, 0.1 * random_hermitian(rng)
+
+
+def test_configuration_grid_is_cartesian_product(sweep):
+    base, psi_values, metrics, grid, _ = sweep
+    assert len(grid) == 6
+    # Last axis varies fastest; unswept fields are shared
+    np.testing.assert_array_equal(grid[1].coherence_field, psi_values[0])
+    np.testing.assert_array_equal(grid[1].metric, metrics[1])
+    assert all(c.connection is base.connection for c in grid)
+
+
+def test_sweep_matches_direct_evaluation(sweep):
+    *_, grid, Psi_dot = sweep
+    result = ActionSweepRunner(chunk_size=4).run(grid, Psi_dot)
+
+    action = UnifiedFSCTFAction()
+    for i, config in enumerate(grid):
+        lagrangian = action.compute_lagrangian_density(config, Psi_dot)
+        residual = action.compute_euler_lagrange_residual(config, Psi_dot, Psi_dot)
+        assert result.columns["total"][i] == pytest.approx(lagrangian.total, abs=1e-12)
+        assert result.columns["gradient_term"][i] == pytest.approx(lagrangian.gradient_term, abs=1e-12)
+        assert result.columns["Psi_residual"][i] == pytest.approx(residual["Psi_residual"], abs=1e-9)
+
+    assert result.num_points == 6
+    assert result.num_chunks == 2
+    np.testing.assert_array_equal(result.columns["index"], np.arange(6))
+
+
+def test_parallel_sweep_streams_same_columns(sweep, tmp_path):
+    *_, grid, Psi_dot = sweep
+    serial = ActionSweepRunner(chunk_size=6).run(grid, Psi_dot)
+
+    output = tmp_path / "sweep"
+    parallel = ActionSweepRunner(workers=2, chunk_size=2).run(
+        iter(grid), [Psi_dot] * len(grid), output_path=str(output)
+    )
+    stored = load_sweep_columns(str(output))
+
+    for name in serial.columns:
+        np.testing.assert_array_equal(parallel.columns[name], serial.columns[name])
+        np.testing.assert_array_equal(stored[name], serial.columns[name])
+
+
+def test_seeding_independent_of_chunk_size(sweep):
+    *_, grid, Psi_dot = sweep
+    runs = [
+        ActionSweepRunner(NoisyAction, chunk_size=size, compute_residuals=False).run(grid, Psi_dot)
+        for size in (1, 4, 6)
+    ]
+    for run in runs[1:]:
+        np.testing.assert_array_equal(run.columns["total"], runs[0].columns["total"])
+
+    reseeded = ActionSweepRunner(NoisyAction, seed=1, compute_residuals=False).run(grid, Psi_dot)
+    assert not np.array_equal(reseeded.columns["total"], runs[0].columns["total"])
+
+
+def test_sweep_rejects_short_derivative_list(sweep):
+    *_, grid, Psi_dot = sweep
+    with pytest.raises(ValueError):
+        ActionSweepRunner().run(grid, [Psi_dot])
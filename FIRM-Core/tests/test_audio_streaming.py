@@ -0,0 +1,126 @@
+"""
+Tests for the block-streaming audio coherence engine.
+"""
+
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from FIRM_audio.derivations import (
+    compute_coherence_audio_batch,
+    compute_coherence_audio_normalized,
+    derive_parseval_normalization,
+)
+from FIRM_audio.streaming import (
+    StreamingCoherenceEngine,
+    coherence_from_wav,
+    hann_window,
+)
+
+
+def test_hann_window_energy_matches_correction():
+    N = 1024
+    window = hann_window(N)
+    norm = derive_parseval_normalization(N, 48000.0)
+    assert N / np.sum(window**2) == pytest.approx(norm.correction_factor, rel=1e-12)
+
+
+def test_frames_match_scalar_coherence():
+    """Each hop equals compute_coherence_audio_normalized on its Parseval magnitudes."""
+    N, H = 256, 64
+    rng = np.random.default_rng(0)
+    signal = 0.3 * rng.standard_normal(N * 6)
+    engine = StreamingCoherenceEngine(fft_size=N, sample_rate=8000.0, hop_size=H)
+    c_audio = engine.process_block(signal)
+
+    assert len(c_audio) == 1 + (len(signal) - N) // H
+    weights = np.full(N // 2 + 1, 2.0 / N)
+    weights[0] = weights[-1] = 1.0 / N
+    for i in (0, 7, len(c_audio) - 1):
+        spectrum = np.fft.rfft(signal[i * H:i * H + N] * hann_window(N))
+        magnitudes = np.abs(spectrum) * np.sqrt(weights)
+        expected = compute_coherence_audio_normalized(list(magnitudes), engine.normalization)
+        assert c_audio[i] == pytest.approx(expected, rel=1e-12)
+        batch = compute_coherence_audio_batch(magnitudes[None], engine.normalization)
+        assert batch[0] == pytest.approx(expected, rel=1e-12)
+
+
+def test_block_size_does_not_change_output():
+    rng = np.random.default_rng(1)
+    signal = 0.2 * rng.standard_normal(20_000)
+    reference = StreamingCoherenceEngine(fft_size=512, hop_size=128).process_block(signal)
+
+    engine = StreamingCoherenceEngine(fft_size=512, hop_size=128, max_frames_per_batch=7)
+    cuts = np.sort(rng.integers(0, len(signal), 40))
+    streamed = engine.process_all(np.split(signal, cuts))
+
+    np.testing.assert_allclose(streamed, reference, rtol=1e-12, atol=1e-15)
+    assert engine.frames_emitted == len(reference)
+    # Carried state never exceeds one frame
+    assert len(engine._tail) < engine.fft_size
+
+
+def test_full_scale_sine_saturates():
+    N, fs = 2048, 44100.0
+    t = np.arange(N * 8) / fs
+    k = 100  # bin-centred tone
+    tone = np.sin(2 * np.pi * k * fs / N * t)
+    c_audio = StreamingCoherenceEngine(N, fs).process_block(tone)
+    np.testing.assert_allclose(c_audio, 1.0, atol=1e-9)
+
+    quiet = StreamingCoherenceEngine(N, fs).process_block(0.1 * tone)
+    np.testing.assert_allclose(quiet, 0.01, rtol=1e-6)
+
+
+def test_wav_file_streams_through_memmap(tmp_path):
+    fs = 16000
+    rng = np.random.default_rng(2)
+    pcm = np.clip(0.25 * rng.standard_normal((fs, 2)), -1, 1)
+    raw = np.round(pcm * 32767).astype("<i2")
+
+    path = tmp_path / "noise.wav"
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(fs)
+        w.writeframes(raw.tobytes())
+
+    times, c_audio = coherence_from_wav(str(path), fft_size=1024, block_size=3000)
+    expected = StreamingCoherenceEngine(1024, fs).process_block((raw / 32768.0).mean(axis=1))
+
+    np.testing.assert_allclose(c_audio, expected, rtol=1e-12)
+    assert times[1] == pytest.approx(512 / fs)
+
+
+def write_extensible_wav(path, samples, fs, subformat, bits):
+    channels = samples.shape[1]
+    data = samples.tobytes()
+    block_align = channels * bits // 8
+    guid = struct.pack("<H", subformat) + b"\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71"
+    fmt = struct.pack("<HHIIHHHHI", 0xFFFE, channels, fs, fs * block_align, block_align, bits,
+                      22, bits, 0x3) + guid
+    with open(path, "wb") as f:
+        f.write(b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + len(data)) + b"WAVE")
+        f.write(b"fmt " + struct.pack("<I", len(fmt)) + fmt)
+        f.write(b"data" + struct.pack("<I", len(data)) + data)
+
+
+def test_extensible_wav_uses_subformat(tmp_path):
+    fs = 8000
+    rng = np.random.default_rng(3)
+    samples = np.clip(0.25 * rng.standard_normal((4096, 2)), -1, 1)
+
+    float_path = tmp_path / "float.wav"
+    write_extensible_wav(float_path, samples.astype("<f4"), fs, subformat=3, bits=32)
+    _, c_float = coherence_from_wav(str(float_path), fft_size=512)
+    expected = StreamingCoherenceEngine(512, fs).process_block(samples.astype("<f4").mean(axis=1))
+    np.testing.assert_allclose(c_float, expected, rtol=1e-6)
+
+    pcm = np.round(samples * 32767).astype("<i2")
+    pcm_path = tmp_path / "pcm.wav"
+    write_extensible_wav(pcm_path, pcm, fs, subformat=1, bits=16)
+    _, c_pcm = coherence_from_wav(str(pcm_path), fft_size=512)
+    expected = StreamingCoherenceEngine(512, fs).process_block((pcm / 32768.0).mean(axis=1))
+    np.testing.assert_allclose(c_pcm, expected, rtol=1e-12)
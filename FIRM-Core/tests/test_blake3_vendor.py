@@ -0,0 +1,81 @@
+"""
+Tests for the vendored BLAKE3 engine and streaming hasher API.
+
+Expected digests are from the official BLAKE3 test vectors (input byte i is
+i mod 251).
+"""
+
+import numpy as np
+import pytest
+
+from FIRM_dsl.blake3_vendor import Blake3Hasher, blake3_hex, blake3_hex_file
+
+VECTORS = [
+    (0, "af1349b9f5f9a1a6a0404dea36dcc9499bcb25c9adc112b7cc9a93cae41f3262"),
+    (1, "2d3adedff11b61f14c886e35afa036736dcd87a74d27b5c1510225d0f592e213"),
+    (1023, "10108970eeda3eb932baac1428c7a2163b0e924c9a9e25b35bba72b28f70bd11"),
+    (1024, "42214739f095a406f3fc83deb889744ac00df831c10daa55189b5d121c855af7"),
+    (1025, "d00278ae47eb27b34faecf67b4fe263f82d5412916c1ffd97c8cb7fb814b8444"),
+    (2048, "e776b6028c7cd22a4d0ba182a8bf62205d2ef576467e838ed6f2529b85fba24a"),
+    (2049, "5f4d72f40d7a5f82b15ca2b2e44b1de3c2ef86c426c95c1af0b6879522563030"),
+    (8193, "bab6c09cb8ce8cf459261398d2e7aef35700bf488116ceb94a36d0f5f1b7bc3b"),
+    (31744, "62b6960e1a44bcc1eb1a611a8d6235b6b4b78f32e7abc4fb4c6cdcce94895c47"),
+    (102400, "bc3e3d41a1146b069abffad3c0d44860cf664390afce4d9661f7902e7943e085"),
+]
+
+
+def vector_input(length):
+    return (np.arange(length) % 251).astype(np.uint8).tobytes()
+
+
+@pytest.mark.parametrize("length,expected", VECTORS)
+def test_official_vectors(length, expected):
+    assert Blake3Hasher(vector_input(length)).hexdigest() == expected
+    assert blake3_hex(vector_input(length)) == expected
+
+
+@pytest.mark.parametrize("length,expected", VECTORS[4:])
+def test_streamed_updates_match(length, expected):
+    data = vector_input(length)
+    hasher = Blake3Hasher()
+    rng = np.random.default_rng(length)
+    position = 0
+    while position < length:
+        step = int(rng.integers(1, 3000))
+        hasher.update(memoryview(data)[position:position + step])
+        position += step
+    assert hasher.hexdigest() == expected
+
+    # digest() does not consume state
+    copy = hasher.copy()
+    copy.update(b"x")
+    assert hasher.hexdigest() == expected
+    assert copy.hexdigest() != expected
+
+
+def test_keyed_hash_extended_output():
+    data = vector_input(5121)
+    digest = Blake3Hasher(data, key=bytes(range(32))).hexdigest(72)
+    assert digest == (
+        "f5e92bc50eb02296aad75a7fb1faf6bf95c0f3eccfaaed506e2448df16b45c0b"
+        "0675f9411d630b218105316028420b223308cb51029ae4cbdc00c79aa78848bd"
+        "b3f9d60d31d6e4a8"
+    )
+    with pytest.raises(ValueError):
+        Blake3Hasher(key=b"short")
+
+
+def test_threaded_bulk_and_file_hashing(tmp_path, monkeypatch):
+    import FIRM_dsl.blake3_vendor as vendor
+
+    # Small lane batches so several batches are spread over the pool
+    monkeypatch.setattr(vendor, "_LANE_BATCH", 16)
+    field = np.random.default_rng(0).standard_normal(40_000)
+    expected = Blake3Hasher(field.tobytes()).hexdigest()
+
+    assert Blake3Hasher(field, max_threads=3).hexdigest() == expected
+
+    path = tmp_path / "field.bin"
+    field.tofile(path)
+    assert blake3_hex_file(str(path)) == expected
+    assert Blake3Hasher().update_file(str(path)).hexdigest() == expected
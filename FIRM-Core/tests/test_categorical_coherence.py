@@ -0,0 +1,95 @@
+"""Batched Hom-values, FIRM norms and limits in FSCTFCategory agree with the scalar FIRM series."""
+import numpy as np
+import pytest
+
+from FIRM_dsl.categorical_coherence import FSCTFCategory
+from FIRM_dsl.firm_metric import FIRMMetric
+from FIRM_dsl.grace_operator import (
+    GraceOperator,
+    GraceParameters,
+    GraceImplementation,
+    create_default_grace_operator,
+    create_gentle_grace_operator,
+)
+
+
+def random_hermitian(rng, n=4):
+    A = rng.standard_normal((n, n)) + 1j * rng.standard_normal((n, n))
+    return (A + A.conj().T) / 2
+
+
+@pytest.fixture
+def category_and_objects():
+    rng = np.random.default_rng(5)
+    grace = create_default_grace_operator()
+    category = FSCTFCategory(grace=grace, firm=FIRMMetric(grace, max_terms=60))
+    states = [random_hermitian(rng) for _ in range(5)]
+    # One non-Hermitian state exercises a complex-valued Hom row
+    states.append(rng.standard_normal((4, 4)) + 1j * rng.standard_normal((4, 4)))
+    return category, category.add_objects(states, [f"Ψ{i}" for i in range(6)])
+
+
+def test_batched_norms_match_firm_metric(category_and_objects):
+    category, objects = category_and_objects
+    for obj in objects:
+        assert obj.norm_firm == pytest.approx(category.firm.norm(obj.state).norm, rel=1e-12)
+
+
+def test_hom_matrix_matches_scalar_hom(category_and_objects):
+    category, objects = category_and_objects
+    H = category.hom_matrix(objects)
+    expected = np.array([[category.hom(a, b) for b in objects] for a in objects])
+
+    np.testing.assert_allclose(H, expected, atol=1e-12)
+    np.testing.assert_array_equal(H, H.conj().T)
+
+
+def test_hom_block_between_object_lists(category_and_objects):
+    category, objects = category_and_objects
+    sources, targets = objects[:2], objects[2:]
+    H = category.hom_block(sources, targets)
+
+    assert H.shape == (2, 4)
+    for i, a in enumerate(sources):
+        for j, b in enumerate(targets):
+            assert H[i, j] == pytest.approx(category.hom(a, b), abs=1e-12)
+
+
+def test_limit_and_colimit_resonances_are_hom_values(category_and_objects):
+    category, objects = category_and_objects
+    limit_obj, projections = category.compute_limit(objects)
+    for proj, obj in zip(projections, objects):
+        assert proj.resonance == pytest.approx(category.hom(limit_obj, obj), abs=1e-12)
+
+    colimit_obj, injections = category.compute_colimit(objects)
+    for inj, obj in zip(injections, objects):
+        assert inj.resonance == pytest.approx(category.hom(obj, colimit_obj), abs=1e-12)
+
+
+def test_replacing_object_drops_cached_iterates(category_and_objects):
+    category, objects = category_and_objects
+    category.hom_matrix(objects)
+    old = category.get_object("Ψ0")
+    assert id(old) in category._iterate_cache
+
+    category.add_object(2.0 * old.state, "Ψ0")
+    assert id(old) not in category._iterate_cache
+    assert category.get_object("Ψ0").norm_firm == pytest.approx(2.0 * old.norm_firm)
+
+
+@pytest.mark.parametrize("grace", [
+    create_default_grace_operator(),
+    create_gentle_grace_operator(),
+    GraceOperator(GraceParameters(kappa=0.6, mu=0.5, implementation=GraceImplementation.WAVELET)),
+])
+def test_grace_apply_batch_matches_single_apply(grace):
+    rng = np.random.default_rng(2)
+    X = np.stack([random_hermitian(rng) for _ in range(4)])
+    expected = np.stack([grace.apply(x, verify_axioms=False).output for x in X])
+
+    np.testing.assert_allclose(grace.apply_batch(X), expected, atol=1e-12)
+
+
+def test_grace_apply_batch_rejects_single_matrix():
+    with pytest.raises(ValueError):
+        create_default_grace_operator().apply_batch(np.eye(3))
@@ -19,6 +19,7 @@ import numpy as np
 from FIRM_dsl.clifford_rotors import (
     Bivector,
     Rotor,
+    RotorArray,
     GraceRotor,
     LoveRotor,
     ForgivenessRotor,
@@ -279,6 +280,75 @@ class TestCombinedRotorDynamics:
         assert all(abs(n - norms[0]) < 0.1 for n in norms)
 
 
+# ============================================================================
+# ROTOR ARRAY TESTS
+# ============================================================================
+
+class TestRotorArray:
+    """Test array-backed rotors against the scalar Rotor path."""
+    
+    def setup_method(self):
+        rng = np.random.default_rng(3)
+        self.v = rng.standard_normal((20, 3))
+        self.w = rng.standard_normal((20, 3))
+    
+    def test_apply_matches_rotor(self):
+        """Test vectorized sandwich product matches Rotor.apply."""
+        R = RotorArray.from_vectors(self.v, self.w)
+        rotated = R.apply(self.v)
+        
+        expected = np.array([Rotor.from_vectors(v, w).apply(v) for v, w in zip(self.v, self.w)])
+        assert np.allclose(rotated, expected)
+    
+    def test_compose_and_inverse(self):
+        """Test composition matches Rotor.compose and R̃R = 1."""
+        R1 = RotorArray.from_vectors(self.v, self.w)
+        R2 = RotorArray.from_vectors(self.w, self.v[::-1])
+        combined = R2.compose(R1)
+        
+        for k in range(len(R1)):
+            expected = R2[k].compose(R1[k])
+            assert np.isclose(combined.scalar[k], expected.scalar)
+            assert np.allclose(combined.bivector[k], expected.bivector.components)
+        
+        identity = R1.inverse().compose(R1)
+        assert np.allclose(identity.scalar, 1.0)
+        assert np.allclose(identity.bivector, 0.0)
+    
+    def test_scan_matches_sequential_composition(self):
+        """Test prefix scan equals left-to-right sequential composition."""
+        rotors = RotorArray.from_vectors(self.v, self.w)
+        scanned = rotors.scan()
+        
+        accumulated = rotors[0]
+        for k in range(len(rotors)):
+            if k > 0:
+                accumulated = rotors[k].compose(accumulated)
+            assert np.isclose(scanned.scalar[k], accumulated.scalar)
+            assert np.allclose(scanned.bivector[k], accumulated.bivector.components)
+    
+    def test_batch_helpers_match_single_vector_paths(self):
+        """Test Grace/Love/Forgiveness batch paths match per-vector calls."""
+        combined = CombinedRotorDynamics()
+        dissonance = self.w[::-1]
+        
+        evolved = combined.evolve_states(self.v, targets=self.w, dissonances=dissonance, dt=0.1)
+        expected = np.array([
+            combined.evolve_state(v, target=w, dissonance=d, dt=0.1)
+            for v, w, d in zip(self.v, self.w, dissonance)
+        ])
+        assert np.allclose(evolved, expected)
+    
+    def test_golden_rotation_field(self):
+        """Test field version of the golden sequence matches the list version."""
+        combined = CombinedRotorDynamics()
+        field = combined.golden_rotation_field(self.v, num_steps=5)
+        
+        assert field.shape == (6, 20, 3)
+        trajectory = combined.golden_rotation_sequence(self.v[0], num_steps=5)
+        assert np.allclose(field[:, 0], np.array(trajectory))
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
@@ -22,6 +22,7 @@ from FIRM_dsl.cp1_quantization import (
     GaugeField,
     CP1Configuration,
     CP1Quantizer,
+    GaugeExtractionPipeline,
     extract_gauge_field
 )
 
@@ -307,6 +308,61 @@ class TestConvenienceFunction(unittest.TestCase):
         self.assertEqual(gauge.a.shape, (3, N, N, N))
 
 
+class TestGaugeExtractionPipeline(unittest.TestCase):
+    """Test the shared-gradient snapshot pipeline."""
+    
+    def setUp(self):
+        """Set up random unit field and anisotropic grid."""
+        rng = np.random.default_rng(7)
+        N = 12
+        n = rng.standard_normal((3, N, N, N))
+        self.n = n / np.linalg.norm(n, axis=0)
+        
+        class Grid:
+            Lx, Ly, Lz = 2.0, 3.0, 4.0
+            Nx = Ny = Nz = N
+        self.grid = Grid
+    
+    def test_matches_quantizer(self):
+        """Test pipeline reproduces CP1Quantizer.extract_gauge_field."""
+        reference = CP1Quantizer(grid=self.grid).extract_gauge_field(self.n)
+        gauge = GaugeExtractionPipeline(grid=self.grid).process(self.n)
+        
+        np.testing.assert_allclose(gauge.a, reference.a, atol=1e-10)
+        np.testing.assert_allclose(gauge.f, reference.f, atol=1e-10)
+        np.testing.assert_allclose(gauge.B, reference.B, atol=1e-10)
+        self.assertAlmostEqual(gauge.flux, reference.flux, places=8)
+        self.assertAlmostEqual(gauge.charge, reference.charge, places=8)
+    
+    def test_float32_mode(self):
+        """Test float32 mode keeps precision close to float64."""
+        reference = GaugeExtractionPipeline(grid=self.grid).process(self.n)
+        gauge = GaugeExtractionPipeline(grid=self.grid, dtype=np.float32).process(self.n)
+        
+        self.assertEqual(gauge.a.dtype, np.float32)
+        self.assertEqual(gauge.f.dtype, np.float32)
+        scale = np.max(np.abs(reference.f))
+        self.assertLess(np.max(np.abs(gauge.f - reference.f)) / scale, 1e-4)
+    
+    def test_process_many_outputs_independent(self):
+        """Test reused scratch buffers do not leak into returned fields."""
+        pipeline = GaugeExtractionPipeline()
+        snapshots = np.stack([self.n, -self.n])
+        
+        results = list(pipeline.process_many(snapshots))
+        
+        self.assertEqual(len(results), 2)
+        np.testing.assert_allclose(
+            results[0].a, CP1Quantizer().extract_gauge_field(self.n).a, atol=1e-10
+        )
+        self.assertFalse(np.allclose(results[0].a, results[1].a))
+    
+    def test_rejects_non_3d_field(self):
+        """Test pipeline requires (3, Nx, Ny, Nz) input."""
+        with self.assertRaises(ValueError):
+            GaugeExtractionPipeline().process(np.ones((3, 8)))
+
+
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and error handling."""
     
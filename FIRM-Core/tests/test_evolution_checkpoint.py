@@ -0,0 +1,162 @@
+"""Evolution snapshots, metrics log and resume, plus the long-run script driving them."""
+import json
+import os
+
+import numpy as np
+import pytest
+
+from FIRM_dsl.core import NodeLabel, ObjectG
+from FIRM_dsl.evolution_checkpoint import EvolutionCheckpointer, read_snapshot, write_snapshot
+from scripts.long_run_evolution import run_long_evolution
+
+COLUMNS = ("step", "value")
+
+
+class AttributeGraph:
+    def __init__(self):
+        self.nodes = {}
+        self.edges = []
+
+    def add_node(self, n, **attrs):
+        self.nodes[n] = attrs
+
+    def add_edge(self, u, v):
+        self.edges.append((u, v))
+
+
+def ring_object_g(n=6):
+    labels = {
+        i: NodeLabel(kind='Z' if i % 2 == 0 else 'X', phase_numer=i, phase_denom=4, monadic_id=f"m{i}")
+        for i in range(n)
+    }
+    return ObjectG(nodes=list(range(n)), edges=[(i, (i + 1) % n) for i in range(n)], labels=labels)
+
+
+def run(checkpointer, graph, start, stop, snapshot_interval):
+    # Toy evolution: one random draw per step, logged and snapshotted
+    for step in range(start, stop):
+        checkpointer.log(step=step, value=np.random.random())
+        if (step + 1) % snapshot_interval == 0:
+            checkpointer.save(step, graph, {"last": step})
+
+
+def test_object_g_roundtrip(tmp_path):
+    graph = ring_object_g()
+    path = str(tmp_path / "snap.npz")
+    write_snapshot(path, 7, graph, metric_rows=8, state={"vacuum_coherence": 0.5})
+
+    snapshot = read_snapshot(path)
+    assert (snapshot.step, snapshot.metric_rows) == (7, 8)
+    assert snapshot.state == {"vacuum_coherence": 0.5}
+    assert snapshot.graph == graph
+    assert os.listdir(tmp_path) == ["snap.npz"]
+
+
+def test_attribute_graph_roundtrip(tmp_path):
+    graph = AttributeGraph()
+    for i in range(4):
+        graph.add_node(i, node_type='Z' if i % 2 else 'X', phase=0.25 * i)
+    graph.add_edge(0, 1)
+    graph.add_edge(2, 3)
+    path = str(tmp_path / "snap.npz")
+    write_snapshot(path, 0, graph, metric_rows=0)
+
+    restored = read_snapshot(path, graph_factory=AttributeGraph).graph
+    assert restored.nodes == graph.nodes
+    assert restored.edges == graph.edges
+
+
+def test_keeps_latest_snapshots(tmp_path):
+    checkpointer = EvolutionCheckpointer(str(tmp_path), COLUMNS, keep=2)
+    run(checkpointer, ring_object_g(), 0, 50, snapshot_interval=10)
+
+    names = [os.path.basename(p) for p in checkpointer.snapshots()]
+    assert names == ["snapshot_000000000049.npz", "snapshot_000000000039.npz"]
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    graph = ring_object_g()
+
+    np.random.seed(3)
+    reference = EvolutionCheckpointer(str(tmp_path / "ref"), COLUMNS)
+    run(reference, graph, 0, 40, snapshot_interval=10)
+    expected = np.array(reference.history()["value"])
+
+    np.random.seed(3)
+    first = EvolutionCheckpointer(str(tmp_path / "run"), COLUMNS)
+    run(first, graph, 0, 25, snapshot_interval=10)  # killed after step 24
+    first.flush()
+
+    np.random.seed(99)
+    second = EvolutionCheckpointer(str(tmp_path / "run"), COLUMNS)
+    snapshot = second.resume()
+    assert snapshot.step == 19 and snapshot.state == {"last": 19}
+    assert second.rows == 20  # rows 20-24 were after the last snapshot
+    run(second, snapshot.graph, snapshot.step + 1, 40, snapshot_interval=10)
+
+    history = second.history()
+    np.testing.assert_array_equal(history["step"], np.arange(40))
+    np.testing.assert_array_equal(history["value"], expected)
+
+
+def test_skips_corrupt_snapshot(tmp_path):
+    checkpointer = EvolutionCheckpointer(str(tmp_path), COLUMNS)
+    run(checkpointer, ring_object_g(), 0, 20, snapshot_interval=10)
+    newest = checkpointer.snapshots()[0]
+    with open(newest, "r+b") as f:
+        f.truncate(os.path.getsize(newest) // 2)
+
+    snapshot = EvolutionCheckpointer(str(tmp_path), COLUMNS).resume()
+    assert (snapshot.step, snapshot.metric_rows) == (9, 10)
+
+
+def test_no_usable_snapshot_leaves_log_alone(tmp_path):
+    checkpointer = EvolutionCheckpointer(str(tmp_path), COLUMNS, keep=1)
+    run(checkpointer, ring_object_g(), 0, 10, snapshot_interval=10)
+    # Lose the tail of the log, as if the column files never reached disk
+    log = tmp_path / "metrics" / "value.f64"
+    with open(log, "r+b") as f:
+        f.truncate(5 * 8)
+
+    with pytest.raises(RuntimeError, match="No usable snapshot"):
+        EvolutionCheckpointer(str(tmp_path), COLUMNS).resume()
+    assert os.path.getsize(log) == 5 * 8
+
+    # Nor does logging without resume() or reset() open the log for writing
+    fresh = EvolutionCheckpointer(str(tmp_path), COLUMNS)
+    fresh.log(step=0, value=0.0)
+    with pytest.raises(RuntimeError, match="earlier run"):
+        fresh.flush()
+    assert os.path.getsize(log) == 5 * 8
+
+
+def test_fresh_directory(tmp_path):
+    checkpointer = EvolutionCheckpointer(str(tmp_path), COLUMNS)
+    assert checkpointer.resume() is None
+    assert checkpointer.rows == 0 and not checkpointer.exists()
+
+
+def test_missing_column(tmp_path):
+    checkpointer = EvolutionCheckpointer(str(tmp_path), COLUMNS)
+    with pytest.raises(ValueError):
+        checkpointer.log(step=0)
+
+
+def test_long_run_script_resumes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    options = dict(checkpoint_interval=10, snapshot_interval=12, checkpoint_dir="ckpt")
+
+    run_long_evolution(num_steps=40, output_file="full.json", seed=5, **options)
+    full = json.loads((tmp_path / "full.json").read_text())
+
+    # A plain rerun must not clear the existing run
+    with pytest.raises(FileExistsError):
+        run_long_evolution(num_steps=40, seed=5, **options)
+
+    run_long_evolution(num_steps=30, output_file="part.json", seed=5, overwrite=True, **options)
+    resumed = run_long_evolution(num_steps=40, output_file="resumed.json", resume=True, **options)
+
+    assert len(full["coherence_history"]) == 40
+    assert resumed["coherence_history"] == full["coherence_history"]
+    assert resumed["event_sizes"] == full["event_sizes"]
+    assert full["grace_events"] + full["fusion_events"] + full["colorflip_events"] == sum(full["event_sizes"])
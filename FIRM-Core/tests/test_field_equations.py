@@ -355,6 +355,61 @@ class TestFieldEvolution(unittest.TestCase):
         self.assertTrue(np.all(np.isfinite(G_y)))
         self.assertTrue(np.all(np.isfinite(G_z)))
 
+    
+    def test_jacobian_sparsity_covers_rhs(self):
+        """Test that the stencil sparsity pattern contains every nonzero of ∂rhs/∂y."""
+        field = CoherenceField(self.grid_1d)
+        field.set_gaussian_soliton((5.0,), 1.0, [0.5, 0.5, 0.7])
+        evolution = FieldEvolution(field, self.params)
+        
+        pattern = evolution.jacobian_sparsity().toarray()
+        y0 = field.get_state_vector()
+        self.assertEqual(pattern.shape, (y0.size, y0.size))
+        
+        r0 = evolution.rhs(0.0, y0)
+        eps = 1e-6
+        for k in range(y0.size):
+            y = y0.copy()
+            y[k] += eps
+            column = (evolution.rhs(0.0, y) - r0) / eps
+            self.assertEqual(np.max(np.abs(column[~pattern[:, k]])), 0.0)
+        
+        # Sparse: O(N) nonzeros rather than (6N)²
+        self.assertLess(pattern.sum(), 0.1 * pattern.size)
+    
+    def test_implicit_evolution_with_sparsity(self):
+        """Test BDF with the sparse Jacobian pattern matches explicit RK45."""
+        results = {}
+        for method in ('RK45', 'BDF'):
+            field = CoherenceField(self.grid_1d)
+            field.set_gaussian_soliton((5.0,), 1.0, [0.5, 0.5, 0.7])
+            evolution = FieldEvolution(field, self.params)
+            sol = evolution.evolve((0, 0.2), method=method)
+            self.assertTrue(sol['success'])
+            results[method] = (field.n_z.copy(), len(sol['t']))
+        
+        np.testing.assert_allclose(results['BDF'][0], results['RK45'][0], atol=1e-3)
+        # Implicit solver is not pinned to max_step=dt
+        self.assertLess(results['BDF'][1], results['RK45'][1])
+    
+    def test_leapfrog_evolution(self):
+        """Test fixed-step symplectic leapfrog evolution."""
+        field = CoherenceField(self.grid_1d)
+        field.set_gaussian_soliton((5.0,), 1.0, [0.5, 0.5, 0.7])
+        evolution = FieldEvolution(field, self.params)
+        
+        sol = evolution.evolve((0, 0.1), method='leapfrog')
+        
+        self.assertTrue(sol['success'])
+        self.assertAlmostEqual(field.t, 0.1, places=10)
+        self.assertEqual(len(sol['t']), 11)
+        
+        norm = np.sqrt(field.n_x**2 + field.n_y**2 + field.n_z**2)
+        np.testing.assert_array_almost_equal(norm, np.ones_like(norm), decimal=3)
+        
+        with self.assertRaises(ValueError):
+            evolution.evolve_leapfrog((0, 0.1), dt=0.0)
+
 
 class TestConvenienceFunctions(unittest.TestCase):
     """Test module-level convenience functions."""
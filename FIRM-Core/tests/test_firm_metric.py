@@ -0,0 +1,83 @@
+"""
+Tests for FIRM Metric Memoization
+
+Covers the opt-in LRU cache on FIRMMetric:
+1. Cached results are identical to the uncached series
+2. Hit/miss statistics and the LRU size bound
+3. Content fingerprints (equal copies share entries)
+4. Cached Grace iterates are read-only
+"""
+
+import numpy as np
+import pytest
+
+from FIRM_dsl.firm_metric import FIRMMetric, operator_fingerprint
+
+
+def random_hermitian(rng, n=4):
+    A = rng.standard_normal((n, n)) + 1j * rng.standard_normal((n, n))
+    return (A + A.conj().T) / 2
+
+
+class TestFIRMCache:
+    """Test FIRM norm / inner product memoization."""
+    
+    def setup_method(self):
+        rng = np.random.default_rng(11)
+        self.A = random_hermitian(rng)
+        self.B = random_hermitian(rng)
+    
+    def test_cache_disabled_by_default(self):
+        """Test caching is opt-in."""
+        firm = FIRMMetric(max_terms=10)
+        firm.norm(self.A)
+        
+        info = firm.cache_info()
+        assert not firm.cache_enabled
+        assert info.size == 0 and info.hits == 0
+    
+    def test_cached_results_match_uncached(self):
+        """Test memoized norm and inner product equal the direct series."""
+        plain = FIRMMetric(max_terms=10)
+        cached = FIRMMetric(max_terms=10, cache_size=16)
+        
+        for _ in range(2):
+            assert cached.norm(self.A) == plain.norm(self.A)
+            assert cached.inner_product(self.A, self.B) == plain.inner_product(self.A, self.B)
+    
+    def test_hits_on_equal_content(self):
+        """Test a fresh copy of the same operator hits the cache."""
+        firm = FIRMMetric(max_terms=10, cache_size=16)
+        first = firm.norm(self.A)
+        second = firm.norm(self.A.copy())
+        
+        assert second is first
+        info = firm.cache_info()
+        assert info.hits >= 1
+        assert 0.0 < info.hit_rate < 1.0
+        assert operator_fingerprint(self.A) == operator_fingerprint(self.A.copy())
+        assert operator_fingerprint(self.A) != operator_fingerprint(self.B)
+    
+    def test_lru_bound_and_clear(self):
+        """Test the cache never exceeds its bound and can be cleared."""
+        firm = FIRMMetric(max_terms=10, cache_size=3)
+        rng = np.random.default_rng(0)
+        for _ in range(5):
+            firm.norm(random_hermitian(rng))
+        
+        assert firm.cache_info().size == 3
+        firm.clear_cache()
+        assert firm.cache_info().size == 0
+        
+        with pytest.raises(ValueError):
+            FIRMMetric(cache_size=-1)
+    
+    def test_grace_iterates_shared_and_read_only(self):
+        """Test cached Grace iterates are reused and protected from mutation."""
+        firm = FIRMMetric(max_terms=10, cache_size=16)
+        iterates = firm.grace_iterates(self.A, 3)
+        
+        assert len(iterates) == 3
+        np.testing.assert_allclose(iterates[2], firm.grace.apply_n_times(self.A, 2))
+        assert not iterates[1].flags.writeable
+        assert firm.grace_iterates(self.A, 2)[1] is iterates[1]
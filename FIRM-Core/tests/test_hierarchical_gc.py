@@ -185,6 +185,60 @@ class TestMetaMonad:
         assert 'systemic_drift' in result
         assert 'survivor_count' in result
 
+    def test_incremental_accounting_refreshes_only_dirty_members(self):
+        """Only changed sub-monads are re-evaluated and aggregates stay exact."""
+        structures = [
+            build_test_graph_single('Z', (0, 8)),
+            build_test_graph_triangle(),
+            build_test_graph_chain([('Z', (0, 1)), ('X', (1, 2))])
+        ]
+        sub_monads = [SubMonad(s, derive_omega_signature(s), FieldRegime.VACUUM) for s in structures]
+        meta_monad = MetaMonad(list(sub_monads), derive_omega_signature(structures[1]),
+                               FieldRegime.VACUUM)
+        assert meta_monad.coherence_accounting['members_refreshed'] == 3
+
+        # Unchanged members cost nothing on refresh
+        meta_monad._update_coherence_accounting()
+        assert meta_monad.coherence_accounting['members_refreshed'] == 0
+
+        # Replace one structure and drop another member
+        sub_monads[0].structure = build_test_graph_chain([('X', (1, 8)), ('Z', (3, 8))])
+        meta_monad.sub_monads = sub_monads[:2]
+        meta_monad._update_coherence_accounting()
+        assert meta_monad.coherence_accounting['members_refreshed'] == 1
+
+        coherences = [compute_coherence(sm.structure) for sm in sub_monads[:2]]
+        resonances = [compute_resonance_alignment(sm.structure, meta_monad.shared_omega)
+                      for sm in sub_monads[:2]]
+        mean_c = sum(coherences) / 2
+        std_c = math.sqrt(sum((c - mean_c) ** 2 for c in coherences) / 2)
+
+        accounting = meta_monad.coherence_accounting
+        assert abs(accounting['ensemble_coherence'] - mean_c) < 1e-12
+        assert abs(accounting['ensemble_resonance'] - sum(resonances) / 2) < 1e-12
+        assert abs(accounting['coherence_variance'] - std_c) < 1e-12
+        assert accounting['sub_monad_count'] == 2
+
+    def test_accounting_keyed_by_stable_member_id(self):
+        """Members are tracked by member_id, and organized ensembles account for joiners."""
+        structure = build_test_graph_triangle()
+        omega = derive_omega_signature(structure)
+        first = SubMonad(structure, omega, FieldRegime.VACUUM)
+        second = SubMonad(structure, omega, FieldRegime.VACUUM)
+        assert first.member_id != second.member_id
+
+        meta_monad = MetaMonad([first], omega, FieldRegime.VACUUM)
+        meta_monad.sub_monads = [second]
+        meta_monad._update_coherence_accounting()
+        assert set(meta_monad._members) == {second.member_id}
+
+        system = SovereignMonadGC()
+        for _ in range(3):
+            system.add_sub_monad(build_test_graph_triangle(), FieldRegime.VACUUM)
+        system.organize_meta_monads(resonance_threshold=1.0)
+        for meta_monad in system.meta_monads:
+            assert meta_monad.coherence_accounting['sub_monad_count'] == len(meta_monad.sub_monads)
+
 
 class TestHarvestLayer:
     """Test harvest layer Ω-compression."""
@@ -418,6 +472,60 @@ class TestSovereignMonadGC:
         assert meta_band[1] <= harvest_band[0]  # Meta max <= Harvest min
 
 
+class TestSGCModeScheduler:
+    """Test the cost-aware mode scheduler and its shared metrics context."""
+
+    def test_context_memoizes_metrics(self):
+        """Coherence and resonance are evaluated once per structure."""
+        from FIRM_dsl.sgc_modes import SGCModeScheduler
+
+        structure = build_test_graph_triangle()
+        omega = derive_omega_signature(structure)
+        scheduler = SGCModeScheduler()
+        ctx = scheduler.context(structure)
+
+        assert ctx.coherence() == compute_coherence(structure)
+        assert ctx.resonance(omega) == compute_resonance_alignment(structure, omega)
+        ctx.coherence()
+        ctx.resonance(omega)
+
+        assert scheduler.metric_counter.misses == 2
+        assert scheduler.metric_counter.hits == 2
+
+    def test_skipped_modes_match_executed_failures(self):
+        """Prechecked modes report the same failure the mode itself would."""
+        from FIRM_dsl.sgc_modes import SGCMode, SGCModeSystem, SGCModeScheduler
+
+        structure = build_test_graph_triangle()  # No leaves, one component
+        omega = derive_omega_signature(structure)
+        mode_system = SGCModeSystem()
+        scheduler = SGCModeScheduler(mode_system)
+        ctx = scheduler.context(structure)
+
+        for mode in (SGCMode.RESONANT_ASSIMILATION, SGCMode.BOUNDARY_PRUNING,
+                     SGCMode.TRANSMUTATIVE_MEDIATION, SGCMode.GLOBAL_RESYNCHRONIZATION):
+            skipped = scheduler.run(mode, ctx, omega, FieldRegime.VACUUM)
+            direct = mode_system.execute_mode(mode, structure, omega, FieldRegime.VACUUM)
+            assert skipped.metrics.get('skipped') is True
+            assert not skipped.success and not direct.success
+            assert skipped.metrics['reason'] == direct.metrics['reason']
+            assert scheduler.mode_stats[mode].skipped == 1
+
+    def test_cycle_records_mode_statistics(self):
+        """A complete GC cycle exposes per-mode timing and hit rates."""
+        structures = [
+            build_test_graph_triangle(),
+            build_test_graph_chain([('Z', (0, 1)), ('X', (1, 2)), ('Z', (1, 4))])
+        ]
+        system = create_gc_hierarchy_from_structures(structures)
+        system.perform_complete_gc_cycle()
+
+        summary = system.get_system_metrics()['mode_scheduler']
+        assert summary['metric_evaluations'] > 0
+        assert 0.0 < summary['metric_hit_rate'] <= 1.0
+        assert summary['modes']['reflective_rewriting']['executed'] == len(structures)
+
+
 class TestFactoryFunctions:
     """Test factory function creation."""
 
@@ -0,0 +1,163 @@
+"""Analytic exp(H)/Z Fisher metric and batched curvature checks.
+
+The analytic Daleckii–Krein derivatives are compared with the finite-difference
+path; curvature is checked on the round sphere and against the single-state API.
+"""
+import numpy as np
+import pytest
+import scipy.linalg as la
+
+from FIRM_dsl.information_geometry import (
+    FisherInformationMetric,
+    ProbabilityState,
+    RiemannianCurvature,
+)
+
+ANALYTIC = FisherInformationMetric()
+NUMERIC = FisherInformationMetric(analytic=False)
+
+
+def make_state(metric, theta, n):
+    rho = metric._rho_from_parameters(theta, n)
+    return ProbabilityState(density_matrix=rho, parameters=theta, name="ρ(θ)")
+
+
+@pytest.mark.parametrize("n,d", [(2, 3), (3, 8), (2, 6)])
+@pytest.mark.parametrize("use_bures", [True, False])
+def test_analytic_metric_matches_finite_differences(n, d, use_bures):
+    theta = 0.5 * np.random.default_rng(11).standard_normal(d)
+    state = make_state(ANALYTIC, theta, n)
+
+    g = ANALYTIC.compute_metric(state, use_bures=use_bures).metric_matrix
+    g_fd = NUMERIC.compute_metric(state, use_bures=use_bures).metric_matrix
+
+    np.testing.assert_allclose(g, g_fd, rtol=1e-6, atol=1e-6 * np.abs(g_fd).max())
+
+
+def test_sld_metric_matches_sylvester_solution():
+    # g_ij = ½ Re Tr(∂_i ρ L_j) with ρL + Lρ = 2∂ρ
+    n, d = 3, 8
+    theta = 0.4 * np.random.default_rng(11).standard_normal(d)
+    state = make_state(ANALYTIC, theta, n)
+
+    eps = 1e-6
+    partials = []
+    for i in range(d):
+        step = np.zeros(d)
+        step[i] = eps
+        partials.append((ANALYTIC._rho_from_parameters(theta + step, n)
+                         - ANALYTIC._rho_from_parameters(theta - step, n)) / (2 * eps))
+    rho = state.density_matrix
+    L = [la.solve_sylvester(rho / 2, rho / 2, D) for D in partials]
+    expected = np.array([[0.5 * np.trace(partials[i] @ L[j]).real for j in range(d)]
+                         for i in range(d)])
+
+    g = ANALYTIC.compute_metric(state, sld=True).metric_matrix
+    g_fd = NUMERIC.compute_metric(state, sld=True).metric_matrix
+
+    np.testing.assert_allclose(g, expected, rtol=1e-6, atol=1e-8)
+    np.testing.assert_allclose(g_fd, expected, rtol=1e-5, atol=1e-7)
+
+
+def test_metric_batch_matches_single_points():
+    n, d = 2, 3
+    thetas = 0.5 * np.random.default_rng(11).standard_normal((4, d))
+    batch = ANALYTIC.compute_metric_batch(thetas, n)
+
+    assert batch.shape == (4, d, d)
+    for t, g in zip(thetas, batch):
+        single = ANALYTIC.compute_metric(make_state(ANALYTIC, t, n))
+        np.testing.assert_allclose(g, single.metric_matrix, atol=1e-12)
+
+    assert ANALYTIC.compute_metric_batch(thetas[0], n).shape == (d, d)
+
+
+def test_state_off_manifold_matches_numerical_path():
+    theta = 0.3 * np.random.default_rng(11).standard_normal(3)
+    rho = np.diag([0.7, 0.3]).astype(complex)
+    state = ProbabilityState(density_matrix=rho, parameters=theta, name="off")
+
+    for use_bures in (True, False):
+        g = ANALYTIC.compute_metric(state, use_bures=use_bures).metric_matrix
+        g_fd = NUMERIC.compute_metric(state, use_bures=use_bures).metric_matrix
+        np.testing.assert_allclose(g, g_fd, rtol=1e-6, atol=1e-8)
+
+
+def test_overridden_parameterization_uses_finite_differences():
+    class Diagonal(FisherInformationMetric):
+        def _rho_from_parameters(self, theta, n):
+            w = np.exp(np.resize(theta, n))
+            return np.diag(w / w.sum()).astype(complex)
+
+    metric = Diagonal()
+    assert not metric.uses_analytic_derivatives
+    assert ANALYTIC.uses_analytic_derivatives
+    assert not NUMERIC.uses_analytic_derivatives
+
+    g = metric.compute_metric(make_state(metric, np.array([0.2, -0.1]), 2)).metric_matrix
+    assert g.shape == (2, 2)
+    assert np.all(np.isfinite(g))
+
+
+class RoundSphereMetric(FisherInformationMetric):
+    """Metric of the unit sphere S^d in hyperspherical coordinates (K = 1)."""
+
+    def compute_metric_batch(self, thetas, n, use_bures=True, sld=False):
+        thetas = np.atleast_2d(thetas)
+        m, d = thetas.shape
+        scale = np.cumprod(np.concatenate([np.ones((m, 1)), np.sin(thetas[:, :-1])**2], axis=1),
+                           axis=1)
+        g = np.zeros((m, d, d))
+        g[:, np.arange(d), np.arange(d)] = scale
+        return g
+
+
+@pytest.mark.parametrize("d", [2, 3])
+def test_round_sphere_curvature(d):
+    # S^d: unit sectional curvature, R = d(d-1)
+    curvature = RiemannianCurvature(RoundSphereMetric(), epsilon=1e-4)
+    thetas = np.array([[0.7, 0.3, 0.2], [1.1, 0.9, 0.4]])[:, :d]
+
+    results = curvature.compute_curvature_batch(thetas, n=2, apply_grace_regulation=False)
+    for result in results:
+        np.testing.assert_allclose(result.sectional_curvatures, 1.0, atol=1e-5)
+        assert result.ricci_scalar == pytest.approx(d * (d - 1), abs=1e-5)
+
+    scalars = curvature.scalar_curvature_map(thetas, n=2, apply_grace_regulation=False)
+    np.testing.assert_allclose(scalars, [r.ricci_scalar for r in results], rtol=1e-12)
+
+
+def test_single_state_curvature_matches_batch():
+    fisher = FisherInformationMetric()
+    curvature = RiemannianCurvature(fisher, epsilon=1e-4)
+    theta = np.array([0.4, -0.2, 0.3])
+    result = curvature.compute_curvature(make_state(fisher, theta, 3))
+    batch = curvature.compute_curvature_batch(theta[None], n=3)[0]
+
+    np.testing.assert_allclose(result.riemann_tensor, batch.riemann_tensor, atol=1e-12)
+    assert result.ricci_scalar != 0.0
+
+
+def test_curvature_grid_reuses_cached_samples():
+    curvature = RiemannianCurvature(FisherInformationMetric(), epsilon=1e-4)
+    axis = 0.1 + np.arange(6) * 1e-4
+    grid = np.stack(list(np.meshgrid(axis, axis, indexing="ij")) + [np.full((6, 6), 0.2)], axis=-1)
+
+    scalars = curvature.scalar_curvature_map(grid, n=2)
+    assert scalars.shape == (6, 6)
+    # Neighbouring stencils share sample points, each evaluated once
+    assert curvature.cache_misses < grid[..., 0].size * (1 + 2 * 3**2) // 3
+
+    misses = curvature.cache_misses
+    again = curvature.scalar_curvature_map(grid, n=2)
+    assert curvature.cache_misses == misses
+    np.testing.assert_array_equal(again, scalars)
+
+
+def test_curvature_process_pool_matches_serial():
+    thetas = 0.4 * np.random.default_rng(2).standard_normal((6, 3))
+    serial = RiemannianCurvature(FisherInformationMetric())
+    parallel = RiemannianCurvature(FisherInformationMetric(), workers=2, parallel_threshold=10)
+
+    np.testing.assert_allclose(parallel.scalar_curvature_map(thetas, n=2),
+                               serial.scalar_curvature_map(thetas, n=2), atol=1e-12)
@@ -146,6 +146,58 @@ class TestCliffordAlgebra:
         # Bivector part should be e₁e₂
         assert abs(geom_prod[4] - 1.0) < 1e-10
 
+    
+    def test_basis_product_table(self):
+        """Test blade products from the precomputed table."""
+        cl = CliffordAlgebra(dimension=3)
+        e = np.eye(8)
+        
+        # e₂e₁ = -e₁e₂, e₁e₁ = 1, I² = -1 in Cl(3,0)
+        assert np.allclose(cl.geometric_product(e[2], e[1]), -e[4])
+        assert np.allclose(cl.geometric_product(e[1], e[1]), e[0])
+        I = cl.pseudoscalar()
+        assert np.allclose(cl.geometric_product(I, I), -e[0])
+    
+    def test_geometric_product_associative_batched(self):
+        """Test associativity over batches of multivectors in Cl(1,3)."""
+        cl = CliffordAlgebra(dimension=4, signature=(1, 3))
+        rng = np.random.default_rng(0)
+        A, B, C = rng.standard_normal((3, 20, 16))
+        
+        left = cl.geometric_product(cl.geometric_product(A, B), C)
+        right = cl.geometric_product(A, cl.geometric_product(B, C))
+        
+        assert left.shape == (20, 16)
+        assert np.allclose(left, right)
+    
+    def test_signature_metric(self):
+        """Test vectors square to their metric signature."""
+        cl = CliffordAlgebra(dimension=4, signature=(1, 3))
+        v = np.array([2.0, 1.0, 0.0, 0.0])
+        
+        square = cl.geometric_product(v, v)
+        assert abs(square[0] - 3.0) < 1e-12
+        assert np.allclose(square[1:], 0.0)
+        assert abs(cl.scalar_product(v, v) - 3.0) < 1e-12
+        assert abs(cl.inner_product(v, v) - 5.0) < 1e-12
+        
+        with pytest.raises(ValueError):
+            CliffordAlgebra(dimension=3, signature=(1, 3))
+    
+    def test_outer_and_inner_products(self):
+        """Test outer product is the antisymmetric part and contraction lowers grade."""
+        cl = CliffordAlgebra(dimension=3)
+        rng = np.random.default_rng(1)
+        v, w = rng.standard_normal((2, 5, 3))
+        
+        anti = 0.5 * (cl.geometric_product(v, w) - cl.geometric_product(w, v))
+        assert np.allclose(cl.outer_product(v, w), anti)
+        
+        e = np.eye(8)
+        assert np.allclose(cl.left_contraction(e[1], e[4]), e[2])  # e₁ ⌋ e₁e₂ = e₂
+        assert np.allclose(cl.left_contraction(e[4], e[1]), 0.0)
+        assert np.allclose(cl.scalar_product(e[4], e[4]), -1.0)    # (e₁e₂)² = -1
+
 
 # ============================================================================
 # LOVE OPERATOR TESTS
@@ -170,7 +222,18 @@ class TestLoveOperator:
             
             assert abs(self_love_value - expected) < 1e-10, \
                 f"Self-love {self_love_value} != |v|² {expected}"
-    
+
+    def test_self_love_non_negative_for_multivectors(self):
+        """Test self-love stays |v|² for bivectors and arbitrary-length vectors."""
+        love = LoveOperator()
+
+        bivector = np.zeros(8)
+        bivector[4] = 2.0
+        assert abs(love.self_love(bivector) - 4.0) < 1e-12
+
+        v5 = np.arange(1.0, 6.0)
+        assert abs(love.self_love(v5) - np.dot(v5, v5)) < 1e-12
+
     def test_orthogonal_vectors(self):
         """Test love between orthogonal vectors."""
         love = LoveOperator()
@@ -392,6 +455,20 @@ class TestLoveGraceDynamics:
         # Should get close to attractor
         assert final_distance < 0.5, \
             f"Did not converge: final distance {final_distance}"
+    
+    def test_evolve_trajectory_multivector_field(self):
+        """Test trajectory over a field of multivectors matches per-row evolution."""
+        dynamics = LoveGraceDynamics()
+        rng = np.random.default_rng(2)
+        
+        field = rng.standard_normal((6, 8))
+        a_infinity = np.ones(8) / np.sqrt(8)
+        
+        trajectory = dynamics.evolve_trajectory(field, a_infinity, num_steps=10, dt=0.05)
+        
+        assert trajectory.shape == (11, 6, 8)
+        single = dynamics.evolve_trajectory(field[3], a_infinity, num_steps=10, dt=0.05)
+        assert np.allclose(trajectory[:, 3], single)
 
 
 # ============================================================================
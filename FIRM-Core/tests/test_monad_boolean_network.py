@@ -0,0 +1,73 @@
+"""Sparse Boolean networks: compiled updates, cycle-aware early stopping and attractors."""
+import numpy as np
+import pytest
+
+from monad_listener.src.loaders.boolean_network import BooleanNetwork
+
+
+def dispatch_step(state, functions):
+    # Original per-node dispatch from GraphDynamicsGenerator
+    new_state = np.zeros(len(state), dtype=np.uint8)
+    for node, func in functions.items():
+        values = state[func['inputs']]
+        if func['type'] == 'and':
+            new_state[node] = np.all(values)
+        elif func['type'] == 'or':
+            new_state[node] = np.any(values)
+        elif func['type'] == 'xor':
+            new_state[node] = np.sum(values) % 2
+        else:
+            new_state[node] = np.sum(values) > len(func['inputs']) / 2
+    return new_state
+
+
+def random_functions(rng, n_nodes):
+    functions = {}
+    for node in range(n_nodes):
+        n_inputs = rng.integers(0, 5)
+        functions[node] = {
+            'type': rng.choice(['and', 'or', 'xor', 'majority']),
+            'inputs': rng.choice(n_nodes, n_inputs, replace=False).tolist()
+        }
+    return functions
+
+
+def test_step_matches_per_node_dispatch():
+    rng = np.random.default_rng(4)
+    functions = random_functions(rng, 25)
+    network = BooleanNetwork.from_functions(functions, 25)
+    states = rng.integers(0, 2, (16, 25)).astype(np.uint8)
+
+    expected = np.stack([dispatch_step(s, functions) for s in states])
+    np.testing.assert_array_equal(network.step(states), expected)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_early_stop_reproduces_full_run(seed):
+    rng = np.random.default_rng(seed)
+    network = BooleanNetwork.from_functions(random_functions(rng, 12), 12)
+    initial = rng.integers(0, 2, (8, 12))
+
+    full, _, _ = network.run(initial, 200, stop_on_cycle=False)
+    early, transients, periods = network.run(initial, 200)
+
+    np.testing.assert_array_equal(early, full)
+    assert np.all(periods >= 1)
+    for trajectory, t0, p in zip(full, transients, periods):
+        np.testing.assert_array_equal(trajectory[t0], trajectory[t0 + p])
+
+
+def test_copy_ring_has_period_three():
+    functions = {node: {'type': 'or', 'inputs': [(node - 1) % 3]} for node in range(3)}
+    network = BooleanNetwork.from_functions(functions, 3)
+
+    trajectory, transient, period = network.run(np.array([1, 0, 0]), 10)
+
+    assert (transient, period) == (0, 3)
+    np.testing.assert_array_equal(trajectory[1], [0, 1, 0])
+    np.testing.assert_array_equal(trajectory[9], [1, 0, 0])
+
+
+def test_unknown_function_type():
+    with pytest.raises(ValueError):
+        BooleanNetwork.from_functions({0: {'type': 'nand', 'inputs': [0]}}, 1)
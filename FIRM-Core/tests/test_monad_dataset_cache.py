@@ -0,0 +1,86 @@
+"""Sharded dataset cache: reuse, per-shard seeding and lazy split views."""
+import numpy as np
+import pytest
+
+from monad_listener.src.loaders import dataset_cache
+from monad_listener.src.loaders.dataset_cache import DatasetCache, ShardedDataset
+
+CA_CONFIG = {'rule': 110, 'size': 16, 'steps': 8}
+
+
+def test_reuses_existing_shards(tmp_path, capsys):
+    cache = DatasetCache(cache_dir=str(tmp_path), shard_size=4, workers=1)
+    first = cache.open('ca', 10, **CA_CONFIG)
+    assert "Generating ca dataset: 3/3 shards" in capsys.readouterr().out
+
+    second = cache.open('ca', 10, **CA_CONFIG)
+    assert "Generating" not in capsys.readouterr().out
+    np.testing.assert_array_equal(first['train'].column('trace'), second['train'].column('trace'))
+
+    # A different generator config gets its own shard directory
+    cache.open('ca', 4, **dict(CA_CONFIG, rule=30))
+    assert len(list(tmp_path.glob('ca-*'))) == 2
+
+
+def test_generator_version_bump_rebuilds(tmp_path, monkeypatch, capsys):
+    cache = DatasetCache(cache_dir=str(tmp_path), shard_size=4, workers=1)
+    cache.open('ca', 4, **CA_CONFIG)
+    key = cache.config_hash('ca', CA_CONFIG)
+
+    monkeypatch.setattr(dataset_cache, 'GENERATOR_VERSION', dataset_cache.GENERATOR_VERSION + 1)
+    capsys.readouterr()
+    cache.open('ca', 4, **CA_CONFIG)
+    assert "Generating ca dataset: 1/1 shards" in capsys.readouterr().out
+    assert cache.config_hash('ca', CA_CONFIG) != key
+    assert len(list(tmp_path.glob('ca-*'))) == 2
+
+
+def test_parallel_build_matches_serial(tmp_path):
+    serial = DatasetCache(str(tmp_path / 'serial'), shard_size=4, workers=1).open('ca', 12, **CA_CONFIG)
+    parallel = DatasetCache(str(tmp_path / 'parallel'), shard_size=4, workers=2).open('ca', 12, **CA_CONFIG)
+
+    for split in ('train', 'val', 'test'):
+        np.testing.assert_array_equal(serial[split].column('trace'), parallel[split].column('trace'))
+
+
+def test_serial_build_leaves_global_rng_alone(tmp_path):
+    np.random.seed(1234)
+    expected = np.random.random(3)
+
+    np.random.seed(1234)
+    DatasetCache(str(tmp_path), shard_size=4, workers=1).open('ca', 8, **CA_CONFIG)
+    np.testing.assert_array_equal(np.random.random(3), expected)
+
+
+def test_growing_dataset_keeps_prefix(tmp_path):
+    # Shard i is the same whatever the total sample count
+    cache = DatasetCache(str(tmp_path), shard_size=4, workers=1)
+    small = cache.open('ca', 8, split_ratios=(1.0, 0.0, 0.0), **CA_CONFIG)['train']
+    large = cache.open('ca', 20, split_ratios=(1.0, 0.0, 0.0), **CA_CONFIG)['train']
+
+    assert len(large) == 20
+    np.testing.assert_array_equal(large[:8].column('initial'), small.column('initial'))
+
+
+def test_lazy_views(tmp_path):
+    splits = DatasetCache(str(tmp_path), shard_size=4, workers=1).open('ca', 10, **CA_CONFIG)
+    assert [len(splits[s]) for s in ('train', 'val', 'test')] == [7, 1, 2]
+
+    train = splits['train']
+    sample = train[5]
+    assert sample['type'] == 'ca' and sample['rule'] == 110
+    assert sample['trace'].shape == (9, 16)
+    np.testing.assert_array_equal(sample['trace'][0], sample['initial'])
+
+    view = train[3:6]
+    assert isinstance(view, ShardedDataset) and len(view) == 3
+    np.testing.assert_array_equal(view[-1]['trace'], train[5]['trace'])
+    np.testing.assert_array_equal(view.column('trace'), np.stack([s['trace'] for s in view]))
+
+    with pytest.raises(IndexError):
+        view[3]
+
+
+def test_unknown_domain(tmp_path):
+    with pytest.raises(ValueError):
+        DatasetCache(str(tmp_path), shard_size=4).open('weather', 4)
@@ -0,0 +1,52 @@
+"""Preallocated feature extraction matches the list-based MDL sweep preprocessing."""
+import numpy as np
+
+from monad_listener.src.loaders.features import build_features, feature_dim
+
+
+def samples_for(rng):
+    return {
+        'quantum': [{'circuit': ['H(0)'] * k, 'statevector': rng.standard_normal(16) + 1j}
+                    for k in range(3, 7)],
+        'ca': [{'trace': rng.integers(0, 2, (5, 12))} for _ in range(4)],
+        'pde': [{'field': rng.standard_normal((6, 6))} for _ in range(4)],
+        'spin': [{'trajectory': rng.choice([-1, 1], (3, 4, 4)).astype(np.int8)} for _ in range(4)],
+    }
+
+
+def test_rows_match_list_preprocessing():
+    data = samples_for(np.random.default_rng(0))
+
+    quantum = build_features('quantum', data['quantum'])
+    expected = [[len(s['circuit'])] + np.real(s['statevector'][:8]).tolist() for s in data['quantum']]
+    np.testing.assert_allclose(quantum, np.array(expected, dtype=np.float32))
+
+    ca = build_features('ca', data['ca'])
+    np.testing.assert_array_equal(ca, np.stack([s['trace'][-1] for s in data['ca']]).astype(np.float32))
+
+    pde = build_features('pde', data['pde'])
+    np.testing.assert_allclose(pde, np.stack([s['field'].ravel() for s in data['pde']]).astype(np.float32))
+
+    spin = build_features('spin', data['spin'])
+    expected = [[np.mean(t), np.std(t.flatten()), np.sum(t > 0.5) / t.size]
+                for t in (s['trajectory'] for s in data['spin'])]
+    np.testing.assert_allclose(spin, np.array(expected, dtype=np.float32), rtol=1e-6)
+
+    assert quantum.dtype == np.float32 and feature_dim('ca', data['ca'][0]) == 12
+
+
+def test_memmap_build_is_reused(tmp_path):
+    data = samples_for(np.random.default_rng(1))['pde']
+    path = str(tmp_path / 'features' / 'pde-train.npy')
+
+    first = build_features('pde', data, path)
+    assert isinstance(first, np.memmap)
+    assert [p.name for p in (tmp_path / 'features').iterdir()] == ['pde-train.npy']
+
+    second = build_features('pde', [{'field': np.zeros((6, 6))}] * 4, path)
+    np.testing.assert_array_equal(second, first)
+
+    # A file of the wrong width is rebuilt rather than served
+    wider = build_features('pde', [{'field': np.ones((7, 7))}] * 4, path)
+    assert wider.shape == (4, 49)
+    np.testing.assert_array_equal(wider, 1.0)
@@ -0,0 +1,88 @@
+"""Columnar measurement functor agrees with the per-object MonadListenerPure path."""
+import numpy as np
+import pytest
+
+from monad_listener.src.models.monad_listener_pure import (
+    COLUMN_CATEGORIES, RULE_LETTERS, MonadListenerPure,
+)
+
+LETTER_SETS = [[], ['ת'], ['ש', 'פ'], ['ר', 'צ', 'ל'], ['ק', 'ע', 'מ', 'ס'],
+               ['א', 'ו', 'י', 'ח', 'ט'], ['ב', 'ג', 'ה', 'ז', 'כ', 'ד', 'נ']]
+
+
+def morphic_objects(rng):
+    objects = [{'payload': {'components': rng.standard_normal(k).tolist()}} for k in (16, 16, 12, 4, 1)]
+    return objects + [{}, {'payload': {'components': []}}, {'shape': 'no payload'}]
+
+
+def listener_with(symbols):
+    listener = MonadListenerPure()
+    listener.evolution_state = {'emergent_letters': [{'symbol': s} for s in symbols],
+                                'recursive_depth': 2, 'sovereign_triads': 1}
+    return listener
+
+
+@pytest.mark.parametrize('symbols', LETTER_SETS)
+def test_batch_decodes_to_scalar_functor(symbols):
+    listener = listener_with(symbols)
+    objects = morphic_objects(np.random.default_rng(0))
+
+    columns = listener.measurement_functor_batch(objects)
+    assert set(columns) == set(listener.measurement_functor(objects[0]))
+
+    for i, obj in enumerate(objects):
+        assert listener.decode_columns(columns, i) == listener.measurement_functor(obj)
+
+
+@pytest.mark.parametrize('symbols,expected', [
+    ([], {'morphic_type_signature': 'general_morphism', 'zx_phase_group': 'identity_group',
+          'recursive_depth_metric': {'base': 'shallow', 'mid': 'shallow', 'apex': 'shallow'},
+          'emergence_index': 0.2}),
+    (['ש', 'פ'], {'spinor_projection': 'trivector_spinor', 'dynamical_system_role': 'strange_attractor',
+                  'recursive_depth_metric': {'base': 'deep', 'mid': 'intermediate', 'apex': 'advanced'},
+                  'emergence_index': 0.8}),
+    (['ג', 'ה'], {'morphic_type_signature': 'epimorphism', 'topos_mapping': 'presheaf_category'}),
+    (['ר', 'צ', 'ל'], {'tensor_rank_type': '(1,1,1)_tensor', 'fourier_domain_signature': 'delta_function',
+                       'causal_cone_depth': 'base_layer', 'fractal_attractor_role': 'strange_attractor'}),
+])
+def test_scalar_columns_follow_first_matching_letter(symbols, expected):
+    columns = listener_with(symbols).measurement_functor({'payload': {'components': [0.5] * 16}})
+    for name, value in expected.items():
+        assert columns[name] == value
+
+
+def test_final_structure_invariants_match_scalar():
+    listener = listener_with(['ת'])
+    objects = morphic_objects(np.random.default_rng(1))
+    final = listener.compute_final_structure_batch(listener.morphic_batch(objects))
+
+    for i, obj in enumerate(objects):
+        expected = listener.compute_final_coalgebra_structure(obj)
+        assert final['valid'][i] == bool(expected)
+        numeric = {**expected.get('morphic_invariants', {}),
+                   **{k: v for k, v in expected.items() if k.endswith('_invariant')}}
+        for key, value in numeric.items():
+            assert final[key][i] == pytest.approx(value)
+
+
+def test_per_object_letter_presence():
+    listener = MonadListenerPure()
+    objects = morphic_objects(np.random.default_rng(2))[:len(LETTER_SETS)]
+    letters = np.array([[l in symbols for l in RULE_LETTERS] for symbols in LETTER_SETS])
+
+    columns = listener.measurement_functor_batch(objects, letters)
+    for i, symbols in enumerate(LETTER_SETS):
+        assert listener_with(symbols).decode_columns(columns, i) == \
+            listener_with(symbols).measurement_functor(objects[i])
+
+
+def test_categorical_columns_are_int8_codes():
+    listener = listener_with(['ש'])
+    columns = listener.measurement_functor_batch([{'payload': {'components': [1.0]}}, {}])
+
+    for name in COLUMN_CATEGORIES:
+        assert columns[name].dtype == np.int8
+        # -1 marks objects without a payload
+        assert columns[name][1] == -1
+    assert COLUMN_CATEGORIES['computational_complexity_class'][columns['computational_complexity_class'][0]] == 'NP'
+    assert columns['emergence_index'][0] == 0.8 and np.isnan(columns['emergence_index'][1])
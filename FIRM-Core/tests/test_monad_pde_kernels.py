@@ -0,0 +1,72 @@
+"""Batched PDE stencil kernels match the np.roll updates and padded Dirichlet stencils."""
+import numpy as np
+import pytest
+
+from monad_listener.src.loaders.pde_kernels import (
+    KERNELS,
+    central_difference,
+    laplacian,
+    neighbour_sum,
+    snapshot_times,
+)
+
+
+def roll_step(equation, field):
+    # Original np.roll updates from PDEFieldGenerator, batched over axis 0
+    if equation == "wave":
+        field = np.roll(field, 1, axis=1) * 0.99 + np.roll(field, -1, axis=1) * 0.99
+        return np.roll(field, 1, axis=2) * 0.99 + np.roll(field, -1, axis=2) * 0.99
+    if equation == "burgers":
+        return field - 0.1 * field * (np.roll(field, -1, axis=1) - np.roll(field, 1, axis=1))
+    lap = (np.roll(field, 1, axis=1) + np.roll(field, -1, axis=1) +
+           np.roll(field, 1, axis=2) + np.roll(field, -1, axis=2) - 4 * field)
+    field = field + 0.01 * (0.1 * lap - field * (1 - field) * (field - 0.3))
+    return np.clip(field, 0, 1)
+
+
+@pytest.mark.parametrize("equation", ["wave", "burgers", "gray_scott"])
+def test_periodic_kernels_match_roll_updates(equation):
+    rng = np.random.default_rng(0)
+    field = rng.uniform(0.4, 0.6, (3, 12, 10))
+    expected = [field.copy()]
+    for _ in range(12):
+        expected.append(roll_step(equation, expected[-1]))
+
+    kernel = KERNELS[equation](field.shape)
+    snapshots = kernel.run(field, 12, snapshot_every=4)
+
+    np.testing.assert_allclose(snapshots, np.stack(expected[::4], axis=1), rtol=1e-12)
+    # The field is advanced in place
+    np.testing.assert_allclose(field, expected[-1], rtol=1e-12)
+
+
+def test_dirichlet_stencils_use_ghost_value():
+    rng = np.random.default_rng(1)
+    field = rng.standard_normal((2, 6, 5))
+    padded = np.pad(field, ((0, 0), (1, 1), (1, 1)), constant_values=0.5)
+    out, scratch = np.empty_like(field), np.empty_like(field)
+
+    expected_sum = padded[:, :-2, 1:-1] + padded[:, 2:, 1:-1]
+    expected_diff = padded[:, 1:-1, 2:] - padded[:, 1:-1, :-2]
+    expected_lap = (expected_sum + padded[:, 1:-1, :-2] + padded[:, 1:-1, 2:] - 4 * field)
+
+    np.testing.assert_allclose(neighbour_sum(field, 1, out, 'dirichlet', 0.5), expected_sum)
+    np.testing.assert_allclose(central_difference(field, 2, out, 'dirichlet', 0.5), expected_diff)
+    np.testing.assert_allclose(laplacian(field, out, scratch, 'dirichlet', 0.5), expected_lap)
+
+
+def test_snapshot_times_include_first_and_last_step():
+    np.testing.assert_array_equal(snapshot_times(10), [10])
+    np.testing.assert_array_equal(snapshot_times(10, 5), [0, 5, 10])
+    np.testing.assert_array_equal(snapshot_times(10, 4), [0, 4, 8, 10])
+    with pytest.raises(ValueError):
+        snapshot_times(10, 0)
+
+
+def test_rejects_unknown_boundary_and_mismatched_field():
+    with pytest.raises(ValueError):
+        KERNELS["wave"]((1, 8, 8), boundary="neumann")
+
+    kernel = KERNELS["burgers"]((2, 8, 8))
+    with pytest.raises(ValueError):
+        kernel.run(np.zeros((3, 8, 8)), 1)
@@ -0,0 +1,99 @@
+"""Vectorized Ising sampler: exact small-lattice averages, sublattices and per-chain seeding."""
+import numpy as np
+import pytest
+
+from monad_listener.src.loaders.dataset_generators import SpinLatticeGenerator
+from monad_listener.src.loaders.spin_sampler import (
+    IsingSampler,
+    acceptance_table,
+    checkerboard_masks,
+    ising_energy,
+    spawn_generators,
+)
+
+
+def exact_averages(lattice_size, beta):
+    # Energy and |magnetization| per site by enumerating all configurations
+    n_sites = lattice_size ** 2
+    codes = np.arange(2 ** n_sites)[:, None]
+    states = (((codes >> np.arange(n_sites)) & 1) * 2 - 1).reshape(-1, lattice_size, lattice_size)
+    energy = ising_energy(states)
+    weights = np.exp(-beta * (energy - energy.min()))
+    weights /= weights.sum()
+    magnetization = np.abs(states.sum(axis=(1, 2)))
+    return (weights @ energy) / n_sites, (weights @ magnetization) / n_sites
+
+
+@pytest.mark.parametrize("algorithm,lattice_size", [
+    ("checkerboard", 4),
+    ("checkerboard", 3),
+    ("wolff", 4),
+])
+def test_matches_exact_boltzmann_averages(algorithm, lattice_size):
+    beta = 0.35
+    n_sites = lattice_size ** 2
+    sampler = IsingSampler(lattice_size, beta=beta, algorithm=algorithm)
+    rngs = spawn_generators(7, 200)
+
+    trajectory = sampler.run(sampler.random_spins(rngs), 300, rngs=rngs)[:, 50:]
+    energy = ising_energy(trajectory).mean() / n_sites
+    magnetization = np.abs(trajectory.sum(axis=(2, 3))).mean() / n_sites
+
+    exact_energy, exact_magnetization = exact_averages(lattice_size, beta)
+    assert energy == pytest.approx(exact_energy, abs=0.02)
+    assert magnetization == pytest.approx(exact_magnetization, abs=0.02)
+
+
+def test_acceptance_table():
+    # Flips that lower the energy are always accepted
+    table = acceptance_table(0.5)
+    np.testing.assert_allclose(table, [1.0, 1.0, 1.0, np.exp(-2.0), np.exp(-4.0)])
+
+
+def test_checkerboard_masks():
+    red, black = checkerboard_masks(6)
+    assert not np.any(red & black) and np.all(red | black)
+    assert not np.any(red & np.roll(red, 1, axis=0))
+    assert not np.any(red & np.roll(red, 1, axis=1))
+
+    with pytest.raises(ValueError):
+        checkerboard_masks(5)
+
+
+@pytest.mark.parametrize("lattice_size", [1, 5])
+def test_odd_lattice_falls_back_to_sequential_sweep(lattice_size):
+    sampler = IsingSampler(lattice_size, beta=0.44)
+    assert sampler.masks is None
+
+    trajectory = sampler.run(sampler.random_spins(spawn_generators(0, 3)), 5, seed=1)
+    assert trajectory.shape == (3, 6, lattice_size, lattice_size)
+    assert set(np.unique(trajectory)) <= {-1, 1}
+
+    samples = SpinLatticeGenerator(lattice_size=lattice_size, steps=3)._generate_samples(2)
+    assert samples[0]['trajectory'].shape == (4, lattice_size, lattice_size)
+
+
+def test_trajectory_layout_and_seeding():
+    sampler = IsingSampler(8, beta=0.44)
+    spins = sampler.random_spins(spawn_generators(0, 3))
+    before = spins.copy()
+
+    trajectory = sampler.run(spins, 10, seed=11)
+    assert trajectory.shape == (3, 11, 8, 8) and trajectory.dtype == np.int8
+    np.testing.assert_array_equal(spins, before)
+    np.testing.assert_array_equal(trajectory[:, 0], spins)
+    assert set(np.unique(trajectory)) <= {-1, 1}
+
+    # Chain 1 evolved alone with its own generator gives the same path
+    rngs = spawn_generators(11, 3)
+    alone = sampler.run(spins[1], 10, rngs=rngs[1:2])
+    np.testing.assert_array_equal(alone, trajectory[1])
+
+
+def test_wolff_flips_whole_cluster_at_zero_temperature_limit():
+    # p_add = 1 flips the entire aligned domain
+    sampler = IsingSampler(6, beta=50.0, algorithm="wolff")
+    spins = np.ones((2, 6, 6), dtype=np.int8)
+
+    trajectory = sampler.run(spins, 1, seed=3)
+    np.testing.assert_array_equal(trajectory[:, 1], -spins)
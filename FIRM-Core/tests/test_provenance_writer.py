@@ -0,0 +1,123 @@
+"""
+Tests for the provenance bundle store: atomic writes, batch commit, index.
+"""
+
+import json
+import os
+import struct
+
+import pytest
+
+from FIRM_dsl.blake3_vendor import create_test_blake3_function
+from FIRM_dsl.provenance import RunLedger
+from FIRM_dsl.provenance_writer import INDEX_FILENAME, ProvenanceBundleWriter
+
+
+def make_bundle(tick, length=8):
+    ledger = RunLedger(
+        axioms_hash="STORE_TEST", graph_seed="SEED", version_hash="VER",
+        machine_fingerprint="CI_CANONICAL", compile_time="2025-01-01T00:00:00Z",
+        render_tick=tick, tau_distribution=[1.0, 1.5], active_macros=["FIRM_TEST"]
+    )
+    data = {
+        "run_ledger": ledger,
+        "tau_trace": [0.25 * i for i in range(length)],
+        "coherence_variation": [0.5 + 0.01 * i for i in range(length)],
+    }
+    return data, ledger
+
+
+def test_default_layout_unchanged(tmp_path):
+    writer = ProvenanceBundleWriter(str(tmp_path), create_test_blake3_function())
+    data, ledger = make_bundle(0, length=3)
+    result = writer.write_bundle_to_filesystem(data, ledger)
+
+    assert result["files_written"] == ["run.json", "tau_trace.json", "C_variation.csv", "manifest.json"]
+    with open(os.path.join(result["bundle_path"], "tau_trace.json")) as f:
+        assert json.load(f) == data["tau_trace"]
+    with open(os.path.join(result["bundle_path"], "C_variation.csv")) as f:
+        assert f.read() == "tick,coherence\n0,0.5\n1,0.51\n2,0.52\n"
+    # No temporary files survive the commit
+    assert not [n for n in os.listdir(result["bundle_path"]) if n.endswith(".tmp")]
+
+
+def test_batch_commit_indexes_every_bundle(tmp_path):
+    hash_fn = create_test_blake3_function()
+    writer = ProvenanceBundleWriter(str(tmp_path), hash_fn, trace_format="ndjson")
+    results = writer.write_bundles([make_bundle(tick) for tick in range(5)])
+
+    with open(tmp_path / INDEX_FILENAME) as f:
+        assert len(f.readlines()) == 5
+
+    # A fresh writer sees the same bundles through the index
+    reader = ProvenanceBundleWriter(str(tmp_path), hash_fn)
+    for result in results:
+        entry = reader.lookup_bundle(result["bundle_hash"])
+        assert entry["bundle_path"] == result["bundle_path"]
+        integrity = reader.verify_bundle_integrity(result["bundle_path"], result["bundle_hash"], deep=True)
+        assert integrity["integrity_valid"] is True
+        assert integrity["index_hit"] is True
+    assert reader.lookup_bundle("TEST-missing") is None
+
+
+def test_binary_traces_round_trip(tmp_path):
+    writer = ProvenanceBundleWriter(str(tmp_path), create_test_blake3_function(), trace_format="f64")
+    data, ledger = make_bundle(1)
+    result = writer.write_bundle_to_filesystem(data, ledger)
+
+    with open(os.path.join(result["bundle_path"], "tau_trace.f64"), "rb") as f:
+        raw = f.read()
+    assert list(struct.unpack(f"<{len(raw) // 8}d", raw)) == data["tau_trace"]
+
+
+def test_deep_verification_detects_tampering(tmp_path):
+    writer = ProvenanceBundleWriter(str(tmp_path), create_test_blake3_function())
+    data, ledger = make_bundle(2)
+    result = writer.write_bundle_to_filesystem(data, ledger)
+
+    with open(os.path.join(result["bundle_path"], "tau_trace.json"), "w") as f:
+        json.dump([0.0] * 8, f)
+
+    shallow = writer.verify_bundle_integrity(result["bundle_path"], result["bundle_hash"])
+    deep = writer.verify_bundle_integrity(result["bundle_path"], result["bundle_hash"], deep=True)
+    assert shallow["integrity_valid"] is True
+    assert deep["integrity_valid"] is False
+
+
+def test_failed_batch_leaves_nothing_behind(tmp_path):
+    writer = ProvenanceBundleWriter(str(tmp_path), create_test_blake3_function())
+    bad = ({"run_ledger": make_bundle(9)[1]}, make_bundle(9)[1])
+
+    with pytest.raises(ValueError):
+        writer.write_bundles([make_bundle(3), bad])
+
+    assert not os.path.exists(tmp_path / INDEX_FILENAME)
+    assert os.listdir(tmp_path) == []  # no files and no directories created by the batch
+
+
+def test_same_size_manifest_tampering_detected(tmp_path):
+    writer = ProvenanceBundleWriter(str(tmp_path), create_test_blake3_function())
+    data, ledger = make_bundle(4)
+    result = writer.write_bundle_to_filesystem(data, ledger)
+
+    manifest_path = os.path.join(result["bundle_path"], "manifest.json")
+    with open(manifest_path) as f:
+        text = f.read()
+    with open(manifest_path, "w") as f:
+        f.write(text.replace(result["bundle_hash"], "0" * len(result["bundle_hash"]), 1))
+
+    integrity = writer.verify_bundle_integrity(result["bundle_path"], result["bundle_hash"])
+    assert integrity["index_hit"] is True
+    assert integrity["manifest_hash_matches"] is False
+    assert integrity["integrity_valid"] is False
+
+
+def test_repeated_bundle_in_batch_written_once(tmp_path):
+    writer = ProvenanceBundleWriter(str(tmp_path), create_test_blake3_function())
+    results = writer.write_bundles([make_bundle(5), make_bundle(6), make_bundle(5)])
+
+    assert results[0]["bundle_path"] == results[2]["bundle_path"]
+    with open(tmp_path / INDEX_FILENAME) as f:
+        assert len(f.readlines()) == 2
+    integrity = writer.verify_bundle_integrity(results[2]["bundle_path"], results[2]["bundle_hash"], deep=True)
+    assert integrity["integrity_valid"] is True
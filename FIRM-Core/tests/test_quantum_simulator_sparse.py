@@ -0,0 +1,75 @@
+"""Sparse ring+cross operator: dense equivalence, momentum sectors, Lanczos and the NumPy backend."""
+import numpy as np
+import pytest
+
+from quantum_simulator import (
+    QISKIT_AVAILABLE, RingCrossQuantumSimulator, SparseRingCrossSimulator, finite_size_scaling,
+    ring_cross_adjacency, simplified_numpy_simulation, translation_period,
+)
+
+
+def dense_adjacency(N, frequency=5):
+    adj = np.zeros((N, N))
+    for i in range(N):
+        adj[i, (i + 1) % N] = adj[(i + 1) % N, i] = 1
+    for i in range(0, N, frequency):
+        j = (i + N // 2) % N
+        adj[i, j] = adj[j, i] = 1
+    return adj
+
+
+@pytest.mark.parametrize('N', [1, 2, 3, 10, 21, 37, 100])
+def test_adjacency_matches_dense(N):
+    # Duplicate and coinciding edges are counted once
+    np.testing.assert_array_equal(ring_cross_adjacency(N).toarray(), dense_adjacency(N))
+
+
+@pytest.mark.parametrize('N,frequency,period', [(100, 5, 5), (100, 2, 2), (21, 5, 21), (60, 1, 1)])
+def test_translation_period_leaves_hamiltonian_invariant(N, frequency, period):
+    assert translation_period(N, frequency) == period
+
+    H = SparseRingCrossSimulator(N, frequency).hamiltonian.toarray()
+    shift = np.roll(np.eye(N), period, axis=0)
+    np.testing.assert_allclose(shift @ H @ shift.T, H)
+
+
+@pytest.mark.parametrize('N,frequency', [(100, 5), (40, 4), (21, 5), (30, 3)])
+def test_sector_spectrum_matches_dense(N, frequency):
+    simulator = SparseRingCrossSimulator(N, frequency, cross_coupling=0.7)
+    expected = np.linalg.eigvalsh(simulator.hamiltonian.toarray())
+
+    np.testing.assert_allclose(simulator.spectrum()['energies'], expected, atol=1e-10)
+    np.testing.assert_allclose(simulator.spectrum(4)['energies'], expected[:4], atol=1e-10)
+
+
+def test_lanczos_low_lying_levels():
+    simulator = SparseRingCrossSimulator(120, dense_block_limit=3)
+    expected = np.linalg.eigvalsh(simulator.hamiltonian.toarray())[:3]
+
+    np.testing.assert_allclose(simulator.spectrum(3, method='lanczos')['energies'], expected, atol=1e-8)
+    np.testing.assert_allclose(simulator.spectrum(3)['energies'], expected, atol=1e-8)
+    # Sectors above dense_block_limit need a level count
+    with pytest.raises(ValueError):
+        simulator.spectrum()
+
+
+def test_large_ring_reduces_to_small_sectors():
+    result = finite_size_scaling([100_000])[0]
+    assert result['period'] == 5 and result['n_sectors'] == 20_000
+    assert result['ground_energy'] == pytest.approx(-(1 + np.sqrt(13)) / 2)
+    assert 0 < result['gap'] < 1e-6
+
+
+@pytest.mark.parametrize('N', [50, 100, 150, 200])
+def test_simplified_simulation_coupling(N):
+    # g is the excess average degree of the sparse graph
+    g = dense_adjacency(N).sum(axis=1).mean() - 2
+    assert simplified_numpy_simulation(N)['g'] == pytest.approx(2.0 if abs(g - 0.4) < 0.1 else g)
+
+
+@pytest.mark.skipif(QISKIT_AVAILABLE, reason="numpy fallbacks only run without Qiskit")
+def test_numpy_backend_builds_sparse_simulator():
+    simulator = RingCrossQuantumSimulator(backend='numpy')
+    result = simulator.calculate_alpha()
+    assert result['n_qubits'] == 21
+    assert simulator.sparse_simulator.N == 21
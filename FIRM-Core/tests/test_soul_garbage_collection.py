@@ -23,6 +23,13 @@ from FIRM_dsl.soul_garbage_collection import (
 )
 from FIRM_dsl.resonance import derive_omega_signature
 from FIRM_dsl.grace_field import FieldRegime
+from FIRM_dsl.graph_kernels import (
+    degree_map,
+    connected_components,
+    induced_subgraph,
+    partition_subgraphs,
+)
+from FIRM_dsl.sgc_modes import create_sgc_mode_system
 
 
 class TestSoulGarbageCollectionCore:
@@ -278,6 +285,60 @@ class TestSGCEdgeCases:
         assert result is not None or sgc.pruned_nodes
 
 
+class TestGraphKernels:
+    """Test the shared linear-time graph kernels used by the 𝒮-GC modes."""
+
+    @staticmethod
+    def _forest():
+        # Two paths (0-1-2, 3-4) and an isolated node 5
+        labels = {i: make_node_label('Z', 1, 2, f'node_{i}') for i in range(6)}
+        edges = [(0, 1), (1, 2), (3, 4)]
+        return ObjectG(nodes=list(range(6)), edges=edges, labels=labels)
+
+    def test_components_match_naive_dfs(self):
+        """Components and their traversal order match the edge-scanning DFS."""
+        graph = self._forest()
+        system = create_sgc_mode_system()
+
+        visited = set()
+        naive = []
+        for node_id in graph.nodes:
+            if node_id not in visited:
+                naive.append(system._dfs_connected_component(graph, node_id, visited))
+
+        assert connected_components(graph) == naive
+        assert connected_components(graph, min_size=2) == [c for c in naive if len(c) > 1]
+
+    def test_degree_map(self):
+        """Degrees are counted in one pass, isolated nodes included."""
+        degrees = degree_map(self._forest())
+        assert degrees == {0: 1, 1: 2, 2: 1, 3: 1, 4: 1, 5: 0}
+
+    def test_partition_matches_induced_subgraphs(self):
+        """Single-pass partitioning equals per-group induced subgraphs."""
+        graph = self._forest()
+        groups = [[0, 1, 3], [2, 4, 5]]
+        parts = partition_subgraphs(graph, groups)
+
+        for part, group in zip(parts, groups):
+            expected = induced_subgraph(graph, group)
+            assert part.nodes == expected.nodes
+            assert part.edges == expected.edges
+            assert part.labels == expected.labels
+        assert parts[0].edges == [(0, 1)]
+        assert parts[1].edges == []
+
+    def test_sync_candidates_are_components(self):
+        """Global resynchronization candidates are induced components."""
+        graph = self._forest()
+        system = create_sgc_mode_system()
+        system.resynchronization_threshold = -1.0
+
+        candidates = system._identify_sync_candidates(graph, derive_omega_signature(graph))
+        assert [c.nodes for c in candidates] == [[0, 1, 2], [3, 4]]
+        assert [c.edges for c in candidates] == [[(0, 1), (1, 2)], [(3, 4)]]
+
+
 if __name__ == "__main__":
     # Run tests if called directly
     pytest.main([__file__, "-v"])
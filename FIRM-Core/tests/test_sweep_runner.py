@@ -0,0 +1,121 @@
+"""Task sweeps: grid order, worker-independent seeding, code-keyed memoization and columnar output."""
+import os
+
+import numpy as np
+
+from FIRM_dsl import sweep_runner
+from FIRM_dsl.action_sweep import load_sweep_columns
+from FIRM_dsl.sweep_runner import SweepTask, TaskSweepRunner, load_sweep_table, task_grid
+
+CALLS = []
+
+
+def noisy_power(base, exponent, rng=None):
+    return {'value': base ** exponent, 'noise': rng.standard_normal(), 'legacy': np.random.rand()}
+
+
+def counted(x):
+    CALLS.append(x)
+    return x * 2
+
+
+def fails_on_odd(x):
+    if x % 2:
+        raise ValueError(f"odd input {x}")
+    return {'half': x // 2, 'label': f"x={x}"}
+
+
+def test_grid_order_and_labels():
+    tasks = task_grid(noisy_power, name='pow', base=[2, 3], exponent=[1, 2, 3])
+    assert [(t.params['base'], t.params['exponent']) for t in tasks][:4] == [(2, 1), (2, 2), (2, 3), (3, 1)]
+    assert tasks[0].label == 'pow[base=2, exponent=1]'
+    assert SweepTask(counted, {'x': 1}).label == 'counted(x=1)'
+
+
+def test_results_independent_of_workers_and_order():
+    tasks = task_grid(noisy_power, base=[2, 3], exponent=[1, 2, 3])
+    serial = TaskSweepRunner(workers=1).run(tasks)
+    parallel = TaskSweepRunner(workers=2).run(tasks[::-1])
+
+    assert [r['result'] for r in serial.records] == [r['result'] for r in parallel.records][::-1]
+    assert serial.records[4]['result']['value'] == 9
+    assert len({r['result']['noise'] for r in serial.records}) == len(tasks)
+
+    reseeded = TaskSweepRunner(workers=1, seed=1).run(tasks)
+    assert reseeded.records[0]['result']['noise'] != serial.records[0]['result']['noise']
+
+
+def test_memoized_tasks_resume(tmp_path):
+    CALLS.clear()
+    runner = TaskSweepRunner(workers=1, cache_dir=str(tmp_path))
+    first = runner.run(task_grid(counted, x=[1, 2]))
+    second = runner.run(task_grid(counted, x=[1, 2, 3]))
+
+    assert CALLS == [1, 2, 3]
+    assert (first.num_computed, second.num_computed, second.num_cached) == (2, 1, 2)
+    assert [r['result'] for r in second.records] == [2, 4, 6]
+
+
+def test_no_memo_by_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    CALLS.clear()
+    TaskSweepRunner(workers=1).run(task_grid(counted, x=[1]))
+    TaskSweepRunner(workers=1).run(task_grid(counted, x=[1]))
+
+    assert CALLS == [1, 1]
+    assert os.listdir(tmp_path) == []
+
+
+def test_library_change_invalidates_memo(tmp_path, monkeypatch):
+    # A stand-in library package; any edit to its sources changes every key
+    library = tmp_path / 'sweeplib'
+    library.mkdir()
+    (library / '__init__.py').write_text('SCALE = 2\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    CALLS.clear()
+    runner = TaskSweepRunner(workers=1, cache_dir=str(tmp_path / 'memo'), code_packages=('sweeplib',))
+    runner.run(task_grid(counted, x=[1]))
+    assert runner.run(task_grid(counted, x=[1])).num_cached == 1
+
+    (library / '__init__.py').write_text('SCALE = 3\n')
+    assert runner.run(task_grid(counted, x=[1])).num_computed == 1
+    assert CALLS == [1, 1]
+
+
+def test_code_version_changes_key_not_random_stream(monkeypatch):
+    tasks = task_grid(noisy_power, base=[2], exponent=[3])
+    before = TaskSweepRunner(workers=1).run(tasks).records[0]
+
+    monkeypatch.setattr(sweep_runner, 'code_version', lambda packages: 'edited')
+    after = TaskSweepRunner(workers=1).run(tasks).records[0]
+
+    assert after['key'] != before['key']
+    assert after['seed'] == before['seed']
+    assert after['result'] == before['result']
+
+
+def test_failures_are_recorded_and_retried(tmp_path):
+    runner = TaskSweepRunner(workers=1, cache_dir=str(tmp_path))
+    result = runner.run(task_grid(fails_on_odd, x=[1, 2]))
+
+    assert [r['status'] for r in result.records] == ['error', 'ok']
+    assert result.failures[0]['error'] == 'ValueError: odd input 1'
+    assert runner.run(task_grid(fails_on_odd, x=[1, 2])).num_computed == 1
+
+
+def test_columnar_table(tmp_path):
+    path = str(tmp_path / 'sweep')
+    TaskSweepRunner(workers=1).run(task_grid(fails_on_odd, x=[1, 2, 4]), output_path=path)
+    table = load_sweep_table(path)
+
+    np.testing.assert_array_equal(table['param.x'], [1, 2, 4])
+    np.testing.assert_array_equal(table['result.half'], [np.nan, 1, 2])
+    assert list(table['result.label']) == ['', 'x=2', 'x=4']
+    assert list(table['status']) == ['error', 'ok', 'ok']
+    assert table['elapsed'].dtype == np.float64
+
+    # Float columns are an ordinary ColumnarSweepWriter output
+    columns = load_sweep_columns(path)
+    assert set(columns) == {'seed', 'elapsed', 'param.x', 'result.half'}
+    np.testing.assert_array_equal(columns['param.x'], [1, 2, 4])